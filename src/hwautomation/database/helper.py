@@ -169,6 +169,15 @@ class DbHelper:
         ).fetchall()
         return [row[0] for row in result if row[0]]
 
+    def get_ipmi_addresses(self, working_only: bool = True) -> List[str]:
+        """Get IPMI addresses of known servers, optionally only working ones."""
+        table_name = self._get_table_name()
+        query = f"SELECT DISTINCT ipmi_address FROM {table_name} WHERE ipmi_address IS NOT NULL AND ipmi_address != ''"
+        if working_only:
+            query += " AND ipmi_address_works = 'TRUE'"
+        result = self.sql_db_worker.execute(query).fetchall()
+        return [row[0] for row in result if row[0]]
+
     def _get_table_name(self) -> str:
         """Get the actual table name to use (handles migration from old to new table names)."""
         # Check if 'servers' table exists (new schema)
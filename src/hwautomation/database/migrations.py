@@ -130,6 +130,14 @@ class DatabaseMigrator:
                 "Add device type and workflow fields",
                 self._migration_006_add_device_workflow_fields,
             ),
+            (7, "Add discovery cache", self._migration_007_add_discovery_cache),
+            (8, "Add BMC capabilities", self._migration_008_add_bmc_capabilities),
+            (9, "Add IPMI address leases", self._migration_009_add_ipmi_leases),
+            (
+                10,
+                "Add Redfish BMC capabilities",
+                self._migration_010_add_redfish_capabilities,
+            ),
         ]
 
     # Migration functions
@@ -352,6 +360,98 @@ class DatabaseMigrator:
         """
         )
 
+    def _migration_007_add_discovery_cache(self, cursor):
+        """Migration 007: Add hardware discovery cache"""
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS discovery_cache (
+                cache_key TEXT PRIMARY KEY,
+                system_uuid TEXT,
+                serial_number TEXT,
+                bios_version TEXT,
+                hostname TEXT,
+                content_hash TEXT NOT NULL,
+                discovery_json TEXT NOT NULL,
+                cached_at TIMESTAMP NOT NULL,
+                hit_count INTEGER DEFAULT 0
+            )
+        """
+        )
+
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_discovery_cache_hostname
+            ON discovery_cache(hostname)
+        """
+        )
+
+    def _migration_008_add_bmc_capabilities(self, cursor):
+        """Migration 008: Add BMC capability fingerprints"""
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS bmc_capabilities (
+                ip_address TEXT NOT NULL,
+                port INTEGER NOT NULL DEFAULT 623,
+                guid TEXT NOT NULL,
+                vendor TEXT NOT NULL,
+                firmware_revision TEXT,
+                redfish_available INTEGER,
+                capabilities_json TEXT NOT NULL,
+                detected_at TIMESTAMP NOT NULL,
+                checked_at TIMESTAMP NOT NULL,
+                PRIMARY KEY (ip_address, port, guid)
+            )
+        """
+        )
+
+    def _migration_009_add_ipmi_leases(self, cursor):
+        """Migration 009: Add IPMI address leases"""
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ipmi_leases (
+                ip_address TEXT PRIMARY KEY,
+                ip_int INTEGER NOT NULL,
+                server_id TEXT,
+                state TEXT NOT NULL,
+                token TEXT,
+                reserved_at TIMESTAMP NOT NULL,
+                expires_at TIMESTAMP,
+                committed_at TIMESTAMP
+            )
+        """
+        )
+
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_ipmi_leases_ip_int
+            ON ipmi_leases(ip_int)
+        """
+        )
+
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_ipmi_leases_server_id
+            ON ipmi_leases(server_id)
+        """
+        )
+
+    def _migration_010_add_redfish_capabilities(self, cursor):
+        """Migration 010: Add Redfish details to BMC capabilities"""
+        # Check if columns already exist
+        cursor.execute("PRAGMA table_info(bmc_capabilities)")
+        columns = [row[1] for row in cursor.fetchall()]
+
+        for column in ("redfish_version", "bios_registry_id", "preferred_protocol"):
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE bmc_capabilities ADD COLUMN {column} TEXT")
+
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_bmc_capabilities_ip_address
+            ON bmc_capabilities(ip_address)
+        """
+        )
+
     def backup_database(self, backup_path: str = None):
         """Create a backup of the current database"""
         if backup_path is None:
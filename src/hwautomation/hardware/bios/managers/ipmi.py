@@ -9,6 +9,7 @@ import xml.etree.ElementTree as ET
 from typing import Any, Dict, List, Optional, Tuple
 
 from ....logging import get_logger
+from ...ipmi.capabilities import get_capability_cache
 from ..base import BiosConfigResult, ConfigMethod, DeviceConfig, MethodSelectionResult
 from .base import BaseBiosManagerImpl, BiosManagerMixin
 
@@ -81,9 +82,18 @@ class IpmiBiosManager(BaseBiosManagerImpl, BiosManagerMixin):
                 fallback_methods=[],
             )
 
-        # Test IPMI connectivity
-        ipmi_available, ipmi_message = self.test_ipmi_connection(
-            target_ip, "ADMIN", "ADMIN"  # Default test credentials
+        # A BMC identified over IPMI before does not need another test
+        known = get_capability_cache().lookup(target_ip)
+        if known is not None and known.guid:
+            ipmi_available, ipmi_message = True, "Recorded BMC capabilities"
+            ipmi_tested = False
+        else:
+            ipmi_available, ipmi_message = self.test_ipmi_connection(
+                target_ip, "ADMIN", "ADMIN"  # Default test credentials
+            )
+            ipmi_tested = True
+        redfish_enabled = device_config.redfish_enabled and (
+            known is None or known.redfish_available is not False
         )
 
         available_methods = []
@@ -92,7 +102,7 @@ class IpmiBiosManager(BaseBiosManagerImpl, BiosManagerMixin):
                 ConfigMethod.VENDOR_TOOLS
             )  # IPMI falls under vendor tools
 
-        if device_config.redfish_enabled:
+        if redfish_enabled:
             available_methods.append(ConfigMethod.REDFISH_STANDARD)
 
         available_methods.append(ConfigMethod.MANUAL)
@@ -102,8 +112,8 @@ class IpmiBiosManager(BaseBiosManagerImpl, BiosManagerMixin):
             return MethodSelectionResult(
                 recommended_method=ConfigMethod.VENDOR_TOOLS,
                 available_methods=available_methods,
-                redfish_capabilities={"available": device_config.redfish_enabled},
-                vendor_tools_status={"available": True, "ipmi_tested": True},
+                redfish_capabilities={"available": redfish_enabled},
+                vendor_tools_status={"available": True, "ipmi_tested": ipmi_tested},
                 confidence_score=0.85,
                 reasoning="IPMI protocol available and tested successfully",
                 fallback_methods=[
@@ -114,13 +124,13 @@ class IpmiBiosManager(BaseBiosManagerImpl, BiosManagerMixin):
             return MethodSelectionResult(
                 recommended_method=(
                     ConfigMethod.REDFISH_STANDARD
-                    if device_config.redfish_enabled
+                    if redfish_enabled
                     else ConfigMethod.MANUAL
                 ),
                 available_methods=available_methods,
-                redfish_capabilities={"available": device_config.redfish_enabled},
+                redfish_capabilities={"available": redfish_enabled},
                 vendor_tools_status={"available": False, "ipmi_error": ipmi_message},
-                confidence_score=0.6 if device_config.redfish_enabled else 0.1,
+                confidence_score=0.6 if redfish_enabled else 0.1,
                 reasoning=f"IPMI unavailable: {ipmi_message}",
                 fallback_methods=[ConfigMethod.MANUAL],
             )
@@ -6,12 +6,16 @@ industry-standard Redfish API protocol.
 """
 
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from ....logging import get_logger
+from ...ipmi.capabilities import BMCCapabilities, get_capability_cache
 from ..base import BiosConfigResult, ConfigMethod, DeviceConfig, MethodSelectionResult
 from .base import BaseBiosManagerImpl, BiosManagerMixin
 
+if TYPE_CHECKING:
+    from ...redfish.base import BiosSettingsDiff
+
 logger = get_logger(__name__)
 
 
@@ -81,10 +85,17 @@ class RedfishBiosManager(BaseBiosManagerImpl, BiosManagerMixin):
                 fallback_methods=[],
             )
 
-        # Test Redfish connectivity
-        redfish_available, redfish_message = self.test_redfish_connection(
-            target_ip, "ADMIN", "password"  # Default test credentials
-        )
+        # Use the recorded BMC capabilities before testing connectivity
+        known = get_capability_cache().lookup(target_ip)
+        if known is not None and known.redfish_available is not None:
+            redfish_available = known.redfish_available
+            redfish_message = "Recorded BMC capabilities"
+            redfish_tested = False
+        else:
+            redfish_available, redfish_message = self.test_redfish_connection(
+                target_ip, "ADMIN", "password"  # Default test credentials
+            )
+            redfish_tested = True
 
         available_methods = []
         if redfish_available:
@@ -100,10 +111,18 @@ class RedfishBiosManager(BaseBiosManagerImpl, BiosManagerMixin):
             return MethodSelectionResult(
                 recommended_method=ConfigMethod.REDFISH_STANDARD,
                 available_methods=available_methods,
-                redfish_capabilities={"available": True, "tested": True},
+                redfish_capabilities={
+                    "available": True,
+                    "tested": redfish_tested,
+                    **_recorded_capabilities(known),
+                },
                 vendor_tools_status={"available": device_config.vendor_tools_available},
                 confidence_score=0.95,
-                reasoning="Redfish API available and tested successfully",
+                reasoning=(
+                    "Redfish API available and tested successfully"
+                    if redfish_tested
+                    else "Redfish API available per recorded BMC capabilities"
+                ),
                 fallback_methods=[
                     m for m in available_methods if m != ConfigMethod.REDFISH_STANDARD
                 ],
@@ -220,18 +239,25 @@ class RedfishBiosManager(BaseBiosManagerImpl, BiosManagerMixin):
 
             # Step 7: Push configuration via Redfish
             logger.info("Applying BIOS configuration via Redfish...")
-            success = self._apply_redfish_bios_config(
+            diff = self._apply_redfish_bios_config(
                 modified_config, target_ip, username, password
             )
 
-            if success:
-                logger.info("BIOS configuration applied successfully via Redfish")
+            if diff is not None:
+                logger.info(
+                    f"BIOS configuration applied via Redfish: {len(diff.patch)} "
+                    f"written, {len(diff.unchanged)} unchanged, "
+                    f"{len(diff.unknown)} unknown"
+                )
                 return self._create_config_result(
                     success=True,
                     method=ConfigMethod.REDFISH_STANDARD,
-                    settings_applied={"status": "Configuration applied via Redfish"},
+                    settings_applied={**diff.pending, **diff.patch},
+                    settings_failed={
+                        name: "Unknown BIOS attribute" for name in diff.unknown
+                    },
                     backup_file=backup_file,
-                    reboot_required=True,
+                    reboot_required=diff.reboot_required,
                 )
             else:
                 return self._create_config_result(
@@ -264,12 +290,19 @@ class RedfishBiosManager(BaseBiosManagerImpl, BiosManagerMixin):
         Returns:
             Tuple of (success, message)
         """
+        known = get_capability_cache().lookup(target_ip)
+        if known is not None and known.redfish_available is False:
+            return False, "Redfish not available (recorded BMC capabilities)"
+
         try:
             # Import here to avoid circular imports
             from ...redfish import RedfishManager
 
             with RedfishManager(target_ip, username, password) as redfish:
-                return redfish.test_connection()
+                success, message = redfish.test_connection()
+            if success:
+                get_capability_cache().update_redfish(target_ip, available=True)
+            return success, message
         except Exception as e:
             logger.error(f"Failed to test Redfish connection: {e}")
             return False, f"Connection test failed: {e}"
@@ -338,8 +371,12 @@ class RedfishBiosManager(BaseBiosManagerImpl, BiosManagerMixin):
 
     def _apply_redfish_bios_config(
         self, config: ET.Element, target_ip: str, username: str, password: str
-    ) -> bool:
-        """Apply BIOS configuration via Redfish API."""
+    ) -> Optional["BiosSettingsDiff"]:
+        """Apply BIOS configuration via Redfish API.
+
+        Returns:
+            Attribute diff of the applied settings, or None on failure
+        """
         try:
             from ...redfish import RedfishManager
 
@@ -352,10 +389,10 @@ class RedfishBiosManager(BaseBiosManagerImpl, BiosManagerMixin):
                     bios_settings[name] = value
 
             with RedfishManager(target_ip, username, password) as redfish:
-                return redfish.set_bios_attributes(bios_settings)
+                return redfish.apply_bios_attributes(bios_settings)
         except Exception as e:
             logger.error(f"Failed to apply BIOS config via Redfish: {e}")
-            return False
+            return None
 
     # Abstract method implementations for BaseBiosManager compatibility
     def pull_current_config(
@@ -386,3 +423,14 @@ class RedfishBiosManager(BaseBiosManagerImpl, BiosManagerMixin):
         # Stub implementation for compatibility
         logger.warning("push_config: Stub implementation")
         return True
+
+
+def _recorded_capabilities(known: Optional[BMCCapabilities]) -> Dict[str, Any]:
+    """Redfish details from a capability record for method selection results."""
+    if known is None or not known.redfish_available:
+        return {}
+    return {
+        "redfish_version": known.redfish_version,
+        "features": dict(known.redfish_features),
+        "bios_registry_id": known.bios_registry_id,
+    }
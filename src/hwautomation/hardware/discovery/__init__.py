@@ -12,7 +12,10 @@ from .base import (
     NetworkInterface,
     SystemInfo,
 )
+from .cache import DiscoveryCache, DiscoveryFingerprint
+from .collector import CollectorDocument, CollectorError, DiscoveryCollector
 from .manager import HardwareDiscoveryManager
+from .recorder import DiscoveryRecorder
 
 # Maintain backward compatibility by importing the old class
 HardwareDiscoveryManager = HardwareDiscoveryManager
@@ -25,4 +28,10 @@ __all__ = [
     "SystemInfo",
     "BaseVendorDiscovery",
     "BaseParser",
+    "DiscoveryRecorder",
+    "DiscoveryCache",
+    "DiscoveryFingerprint",
+    "DiscoveryCollector",
+    "CollectorDocument",
+    "CollectorError",
 ]
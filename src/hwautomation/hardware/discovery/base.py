@@ -6,11 +6,14 @@ used throughout the hardware discovery system.
 
 import json
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import asdict, dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from ...logging import get_logger
 
+if TYPE_CHECKING:
+    from .parsers.structured import DiscoverySnapshot
+
 logger = get_logger(__name__)
 
 
@@ -69,10 +72,35 @@ class HardwareDiscovery:
     network_interfaces: List[NetworkInterface]
     discovered_at: str
     discovery_errors: List[str]
+    from_cache: bool = False
+    ssh_accessible: bool = True
+    # Parsed raw output, shared with vendor detection; never serialized
+    snapshot: Optional["DiscoverySnapshot"] = field(
+        default=None, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        data = asdict(replace(self, snapshot=None))
+        del data["snapshot"]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HardwareDiscovery":
+        """Rebuild a discovery result from its to_dict() form."""
+        return cls(
+            hostname=data["hostname"],
+            system_info=SystemInfo(**data.get("system_info", {})),
+            ipmi_info=IPMIInfo(**data.get("ipmi_info", {})),
+            network_interfaces=[
+                NetworkInterface(**iface)
+                for iface in data.get("network_interfaces", [])
+            ],
+            discovered_at=data.get("discovered_at", ""),
+            discovery_errors=list(data.get("discovery_errors", [])),
+            from_cache=data.get("from_cache", False),
+            ssh_accessible=data.get("ssh_accessible", True),
+        )
 
 
 class BaseVendorDiscovery(ABC):
@@ -0,0 +1,256 @@
+"""Persistent hardware discovery cache.
+
+DMI/FRU data rarely changes between provisioning runs, so discovery results
+are cached in the database keyed by host identity (system UUID, falling back
+to serial number). A cached entry is reused when a cheap fingerprint of the
+host (UUID, serial and BIOS version) still matches and the entry is within
+its TTL; otherwise a full discovery is performed and the cache refreshed.
+
+Only the stable inventory (the DMI/CPU/memory ``system_info`` section) is
+cached. IPMI and NIC addressing changes with DHCP leases and BMC
+reconfiguration, so those sections are re-collected on every discovery and
+never stored.
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from ...logging import get_logger
+from .base import HardwareDiscovery
+
+logger = get_logger(__name__)
+
+# Values firmware vendors leave in unprogrammed DMI fields
+PLACEHOLDER_VALUES = {
+    "",
+    "not specified",
+    "not settable",
+    "not present",
+    "to be filled by o.e.m.",
+    "default string",
+    "system serial number",
+    "0123456789",
+    "03000200-0400-0500-0006-000700080009",
+    "00000000-0000-0000-0000-000000000000",
+    "ffffffff-ffff-ffff-ffff-ffffffffffff",
+}
+
+# Sections of a HardwareDiscovery that are stable enough to reuse
+CACHED_SECTIONS = ("system_info",)
+
+
+def _normalize_identity(value: Optional[str]) -> Optional[str]:
+    """Return a usable identity value, or None for vendor placeholders."""
+    if value is None:
+        return None
+    value = value.strip()
+    if value.lower() in PLACEHOLDER_VALUES:
+        return None
+    return value
+
+
+@dataclass
+class DiscoveryFingerprint:
+    """Cheap identity fingerprint of a host used for cache revalidation."""
+
+    system_uuid: Optional[str] = None
+    serial_number: Optional[str] = None
+    bios_version: Optional[str] = None
+
+    def __post_init__(self):
+        """Normalize placeholder DMI values to None."""
+        uuid = _normalize_identity(self.system_uuid)
+        self.system_uuid = uuid.lower() if uuid else None
+        self.serial_number = _normalize_identity(self.serial_number)
+        self.bios_version = _normalize_identity(self.bios_version)
+
+    @property
+    def cache_key(self) -> Optional[str]:
+        """Stable cache key: system UUID, or serial number as a fallback."""
+        if self.system_uuid:
+            return f"uuid:{self.system_uuid}"
+        if self.serial_number:
+            return f"serial:{self.serial_number}"
+        return None
+
+
+def discovery_content_hash(discovery: HardwareDiscovery) -> str:
+    """
+    Hash the cached inventory content of a discovery result.
+
+    Only the cached sections are hashed, so host-specific and volatile fields
+    (hostname, timestamp, errors, IPMI and NIC addressing) never register as
+    a hardware change.
+    """
+    data = _cached_sections(discovery)
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _cached_sections(discovery: HardwareDiscovery) -> Dict[str, Any]:
+    """Return the stable inventory sections of a discovery result."""
+    data = discovery.to_dict()
+    return {section: data[section] for section in CACHED_SECTIONS}
+
+
+class DiscoveryCache:
+    """Database-backed cache of HardwareDiscovery results."""
+
+    def __init__(self, db_helper, ttl: timedelta = timedelta(days=7)):
+        """
+        Initialize discovery cache.
+
+        Args:
+            db_helper: DbHelper whose database holds the discovery_cache table
+            ttl: How long a cached result may be reused without re-discovery
+        """
+        self.db_helper = db_helper
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.logger = get_logger(__name__)
+
+    @property
+    def _db(self):
+        return self.db_helper.sql_db_worker
+
+    def lookup(
+        self, fingerprint: DiscoveryFingerprint, hostname: Optional[str] = None
+    ) -> Optional[HardwareDiscovery]:
+        """
+        Return a cached discovery if the fingerprint still matches.
+
+        Args:
+            fingerprint: Freshly collected identity fingerprint
+            hostname: Host the result is being served for
+
+        Returns:
+            Cached HardwareDiscovery (with from_cache=True) or None on miss.
+            Only the cached inventory sections are filled in; the IPMI and
+            network sections are empty and must be collected by the caller.
+        """
+        key = fingerprint.cache_key
+        if not key:
+            return None
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT serial_number, bios_version, discovery_json, cached_at "
+                "FROM discovery_cache WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+            if not row:
+                return None
+
+            serial_number, bios_version, discovery_json, cached_at = row
+            if datetime.now() - datetime.fromisoformat(cached_at) > self.ttl:
+                self.logger.debug(f"Discovery cache entry {key} expired")
+                return None
+            if (serial_number, bios_version) != (
+                fingerprint.serial_number,
+                fingerprint.bios_version,
+            ):
+                self.logger.info(
+                    f"Hardware identity changed for {key} "
+                    f"(BIOS {bios_version} -> {fingerprint.bios_version}), "
+                    "re-discovering"
+                )
+                return None
+
+            self._db.execute(
+                "UPDATE discovery_cache SET hit_count = hit_count + 1 "
+                "WHERE cache_key = ?",
+                (key,),
+            )
+            self._db.commit()
+
+        data = json.loads(discovery_json)
+        return HardwareDiscovery.from_dict(
+            {
+                **{section: data[section] for section in CACHED_SECTIONS},
+                "hostname": hostname or data.get("hostname", ""),
+                "discovered_at": data.get("discovered_at", ""),
+                "from_cache": True,
+            }
+        )
+
+    def store(
+        self, discovery: HardwareDiscovery, fingerprint: DiscoveryFingerprint
+    ) -> bool:
+        """
+        Cache a discovery result under the host's identity.
+
+        Args:
+            discovery: Complete discovery result
+            fingerprint: Identity fingerprint collected for the same host
+
+        Returns:
+            True if the cached hardware content changed (or is new)
+        """
+        key = fingerprint.cache_key
+        if not key:
+            self.logger.debug(
+                f"No usable UUID or serial for {discovery.hostname}, not caching"
+            )
+            return False
+
+        content_hash = discovery_content_hash(discovery)
+        payload = {
+            **_cached_sections(discovery),
+            "hostname": discovery.hostname,
+            "discovered_at": discovery.discovered_at,
+        }
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT content_hash FROM discovery_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO discovery_cache (cache_key, system_uuid, "
+                "serial_number, bios_version, hostname, content_hash, "
+                "discovery_json, cached_at, hit_count) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                (
+                    key,
+                    fingerprint.system_uuid,
+                    fingerprint.serial_number,
+                    fingerprint.bios_version,
+                    discovery.hostname,
+                    content_hash,
+                    json.dumps(payload),
+                    datetime.now().isoformat(),
+                ),
+            )
+            self._db.commit()
+
+        changed = row is None or row[0] != content_hash
+        if row is not None and changed:
+            self.logger.info(f"Discovered hardware content changed for {key}")
+        return changed
+
+    def invalidate(self, fingerprint: DiscoveryFingerprint) -> None:
+        """Drop the cached entry for a host identity."""
+        key = fingerprint.cache_key
+        if not key:
+            return
+        with self._lock:
+            self._db.execute("DELETE FROM discovery_cache WHERE cache_key = ?", (key,))
+            self._db.commit()
+
+    def purge_expired(self) -> int:
+        """
+        Delete entries older than the TTL.
+
+        Returns:
+            Number of entries removed
+        """
+        cutoff = (datetime.now() - self.ttl).isoformat()
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM discovery_cache WHERE cached_at < ?", (cutoff,)
+            )
+            self._db.commit()
+        return cursor.rowcount
@@ -0,0 +1,195 @@
+"""Agentless one-shot discovery collector.
+
+The collector payload (``collector_payload.py``) is piped to ``python3 -``
+on the target over a single SSH exec. It gathers DMI, CPU, memory, NIC,
+PCI, IPMI LAN and vendor tool output concurrently and returns one
+compressed JSON document, replacing the many round trips (and on-demand
+package installs) of per-command discovery.
+"""
+
+import base64
+import binascii
+import gzip
+import inspect
+import json
+import shlex
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from ...logging import get_logger
+from . import collector_payload
+
+logger = get_logger(__name__)
+
+SUPPORTED_VERSIONS = {collector_payload.PAYLOAD_VERSION}
+
+
+class CollectorError(Exception):
+    """Raised when the collector cannot run or its output cannot be decoded."""
+
+    pass
+
+
+@dataclass
+class CollectedCommand:
+    """Raw result of one command run by the collector payload."""
+
+    cmd: str
+    stdout: str = ""
+    stderr: str = ""
+    rc: int = 127
+    duration: Optional[float] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the command exited successfully."""
+        return self.rc == 0
+
+
+@dataclass
+class CollectorDocument:
+    """Decoded collector output for one host."""
+
+    version: int
+    hostname: str = ""
+    duration: Optional[float] = None
+    commands: Dict[str, CollectedCommand] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CollectorDocument":
+        """Build a document from the payload's JSON form."""
+        version = data.get("version")
+        if version not in SUPPORTED_VERSIONS:
+            raise CollectorError(f"Unsupported collector version: {version}")
+        return cls(
+            version=version,
+            hostname=data.get("hostname", ""),
+            duration=data.get("duration"),
+            commands={
+                name: CollectedCommand(
+                    cmd=result.get("cmd", ""),
+                    stdout=result.get("stdout", ""),
+                    stderr=result.get("stderr", ""),
+                    rc=result.get("rc", 127),
+                    duration=result.get("duration"),
+                )
+                for name, result in data.get("commands", {}).items()
+            },
+        )
+
+    def output(self, name: str) -> Optional[str]:
+        """Stdout of a command if it succeeded, otherwise None."""
+        command = self.commands.get(name)
+        return command.stdout if command and command.ok else None
+
+    def error(self, name: str) -> str:
+        """Stderr of a command, or a note that it was not collected."""
+        command = self.commands.get(name)
+        if command is None:
+            return "not collected"
+        return command.stderr.strip() or f"exit code {command.rc}"
+
+    def outputs(self) -> Dict[str, str]:
+        """Stdout of every successful command keyed by name."""
+        return {
+            name: command.stdout
+            for name, command in self.commands.items()
+            if command.ok
+        }
+
+    def pci_devices(self) -> List[Dict[str, str]]:
+        """Parse ``lspci -mm`` output into slot/class/vendor/device records."""
+        devices = []
+        for line in (self.output("lspci") or "").splitlines():
+            try:
+                fields = [f for f in shlex.split(line) if not f.startswith("-")]
+            except ValueError:
+                continue
+            if len(fields) >= 4:
+                devices.append(
+                    {
+                        "slot": fields[0],
+                        "class": fields[1],
+                        "vendor": fields[2],
+                        "device": fields[3],
+                    }
+                )
+        return devices
+
+
+def decode_document(text: str) -> CollectorDocument:
+    """
+    Decode collector stdout (base64 of gzip-compressed JSON).
+
+    Args:
+        text: Raw stdout of the payload
+
+    Returns:
+        Decoded CollectorDocument
+
+    Raises:
+        CollectorError: If the output is not a valid collector document
+    """
+    try:
+        raw = gzip.decompress(base64.b64decode(text.strip(), validate=True))
+        data = json.loads(raw.decode("utf-8"))
+    except (binascii.Error, OSError, EOFError, ValueError) as e:
+        raise CollectorError(f"Invalid collector output: {e}") from e
+    if not isinstance(data, dict):
+        raise CollectorError("Invalid collector output: not a JSON object")
+    return CollectorDocument.from_dict(data)
+
+
+def payload_source() -> str:
+    """Source code of the collector payload as sent to the target."""
+    return inspect.getsource(collector_payload)
+
+
+class DiscoveryCollector:
+    """Run the collector payload on a host over one SSH exec."""
+
+    def __init__(self, python: str = "python3", use_sudo: bool = True):
+        """
+        Initialize collector.
+
+        Args:
+            python: Interpreter on the target used to run the payload
+            use_sudo: Run the payload with non-interactive sudo (needed for
+                dmidecode and ipmitool)
+        """
+        self.python = python
+        self.use_sudo = use_sudo
+        self._source = payload_source()
+
+    @property
+    def command(self) -> str:
+        """Remote command that reads the payload from stdin."""
+        command = f"{self.python} -"
+        return f"sudo -n {command}" if self.use_sudo else command
+
+    def collect(self, ssh_client) -> CollectorDocument:
+        """
+        Run the payload on a connected host and decode its document.
+
+        Args:
+            ssh_client: Connected SSHClient
+
+        Returns:
+            CollectorDocument with the raw output of every command
+
+        Raises:
+            CollectorError: If the payload could not run or its output is invalid
+        """
+        stdout, stderr, exit_code = ssh_client.exec_command(
+            self.command, stdin_data=self._source
+        )
+        if exit_code != 0:
+            raise CollectorError(
+                f"Collector exited with code {exit_code}: {stderr.strip()}"
+            )
+        document = decode_document(stdout)
+        logger.debug(
+            f"Collected {len(document.commands)} outputs from "
+            f"{document.hostname or 'host'} in {document.duration}s"
+        )
+        return document
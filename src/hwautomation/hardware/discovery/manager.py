@@ -5,8 +5,9 @@ various parsers and vendor-specific handlers, with enhanced
 device classification through unified configuration integration.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type
 
 from ...config.adapters import ConfigurationManager
 from ...config.unified_loader import UnifiedConfigLoader
@@ -19,7 +20,16 @@ from .base import (
     NetworkInterface,
     SystemInfo,
 )
-from .parsers import DmidecodeParser, IpmiParser, NetworkParser
+from .cache import DiscoveryCache, DiscoveryFingerprint
+from .collector import CollectorDocument, CollectorError, DiscoveryCollector
+from .parsers import (
+    DiscoverySnapshot,
+    DmidecodeParser,
+    IpmiParser,
+    NetworkParser,
+    StructuredParser,
+)
+from .recorder import DiscoveryRecorder
 from .utils import SSHCommandRunner, ToolInstaller
 from .vendors import DellDiscovery, HPEDiscovery, SupermicroDiscovery
 
@@ -35,7 +45,12 @@ class HardwareDiscoveryManager:
     with enhanced device classification through unified configuration.
     """
 
-    def __init__(self, ssh_manager: SSHManager):
+    def __init__(
+        self,
+        ssh_manager: SSHManager,
+        discovery_cache: Optional[DiscoveryCache] = None,
+        collector: Optional[DiscoveryCollector] = None,
+    ):
         """
         Initialize hardware discovery manager.
 
@@ -43,8 +58,14 @@ class HardwareDiscoveryManager:
         ----
         ssh_manager : SSHManager
             SSH manager for remote connections
+        discovery_cache : DiscoveryCache, optional
+            Cache of previous results reused when the host identity is unchanged
+        collector : DiscoveryCollector, optional
+            One-shot collector tried before per-command discovery
         """
         self.ssh_manager = ssh_manager
+        self.discovery_cache = discovery_cache
+        self.collector = collector
         self.logger = get_logger(__name__)
 
         # Initialize unified configuration system
@@ -55,6 +76,7 @@ class HardwareDiscoveryManager:
         self.dmidecode_parser = DmidecodeParser()
         self.ipmi_parser = IpmiParser()
         self.network_parser = NetworkParser()
+        self.structured_parser = StructuredParser()
 
         # Initialize vendor handlers
         self.vendor_handlers: List[Type[BaseVendorDiscovery]] = [
@@ -70,11 +92,24 @@ class HardwareDiscoveryManager:
         )
 
     def discover_hardware(
-        self, host: str, username: str = "ubuntu", key_file: str = None
+        self,
+        host: str,
+        username: str = "ubuntu",
+        key_file: str = None,
+        use_cache: bool = True,
     ) -> HardwareDiscovery:
         """
         Discover all hardware information from a remote system.
 
+        When a discovery cache is configured, only the host fingerprint
+        (system UUID, serial and BIOS version) is fetched first; if it
+        matches a fresh cache entry the cached inventory is reused and only
+        the IPMI and network sections are collected again.
+
+        When a collector is configured, all raw output is gathered in a
+        single remote execution and ingested locally; hosts where the
+        collector cannot run fall back to per-command discovery.
+
         Args
         ----
         host : str
@@ -83,6 +118,8 @@ class HardwareDiscoveryManager:
             SSH username (default: ubuntu)
         key_file : str, optional
             SSH private key file path
+        use_cache : bool, optional
+            Set False to force a full re-discovery (default: True)
 
         Returns
         -------
@@ -90,16 +127,48 @@ class HardwareDiscoveryManager:
             Complete hardware discovery results
         """
         errors: List[str] = []
+        connected = False
 
         try:
             # Connect to the system
             ssh_client = self.ssh_manager.connect(
                 host=host, username=username, key_file=key_file, timeout=30
             )
+            connected = True
 
             with ssh_client:
-                # Discover system information
-                system_info = self._discover_system_info(ssh_client, errors)
+                fingerprint = None
+                if self.discovery_cache:
+                    fingerprint = self._get_fingerprint(ssh_client)
+                    cached = (
+                        self.discovery_cache.lookup(fingerprint, hostname=host)
+                        if use_cache and fingerprint
+                        else None
+                    )
+                    if cached:
+                        self.logger.info(
+                            f"Reusing cached hardware inventory for {host}"
+                        )
+                        # Addressing is not cached; collect it fresh
+                        cached.ipmi_info = self._discover_ipmi_info(ssh_client, errors)
+                        cached.network_interfaces = self._discover_network_interfaces(
+                            ssh_client, errors
+                        )
+                        cached.discovery_errors = errors
+                        return cached
+
+                discovery = None
+                if self.collector:
+                    discovery = self._discover_with_collector(host, ssh_client)
+                if discovery is not None:
+                    if fingerprint and not discovery.discovery_errors:
+                        self.discovery_cache.store(discovery, fingerprint)
+                    return discovery
+
+                # Discover system information; the parsed DMI snapshot is
+                # kept on the result for vendor detection
+                snapshot = self._try_collect_snapshot(ssh_client)
+                system_info = self._discover_system_info(ssh_client, errors, snapshot)
 
                 # Discover IPMI information
                 ipmi_info = self._discover_ipmi_info(ssh_client, errors)
@@ -120,15 +189,22 @@ class HardwareDiscoveryManager:
                 # Perform device classification using unified configuration
                 self._classify_and_enhance_system_info(system_info)
 
-                return HardwareDiscovery(
+                discovery = HardwareDiscovery(
                     hostname=host,
                     system_info=system_info,
                     ipmi_info=ipmi_info,
                     network_interfaces=network_interfaces,
                     discovered_at=self._get_timestamp(),
                     discovery_errors=errors,
+                    snapshot=snapshot,
                 )
 
+                # Only complete results are worth reusing
+                if fingerprint and not errors:
+                    self.discovery_cache.store(discovery, fingerprint)
+
+                return discovery
+
         except Exception as e:
             self.logger.error(f"Hardware discovery failed for {host}: {e}")
             errors.append(f"Discovery failed: {str(e)}")
@@ -141,12 +217,311 @@ class HardwareDiscoveryManager:
                 network_interfaces=[],
                 discovered_at=self._get_timestamp(),
                 discovery_errors=errors,
+                ssh_accessible=connected,
             )
 
+    def discover_many(
+        self,
+        hosts: Iterable[str],
+        concurrency: int = 16,
+        username: str = "ubuntu",
+        key_file: str = None,
+        progress_callback: Optional[
+            Callable[[int, int, str, HardwareDiscovery], None]
+        ] = None,
+        recorder: Optional[DiscoveryRecorder] = None,
+        use_cache: bool = True,
+    ) -> Dict[str, HardwareDiscovery]:
+        """
+        Discover hardware on many hosts in parallel.
+
+        Each worker holds one SSH connection per host for the duration of
+        that host's discovery, so total latency is roughly one discovery
+        per ``concurrency`` hosts rather than one per host.
+
+        Args
+        ----
+        hosts : Iterable[str]
+            Target hostnames or IP addresses
+        concurrency : int, optional
+            Maximum number of hosts discovered at once (default: 16)
+        username : str, optional
+            SSH username (default: ubuntu)
+        key_file : str, optional
+            SSH private key file path
+        progress_callback : callable, optional
+            Called as ``(completed, total, host, result)`` as each host finishes
+        recorder : DiscoveryRecorder, optional
+            Writes each result to the database as soon as it arrives
+        use_cache : bool, optional
+            Set False to force a full re-discovery of every host (default: True)
+
+        Returns
+        -------
+        Dict[str, HardwareDiscovery]
+            Discovery results keyed by host, in completion order
+        """
+        targets = list(dict.fromkeys(hosts))
+        results: Dict[str, HardwareDiscovery] = {}
+        if not targets:
+            return results
+
+        self.logger.info(
+            f"Starting discovery of {len(targets)} hosts "
+            f"with concurrency {concurrency}"
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(concurrency, len(targets)))
+        ) as pool:
+            futures = {
+                pool.submit(
+                    self._discover_isolated, host, username, key_file, use_cache
+                ): host
+                for host in targets
+            }
+            for future in as_completed(futures):
+                host = futures[future]
+                result = future.result()
+                results[host] = result
+
+                if recorder:
+                    try:
+                        recorder.record(result)
+                    except Exception as e:
+                        self.logger.error(f"Failed to record discovery for {host}: {e}")
+                        result.discovery_errors.append(f"Database record failed: {e}")
+
+                if progress_callback:
+                    try:
+                        progress_callback(len(results), len(targets), host, result)
+                    except Exception as e:
+                        self.logger.warning(f"Discovery progress callback failed: {e}")
+
+        failed = sum(1 for r in results.values() if r.discovery_errors)
+        self.logger.info(
+            f"Discovery of {len(targets)} hosts complete ({failed} with errors)"
+        )
+        return results
+
+    def _discover_isolated(
+        self, host: str, username: str, key_file: Optional[str], use_cache: bool
+    ) -> HardwareDiscovery:
+        """Run discovery for one host, never letting an exception escape."""
+        try:
+            return self.discover_hardware(
+                host, username=username, key_file=key_file, use_cache=use_cache
+            )
+        except Exception as e:
+            self.logger.error(f"Hardware discovery failed for {host}: {e}")
+            return HardwareDiscovery(
+                hostname=host,
+                system_info=SystemInfo(),
+                ipmi_info=IPMIInfo(),
+                network_interfaces=[],
+                discovered_at=self._get_timestamp(),
+                discovery_errors=[f"Discovery failed: {str(e)}"],
+                ssh_accessible=False,
+            )
+
+    def _discover_with_collector(
+        self, host: str, ssh_client: SSHClient
+    ) -> Optional[HardwareDiscovery]:
+        """Run the one-shot collector, returning None if it is unusable."""
+        try:
+            document = self.collector.collect(ssh_client)
+        except CollectorError as e:
+            self.logger.info(
+                f"Collector unavailable on {host}, using per-command discovery: {e}"
+            )
+            return None
+        return self.ingest_collected(host, document)
+
+    def ingest_collected(
+        self, host: str, document: CollectorDocument
+    ) -> HardwareDiscovery:
+        """
+        Build a discovery result from a collector document.
+
+        Args
+        ----
+        host : str
+            Hostname or IP address the document was collected from
+        document : CollectorDocument
+            Decoded output of the collector payload
+
+        Returns
+        -------
+        HardwareDiscovery
+            Discovery results parsed from the collected output
+        """
+        errors: List[str] = []
+
+        snapshot = self.structured_parser.parse_snapshot(
+            dmidecode=document.output("dmidecode"),
+            lscpu_json=document.output("lscpu_json"),
+            ip_json=document.output("ip_json"),
+        )
+        if snapshot.dmi.first(1):
+            system_info = snapshot.system_info()
+        else:
+            system_info = SystemInfo()
+            errors.append(f"dmidecode failed: {document.error('dmidecode')}")
+
+        if snapshot.cpu is None:
+            lscpu_output = document.output("lscpu")
+            if lscpu_output is not None:
+                cpu_info = self.dmidecode_parser.parse_cpu_info(lscpu_output)
+                system_info.cpu_model = cpu_info.get("model")
+                system_info.cpu_cores = cpu_info.get("cores")
+            elif not system_info.cpu_model:
+                errors.append(f"lscpu failed: {document.error('lscpu')}")
+
+        memory_output = document.output("memory")
+        if memory_output is not None:
+            memory_info = self.dmidecode_parser.parse_memory_info(memory_output)
+            system_info.memory_total = memory_info.get("total")
+        else:
+            errors.append(f"memory info failed: {document.error('memory')}")
+
+        ipmi_info = IPMIInfo()
+        for channel in (1, 8):
+            lan_output = document.output(f"ipmi_lan_{channel}")
+            if lan_output is not None:
+                ipmi_info = self.ipmi_parser.parse_lan_config(lan_output)
+                if channel != 1:
+                    ipmi_info.channel = channel
+                break
+        else:
+            errors.append(f"IPMI lan print failed: {document.error('ipmi_lan_8')}")
+
+        network_interfaces = snapshot.interfaces
+        if not network_interfaces:
+            ip_output = document.output("ip_addr")
+            if ip_output is not None:
+                network_interfaces = self.network_parser.parse_ip_addr(ip_output)
+            elif document.output("ip_json") is None:
+                errors.append(
+                    f"Network interface discovery failed: {document.error('ip_addr')}"
+                )
+
+        vendor_info: Dict[str, Any] = {}
+        for vendor_class in self.vendor_handlers:
+            try:
+                vendor_handler = vendor_class(None)
+                if vendor_handler.can_handle(system_info):
+                    vendor_info = vendor_handler.parse_collected_output(
+                        document.outputs()
+                    )
+                    break
+            except Exception as e:
+                errors.append(f"Vendor discovery error ({vendor_class.__name__}): {e}")
+
+        self._enhance_system_info(system_info, vendor_info)
+        self._classify_and_enhance_system_info(system_info)
+
+        return HardwareDiscovery(
+            hostname=host,
+            system_info=system_info,
+            ipmi_info=ipmi_info,
+            network_interfaces=network_interfaces,
+            discovered_at=self._get_timestamp(),
+            discovery_errors=errors,
+            snapshot=snapshot,
+        )
+
+    def _get_fingerprint(self, ssh_client: SSHClient) -> Optional[DiscoveryFingerprint]:
+        """Fetch the cheap identity fingerprint used for cache revalidation."""
+        try:
+            stdout, stderr, exit_code = SSHCommandRunner(
+                ssh_client
+            ).get_identity_fingerprint()
+            if exit_code != 0:
+                self.logger.debug(f"Identity fingerprint failed: {stderr}")
+                return None
+            return DiscoveryFingerprint(**self.dmidecode_parser.parse_identity(stdout))
+        except Exception as e:
+            self.logger.debug(f"Identity fingerprint failed: {e}")
+            return None
+
+    def collect_snapshot(
+        self, ssh_client: SSHClient, errors: Optional[List[str]] = None
+    ) -> Optional[DiscoverySnapshot]:
+        """
+        Collect full dmidecode and lscpu -J output and parse it in one pass.
+
+        The snapshot can be shared with vendor detection so the same DMI
+        data is not fetched or parsed again.
+
+        Returns:
+            DiscoverySnapshot, or None if full dmidecode is unavailable
+        """
+        ssh_runner = SSHCommandRunner(ssh_client)
+
+        stdout, stderr, exit_code = ssh_runner.run_dmidecode_all()
+        if exit_code != 0:
+            if errors is not None:
+                errors.append(f"dmidecode failed: {stderr}")
+            return None
+        dmidecode_output = stdout
+
+        stdout, stderr, exit_code = ssh_runner.get_cpu_info_json()
+        lscpu_output = stdout if exit_code == 0 else None
+
+        return self.structured_parser.parse_snapshot(
+            dmidecode=dmidecode_output, lscpu_json=lscpu_output
+        )
+
+    def _try_collect_snapshot(
+        self, ssh_client: SSHClient
+    ) -> Optional[DiscoverySnapshot]:
+        """Collect a snapshot, returning None if structured discovery fails."""
+        try:
+            return self.collect_snapshot(ssh_client)
+        except Exception as e:
+            self.logger.debug(f"Structured discovery failed, using legacy path: {e}")
+            return None
+
     def _discover_system_info(
-        self, ssh_client: SSHClient, errors: List[str]
+        self,
+        ssh_client: SSHClient,
+        errors: List[str],
+        snapshot: Optional[DiscoverySnapshot] = None,
     ) -> SystemInfo:
         """Discover system hardware information using dmidecode and basic tools."""
+        if snapshot is None or not snapshot.dmi.first(1):
+            return self._discover_system_info_legacy(ssh_client, errors)
+
+        system_info = snapshot.system_info()
+        ssh_runner = SSHCommandRunner(ssh_client)
+
+        try:
+            # lscpu -J is missing on older util-linux; fall back to text lscpu
+            if snapshot.cpu is None:
+                stdout, stderr, exit_code = ssh_runner.get_cpu_info()
+                if exit_code == 0:
+                    cpu_info = self.dmidecode_parser.parse_cpu_info(stdout)
+                    system_info.cpu_model = cpu_info.get("model")
+                    system_info.cpu_cores = cpu_info.get("cores")
+                elif not system_info.cpu_model:
+                    errors.append(f"lscpu failed: {stderr}")
+
+            stdout, stderr, exit_code = ssh_runner.get_memory_info()
+            if exit_code == 0:
+                memory_info = self.dmidecode_parser.parse_memory_info(stdout)
+                system_info.memory_total = memory_info.get("total")
+            else:
+                errors.append(f"memory info failed: {stderr}")
+
+        except Exception as e:
+            errors.append(f"System discovery failed: {str(e)}")
+
+        return system_info
+
+    def _discover_system_info_legacy(
+        self, ssh_client: SSHClient, errors: List[str]
+    ) -> SystemInfo:
+        """Discover system information with per-table dmidecode and text lscpu."""
         system_info = SystemInfo()
         ssh_runner = SSHCommandRunner(ssh_client)
 
@@ -226,6 +601,13 @@ class HardwareDiscoveryManager:
         ssh_runner = SSHCommandRunner(ssh_client)
 
         try:
+            stdout, stderr, exit_code = ssh_runner.get_network_interfaces_json()
+            if exit_code == 0:
+                try:
+                    return self.structured_parser.parse_ip_json(stdout)
+                except ValueError as e:
+                    self.logger.debug(f"ip -j output unusable, using text: {e}")
+
             stdout, stderr, exit_code = ssh_runner.get_network_interfaces()
             if exit_code == 0:
                 network_data = self.network_parser.parse_ip_addr(stdout)
@@ -7,9 +7,21 @@ used in hardware discovery.
 from .dmidecode import DmidecodeParser
 from .ipmi import IpmiParser
 from .network import NetworkParser
+from .structured import (
+    CpuTopology,
+    DiscoverySnapshot,
+    DmiRecord,
+    DmiTable,
+    StructuredParser,
+)
 
 __all__ = [
     "DmidecodeParser",
     "IpmiParser",
     "NetworkParser",
+    "StructuredParser",
+    "DiscoverySnapshot",
+    "DmiTable",
+    "DmiRecord",
+    "CpuTopology",
 ]
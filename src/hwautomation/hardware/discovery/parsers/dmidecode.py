@@ -1,7 +1,7 @@
 """DMI decode output parser for system hardware information."""
 
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from ..base import BaseParser, SystemInfo
 
@@ -26,6 +26,18 @@ class DmidecodeParser(BaseParser):
 
         return system_info
 
+    def parse_identity(self, output: str) -> Dict[str, Optional[str]]:
+        """Parse `dmidecode -s` system-uuid/serial/bios-version output."""
+        lines = [
+            line.strip() for line in output.split("\n") if not line.startswith("#")
+        ]
+        lines += [""] * (3 - len(lines))
+        return {
+            "system_uuid": lines[0] or None,
+            "serial_number": lines[1] or None,
+            "bios_version": lines[2] or None,
+        }
+
     def parse_bios_info(self, output: str) -> Dict[str, str]:
         """Parse dmidecode BIOS output."""
         bios_info = {}
@@ -0,0 +1,310 @@
+"""Single-pass structured parsers for discovery command output.
+
+Full ``dmidecode`` output (every DMI type at once), ``lscpu -J`` and
+``ip -j addr`` are each scanned exactly once into typed structures. The
+resulting snapshot is shared by hardware discovery and vendor detection so
+the same raw text is never split or searched twice.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..base import BaseParser, NetworkInterface, SystemInfo
+
+# DMI structure type numbers (SMBIOS specification)
+DMI_BIOS = 0
+DMI_SYSTEM = 1
+DMI_BASEBOARD = 2
+DMI_CHASSIS = 3
+DMI_PROCESSOR = 4
+DMI_MEMORY_DEVICE = 17
+
+_HANDLE_RE = re.compile(r"^Handle (0x[0-9A-Fa-f]+), DMI type (\d+)")
+
+
+@dataclass
+class DmiRecord:
+    """A single DMI structure from dmidecode output."""
+
+    handle: str
+    type_id: int
+    name: str = ""
+    properties: Dict[str, str] = field(default_factory=dict)
+    lists: Dict[str, List[str]] = field(default_factory=dict)
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get a property value by its dmidecode label."""
+        return self.properties.get(key, default)
+
+
+class DmiTable:
+    """All DMI structures from one dmidecode run, indexed by type."""
+
+    def __init__(self, records: Optional[List[DmiRecord]] = None):
+        """Initialize table from parsed records."""
+        self.records: List[DmiRecord] = []
+        self._by_type: Dict[int, List[DmiRecord]] = {}
+        for record in records or []:
+            self.add(record)
+
+    def add(self, record: DmiRecord):
+        """Add a record to the table."""
+        self.records.append(record)
+        self._by_type.setdefault(record.type_id, []).append(record)
+
+    def by_type(self, type_id: int) -> List[DmiRecord]:
+        """Get all records of a DMI type."""
+        return self._by_type.get(type_id, [])
+
+    def first(self, type_id: int) -> Optional[DmiRecord]:
+        """Get the first record of a DMI type."""
+        records = self._by_type.get(type_id)
+        return records[0] if records else None
+
+    def value(self, type_id: int, key: str) -> Optional[str]:
+        """Get a property from the first record of a DMI type."""
+        record = self.first(type_id)
+        return record.get(key) if record else None
+
+    def text(self, *type_ids: int) -> str:
+        """Join the property values of the given types for pattern matching."""
+        return " ".join(
+            value
+            for type_id in type_ids
+            for record in self.by_type(type_id)
+            for value in record.properties.values()
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+@dataclass
+class CpuTopology:
+    """CPU details from lscpu -J."""
+
+    model_name: Optional[str] = None
+    vendor_id: Optional[str] = None
+    architecture: Optional[str] = None
+    cpus: Optional[int] = None
+    sockets: Optional[int] = None
+    cores_per_socket: Optional[int] = None
+    threads_per_core: Optional[int] = None
+    flags: List[str] = field(default_factory=list)
+    fields: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class DiscoverySnapshot:
+    """Typed result of parsing one host's raw discovery output."""
+
+    dmi: DmiTable = field(default_factory=DmiTable)
+    cpu: Optional[CpuTopology] = None
+    interfaces: List[NetworkInterface] = field(default_factory=list)
+
+    def system_info(self) -> SystemInfo:
+        """Build SystemInfo from the DMI and CPU structures."""
+        dmi = self.dmi
+        info = SystemInfo(
+            manufacturer=dmi.value(DMI_SYSTEM, "Manufacturer"),
+            product_name=dmi.value(DMI_SYSTEM, "Product Name"),
+            serial_number=dmi.value(DMI_SYSTEM, "Serial Number"),
+            uuid=dmi.value(DMI_SYSTEM, "UUID"),
+            bios_version=dmi.value(DMI_BIOS, "Version"),
+            bios_date=dmi.value(DMI_BIOS, "Release Date"),
+            chassis_type=dmi.value(DMI_CHASSIS, "Type"),
+        )
+
+        if self.cpu:
+            info.cpu_model = self.cpu.model_name
+            info.cpu_cores = self.cpu.cpus
+        else:
+            processor = dmi.first(DMI_PROCESSOR)
+            if processor:
+                info.cpu_model = processor.get("Version")
+                cores = [
+                    _to_int(p.get("Thread Count")) for p in dmi.by_type(DMI_PROCESSOR)
+                ]
+                if all(cores):
+                    info.cpu_cores = sum(cores)
+
+        return info
+
+    def vendor_text(self) -> str:
+        """Text used for vendor pattern matching (system and baseboard)."""
+        return self.dmi.text(DMI_SYSTEM, DMI_BASEBOARD)
+
+    def bios_text(self) -> str:
+        """Text used for BIOS vendor pattern matching."""
+        return self.dmi.text(DMI_BIOS)
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    """Parse an integer, returning None on failure."""
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _cidr_to_netmask(prefix: int) -> str:
+    """Convert an IPv4 prefix length to a dotted netmask."""
+    mask = (0xFFFFFFFF << (32 - prefix)) & 0xFFFFFFFF
+    return ".".join(str((mask >> shift) & 0xFF) for shift in (24, 16, 8, 0))
+
+
+class StructuredParser(BaseParser):
+    """Single-pass parser for full dmidecode and JSON tool output."""
+
+    def parse_dmidecode(self, output: str) -> DmiTable:
+        """
+        Parse complete dmidecode output into a DmiTable in one scan.
+
+        Args:
+            output: Output of ``dmidecode`` (all types) or ``dmidecode -t ...``
+
+        Returns:
+            DmiTable indexed by DMI type
+        """
+        table = DmiTable()
+        record: Optional[DmiRecord] = None
+        expect_name = False
+        list_key: Optional[str] = None
+
+        for line in output.splitlines():
+            if not line:
+                record = None
+                list_key = None
+                expect_name = False
+                continue
+
+            if line[0] == "H":
+                match = _HANDLE_RE.match(line)
+                if match:
+                    record = DmiRecord(
+                        handle=match.group(1), type_id=int(match.group(2))
+                    )
+                    table.add(record)
+                    expect_name = True
+                    list_key = None
+                    continue
+
+            if record is None:
+                continue
+
+            if expect_name:
+                record.name = line.strip()
+                expect_name = False
+                continue
+
+            if line.startswith("\t\t"):
+                if list_key is not None:
+                    record.lists[list_key].append(line.strip())
+                continue
+
+            if line[0] == "\t":
+                key, sep, value = line[1:].partition(":")
+                if not sep:
+                    continue
+                value = value.strip()
+                if value:
+                    record.properties[key] = value
+                    list_key = None
+                else:
+                    list_key = key
+                    record.lists[key] = []
+
+        return table
+
+    def parse_lscpu_json(self, output: str) -> CpuTopology:
+        """
+        Parse ``lscpu -J`` output.
+
+        Handles both the flat field list and the nested ``children`` layout
+        used by newer util-linux releases.
+        """
+        data = json.loads(output)
+        fields: Dict[str, str] = {}
+
+        def walk(entries: Iterable[Dict[str, Any]]):
+            for entry in entries:
+                name = (entry.get("field") or "").rstrip(":")
+                if name and entry.get("data") is not None:
+                    fields[name] = str(entry["data"])
+                walk(entry.get("children", []))
+
+        walk(data.get("lscpu", []))
+
+        return CpuTopology(
+            model_name=fields.get("Model name"),
+            vendor_id=fields.get("Vendor ID"),
+            architecture=fields.get("Architecture"),
+            cpus=_to_int(fields.get("CPU(s)")),
+            sockets=_to_int(fields.get("Socket(s)")),
+            cores_per_socket=_to_int(fields.get("Core(s) per socket")),
+            threads_per_core=_to_int(fields.get("Thread(s) per core")),
+            flags=fields.get("Flags", "").split(),
+            fields=fields,
+        )
+
+    def parse_ip_json(self, output: str) -> List[NetworkInterface]:
+        """Parse ``ip -j addr`` output into NetworkInterface objects."""
+        interfaces = []
+        for link in json.loads(output):
+            interface = NetworkInterface(
+                name=link.get("ifname", ""),
+                mac_address=(
+                    link.get("address", "") if link.get("link_type") == "ether" else ""
+                ),
+                state="up" if "UP" in link.get("flags", []) else "down",
+            )
+            for addr in link.get("addr_info", []):
+                if addr.get("family") == "inet":
+                    interface.ip_address = addr.get("local")
+                    if addr.get("prefixlen") is not None:
+                        interface.netmask = _cidr_to_netmask(int(addr["prefixlen"]))
+                    break
+            interfaces.append(interface)
+        return interfaces
+
+    def parse_snapshot(
+        self,
+        dmidecode: Optional[str] = None,
+        lscpu_json: Optional[str] = None,
+        ip_json: Optional[str] = None,
+    ) -> DiscoverySnapshot:
+        """
+        Parse whichever raw outputs are available into one snapshot.
+
+        Malformed JSON for an individual tool is logged and skipped so one
+        bad output never loses the rest of the snapshot.
+        """
+        snapshot = DiscoverySnapshot()
+        if dmidecode:
+            snapshot.dmi = self.parse_dmidecode(dmidecode)
+        for attr, raw, parse in (
+            ("cpu", lscpu_json, self.parse_lscpu_json),
+            ("interfaces", ip_json, self.parse_ip_json),
+        ):
+            if not raw:
+                continue
+            try:
+                setattr(snapshot, attr, parse(raw))
+            except (ValueError, TypeError, AttributeError) as e:
+                self.logger.warning(f"Failed to parse {attr} JSON output: {e}")
+        return snapshot
+
+    def parse(self, output: str) -> Dict[str, Any]:
+        """Parse dmidecode output into a dict of handle -> record fields."""
+        table = self.parse_dmidecode(output)
+        return {
+            record.handle: {
+                "type": record.type_id,
+                "name": record.name,
+                "properties": record.properties,
+                "lists": record.lists,
+            }
+            for record in table.records
+        }
@@ -0,0 +1,98 @@
+"""Database recording of hardware discovery results.
+
+This module persists HardwareDiscovery results into the servers table as
+they arrive, so multi-host discovery can stream results into the database
+without waiting for the whole fleet to finish.
+"""
+
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from ...logging import get_logger
+from .base import HardwareDiscovery
+
+logger = get_logger(__name__)
+
+
+class DiscoveryRecorder:
+    """Thread-safe writer of discovery results into the servers table."""
+
+    def __init__(self, db_helper, server_ids: Optional[Dict[str, str]] = None):
+        """
+        Initialize discovery recorder.
+
+        Args:
+            db_helper: DbHelper instance used for writes
+            server_ids: Optional mapping of discovered host to server_id;
+                hosts without a mapping are matched on ip_address
+        """
+        self.db_helper = db_helper
+        self.server_ids = server_ids or {}
+        self._lock = threading.Lock()
+        self.logger = get_logger(__name__)
+
+    def record(self, discovery: HardwareDiscovery) -> bool:
+        """
+        Persist a single discovery result.
+
+        Args:
+            discovery: Discovery result to record
+
+        Returns:
+            True if a server row was updated, False otherwise
+        """
+        with self._lock:
+            server_id = self._resolve_server_id(discovery.hostname)
+            if not server_id:
+                self.logger.debug(
+                    f"No server row for {discovery.hostname}, skipping record"
+                )
+                return False
+
+            self.db_helper.update_server_metadata(
+                server_id, **self._build_columns(discovery)
+            )
+            return True
+
+    def _resolve_server_id(self, host: str) -> Optional[str]:
+        """Find the server_id for a discovered host."""
+        if host in self.server_ids:
+            return self.server_ids[host]
+
+        table_name = self.db_helper._get_table_name()
+        row = self.db_helper.sql_db_worker.execute(
+            f"SELECT server_id FROM {table_name} WHERE ip_address = ?", (host,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _build_columns(self, discovery: HardwareDiscovery) -> Dict[str, object]:
+        """Map a discovery result onto servers table columns."""
+        system_info = discovery.system_info
+        columns: Dict[str, object] = {
+            "ssh_accessible": 1 if discovery.ssh_accessible else 0,
+            "hardware_validated": 0 if discovery.discovery_errors else 1,
+        }
+        if not discovery.ssh_accessible:
+            # Unreachable hosts keep the last time they were actually seen
+            return columns
+        columns["last_seen"] = datetime.now().isoformat()
+
+        if system_info.manufacturer:
+            columns["server_model"] = (
+                f"{system_info.manufacturer} {system_info.product_name or ''}".strip()
+            )
+        if system_info.cpu_model:
+            columns["cpu_model"] = system_info.cpu_model
+        if system_info.bios_version:
+            columns["firmware_version"] = system_info.bios_version
+        if system_info.device_type and system_info.device_type != "unknown":
+            columns["device_type"] = system_info.device_type
+        if discovery.ipmi_info and discovery.ipmi_info.ip_address:
+            columns["ipmi_address"] = discovery.ipmi_info.ip_address
+        if discovery.network_interfaces:
+            columns["network_interfaces"] = ",".join(
+                iface.name for iface in discovery.network_interfaces
+            )
+
+        return columns
@@ -27,6 +27,18 @@ class SSHCommandRunner:
         """Run dmidecode command for specific table type."""
         return self.run_command(f"dmidecode -t {table_type}", use_sudo=True)
 
+    def run_dmidecode_all(self) -> Tuple[str, str, int]:
+        """Run dmidecode once for every DMI type."""
+        return self.run_command("dmidecode", use_sudo=True)
+
+    def get_identity_fingerprint(self) -> Tuple[str, str, int]:
+        """Get system UUID, serial number and BIOS version in one call."""
+        return self.run_command(
+            "sh -c 'dmidecode -s system-uuid; dmidecode -s system-serial-number; "
+            "dmidecode -s bios-version'",
+            use_sudo=True,
+        )
+
     def run_ipmitool(self, subcommand: str) -> Tuple[str, str, int]:
         """Run ipmitool command."""
         return self.run_command(f"ipmitool {subcommand}")
@@ -50,10 +62,18 @@ class SSHCommandRunner:
         """Get network interface information."""
         return self.run_command("ip addr show")
 
+    def get_network_interfaces_json(self) -> Tuple[str, str, int]:
+        """Get network interface information as JSON."""
+        return self.run_command("ip -j addr show")
+
     def get_cpu_info(self) -> Tuple[str, str, int]:
         """Get CPU information."""
         return self.run_command("lscpu")
 
+    def get_cpu_info_json(self) -> Tuple[str, str, int]:
+        """Get CPU information as JSON."""
+        return self.run_command("lscpu -J")
+
     def get_memory_info(self) -> Tuple[str, str, int]:
         """Get memory information."""
         return self.run_command("free -h")
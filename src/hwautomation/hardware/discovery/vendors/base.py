@@ -43,6 +43,10 @@ class BaseVendorHandler(BaseVendorDiscovery):
 
         return vendor_info
 
+    def parse_collected_output(self, outputs: Dict[str, str]) -> Dict[str, Any]:
+        """Parse vendor tool output gathered by the one-shot collector."""
+        return {}
+
     @abstractmethod
     def _run_vendor_discovery(self, errors: list) -> Dict[str, Any]:
         """Run vendor-specific discovery commands."""
@@ -44,6 +44,19 @@ class DellDiscovery(BaseVendorHandler):
 
         return dell_info
 
+    def parse_collected_output(self, outputs: Dict[str, str]) -> Dict[str, Any]:
+        """Parse OpenManage and RACADM output gathered by the one-shot collector."""
+        dell_info: Dict[str, Any] = {}
+        if "dell_chassis" in outputs:
+            dell_info.update(self._parse_dell_chassis_info(outputs["dell_chassis"]))
+        for key, name in (
+            ("racadm_nic", "nic_config"),
+            ("racadm_topology", "server_topology"),
+        ):
+            if key in outputs:
+                dell_info[name] = outputs[key].strip()
+        return dell_info
+
     def _get_chassis_info(self, errors: list) -> Dict[str, Any]:
         """Get chassis information using omreport."""
         stdout, stderr, exit_code = self.ssh_runner.run_command(
@@ -41,6 +41,12 @@ class HPEDiscovery(BaseVendorHandler):
 
         return hpe_info
 
+    def parse_collected_output(self, outputs: Dict[str, str]) -> Dict[str, Any]:
+        """Parse controller output gathered by the one-shot collector."""
+        if "hpe_controller" in outputs:
+            return self._parse_hpe_controller_info(outputs["hpe_controller"])
+        return {}
+
     def _find_hpe_tool(self) -> str:
         """Find available HPE management tool."""
         hpe_tools = ["hpssacli", "ssacli", "hpacucli"]
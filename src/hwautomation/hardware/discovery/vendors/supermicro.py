@@ -48,6 +48,18 @@ class SupermicroDiscovery(BaseVendorHandler):
 
         return supermicro_info
 
+    def parse_collected_output(self, outputs: Dict[str, str]) -> Dict[str, Any]:
+        """Parse SUM output gathered by the one-shot collector."""
+        supermicro_info: Dict[str, Any] = {}
+        for key, parse in (
+            ("sum_system", self._parse_sum_system_info),
+            ("sum_bios", self._parse_sum_bios_info),
+            ("sum_bmc", self._parse_sum_bmc_info),
+        ):
+            if key in outputs:
+                supermicro_info.update(parse(outputs[key]))
+        return supermicro_info
+
     def _find_sum_tool(self) -> str:
         """Find available SUM tool variant."""
         sum_tools = ["sum", "sumtool", "/opt/supermicro/sum/sum"]
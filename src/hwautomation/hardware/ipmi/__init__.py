@@ -17,7 +17,25 @@ from .base import (
     PowerStatus,
     SensorReading,
 )
+from .capabilities import BMCCapabilities, BMCCapabilityCache, get_capability_cache
+from .console import ConsoleBuffer, SOLConsoleService, get_console_service
+from .ipam import AddressPoolExhaustedError, IPMIAddressAllocator, IPMILease
 from .manager import IpmiManager
+from .operations.bulk import BulkHostResult, BulkIPMIExecutor, BulkResult
+from .operations.plan import IPMIConfigPlan, PlanResult
+from .telemetry import (
+    SensorTelemetryCollector,
+    SensorTelemetryStore,
+    TelemetryAlert,
+    TelemetryPoint,
+)
+from .transport import (
+    IPMITransport,
+    IpmitoolTransport,
+    NativeIPMITransport,
+    get_default_transport,
+    set_default_transport,
+)
 
 __all__ = [
     "IpmiManager",
@@ -32,4 +50,27 @@ __all__ = [
     "IPMICommandError",
     "IPMIConnectionError",
     "IPMIConfigurationError",
+    "IPMITransport",
+    "IpmitoolTransport",
+    "NativeIPMITransport",
+    "get_default_transport",
+    "set_default_transport",
+    "BMCCapabilities",
+    "BMCCapabilityCache",
+    "get_capability_cache",
+    "ConsoleBuffer",
+    "SOLConsoleService",
+    "get_console_service",
+    "AddressPoolExhaustedError",
+    "IPMIAddressAllocator",
+    "IPMILease",
+    "BulkIPMIExecutor",
+    "BulkHostResult",
+    "BulkResult",
+    "IPMIConfigPlan",
+    "PlanResult",
+    "SensorTelemetryCollector",
+    "SensorTelemetryStore",
+    "TelemetryAlert",
+    "TelemetryPoint",
 ]
@@ -0,0 +1,692 @@
+"""Per-BMC capability fingerprints.
+
+Vendor detection used to issue ``mc info`` every time a vendor handler was
+needed, and configuration and validation each detected again. This module
+detects a BMC's capabilities once (vendor, firmware revision, IPMI channels
+and Redfish availability) and keeps the result keyed by BMC address plus
+GUID, optionally persisted in the database. A cached record is revalidated
+with a cheap identity check (Get Device ID and the BMC GUID) and full
+detection only runs again when the GUID or firmware revision changes.
+
+The same record carries what Redfish clients learn about the BMC (Redfish
+version, supported features, BIOS attribute registry ID), so Redfish
+discovery and BIOS method selection can look a BMC up by address instead of
+probing it again. Redfish details are dropped when the firmware changes and
+re-learned by the next Redfish request.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+import warnings
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from hwautomation.logging import get_logger
+
+from .base import IPMICommand, IPMICredentials, IPMIVendor
+from .transport import IPMITransport, get_default_transport
+
+logger = get_logger(__name__)
+
+# IANA enterprise numbers reported in Get Device ID
+VENDOR_IDS = {
+    11: IPMIVendor.HP_ILO,
+    674: IPMIVendor.DELL_IDRAC,
+    10876: IPMIVendor.SUPERMICRO,
+    47196: IPMIVendor.HP_ILO,
+}
+
+# Channel medium types from Get Channel Info (IPMI 2.0 table 6-3)
+CHANNEL_MEDIUMS = {
+    0x01: "ipmb",
+    0x02: "icmb",
+    0x03: "icmb",
+    0x04: "lan",
+    0x05: "serial",
+    0x06: "lan",
+    0x07: "pci-smbus",
+    0x08: "smbus",
+    0x09: "smbus",
+    0x0A: "usb",
+    0x0B: "usb",
+    0x0C: "system",
+}
+
+# Channels 0x1-0xB are implementation specific; 0x0 is the primary IPMB
+CHANNEL_NUMBERS = range(0x01, 0x0C)
+
+# Fields describing the BMC's Redfish service
+REDFISH_FIELDS = (
+    "redfish_available",
+    "redfish_version",
+    "redfish_features",
+    "bios_registry_id",
+    "redfish_checked_at",
+)
+
+
+def vendor_from_mc_info(output: str) -> IPMIVendor:
+    """Identify the BMC vendor from ``mc info`` output.
+
+    Args:
+        output: Raw ``mc info`` output
+
+    Returns:
+        Detected vendor, or UNKNOWN
+    """
+    fields = parse_mc_info(output)
+    try:
+        manufacturer_id = int(fields.get("manufacturer id", "").split()[0])
+    except (IndexError, ValueError):
+        manufacturer_id = None
+    if manufacturer_id in VENDOR_IDS:
+        return VENDOR_IDS[manufacturer_id]
+
+    output = output.lower()
+    if "supermicro" in output or "super micro" in output:
+        return IPMIVendor.SUPERMICRO
+    elif "hp" in output or "hewlett" in output or "ilo" in output:
+        return IPMIVendor.HP_ILO
+    elif "dell" in output or "idrac" in output:
+        return IPMIVendor.DELL_IDRAC
+    return IPMIVendor.UNKNOWN
+
+
+def parse_mc_info(output: str) -> Dict[str, str]:
+    """Parse ``key : value`` lines of ``mc info`` output (keys lowercased)."""
+    fields: Dict[str, str] = {}
+    for line in output.splitlines():
+        key, sep, value = line.partition(":")
+        if sep and key.strip() and value.strip():
+            fields.setdefault(key.strip().lower(), value.strip())
+    return fields
+
+
+def parse_raw_output(output: str) -> bytes:
+    """Parse the hex bytes printed by ``ipmitool raw``."""
+    try:
+        return bytes(int(token, 16) for token in output.split())
+    except ValueError:
+        return b""
+
+
+def format_guid(data: bytes) -> str:
+    """Format a 16-byte IPMI GUID (SMBIOS byte order) as a UUID string."""
+    if len(data) < 16:
+        return ""
+    data = data[:16]
+    fields = (
+        data[3::-1].hex(),
+        data[5:3:-1].hex(),
+        data[7:5:-1].hex(),
+        data[8:10].hex(),
+        data[10:16].hex(),
+    )
+    return "-".join(fields)
+
+
+def probe_redfish_service(host: str, timeout: float = 5.0) -> bool:
+    """Check whether a BMC serves the Redfish service root.
+
+    The service root does not require authentication, so this is a single
+    anonymous GET.
+
+    Args:
+        host: BMC address
+        timeout: Request timeout in seconds
+
+    Returns:
+        True if a Redfish service root answered
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            response = requests.get(
+                f"https://{host}/redfish/v1/", timeout=timeout, verify=False
+            )
+    except requests.RequestException:
+        return False
+    if response.status_code == 401:
+        return True
+    if response.status_code != 200:
+        return False
+    try:
+        return "RedfishVersion" in response.json()
+    except ValueError:
+        return False
+
+
+@dataclass
+class BMCCapabilities:
+    """Detected capabilities of one BMC."""
+
+    ip_address: str
+    guid: str
+    port: int = 623
+    vendor: IPMIVendor = IPMIVendor.UNKNOWN
+    manufacturer: Optional[str] = None
+    manufacturer_id: Optional[str] = None
+    product_id: Optional[str] = None
+    firmware_revision: Optional[str] = None
+    ipmi_version: Optional[str] = None
+    channels: Dict[int, str] = field(default_factory=dict)
+    redfish_available: Optional[bool] = None
+    redfish_version: Optional[str] = None
+    redfish_features: Dict[str, bool] = field(default_factory=dict)
+    bios_registry_id: Optional[str] = None
+    redfish_checked_at: Optional[str] = None
+    detected_at: Optional[str] = None
+    checked_at: Optional[str] = None
+
+    @property
+    def lan_channels(self) -> List[int]:
+        """Channel numbers whose medium is LAN."""
+        return sorted(n for n, medium in self.channels.items() if medium == "lan")
+
+    @property
+    def preferred_protocol(self) -> Optional[str]:
+        """Protocol to manage the BMC with ("redfish", "ipmi" or None)."""
+        if self.redfish_available:
+            return "redfish"
+        if self.guid or self.ipmi_version:
+            return "ipmi"
+        return None
+
+    def clear_redfish(self) -> None:
+        """Forget the Redfish details so they are learned again."""
+        self.redfish_available = None
+        self.redfish_version = None
+        self.redfish_features = {}
+        self.bios_registry_id = None
+        self.redfish_checked_at = None
+
+    def matches(self, guid: str, firmware_revision: Optional[str]) -> bool:
+        """Whether a freshly read identity still describes this BMC."""
+        return (self.guid, self.firmware_revision) == (guid, firmware_revision)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["vendor"] = self.vendor.value
+        data["channels"] = {str(n): medium for n, medium in self.channels.items()}
+        data["preferred_protocol"] = self.preferred_protocol
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BMCCapabilities":
+        """Create from a dictionary produced by to_dict."""
+        data = dict(data)
+        data.pop("preferred_protocol", None)
+        data["vendor"] = IPMIVendor(data.get("vendor", IPMIVendor.UNKNOWN.value))
+        data["channels"] = {
+            int(n): medium for n, medium in (data.get("channels") or {}).items()
+        }
+        return cls(**data)
+
+
+class BMCCapabilityCache:
+    """Detects BMC capabilities once and reuses them across operations."""
+
+    def __init__(
+        self,
+        transport: Optional[IPMITransport] = None,
+        db_helper=None,
+        timeout: int = 30,
+        revalidate_interval: float = 300.0,
+        redfish_probe: Optional[Callable[[str], bool]] = probe_redfish_service,
+        redfish_ttl: float = 86400.0,
+    ):
+        """Initialize capability cache.
+
+        Args:
+            transport: IPMI transport (defaults to the ipmitool transport)
+            db_helper: DbHelper whose database holds the bmc_capabilities
+                table; without it records are kept in memory only
+            timeout: Command timeout in seconds
+            revalidate_interval: Seconds a record is trusted before its GUID
+                and firmware revision are checked again (0 checks every time)
+            redfish_probe: Returns whether a BMC address serves Redfish;
+                None skips the Redfish check
+            redfish_ttl: Seconds recorded Redfish details are trusted by
+                address lookups before they are learned again
+        """
+        self.transport = transport or get_default_transport()
+        self.db_helper = db_helper
+        self.timeout = timeout
+        self.revalidate_interval = revalidate_interval
+        self.redfish_probe = redfish_probe
+        self.redfish_ttl = redfish_ttl
+
+        self._records: Dict[Tuple[str, int], BMCCapabilities] = {}
+        self._checked: Dict[Tuple[str, int], float] = {}
+        self._fetch_locks: Dict[Tuple[str, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        credentials: IPMICredentials,
+        refresh: bool = False,
+        transport: Optional[IPMITransport] = None,
+        timeout: Optional[int] = None,
+    ) -> Optional[BMCCapabilities]:
+        """Get the capabilities of a BMC, detecting them only when needed.
+
+        Args:
+            credentials: IPMI connection credentials
+            refresh: Re-run full detection even if the identity is unchanged
+            transport: IPMI transport for detection (defaults to the cache's)
+            timeout: Command timeout for detection (defaults to the cache's)
+
+        Returns:
+            Capabilities, or None if the BMC cannot be reached and nothing
+            is cached for it
+        """
+        key = (credentials.ip_address, credentials.port)
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+
+        with fetch_lock:
+            cached = self._records.get(key)
+            checked = self._checked.get(key, 0.0)
+            if (
+                cached
+                and not refresh
+                and time.monotonic() - checked < self.revalidate_interval
+            ):
+                return cached
+
+            execute = self._executor(transport, timeout)
+            identity = self._read_identity(credentials, execute)
+            if identity is None:
+                if cached:
+                    logger.debug(
+                        f"Using unverified capabilities for {credentials.ip_address}"
+                    )
+                return cached
+            guid, mc_info = identity
+            firmware = parse_mc_info(mc_info).get("firmware revision")
+
+            previous = cached
+            if cached is None or cached.guid != guid:
+                previous = cached or self._load_address(credentials.ip_address)
+                cached = self._load(credentials, guid)
+            if cached and not refresh and cached.matches(guid, firmware):
+                cached.checked_at = datetime.now().isoformat()
+            else:
+                if cached:
+                    logger.info(
+                        f"BMC {credentials.ip_address} identity changed "
+                        f"(GUID {cached.guid or '-'} -> {guid or '-'}, firmware "
+                        f"{cached.firmware_revision} -> {firmware}), re-detecting"
+                    )
+                # Redfish details recorded before the BMC was identified
+                recorded = previous if previous and not previous.guid else None
+                cached = self._detect(credentials, guid, mc_info, execute, recorded)
+            self._save(cached)
+
+            with self._lock:
+                self._records[key] = cached
+                self._checked[key] = time.monotonic()
+            return cached
+
+    def get_vendor(
+        self,
+        credentials: IPMICredentials,
+        transport: Optional[IPMITransport] = None,
+        timeout: Optional[int] = None,
+    ) -> IPMIVendor:
+        """Get the vendor of a BMC (UNKNOWN if it cannot be detected)."""
+        capabilities = self.get(credentials, transport=transport, timeout=timeout)
+        return capabilities.vendor if capabilities else IPMIVendor.UNKNOWN
+
+    def lookup(self, ip_address: str) -> Optional[BMCCapabilities]:
+        """Get the recorded capabilities of a BMC without contacting it.
+
+        Redfish details older than ``redfish_ttl`` are cleared, so callers
+        treat them as unknown and probe again.
+
+        Args:
+            ip_address: BMC address
+
+        Returns:
+            Recorded capabilities, or None if nothing is known about the BMC
+        """
+        with self._lock:
+            record = self._find(ip_address)
+        if record is None:
+            record = self._load_address(ip_address)
+            if record is None:
+                return None
+            with self._lock:
+                record = self._records.setdefault(
+                    (record.ip_address, record.port), record
+                )
+        if not self._redfish_fresh(record):
+            record.clear_redfish()
+        return record
+
+    def update_redfish(
+        self,
+        ip_address: str,
+        available: Optional[bool] = None,
+        version: Optional[str] = None,
+        features: Optional[Dict[str, bool]] = None,
+        bios_registry_id: Optional[str] = None,
+    ) -> BMCCapabilities:
+        """Record what a Redfish client learned about a BMC.
+
+        Values left as None are kept; features are merged into the recorded
+        ones. A record is created for BMCs not identified over IPMI yet.
+
+        Args:
+            ip_address: BMC address
+            available: Whether the BMC serves Redfish
+            version: RedfishVersion from the service root
+            features: Supported features, e.g. ``expand``, ``sessions``,
+                ``events`` and ``push_update``
+            bios_registry_id: BIOS AttributeRegistry ID
+
+        Returns:
+            Updated capabilities
+        """
+        record = self.lookup(ip_address) or BMCCapabilities(
+            ip_address=ip_address, guid=""
+        )
+        with self._lock:
+            fresh = self._redfish_fresh(record) and record.redfish_checked_at
+            changed = False
+            for name, value in (
+                ("redfish_available", available),
+                ("redfish_version", version),
+                ("bios_registry_id", bios_registry_id),
+            ):
+                if value is not None and getattr(record, name) != value:
+                    setattr(record, name, value)
+                    changed = True
+            if version is not None and record.redfish_available is None:
+                record.redfish_available = True
+                changed = True
+            for name, value in (features or {}).items():
+                if record.redfish_features.get(name) != value:
+                    record.redfish_features[name] = value
+                    changed = True
+            self._records.setdefault((record.ip_address, record.port), record)
+            if fresh and not changed:
+                return record
+            record.redfish_checked_at = datetime.now().isoformat()
+            if record.checked_at is None:
+                record.checked_at = record.redfish_checked_at
+                record.detected_at = record.redfish_checked_at
+        self._save(record)
+        return record
+
+    def forget_redfish(self, ip_address: str) -> None:
+        """Drop the Redfish details of a BMC, e.g. after a firmware update.
+
+        Args:
+            ip_address: BMC address
+        """
+        record = self.lookup(ip_address)
+        if record is None:
+            return
+        with self._lock:
+            record.clear_redfish()
+        self._save(record)
+
+    def invalidate(self, credentials: Optional[IPMICredentials] = None) -> None:
+        """Force revalidation of one BMC, or of all BMCs.
+
+        Persisted records are kept; they are reused if the identity check
+        still matches.
+
+        Args:
+            credentials: BMC to revalidate; None revalidates every BMC
+        """
+        with self._lock:
+            if credentials is None:
+                self._records.clear()
+                self._checked.clear()
+            else:
+                key = (credentials.ip_address, credentials.port)
+                self._records.pop(key, None)
+                self._checked.pop(key, None)
+
+    def _executor(
+        self, transport: Optional[IPMITransport] = None, timeout: Optional[int] = None
+    ) -> Callable:
+        """Command runner over the given transport and timeout or the cache's."""
+        transport = transport or self.transport
+        timeout = self.timeout if timeout is None else timeout
+
+        def execute(credentials: IPMICredentials, command):
+            return transport.execute(credentials, command, timeout=timeout)
+
+        return execute
+
+    def _read_identity(
+        self, credentials: IPMICredentials, execute: Callable
+    ) -> Optional[Tuple[str, str]]:
+        """Read the BMC GUID and ``mc info`` output, or None if unreachable."""
+        try:
+            result = execute(credentials, IPMICommand.MC_INFO)
+            if result.returncode != 0:
+                logger.warning(
+                    f"MC info failed on {credentials.ip_address}: {result.stderr}"
+                )
+                return None
+            mc_info = result.stdout
+
+            guid = ""
+            # Get Device GUID, falling back to Get System GUID
+            for command in ("0x08", "0x37"):
+                raw = execute(credentials, ["raw", "0x06", command])
+                if raw.returncode == 0:
+                    guid = format_guid(parse_raw_output(raw.stdout))
+                    if guid:
+                        break
+            return guid, mc_info
+        except Exception as e:
+            logger.warning(
+                f"BMC identity check failed on {credentials.ip_address}: {e}"
+            )
+            return None
+
+    def _detect(
+        self,
+        credentials: IPMICredentials,
+        guid: str,
+        mc_info: str,
+        execute: Callable,
+        recorded: Optional[BMCCapabilities] = None,
+    ) -> BMCCapabilities:
+        """Run full capability detection.
+
+        Redfish details in ``recorded`` are kept instead of probing again.
+        """
+        fields = parse_mc_info(mc_info)
+        now = datetime.now().isoformat()
+        capabilities = BMCCapabilities(
+            ip_address=credentials.ip_address,
+            port=credentials.port,
+            guid=guid,
+            vendor=vendor_from_mc_info(mc_info),
+            manufacturer=fields.get("manufacturer name"),
+            manufacturer_id=fields.get("manufacturer id"),
+            product_id=fields.get("product id"),
+            firmware_revision=fields.get("firmware revision"),
+            ipmi_version=fields.get("ipmi version"),
+            channels=self._detect_channels(credentials, execute),
+            detected_at=now,
+            checked_at=now,
+        )
+        if recorded is not None and recorded.redfish_available is not None:
+            _merge_redfish(capabilities, recorded)
+        elif self.redfish_probe is not None:
+            try:
+                capabilities.redfish_available = bool(
+                    self.redfish_probe(credentials.ip_address)
+                )
+                capabilities.redfish_checked_at = now
+            except Exception as e:
+                # Unknown rather than unavailable, so the next lookup probes again
+                logger.debug(f"Redfish probe failed on {credentials.ip_address}: {e}")
+
+        logger.info(
+            f"Detected BMC {credentials.ip_address}: {capabilities.vendor.value}, "
+            f"firmware {capabilities.firmware_revision}, "
+            f"LAN channels {capabilities.lan_channels}, "
+            f"Redfish {capabilities.redfish_available}"
+        )
+        return capabilities
+
+    def _detect_channels(
+        self, credentials: IPMICredentials, execute: Callable
+    ) -> Dict[int, str]:
+        """Map implemented channel numbers to their medium type."""
+        channels: Dict[int, str] = {}
+        for number in CHANNEL_NUMBERS:
+            try:
+                result = execute(
+                    credentials, ["raw", "0x06", "0x42", f"0x{number:02x}"]
+                )
+            except Exception as e:
+                logger.debug(f"Channel {number} probe failed: {e}")
+                continue
+            data = parse_raw_output(result.stdout) if result.returncode == 0 else b""
+            if len(data) >= 2:
+                medium = data[1] & 0x7F
+                channels[data[0] & 0x0F] = CHANNEL_MEDIUMS.get(
+                    medium, f"0x{medium:02x}"
+                )
+        return channels
+
+    def _find(self, ip_address: str) -> Optional[BMCCapabilities]:
+        """In-memory record for an address (caller holds the lock)."""
+        for (address, _), record in self._records.items():
+            if address == ip_address:
+                return record
+        return None
+
+    def _redfish_fresh(self, record: BMCCapabilities) -> bool:
+        """Whether the record's Redfish details are recent enough to use."""
+        if record.redfish_checked_at is None:
+            # Details without a timestamp cannot be aged, so they are stale
+            return record.redfish_available is None
+        try:
+            checked = datetime.fromisoformat(record.redfish_checked_at)
+        except ValueError:
+            return False
+        return (datetime.now() - checked).total_seconds() < self.redfish_ttl
+
+    @property
+    def _db(self):
+        return self.db_helper.sql_db_worker
+
+    def _load(
+        self, credentials: IPMICredentials, guid: str
+    ) -> Optional[BMCCapabilities]:
+        """Load a persisted record for a BMC address and GUID."""
+        if self.db_helper is None:
+            return None
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT capabilities_json FROM bmc_capabilities "
+                    "WHERE ip_address = ? AND port = ? AND guid = ?",
+                    (credentials.ip_address, credentials.port, guid),
+                ).fetchone()
+            return BMCCapabilities.from_dict(json.loads(row[0])) if row else None
+        except Exception as e:
+            logger.warning(f"Failed to load BMC capabilities: {e}")
+            return None
+
+    def _load_address(self, ip_address: str) -> Optional[BMCCapabilities]:
+        """Load the most recently checked persisted record for an address."""
+        if self.db_helper is None:
+            return None
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT capabilities_json FROM bmc_capabilities "
+                    "WHERE ip_address = ? ORDER BY checked_at DESC LIMIT 1",
+                    (ip_address,),
+                ).fetchone()
+            return BMCCapabilities.from_dict(json.loads(row[0])) if row else None
+        except Exception as e:
+            logger.warning(f"Failed to load BMC capabilities: {e}")
+            return None
+
+    def _save(self, capabilities: BMCCapabilities) -> None:
+        """Persist a record, replacing earlier records for the address."""
+        if self.db_helper is None:
+            return
+        redfish = capabilities.redfish_available
+        try:
+            with self._lock:
+                # A new GUID at the same address is a replaced BMC
+                self._db.execute(
+                    "DELETE FROM bmc_capabilities "
+                    "WHERE ip_address = ? AND port = ? AND guid != ?",
+                    (capabilities.ip_address, capabilities.port, capabilities.guid),
+                )
+                self._db.execute(
+                    "INSERT OR REPLACE INTO bmc_capabilities (ip_address, port, "
+                    "guid, vendor, firmware_revision, redfish_available, "
+                    "redfish_version, bios_registry_id, preferred_protocol, "
+                    "capabilities_json, detected_at, checked_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        capabilities.ip_address,
+                        capabilities.port,
+                        capabilities.guid,
+                        capabilities.vendor.value,
+                        capabilities.firmware_revision,
+                        None if redfish is None else int(redfish),
+                        capabilities.redfish_version,
+                        capabilities.bios_registry_id,
+                        capabilities.preferred_protocol,
+                        json.dumps(capabilities.to_dict()),
+                        capabilities.detected_at,
+                        capabilities.checked_at,
+                    ),
+                )
+                self._db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to persist BMC capabilities: {e}")
+
+
+def _merge_redfish(target: BMCCapabilities, source: BMCCapabilities) -> None:
+    """Copy Redfish details from ``source`` where ``target`` has none."""
+    for name in REDFISH_FIELDS:
+        if getattr(target, name) in (None, {}):
+            setattr(target, name, getattr(source, name))
+
+
+_capability_cache: Optional[BMCCapabilityCache] = None
+_capability_cache_lock = threading.Lock()
+
+
+def get_capability_cache() -> BMCCapabilityCache:
+    """Process-wide capability cache shared by IPMI, Redfish and BIOS code.
+
+    Records are persisted in the database at ``DATABASE_PATH`` when it is
+    set and kept in memory otherwise.
+    """
+    global _capability_cache
+    with _capability_cache_lock:
+        if _capability_cache is None:
+            db_helper = None
+            db_path = os.getenv("DATABASE_PATH")
+            if db_path:
+                from hwautomation.database.helper import DbHelper
+
+                db_helper = DbHelper(db_path)
+                atexit.register(db_helper.close)
+            _capability_cache = BMCCapabilityCache(db_helper=db_helper)
+        return _capability_cache
@@ -0,0 +1,548 @@
+"""Serial-over-LAN console capture.
+
+Boot output during BIOS and firmware reboots is only visible on the serial
+console. ``SOLConsoleService`` keeps one ``ipmitool sol activate`` session
+per server and stores its output in a bounded ring buffer. Subscribers
+(such as the web UI) receive coalesced batches from a shared publisher and
+never slow the capture down: a subscriber that falls behind skips the
+oldest output and is told how much it missed. Workflows can wait for a
+console pattern, such as the end of POST, instead of sleeping.
+"""
+
+import atexit
+import codecs
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Pattern, Tuple, Union
+
+from hwautomation.logging import get_logger
+
+from .base import IPMICredentials
+from .transport import IpmitoolTransport
+
+logger = get_logger(__name__)
+
+# Setup-key prompts and boot handoff messages printed once POST finishes
+POST_COMPLETE_PATTERN = (
+    r"Press\s+<?(DEL|Del|F2|F11|F12|ESC)>?|Booting from|GNU GRUB|"
+    r"Loading Linux|login:"
+)
+
+# CSI sequences, charset selection and single-character escapes
+ANSI_ESCAPE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*[@-~]|[()][0-9A-Za-z]|[=>78cDEHM])")
+
+# Longest incomplete escape sequence held back between reads
+_MAX_PENDING_ESCAPE = 32
+
+ConsoleSink = Callable[[str, "ConsoleChunk"], None]
+
+
+def clean_console_text(text: str) -> str:
+    """Strip terminal escape sequences and normalize line endings."""
+    text = ANSI_ESCAPE.sub("", text)
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+@dataclass
+class ConsoleChunk:
+    """Console output read from a buffer offset."""
+
+    offset: int
+    text: str
+    dropped: int = 0
+
+    @property
+    def next_offset(self) -> int:
+        """Offset to read from next."""
+        return self.offset + len(self.text)
+
+    def to_dict(self) -> Dict[str, Union[int, str]]:
+        """Convert to dictionary."""
+        return {"offset": self.offset, "text": self.text, "dropped": self.dropped}
+
+
+class ConsoleBuffer:
+    """Bounded ring buffer of console text addressed by absolute offset."""
+
+    def __init__(self, max_chars: int = 256 * 1024):
+        """Initialize console buffer.
+
+        Args:
+            max_chars: Characters retained before the oldest output is dropped
+        """
+        self.max_chars = max_chars
+        self._chunks: Deque[Tuple[int, str]] = deque()
+        self._size = 0
+        self._start = 0
+        self._end = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def start(self) -> int:
+        """Offset of the oldest retained character."""
+        with self._condition:
+            return self._start
+
+    @property
+    def end(self) -> int:
+        """Offset just past the newest character."""
+        with self._condition:
+            return self._end
+
+    @property
+    def closed(self) -> bool:
+        """Whether the capture feeding this buffer has stopped."""
+        return self._closed
+
+    def append(self, text: str) -> None:
+        """Append console output, dropping the oldest output beyond the limit."""
+        if not text:
+            return
+        with self._condition:
+            self._chunks.append((self._end, text))
+            self._end += len(text)
+            self._size += len(text)
+            while self._size > self.max_chars:
+                offset, chunk = self._chunks[0]
+                excess = self._size - self.max_chars
+                if len(chunk) <= excess:
+                    self._chunks.popleft()
+                    self._size -= len(chunk)
+                    self._start = offset + len(chunk)
+                else:
+                    self._chunks[0] = (offset + excess, chunk[excess:])
+                    self._size -= excess
+                    self._start = offset + excess
+            self._condition.notify_all()
+
+    def read(self, offset: int = 0, limit: Optional[int] = None) -> ConsoleChunk:
+        """Read output from an offset.
+
+        Args:
+            offset: Absolute offset to read from; output older than the
+                buffer start is reported as dropped
+            limit: Maximum characters to return
+
+        Returns:
+            ConsoleChunk starting at the first available offset
+        """
+        with self._condition:
+            return self._read(offset, limit)
+
+    def _read(self, offset: int, limit: Optional[int]) -> ConsoleChunk:
+        dropped = max(0, self._start - offset)
+        offset = max(offset, self._start)
+        parts: List[str] = []
+        remaining = limit
+        for chunk_offset, text in self._chunks:
+            if chunk_offset + len(text) <= offset:
+                continue
+            piece = text[max(0, offset - chunk_offset) :]
+            if remaining is not None:
+                piece = piece[:remaining]
+                remaining -= len(piece)
+            parts.append(piece)
+            if remaining == 0:
+                break
+        return ConsoleChunk(offset=offset, text="".join(parts), dropped=dropped)
+
+    def wait_for(
+        self,
+        pattern: Union[str, Pattern[str]],
+        timeout: float,
+        since: Optional[int] = None,
+    ) -> Optional["re.Match[str]"]:
+        """Block until console output matches a pattern.
+
+        Args:
+            pattern: Regular expression searched in the output
+            timeout: Seconds to wait
+            since: Offset to search from (defaults to the current end, so
+                only new output matches)
+
+        Returns:
+            The match, or None on timeout or when the capture stops
+        """
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            scan_from = self._end if since is None else since
+            while True:
+                chunk = self._read(scan_from, None)
+                match = regex.search(chunk.text)
+                if match:
+                    return match
+                # Rescan a tail of the text so matches spanning reads are found
+                scan_from = max(chunk.offset, chunk.next_offset - 4096)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._closed:
+                    return None
+                self._condition.wait(remaining)
+
+    def close(self) -> None:
+        """Mark the capture as stopped and wake waiters."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def reopen(self) -> None:
+        """Mark the capture as running again."""
+        with self._condition:
+            self._closed = False
+
+
+class SOLCapture:
+    """Reads one server's serial-over-LAN session into a console buffer."""
+
+    def __init__(
+        self,
+        server_id: str,
+        credentials: IPMICredentials,
+        buffer: ConsoleBuffer,
+        transport: Optional[IpmitoolTransport] = None,
+        reconnect_delay: float = 5.0,
+        popen: Callable[..., subprocess.Popen] = subprocess.Popen,
+    ):
+        """Initialize SOL capture.
+
+        Args:
+            server_id: Server the console belongs to
+            credentials: IPMI connection credentials
+            buffer: Buffer receiving console output
+            transport: ipmitool transport used to build commands
+            reconnect_delay: Seconds between reconnects after the session drops
+            popen: Process factory (for testing)
+        """
+        self.server_id = server_id
+        self.credentials = credentials
+        self.buffer = buffer
+        self.transport = transport or IpmitoolTransport()
+        self.reconnect_delay = reconnect_delay
+        self.popen = popen
+        self.sessions = 0
+
+        self._process: Optional[subprocess.Popen] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the capture thread is active."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start capturing in a background thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self.buffer.reopen()
+        self._thread = threading.Thread(
+            target=self._run, name=f"sol-{self.server_id}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop capturing and deactivate the SOL session."""
+        self._stop.set()
+        with self._lock:
+            process = self._process
+        if process is not None and process.poll() is None:
+            process.terminate()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.buffer.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._deactivate()
+            try:
+                self._read_session()
+            except Exception as e:
+                logger.debug(f"SOL session for {self.server_id} failed: {e}")
+            if not self._stop.wait(self.reconnect_delay):
+                logger.debug(f"Reconnecting SOL session for {self.server_id}")
+        self._deactivate()
+        self.buffer.close()
+
+    def _deactivate(self) -> None:
+        """Close a stale SOL session (only one may be active per BMC)."""
+        try:
+            self.transport.execute(self.credentials, "sol deactivate", timeout=10)
+        except Exception as e:
+            logger.debug(f"SOL deactivate for {self.server_id} failed: {e}")
+
+    def _read_session(self) -> None:
+        process = self.popen(
+            self.transport.build_args(self.credentials, "sol activate"),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        with self._lock:
+            self._process = process
+        self.sessions += 1
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        try:
+            while not self._stop.is_set():
+                data = process.stdout.read1(4096)
+                if not data:
+                    break
+                text = pending + decoder.decode(data)
+                pending = ""
+                # Hold back an escape sequence split across reads
+                escape = text.rfind("\x1b")
+                if (
+                    escape >= 0
+                    and len(text) - escape < _MAX_PENDING_ESCAPE
+                    and not ANSI_ESCAPE.match(text, escape)
+                ):
+                    text, pending = text[:escape], text[escape:]
+                self.buffer.append(clean_console_text(text))
+        finally:
+            self.buffer.append(clean_console_text(pending + decoder.decode(b"", True)))
+            if process.poll() is None:
+                process.terminate()
+            with self._lock:
+                self._process = None
+
+
+class _Subscription:
+    """Delivery cursor of one console subscriber."""
+
+    def __init__(self, server_id: str, sink: ConsoleSink, offset: int):
+        self.server_id = server_id
+        self.sink = sink
+        self.offset = offset
+        self.in_flight = False
+        self.active = True
+
+
+class SOLConsoleService:
+    """Per-server SOL captures with buffered fan-out to subscribers."""
+
+    def __init__(
+        self,
+        transport: Optional[IpmitoolTransport] = None,
+        buffer_size: int = 256 * 1024,
+        flush_interval: float = 0.25,
+        max_batch: int = 16 * 1024,
+        max_workers: int = 8,
+        popen: Callable[..., subprocess.Popen] = subprocess.Popen,
+    ):
+        """Initialize console service.
+
+        Args:
+            transport: ipmitool transport used for SOL sessions
+            buffer_size: Characters retained per server
+            flush_interval: Seconds between deliveries to subscribers
+            max_batch: Maximum characters per delivery
+            max_workers: Concurrent subscriber deliveries
+            popen: Process factory (for testing)
+        """
+        self.transport = transport or IpmitoolTransport()
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_workers = max_workers
+        self.popen = popen
+
+        self._buffers: Dict[str, ConsoleBuffer] = {}
+        self._captures: Dict[str, SOLCapture] = {}
+        self._subscriptions: List[_Subscription] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._publisher: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def get_buffer(
+        self, server_id: str, create: bool = False
+    ) -> Optional[ConsoleBuffer]:
+        """Get a server's console buffer.
+
+        Args:
+            server_id: Server identifier
+            create: Create an empty buffer if none exists
+
+        Returns:
+            ConsoleBuffer or None
+        """
+        with self._lock:
+            buffer = self._buffers.get(server_id)
+            if buffer is None and create:
+                buffer = ConsoleBuffer(self.buffer_size)
+                self._buffers[server_id] = buffer
+            return buffer
+
+    def is_capturing(self, server_id: str) -> bool:
+        """Whether a server's console is being captured."""
+        with self._lock:
+            capture = self._captures.get(server_id)
+        return capture is not None and capture.running
+
+    def start(self, server_id: str, credentials: IPMICredentials) -> ConsoleBuffer:
+        """Start capturing a server's console (no-op if already capturing).
+
+        Args:
+            server_id: Server identifier
+            credentials: IPMI connection credentials
+
+        Returns:
+            The server's console buffer
+        """
+        buffer = self.get_buffer(server_id, create=True)
+        with self._lock:
+            capture = self._captures.get(server_id)
+            if capture is not None and capture.credentials != credentials:
+                capture.stop()
+                capture = None
+            if capture is None:
+                capture = SOLCapture(
+                    server_id,
+                    credentials,
+                    buffer,
+                    transport=self.transport,
+                    popen=self.popen,
+                )
+                self._captures[server_id] = capture
+        capture.start()
+        logger.info(f"Capturing SOL console for {server_id}")
+        return buffer
+
+    def stop(self, server_id: str) -> None:
+        """Stop capturing a server's console; its buffer is kept."""
+        with self._lock:
+            capture = self._captures.pop(server_id, None)
+        if capture is not None:
+            capture.stop()
+            logger.info(f"Stopped SOL console capture for {server_id}")
+
+    def wait_for(
+        self,
+        server_id: str,
+        pattern: Union[str, Pattern[str]],
+        timeout: float,
+        since: Optional[int] = None,
+    ) -> Optional["re.Match[str]"]:
+        """Block until a server's console output matches a pattern.
+
+        Args:
+            server_id: Server identifier
+            pattern: Regular expression searched in the output
+            timeout: Seconds to wait
+            since: Buffer offset to search from (defaults to new output only)
+
+        Returns:
+            The match, or None on timeout or when the capture stops
+        """
+        buffer = self.get_buffer(server_id, create=True)
+        return buffer.wait_for(pattern, timeout, since)
+
+    def subscribe(
+        self, server_id: str, sink: ConsoleSink, offset: Optional[int] = None
+    ) -> Callable[[], None]:
+        """Deliver a server's console output to a sink.
+
+        Deliveries are coalesced every ``flush_interval`` and at most one is
+        in flight per subscriber. Output that leaves the buffer while a
+        subscriber is busy is skipped and counted in ``ConsoleChunk.dropped``.
+
+        Args:
+            server_id: Server identifier
+            sink: Called with ``(server_id, chunk)``
+            offset: Buffer offset to start from (defaults to new output only)
+
+        Returns:
+            Callable that cancels the subscription
+        """
+        buffer = self.get_buffer(server_id, create=True)
+        subscription = _Subscription(
+            server_id, sink, buffer.end if offset is None else offset
+        )
+        with self._lock:
+            self._subscriptions.append(subscription)
+            self._ensure_publisher()
+
+        def unsubscribe() -> None:
+            with self._lock:
+                subscription.active = False
+                if subscription in self._subscriptions:
+                    self._subscriptions.remove(subscription)
+
+        return unsubscribe
+
+    def shutdown(self) -> None:
+        """Stop all captures and the publisher."""
+        with self._lock:
+            self._stopped = True
+            captures = list(self._captures.values())
+            self._captures.clear()
+            executor = self._executor
+        for capture in captures:
+            capture.stop()
+        self._wakeup.set()
+        if self._publisher is not None:
+            self._publisher.join(5)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _ensure_publisher(self) -> None:
+        if self._publisher is None or not self._publisher.is_alive():
+            self._stopped = False
+            self._wakeup.clear()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="sol-publish"
+            )
+            self._publisher = threading.Thread(
+                target=self._publish_loop, name="sol-publisher", daemon=True
+            )
+            self._publisher.start()
+
+    def _publish_loop(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            with self._lock:
+                if self._stopped:
+                    return
+                ready = [s for s in self._subscriptions if s.active and not s.in_flight]
+            for subscription in ready:
+                buffer = self.get_buffer(subscription.server_id)
+                if buffer is None:
+                    continue
+                chunk = buffer.read(subscription.offset, self.max_batch)
+                if not chunk.text and not chunk.dropped:
+                    continue
+                subscription.in_flight = True
+                self._executor.submit(self._deliver, subscription, chunk)
+
+    def _deliver(self, subscription: _Subscription, chunk: ConsoleChunk) -> None:
+        try:
+            if subscription.active:
+                subscription.sink(subscription.server_id, chunk)
+        except Exception as e:
+            logger.warning(f"Console subscriber for {subscription.server_id}: {e}")
+        finally:
+            subscription.offset = chunk.next_offset
+            subscription.in_flight = False
+
+
+_console_service: Optional[SOLConsoleService] = None
+_console_service_lock = threading.Lock()
+
+
+def get_console_service() -> SOLConsoleService:
+    """Get the process-wide SOL console service."""
+    global _console_service
+    with _console_service_lock:
+        if _console_service is None:
+            _console_service = SOLConsoleService()
+            atexit.register(_console_service.shutdown)
+        return _console_service
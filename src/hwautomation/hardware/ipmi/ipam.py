@@ -0,0 +1,466 @@
+"""IPMI address allocation backed by a persistent lease table.
+
+Addresses are handed out from a configured range through the
+``ipmi_leases`` table: an address is first *reserved* (with an expiry, so a
+crashed workflow does not leak it), checked for liveness and then
+*committed*. Reservation runs in an immediate SQLite transaction, so
+concurrent workflows - in this or another process - never receive the same
+address. A free-range bitmap finds the next free address without walking
+the range; it is rebuilt only when another connection changed the database.
+"""
+
+import ipaddress
+import sqlite3
+import subprocess
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from hwautomation.logging import get_logger
+
+from .base import IPMIConfigurationError
+
+logger = get_logger(__name__)
+
+LEASE_RESERVED = "reserved"
+LEASE_COMMITTED = "committed"
+# Address answered a liveness check; kept out of use until the lease expires
+LEASE_CONFLICT = "conflict"
+
+_LEASE_COLUMNS = (
+    "ip_address, server_id, state, token, reserved_at, expires_at, committed_at"
+)
+
+
+class AddressPoolExhaustedError(IPMIConfigurationError):
+    """Raised when no free address is left in the range."""
+
+    pass
+
+
+def ping_address(ip: str, timeout: float = 1.0) -> bool:
+    """Check whether an address answers a single ICMP echo request."""
+    try:
+        result = subprocess.run(
+            ["ping", "-c", "1", "-W", str(max(1, int(timeout))), ip],
+            capture_output=True,
+            timeout=timeout + 2,
+        )
+        return result.returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+
+class FreeBitmap:
+    """Bitmap of used slots with constant-time lowest-free lookup.
+
+    The used set is a Python integer; the lowest clear bit is
+    ``(used + 1) & ~used``, a few big-integer operations instead of a
+    Python-level scan of the range.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.used = 0
+
+    def mark(self, index: int) -> None:
+        self.used |= 1 << index
+
+    def clear(self, index: int) -> None:
+        self.used &= ~(1 << index)
+
+    def next_free(self) -> Optional[int]:
+        """Index of the lowest free slot, or None if the range is full."""
+        index = ((self.used + 1) & ~self.used).bit_length() - 1
+        return index if index < self.size else None
+
+    @property
+    def free_count(self) -> int:
+        return self.size - bin(self.used).count("1")
+
+
+@dataclass
+class IPMILease:
+    """Lease of one IPMI address."""
+
+    ip_address: str
+    server_id: Optional[str]
+    state: str
+    token: Optional[str] = None
+    reserved_at: Optional[str] = None
+    expires_at: Optional[str] = None
+    committed_at: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class IPMIAddressAllocator:
+    """Allocates IPMI addresses from a range without conflicts."""
+
+    def __init__(
+        self,
+        db_helper,
+        range_start: str,
+        range_end: str,
+        reservation_ttl: timedelta = timedelta(minutes=30),
+        conflict_ttl: timedelta = timedelta(hours=1),
+        liveness_check: Optional[Callable[[str], bool]] = ping_address,
+        max_workers: int = 32,
+    ):
+        """Initialize address allocator.
+
+        Args:
+            db_helper: DbHelper whose database holds the ipmi_leases table
+            range_start: First address of the range
+            range_end: Last address of the range (inclusive)
+            reservation_ttl: How long an uncommitted reservation is held
+            conflict_ttl: How long an address that answered a liveness check
+                is kept out of use
+            liveness_check: Returns True if an address is already in use on
+                the network; None skips liveness checks
+            max_workers: Maximum concurrent liveness checks
+
+        Raises:
+            ValueError: If the range is invalid
+        """
+        self.db_helper = db_helper
+        self.start = int(ipaddress.IPv4Address(range_start))
+        self.end = int(ipaddress.IPv4Address(range_end))
+        if self.end < self.start:
+            raise ValueError(f"Invalid IPMI range {range_start} - {range_end}")
+        self.reservation_ttl = reservation_ttl
+        self.conflict_ttl = conflict_ttl
+        self.liveness_check = liveness_check
+        self.max_workers = max_workers
+
+        self._bitmap = FreeBitmap(self.end - self.start + 1)
+        self._data_version: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def _db(self):
+        return self.db_helper.sql_db_worker
+
+    @property
+    def free_count(self) -> int:
+        """Number of addresses neither leased nor in conflict."""
+        with self._lock:
+            self._transaction(lambda: None)
+            return self._bitmap.free_count
+
+    def allocate(self, server_id: str, commit: bool = True) -> IPMILease:
+        """Allocate an address for one server.
+
+        Raises:
+            AddressPoolExhaustedError: If the range has no free address
+        """
+        return self.allocate_batch([server_id], commit=commit)[server_id]
+
+    def allocate_batch(
+        self, server_ids: Iterable[str], commit: bool = True
+    ) -> Dict[str, IPMILease]:
+        """Allocate addresses for many servers.
+
+        Addresses are reserved in one transaction, checked for liveness in
+        parallel, replaced where something already answers, and committed
+        in one transaction. A server that already holds a lease keeps it.
+
+        Args:
+            server_ids: Servers needing an address
+            commit: Commit the leases (otherwise they stay reserved until
+                ``commit_batch`` or expiry)
+
+        Returns:
+            Lease per server ID
+
+        Raises:
+            AddressPoolExhaustedError: If the range runs out of addresses
+        """
+        pending = list(dict.fromkeys(server_ids))
+        allocated: Dict[str, IPMILease] = {}
+
+        while pending:
+            leases = self.reserve_batch(pending)
+            fresh = [lease for lease in leases if lease.state == LEASE_RESERVED]
+            live = self.find_live_addresses(lease.ip_address for lease in fresh)
+            conflicts = [lease for lease in fresh if lease.ip_address in live]
+            if conflicts:
+                logger.warning(
+                    "IPMI addresses already in use on the network: "
+                    f"{', '.join(lease.ip_address for lease in conflicts)}"
+                )
+                self._mark_conflicts(conflicts)
+            pending = [lease.server_id for lease in conflicts]
+            for lease in leases:
+                if lease.ip_address not in live:
+                    allocated[lease.server_id] = lease
+
+        if commit:
+            self.commit_batch(
+                [lease for lease in allocated.values() if lease.state == LEASE_RESERVED]
+            )
+        return allocated
+
+    def reserve_batch(self, server_ids: List[str]) -> List[IPMILease]:
+        """Reserve one address per server in a single transaction.
+
+        Servers that already hold a reservation or committed lease in the
+        range get that lease back.
+
+        Raises:
+            AddressPoolExhaustedError: If the range has too few free addresses
+        """
+
+        def reserve() -> List[IPMILease]:
+            placeholders = ", ".join("?" for _ in server_ids)
+            rows = self._db.execute(
+                f"SELECT {_LEASE_COLUMNS} FROM ipmi_leases "  # nosec B608
+                f"WHERE server_id IN ({placeholders}) AND state != ? "
+                "AND ip_int BETWEEN ? AND ?",
+                (*server_ids, LEASE_CONFLICT, self.start, self.end),
+            ).fetchall()
+            existing = {row[1]: IPMILease(*row) for row in rows}
+
+            now = datetime.now()
+            expires = (now + self.reservation_ttl).isoformat()
+            leases = []
+            for server_id in server_ids:
+                if server_id in existing:
+                    leases.append(existing[server_id])
+                    continue
+                lease = IPMILease(
+                    ip_address="",
+                    server_id=server_id,
+                    state=LEASE_RESERVED,
+                    token=uuid.uuid4().hex,
+                    reserved_at=now.isoformat(),
+                    expires_at=expires,
+                )
+                self._insert(lease)
+                leases.append(lease)
+            return leases
+
+        with self._lock:
+            return self._transaction(reserve)
+
+    def commit_batch(self, leases: List[IPMILease]) -> None:
+        """Commit reserved leases in a single transaction.
+
+        Raises:
+            IPMIConfigurationError: If a reservation expired or was released
+                (no lease is committed in that case)
+        """
+        if not leases:
+            return
+
+        def commit() -> None:
+            now = datetime.now().isoformat()
+            lost = []
+            for lease in leases:
+                cursor = self._db.execute(
+                    "UPDATE ipmi_leases SET state = ?, committed_at = ?, "
+                    "expires_at = NULL WHERE ip_address = ? AND token = ? "
+                    "AND state = ?",
+                    (
+                        LEASE_COMMITTED,
+                        now,
+                        lease.ip_address,
+                        lease.token,
+                        LEASE_RESERVED,
+                    ),
+                )
+                if cursor.rowcount == 0:
+                    lost.append(lease.ip_address)
+            if lost:
+                raise IPMIConfigurationError(
+                    f"IPMI address reservations no longer held: {', '.join(lost)}"
+                )
+            for lease in leases:
+                lease.state = LEASE_COMMITTED
+                lease.committed_at = now
+                lease.expires_at = None
+
+        with self._lock:
+            self._transaction(commit)
+
+    def release(self, address: Union[str, IPMILease]) -> bool:
+        """Return an address to the range.
+
+        Returns:
+            True if a lease was removed
+        """
+        ip = address.ip_address if isinstance(address, IPMILease) else address
+
+        def release() -> bool:
+            cursor = self._db.execute(
+                "DELETE FROM ipmi_leases WHERE ip_address = ?", (ip,)
+            )
+            index = int(ipaddress.IPv4Address(ip)) - self.start
+            if cursor.rowcount and 0 <= index < self._bitmap.size:
+                self._bitmap.clear(index)
+            return cursor.rowcount > 0
+
+        with self._lock:
+            return self._transaction(release)
+
+    def get_lease(self, server_id: str) -> Optional[IPMILease]:
+        """Get the active lease of a server within this range, if any."""
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {_LEASE_COLUMNS} FROM ipmi_leases "  # nosec B608
+                "WHERE server_id = ? AND state != ? AND ip_int BETWEEN ? AND ? "
+                "AND (expires_at IS NULL OR expires_at >= ?)",
+                (
+                    server_id,
+                    LEASE_CONFLICT,
+                    self.start,
+                    self.end,
+                    datetime.now().isoformat(),
+                ),
+            ).fetchone()
+        return IPMILease(*row) if row else None
+
+    def find_live_addresses(self, addresses: Iterable[str]) -> Set[str]:
+        """Check addresses for liveness in parallel.
+
+        Returns:
+            Addresses that answered
+        """
+        addresses = list(addresses)
+        if not addresses or self.liveness_check is None:
+            return set()
+        workers = min(self.max_workers, len(addresses))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="ipam-liveness"
+        ) as executor:
+            answered = list(executor.map(self._is_live, addresses))
+        return {ip for ip, live in zip(addresses, answered) if live}
+
+    def _is_live(self, ip: str) -> bool:
+        try:
+            return bool(self.liveness_check(ip))
+        except Exception as e:
+            logger.debug(f"Liveness check of {ip} failed: {e}")
+            return False
+
+    def _mark_conflicts(self, leases: List[IPMILease]) -> None:
+        expires = (datetime.now() + self.conflict_ttl).isoformat()
+
+        def mark() -> None:
+            for lease in leases:
+                self._db.execute(
+                    "UPDATE ipmi_leases SET state = ?, server_id = NULL, "
+                    "token = NULL, expires_at = ? WHERE ip_address = ? AND token = ?",
+                    (LEASE_CONFLICT, expires, lease.ip_address, lease.token),
+                )
+
+        with self._lock:
+            self._transaction(mark)
+
+    def _insert(self, lease: IPMILease) -> None:
+        """Insert a reservation at the lowest free address (inside a transaction)."""
+        while True:
+            index = self._bitmap.next_free()
+            if index is None:
+                raise AddressPoolExhaustedError(
+                    f"No free IPMI address in {ipaddress.IPv4Address(self.start)} - "
+                    f"{ipaddress.IPv4Address(self.end)}"
+                )
+            self._bitmap.mark(index)
+            ip_int = self.start + index
+            lease.ip_address = str(ipaddress.IPv4Address(ip_int))
+            try:
+                self._db.execute(
+                    "INSERT INTO ipmi_leases (ip_address, ip_int, server_id, state, "
+                    "token, reserved_at, expires_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        lease.ip_address,
+                        ip_int,
+                        lease.server_id,
+                        lease.state,
+                        lease.token,
+                        lease.reserved_at,
+                        lease.expires_at,
+                    ),
+                )
+                return
+            except sqlite3.IntegrityError:
+                # Leased outside this allocator's view; the bit stays marked
+                continue
+
+    def _transaction(self, operation: Callable[[], Any]) -> Any:
+        """Run an operation in an immediate transaction on a synced bitmap."""
+        db = self._db
+        if db.in_transaction:
+            db.commit()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            self._sync()
+            result = operation()
+            db.commit()
+            return result
+        except Exception:
+            db.rollback()
+            self._data_version = None
+            raise
+
+    def _sync(self) -> None:
+        """Expire stale leases and rebuild the bitmap if the database changed."""
+        expired = self._db.execute(
+            "DELETE FROM ipmi_leases WHERE state != ? AND expires_at < ?",
+            (LEASE_COMMITTED, datetime.now().isoformat()),
+        ).rowcount
+        version = self._db.execute("PRAGMA data_version").fetchone()[0]
+        if not expired and version == self._data_version:
+            return
+
+        bitmap = FreeBitmap(self.end - self.start + 1)
+        for (ip_int,) in self._db.execute(
+            "SELECT ip_int FROM ipmi_leases WHERE ip_int BETWEEN ? AND ?",
+            (self.start, self.end),
+        ):
+            bitmap.mark(ip_int - self.start)
+        # Addresses recorded on servers outside the lease table are in use too
+        try:
+            recorded = self.db_helper.get_ipmi_addresses(working_only=False)
+        except sqlite3.Error:
+            recorded = []
+        for ip in recorded:
+            try:
+                ip_int = int(ipaddress.IPv4Address(ip))
+            except ValueError:
+                continue
+            if self.start <= ip_int <= self.end:
+                bitmap.mark(ip_int - self.start)
+
+        self._bitmap = bitmap
+        self._data_version = version
+
+
+_allocators: Dict[Tuple[str, str, str], IPMIAddressAllocator] = {}
+_allocators_lock = threading.Lock()
+
+
+def get_ipmi_allocator(
+    db_path: str, range_start: str, range_end: str
+) -> IPMIAddressAllocator:
+    """Get the process-wide allocator for a database and range.
+
+    Workflows allocating from the same range share one allocator (and its
+    bitmap and database connection); workflows in other processes are kept
+    apart by the database.
+    """
+    key = (db_path, range_start, range_end)
+    with _allocators_lock:
+        allocator = _allocators.get(key)
+        if allocator is None:
+            from ...database.helper import DbHelper
+
+            allocator = IPMIAddressAllocator(DbHelper(db_path), range_start, range_end)
+            _allocators[key] = allocator
+        return allocator
@@ -5,8 +5,7 @@ consolidating basic operations with vendor-specific configuration.
 """
 
 import subprocess
-import time
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from hwautomation.logging import get_logger
 from hwautomation.utils.network import get_ipmi_ip_via_ssh
@@ -25,9 +24,12 @@ from .base import (
     PowerStatus,
     SensorReading,
 )
+from .capabilities import BMCCapabilities, BMCCapabilityCache, get_capability_cache
+from .operations.bulk import BulkIPMIExecutor, BulkResult
 from .operations.config import IPMIConfigurator
 from .operations.power import PowerManager
 from .operations.sensors import SensorManager
+from .transport import IPMITransport, create_transport, get_default_transport
 from .vendors.factory import VendorHandlerFactory
 
 logger = get_logger(__name__)
@@ -42,6 +44,8 @@ class IpmiManager(BaseIPMIHandler):
         password: str = "",
         timeout: int = 30,
         config: Optional[Dict] = None,
+        transport: Optional[IPMITransport] = None,
+        capabilities: Optional[BMCCapabilityCache] = None,
     ):
         """Initialize IPMI manager.
 
@@ -49,7 +53,17 @@ class IpmiManager(BaseIPMIHandler):
             username: Default IPMI username
             password: Default IPMI password
             timeout: Command timeout in seconds
-            config: Additional configuration dictionary
+            config: Additional configuration dictionary; ``transport`` may be
+                ``"ipmitool"`` (the default) or ``"native"`` to opt in to
+                persistent RMCP+ sessions,
+                ``bulk`` holds BulkIPMIExecutor keyword arguments, and
+                ``sensor_cache_ttl``/``sdr_cache_dir`` tune sensor caching and
+                ``capabilities`` holds keyword arguments for a BMCCapabilityCache
+                private to this manager
+            transport: IPMI transport, overriding ``config["transport"]``
+            capabilities: BMC capability cache, overriding
+                ``config["capabilities"]``; defaults to the process-wide
+                cache shared with Redfish and BIOS code
         """
         # Create default credentials (IP will be set per operation)
         default_credentials = IPMICredentials(
@@ -58,12 +72,33 @@ class IpmiManager(BaseIPMIHandler):
         super().__init__(default_credentials, timeout)
 
         self.config = config or {}
+        if transport is None and "transport" in self.config:
+            transport = create_transport(self.config["transport"])
+        self.transport = transport or get_default_transport()
 
         # Initialize operation managers
-        self.power_manager = PowerManager(timeout=timeout)
-        self.sensor_manager = SensorManager(timeout=timeout)
-        self.configurator = IPMIConfigurator(config=self.config)
+        self.power_manager = PowerManager(timeout=timeout, transport=self.transport)
+        self.sensor_manager = SensorManager(
+            timeout=timeout,
+            transport=self.transport,
+            cache_ttl=self.config.get("sensor_cache_ttl", 5.0),
+            sdr_cache_dir=self.config.get("sdr_cache_dir"),
+        )
+        if capabilities is None and "capabilities" in self.config:
+            capability_options = {"timeout": timeout, **self.config["capabilities"]}
+            capabilities = BMCCapabilityCache(
+                transport=self.transport, **capability_options
+            )
+        # Shared with Redfish and BIOS code so every path sees one record;
+        # detection still runs over this manager's transport and timeout
+        self.capabilities = capabilities or get_capability_cache()
+        self.configurator = IPMIConfigurator(
+            config={"timeout": timeout, **self.config},
+            transport=self.transport,
+            capabilities=self.capabilities,
+        )
         self.vendor_factory = VendorHandlerFactory()
+        self.bulk_executor = BulkIPMIExecutor(**self.config.get("bulk", {}))
 
         logger.info(f"Initialized IpmiManager with username: {username}")
 
@@ -83,39 +118,26 @@ class IpmiManager(BaseIPMIHandler):
         Returns:
             Completed process result
         """
-        cmd_args = [
-            "ipmitool",
-            "-I",
-            credentials.interface,
-            "-H",
-            credentials.ip_address,
-            "-U",
-            credentials.username,
-            "-P",
-            credentials.password,
-        ]
-
-        if additional_args:
-            cmd_args.extend(additional_args)
-
-        cmd_args.extend(command.split())
-
         try:
-            result = subprocess.run(
-                cmd_args,
-                capture_output=True,
-                text=True,
+            result = self.transport.execute(
+                credentials,
+                command,
                 timeout=self.timeout,
+                additional_args=additional_args,
             )
 
             if result.returncode != 0:
-                logger.error(f"IPMI command failed: {' '.join(cmd_args)}")
+                logger.error(
+                    f"IPMI command failed: {command} on {credentials.ip_address}"
+                )
                 logger.error(f"Error output: {result.stderr}")
 
             return result
 
         except subprocess.TimeoutExpired:
-            logger.error(f"IPMI command timed out: {' '.join(cmd_args)}")
+            logger.error(
+                f"IPMI command timed out: {command} on {credentials.ip_address}"
+            )
             raise IPMICommandError(f"Command timed out after {self.timeout}s", command)
         except Exception as e:
             logger.error(f"IPMI command execution failed: {e}")
@@ -192,12 +214,44 @@ class IpmiManager(BaseIPMIHandler):
             logger.error(f"Error setting IPMI password for {ipmi_ip}: {e}")
             return False
 
+    def run_bulk(
+        self,
+        ipmi_ips: List[str],
+        operation: Union[str, Callable[..., Any]],
+        *args: Any,
+        progress_callback: Optional[Callable[[int, int, Any], None]] = None,
+        **kwargs: Any,
+    ) -> BulkResult:
+        """Run a per-BMC operation concurrently across many BMCs.
+
+        Args:
+            ipmi_ips: List of IPMI IP addresses
+            operation: Name of an IpmiManager method taking the IPMI IP first,
+                or any callable with that signature
+            *args: Extra positional arguments for the operation
+            progress_callback: Called as ``(completed, total, result)`` per BMC
+            **kwargs: Extra keyword arguments for the operation
+
+        Returns:
+            BulkResult mapping each IP to its BulkHostResult
+        """
+        if isinstance(operation, str):
+            operation = getattr(self, operation)
+        return self.bulk_executor.run(
+            ipmi_ips,
+            operation,
+            *args,
+            progress_callback=progress_callback,
+            **kwargs,
+        )
+
     def set_ipmi_passwords_bulk(
         self,
         ipmi_ips: List[str],
         current_password: str,
         new_password: str,
         user_id: str = "2",
+        progress_callback: Optional[Callable[[int, int, Any], None]] = None,
     ) -> Dict[str, bool]:
         """Set IPMI passwords for multiple systems.
 
@@ -206,19 +260,35 @@ class IpmiManager(BaseIPMIHandler):
             current_password: Current password
             new_password: New password to set
             user_id: User ID to modify
+            progress_callback: Called as ``(completed, total, result)`` per BMC
 
         Returns:
             Dictionary mapping IP addresses to success status
         """
-        results = {}
+        results = self.run_bulk(
+            ipmi_ips,
+            self.set_ipmi_password,
+            current_password,
+            new_password,
+            user_id,
+            progress_callback=progress_callback,
+        )
+        return {ip: results[ip].success for ip in dict.fromkeys(ipmi_ips)}
 
-        for ipmi_ip in ipmi_ips:
-            results[ipmi_ip] = self.set_ipmi_password(
-                ipmi_ip, current_password, new_password, user_id
-            )
-            time.sleep(1)  # Brief delay between operations
+    def get_power_status_bulk(
+        self, ipmi_ips: List[str], password: str
+    ) -> Dict[str, Optional[str]]:
+        """Get power status for multiple systems.
 
-        return results
+        Args:
+            ipmi_ips: List of IPMI IP addresses
+            password: IPMI password
+
+        Returns:
+            Dictionary mapping IP addresses to power status (None if failed)
+        """
+        results = self.run_bulk(ipmi_ips, self.get_power_status, password)
+        return {ip: results[ip].value for ip in dict.fromkeys(ipmi_ips)}
 
     def get_power_status(self, ipmi_ip: str, password: str) -> Optional[str]:
         """Get power status using power manager.
@@ -325,6 +395,29 @@ class IpmiManager(BaseIPMIHandler):
 
         return self.configurator.detect_vendor(credentials)
 
+    def get_bmc_capabilities(
+        self, ipmi_ip: str, password: str, refresh: bool = False
+    ) -> Optional[BMCCapabilities]:
+        """Get the cached capability fingerprint of a BMC.
+
+        Args:
+            ipmi_ip: IPMI IP address
+            password: IPMI password
+            refresh: Re-run full detection
+
+        Returns:
+            BMC capabilities, or None if the BMC cannot be reached
+        """
+        credentials = IPMICredentials(
+            ip_address=ipmi_ip,
+            username=self.credentials.username,
+            password=password,
+        )
+
+        return self.capabilities.get(
+            credentials, refresh=refresh, transport=self.transport, timeout=self.timeout
+        )
+
     def configure_ipmi(
         self,
         ipmi_ip: str,
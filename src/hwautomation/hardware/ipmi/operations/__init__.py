@@ -1,11 +1,20 @@
 """IPMI operations modules."""
 
+from .bulk import BulkHostResult, BulkIPMIExecutor, BulkResult
 from .config import IPMIConfigurator
+from .plan import IPMIConfigPlan, PlanResult
 from .power import PowerManager
+from .sensor_frame import SensorFrame
 from .sensors import SensorManager
 
 __all__ = [
+    "BulkHostResult",
+    "BulkIPMIExecutor",
+    "BulkResult",
+    "IPMIConfigPlan",
     "IPMIConfigurator",
+    "PlanResult",
     "PowerManager",
+    "SensorFrame",
     "SensorManager",
 ]
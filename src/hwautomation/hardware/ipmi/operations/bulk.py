@@ -0,0 +1,268 @@
+"""Bulk IPMI operations across many BMCs.
+
+This module fans a per-BMC operation out over a thread pool with a
+concurrency cap, per-BMC rate limiting, per-host timeouts and retries,
+and streams each host's result as soon as it is available.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from hwautomation.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _default_success(value: Any) -> bool:
+    """IpmiManager operations report failure as False or None."""
+    return value is not None and value is not False
+
+
+@dataclass
+class BulkHostResult:
+    """Outcome of a bulk operation on one BMC."""
+
+    host: str
+    success: bool
+    value: Any = None
+    error: Optional[str] = None
+    attempts: int = 0
+    duration: float = 0.0
+    timed_out: bool = False
+
+
+class BulkResult(Dict[str, BulkHostResult]):
+    """Per-host results of a bulk operation, in completion order."""
+
+    @property
+    def succeeded(self) -> List[str]:
+        """Hosts where the operation succeeded."""
+        return [host for host, result in self.items() if result.success]
+
+    @property
+    def failed(self) -> List[str]:
+        """Hosts where the operation failed or timed out."""
+        return [host for host, result in self.items() if not result.success]
+
+    def values_by_host(self) -> Dict[str, Any]:
+        """Operation return values keyed by host."""
+        return {host: result.value for host, result in self.items()}
+
+
+class BulkIPMIExecutor:
+    """Runs one IPMI operation against many BMCs concurrently."""
+
+    # Seconds between checks for queued hosts that have started
+    _QUEUED_POLL = 0.05
+
+    def __init__(
+        self,
+        max_workers: int = 32,
+        per_host_interval: float = 0.0,
+        timeout: Optional[float] = None,
+        retries: int = 0,
+        retry_delay: float = 1.0,
+        backoff: float = 2.0,
+    ):
+        """Initialize bulk executor.
+
+        Args:
+            max_workers: Maximum number of BMCs contacted at once
+            per_host_interval: Minimum seconds between calls to the same BMC,
+                including retries and calls from earlier bulk runs
+            timeout: Seconds after a host's operation starts (including its
+                retries) at which it is reported as timed out; time spent
+                queued for a worker does not count. The underlying call is
+                bounded by the transport timeout.
+            retries: Extra attempts after a failed or raising call
+            retry_delay: Seconds before the first retry
+            backoff: Multiplier applied to the delay after each retry
+        """
+        self.max_workers = max(1, max_workers)
+        self.per_host_interval = per_host_interval
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.retry_delay = retry_delay
+        self.backoff = backoff
+
+        self._last_call: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _throttle(self, host: str) -> None:
+        """Sleep until the per-BMC interval since the last call has passed."""
+        if self.per_host_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._last_call.get(host, 0.0) + self.per_host_interval)
+            self._last_call[host] = start
+        if start > now:
+            time.sleep(start - now)
+
+    def _run_host(
+        self,
+        host: str,
+        operation: Callable[..., Any],
+        args: tuple,
+        kwargs: Dict[str, Any],
+        success: Callable[[Any], bool],
+        host_started: Dict[str, float],
+    ) -> BulkHostResult:
+        """Run an operation on one host with retries."""
+        started = time.monotonic()
+        host_started[host] = started
+        delay = self.retry_delay
+        result = BulkHostResult(host=host, success=False)
+
+        for attempt in range(1, self.retries + 2):
+            self._throttle(host)
+            result.attempts = attempt
+            try:
+                result.value = operation(host, *args, **kwargs)
+                result.error = None
+                if success(result.value):
+                    result.success = True
+                    break
+                result.error = "Operation reported failure"
+            except Exception as e:
+                result.value = None
+                result.error = str(e)
+
+            if attempt <= self.retries:
+                logger.debug(f"Retrying IPMI operation on {host}: {result.error}")
+                time.sleep(delay)
+                delay *= self.backoff
+
+        result.duration = time.monotonic() - started
+        return result
+
+    def _next_wait(
+        self, hosts: Iterable[str], host_started: Dict[str, float]
+    ) -> Optional[float]:
+        """Seconds until the earliest running host times out."""
+        if self.timeout is None:
+            return None
+        now = time.monotonic()
+        waits = []
+        for host in hosts:
+            started = host_started.get(host)
+            if started is None:
+                # Queued hosts may start at any moment; check back shortly
+                waits.append(self._QUEUED_POLL)
+            else:
+                waits.append(max(0.0, started + self.timeout - now))
+        return min(waits, default=None)
+
+    def iter_results(
+        self,
+        hosts: Iterable[str],
+        operation: Callable[..., Any],
+        *args: Any,
+        success: Callable[[Any], bool] = _default_success,
+        **kwargs: Any,
+    ) -> Iterator[BulkHostResult]:
+        """Run ``operation(host, *args, **kwargs)`` on each host, yielding results.
+
+        Results are yielded in completion order. A host still running
+        ``timeout`` seconds after it started is yielded as a timed-out
+        failure; its late result is discarded.
+
+        Args:
+            hosts: BMC addresses (duplicates are run once)
+            operation: Callable taking the BMC address as first argument
+            *args: Extra positional arguments for the operation
+            success: Predicate deciding whether a return value is a success
+            **kwargs: Extra keyword arguments for the operation
+
+        Yields:
+            BulkHostResult for each host
+        """
+        targets = list(dict.fromkeys(hosts))
+        if not targets:
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(targets)),
+            thread_name_prefix="ipmi-bulk",
+        )
+        # Filled in by each worker when its host actually starts
+        host_started: Dict[str, float] = {}
+        try:
+            pending: Dict[Future, str] = {
+                executor.submit(
+                    self._run_host, host, operation, args, kwargs, success, host_started
+                ): host
+                for host in targets
+            }
+
+            while pending:
+                done, _ = wait(
+                    pending,
+                    timeout=self._next_wait(pending.values(), host_started),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    pending.pop(future)
+                    yield future.result()
+
+                if self.timeout is None:
+                    continue
+                now = time.monotonic()
+                for future, host in list(pending.items()):
+                    started = host_started.get(host)
+                    if started is None or now < started + self.timeout:
+                        continue
+                    future.cancel()
+                    pending.pop(future)
+                    yield BulkHostResult(
+                        host=host,
+                        success=False,
+                        error=f"Timed out after {self.timeout}s",
+                        duration=now - started,
+                        timed_out=True,
+                    )
+        finally:
+            executor.shutdown(wait=False)
+
+    def run(
+        self,
+        hosts: Iterable[str],
+        operation: Callable[..., Any],
+        *args: Any,
+        success: Callable[[Any], bool] = _default_success,
+        progress_callback: Optional[Callable[[int, int, BulkHostResult], None]] = None,
+        **kwargs: Any,
+    ) -> BulkResult:
+        """Run an operation on every host and collect the results.
+
+        Args:
+            hosts: BMC addresses
+            operation: Callable taking the BMC address as first argument
+            *args: Extra positional arguments for the operation
+            success: Predicate deciding whether a return value is a success
+            progress_callback: Called as ``(completed, total, result)`` per host
+            **kwargs: Extra keyword arguments for the operation
+
+        Returns:
+            BulkResult keyed by host
+        """
+        targets = list(dict.fromkeys(hosts))
+        results = BulkResult()
+        for result in self.iter_results(
+            targets, operation, *args, success=success, **kwargs
+        ):
+            results[result.host] = result
+            if progress_callback:
+                try:
+                    progress_callback(len(results), len(targets), result)
+                except Exception as e:
+                    logger.warning(f"Bulk progress callback failed: {e}")
+
+        logger.info(
+            f"Bulk IPMI operation finished: {len(results.succeeded)} succeeded, "
+            f"{len(results.failed)} failed"
+        )
+        return results
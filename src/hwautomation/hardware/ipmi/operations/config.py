@@ -20,6 +20,8 @@ from ..base import (
     IPMISystemInfo,
     IPMIVendor,
 )
+from ..capabilities import BMCCapabilityCache
+from ..transport import IPMITransport, get_default_transport
 
 logger = get_logger(__name__)
 
@@ -27,14 +29,25 @@ logger = get_logger(__name__)
 class IPMIConfigurator:
     """Handles IPMI configuration operations."""
 
-    def __init__(self, config: Optional[Dict] = None):
+    def __init__(
+        self,
+        config: Optional[Dict] = None,
+        transport: Optional[IPMITransport] = None,
+        capabilities: Optional[BMCCapabilityCache] = None,
+    ):
         """Initialize IPMI configurator.
 
         Args:
             config: Configuration dictionary
+            transport: IPMI transport (defaults to the ipmitool transport)
+            capabilities: BMC capability cache used for vendor detection
         """
         self.config = config or {}
         self.timeout = self.config.get("timeout", 30)
+        self.transport = transport or get_default_transport()
+        self.capabilities = capabilities or BMCCapabilityCache(
+            transport=self.transport, timeout=self.timeout
+        )
         self._vendor_handlers: Dict[IPMIVendor, BaseVendorHandler] = {}
 
     def detect_vendor(self, credentials: IPMICredentials) -> IPMIVendor:
@@ -44,32 +57,11 @@ class IPMIConfigurator:
             credentials: IPMI connection credentials
 
         Returns:
-            Detected vendor type
+            Detected vendor type (from the cached capability fingerprint)
         """
-        try:
-            # Get system information to identify vendor
-            result = self._execute_ipmi_command(credentials, IPMICommand.MC_INFO)
-
-            if result.returncode != 0:
-                logger.warning(f"MC info command failed: {result.stderr}")
-                return IPMIVendor.UNKNOWN
-
-            output = result.stdout.lower()
-
-            # Vendor detection patterns
-            if "supermicro" in output:
-                return IPMIVendor.SUPERMICRO
-            elif "hp" in output or "hewlett" in output or "ilo" in output:
-                return IPMIVendor.HP_ILO
-            elif "dell" in output or "idrac" in output:
-                return IPMIVendor.DELL_IDRAC
-            else:
-                logger.info(f"Unknown vendor detected from output: {output[:200]}")
-                return IPMIVendor.UNKNOWN
-
-        except Exception as e:
-            logger.error(f"Vendor detection failed: {e}")
-            return IPMIVendor.UNKNOWN
+        return self.capabilities.get_vendor(
+            credentials, transport=self.transport, timeout=self.timeout
+        )
 
     def configure_ipmi(
         self,
@@ -104,6 +96,11 @@ class IPMIConfigurator:
                 # Fall back to generic configuration
                 result = self._configure_generic_ipmi(credentials, settings, vendor)
 
+            if result.firmware_version is None:
+                cached = self.capabilities.get(
+                    credentials, transport=self.transport, timeout=self.timeout
+                )
+                result.firmware_version = cached.firmware_revision if cached else None
             result.execution_time = time.time() - start_time
             return result
 
@@ -189,15 +186,21 @@ class IPMIConfigurator:
                 if vendor == IPMIVendor.SUPERMICRO:
                     from ..vendors.supermicro import SupermicroHandler
 
-                    self._vendor_handlers[vendor] = SupermicroHandler(vendor)
+                    self._vendor_handlers[vendor] = SupermicroHandler(
+                        vendor, transport=self.transport
+                    )
                 elif vendor == IPMIVendor.HP_ILO:
                     from ..vendors.hp_ilo import HPiLOHandler
 
-                    self._vendor_handlers[vendor] = HPiLOHandler(vendor)
+                    self._vendor_handlers[vendor] = HPiLOHandler(
+                        vendor, transport=self.transport
+                    )
                 elif vendor == IPMIVendor.DELL_IDRAC:
                     from ..vendors.dell_idrac import DellHandler
 
-                    self._vendor_handlers[vendor] = DellHandler(vendor)
+                    self._vendor_handlers[vendor] = DellHandler(
+                        vendor, transport=self.transport
+                    )
 
             except ImportError as e:
                 logger.warning(f"Vendor handler not available for {vendor.value}: {e}")
@@ -280,26 +283,7 @@ class IPMIConfigurator:
         Returns:
             Completed process result
         """
-        cmd_args = [
-            "ipmitool",
-            "-I",
-            credentials.interface,
-            "-H",
-            credentials.ip_address,
-            "-U",
-            credentials.username,
-            "-P",
-            credentials.password,
-        ]
-
-        cmd_args.extend(command.split())
-
-        return subprocess.run(
-            cmd_args,
-            capture_output=True,
-            text=True,
-            timeout=self.timeout,
-        )
+        return self.transport.execute(credentials, command, timeout=self.timeout)
 
     def _parse_system_info(self, mc_output: str, fru_output: str) -> IPMISystemInfo:
         """Parse system information from IPMI output.
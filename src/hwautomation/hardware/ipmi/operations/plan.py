@@ -0,0 +1,490 @@
+"""Declarative IPMI configuration plans.
+
+A plan lists the desired BMC settings (LAN, users, channel access and
+vendor options such as Supermicro KCS control and host interface) for a
+vendor. Applying a plan reads the current BMC state in one batch, diffs it
+against the desired settings and sends only the changed settings in a
+second batch, ordered so that dependent settings (e.g. the static address
+source before the address) are written first.
+"""
+
+import shlex
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from hwautomation.logging import get_logger
+
+from ..base import IPMICredentials
+from ..transport import IPMITransport
+
+logger = get_logger(__name__)
+
+# Apply order: accounts first, then BMC options, then the LAN settings
+PHASE_USERS = 0
+PHASE_CHANNEL_ACCESS = 1
+PHASE_BMC_OPTIONS = 2
+PHASE_LAN_SOURCE = 3
+PHASE_LAN_ADDRESS = 4
+PHASE_LAN_ACCESS = 5
+
+PRIVILEGE_LEVELS = {
+    "CALLBACK": "1",
+    "USER": "2",
+    "OPERATOR": "3",
+    "ADMINISTRATOR": "4",
+    "OEM": "5",
+    "NO ACCESS": "15",
+}
+
+# Supermicro OEM commands (see vendors.supermicro)
+SUPERMICRO_KCS = {
+    "user": ["raw", "0x30", "0x70", "0x0c", "0x01", "0x01"],
+    "system": ["raw", "0x30", "0x70", "0x0c", "0x01", "0x00"],
+}
+SUPERMICRO_HOST_INTERFACE = {
+    "on": ["raw", "0x30", "0x70", "0x0c", "0x02", "0x01"],
+    "off": ["raw", "0x30", "0x70", "0x0c", "0x02", "0x00"],
+}
+
+# Vendors whose plans include user accounts and OEM options
+VENDOR_SECTIONS = {
+    "supermicro": {"users", "kcs", "host_interface"},
+    "generic": set(),
+}
+
+# Runs a batch of ipmitool argument lists, returning (exit code, output) each
+BatchRunner = Callable[[Sequence[List[str]]], List[Tuple[int, str]]]
+
+
+@dataclass
+class PlanItem:
+    """One desired BMC setting."""
+
+    key: str
+    desired: str
+    command: List[str]
+    phase: int
+    # Settings the BMC cannot report are always applied
+    readable: bool = True
+    secret: bool = False
+
+
+@dataclass
+class ConfigChange:
+    """A setting whose current value differs from the plan."""
+
+    key: str
+    current: Optional[str]
+    desired: str
+    command: List[str]
+    secret: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary, masking secret values."""
+        mask = "********" if self.secret else None
+        return {
+            "key": self.key,
+            "current": mask if self.current is not None and mask else self.current,
+            "desired": mask or self.desired,
+        }
+
+
+@dataclass
+class PlanResult:
+    """Result of applying an IPMI configuration plan."""
+
+    success: bool
+    applied: List[ConfigChange] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    duration: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "success": self.success,
+            "applied": [change.to_dict() for change in self.applied],
+            "unchanged": list(self.unchanged),
+            "errors": list(self.errors),
+            "duration": self.duration,
+        }
+
+
+@dataclass
+class IPMIConfigPlan:
+    """Desired IPMI settings for one BMC."""
+
+    vendor: str = "generic"
+    channel: int = 1
+    items: List[PlanItem] = field(default_factory=list)
+
+    @classmethod
+    def for_vendor(
+        cls,
+        vendor: Optional[str],
+        ipmi_ip: Optional[str] = None,
+        netmask: Optional[str] = None,
+        gateway: Optional[str] = None,
+        channel: int = 1,
+        user_id: int = 2,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        privilege: int = 4,
+        kcs_control: Optional[str] = None,
+        host_interface: Optional[str] = None,
+        lan_access: bool = False,
+    ) -> "IPMIConfigPlan":
+        """Build the plan for a vendor.
+
+        Sections a vendor does not support are left out: user accounts and
+        OEM options are only configured where the vendor plan includes them.
+
+        Args:
+            vendor: Vendor name (e.g. ``supermicro``); unknown vendors get
+                the generic LAN-only plan
+            ipmi_ip: Static BMC address
+            netmask: BMC subnet mask
+            gateway: BMC default gateway
+            channel: LAN channel number
+            user_id: User slot of the administrator account
+            username: Administrator user name
+            password: Administrator password
+            privilege: Channel privilege level of the administrator
+            kcs_control: Supermicro KCS control (``user`` or ``system``)
+            host_interface: Supermicro host interface (``on`` or ``off``)
+            lan_access: Enable IPMI over LAN on the channel
+
+        Returns:
+            Configuration plan
+        """
+        vendor = (vendor or "generic").lower()
+        sections = VENDOR_SECTIONS.get(vendor, VENDOR_SECTIONS["generic"])
+        plan = cls(vendor=vendor if vendor in VENDOR_SECTIONS else "generic")
+        plan.channel = channel
+        ch = str(channel)
+
+        if "users" in sections:
+            uid = str(user_id)
+            if username:
+                plan.add(
+                    f"user.{uid}.name",
+                    username,
+                    ["user", "set", "name", uid, username],
+                    PHASE_USERS,
+                )
+            if password:
+                plan.add(
+                    f"user.{uid}.password",
+                    password,
+                    ["user", "set", "password", uid, password],
+                    PHASE_USERS,
+                    secret=True,
+                )
+            if username or password:
+                plan.add(
+                    f"user.{uid}.enabled",
+                    "true",
+                    ["user", "enable", uid],
+                    PHASE_USERS,
+                    readable=False,
+                )
+                plan.add(
+                    f"user.{uid}.privilege",
+                    str(privilege),
+                    ["channel", "setaccess", ch, uid, f"privilege={privilege}"],
+                    PHASE_CHANNEL_ACCESS,
+                )
+
+        kcs_command = SUPERMICRO_KCS.get(kcs_control or "")
+        if "kcs" in sections and kcs_command:
+            plan.add(
+                "bmc.kcs_control",
+                kcs_control,
+                kcs_command,
+                PHASE_BMC_OPTIONS,
+                readable=False,
+            )
+        host_command = SUPERMICRO_HOST_INTERFACE.get(host_interface or "")
+        if "host_interface" in sections and host_command:
+            plan.add(
+                "bmc.host_interface",
+                host_interface,
+                host_command,
+                PHASE_BMC_OPTIONS,
+                readable=False,
+            )
+
+        if ipmi_ip:
+            plan.add(
+                "lan.ipsrc",
+                "static",
+                ["lan", "set", ch, "ipsrc", "static"],
+                PHASE_LAN_SOURCE,
+            )
+            plan.add(
+                "lan.ipaddr",
+                ipmi_ip,
+                ["lan", "set", ch, "ipaddr", ipmi_ip],
+                PHASE_LAN_ADDRESS,
+            )
+        if netmask:
+            plan.add(
+                "lan.netmask",
+                netmask,
+                ["lan", "set", ch, "netmask", netmask],
+                PHASE_LAN_ADDRESS,
+            )
+        if gateway:
+            plan.add(
+                "lan.defgw",
+                gateway,
+                ["lan", "set", ch, "defgw", "ipaddr", gateway],
+                PHASE_LAN_ADDRESS,
+            )
+        if lan_access:
+            plan.add(
+                "lan.access",
+                "on",
+                ["lan", "set", ch, "access", "on"],
+                PHASE_LAN_ACCESS,
+                readable=False,
+            )
+        return plan
+
+    def add(
+        self,
+        key: str,
+        desired: str,
+        command: List[str],
+        phase: int,
+        readable: bool = True,
+        secret: bool = False,
+    ) -> None:
+        """Add a desired setting to the plan."""
+        self.items.append(PlanItem(key, desired, command, phase, readable, secret))
+
+    def read_commands(self) -> List[List[str]]:
+        """Commands that read the BMC state this plan depends on."""
+        ch = str(self.channel)
+        keys = [item.key for item in self.items if item.readable]
+        commands = []
+        if any(key.startswith("lan.") for key in keys):
+            commands.append(["lan", "print", ch])
+        if any(key.startswith("user.") for key in keys):
+            commands.append(["user", "list", ch])
+        for item in self.items:
+            if item.key.endswith(".password"):
+                uid = item.key.split(".")[1]
+                size = "20" if len(item.desired) > 16 else "16"
+                commands.append(["user", "test", uid, size, item.desired])
+        return commands
+
+    def parse_state(
+        self, commands: Sequence[List[str]], results: Sequence[Tuple[int, str]]
+    ) -> Dict[str, str]:
+        """Build the current state from the output of read_commands."""
+        state: Dict[str, str] = {}
+        for command, (returncode, output) in zip(commands, results):
+            if returncode != 0 and command[:2] != ["user", "test"]:
+                continue
+            if command[:2] == ["lan", "print"]:
+                state.update(parse_lan_print(output))
+            elif command[:2] == ["user", "list"]:
+                state.update(parse_user_list(output))
+            elif command[:2] == ["user", "test"]:
+                # The password itself is never read back, only compared
+                if returncode == 0 and "success" in output.lower():
+                    state[f"user.{command[2]}.password"] = command[4]
+        return state
+
+    def diff(self, state: Dict[str, str]) -> List[ConfigChange]:
+        """List the settings that differ from the current state, in apply order.
+
+        Args:
+            state: Current BMC state (from parse_state)
+
+        Returns:
+            Changes sorted by phase; unreadable settings are always included
+        """
+        changes = []
+        for item in sorted(self.items, key=lambda i: i.phase):
+            current = state.get(item.key) if item.readable else None
+            if item.readable and current is not None:
+                if current.lower() == item.desired.lower():
+                    continue
+            changes.append(
+                ConfigChange(
+                    item.key, current, item.desired, list(item.command), item.secret
+                )
+            )
+        return changes
+
+    def apply(self, runner: BatchRunner, dry_run: bool = False) -> PlanResult:
+        """Read the BMC state, then apply only the changed settings.
+
+        Args:
+            runner: Executes a batch of ipmitool commands (see
+                ``shell_batch_runner`` and ``transport_batch_runner``)
+            dry_run: Compute the changes without applying them
+
+        Returns:
+            Plan result; on a dry run ``applied`` lists the pending changes
+        """
+        started = time.time()
+        result = PlanResult(success=True)
+
+        read_commands = self.read_commands()
+        state = (
+            self.parse_state(read_commands, runner(read_commands))
+            if read_commands
+            else {}
+        )
+        changes = self.diff(state)
+        changed_keys = {change.key for change in changes}
+        result.unchanged = [i.key for i in self.items if i.key not in changed_keys]
+
+        if dry_run or not changes:
+            result.applied = changes
+            result.duration = time.time() - started
+            return result
+
+        outcomes = runner([change.command for change in changes])
+        for change, (returncode, output) in zip(changes, outcomes):
+            if returncode == 0:
+                result.applied.append(change)
+            else:
+                result.success = False
+                result.errors.append(
+                    f"{change.key}: {output.strip() or f'exit code {returncode}'}"
+                )
+
+        result.duration = time.time() - started
+        logger.info(
+            f"IPMI plan ({self.vendor}): {len(result.applied)} applied, "
+            f"{len(result.unchanged)} unchanged, {len(result.errors)} failed"
+        )
+        return result
+
+
+def parse_lan_print(output: str) -> Dict[str, str]:
+    """Parse ``ipmitool lan print`` output into plan state keys."""
+    fields = {}
+    for line in output.splitlines():
+        key, sep, value = line.partition(":")
+        if sep:
+            fields[key.strip().lower()] = value.strip()
+
+    state = {}
+    source = fields.get("ip address source", "").lower()
+    if source:
+        state["lan.ipsrc"] = "static" if "static" in source else source.split()[0]
+    for name, key in (
+        ("ip address", "lan.ipaddr"),
+        ("subnet mask", "lan.netmask"),
+        ("default gateway ip", "lan.defgw"),
+    ):
+        if fields.get(name):
+            state[key] = fields[name]
+    return state
+
+
+def parse_user_list(output: str) -> Dict[str, str]:
+    """Parse ``ipmitool user list`` output into plan state keys."""
+    state = {}
+    for line in output.splitlines():
+        tokens = line.split()
+        if len(tokens) < 5 or not tokens[0].isdigit():
+            continue
+        uid = tokens[0]
+        # Empty user slots have no name column
+        if tokens[1] in ("true", "false"):
+            name, flags = "", tokens[1:]
+        else:
+            name, flags = tokens[1], tokens[2:]
+        privilege = " ".join(flags[3:]).upper()
+        state[f"user.{uid}.name"] = name
+        if privilege in PRIVILEGE_LEVELS:
+            state[f"user.{uid}.privilege"] = PRIVILEGE_LEVELS[privilege]
+    return state
+
+
+_MARKER = "__ipmi_plan_rc__"
+
+
+def shell_batch_runner(
+    exec_command: Callable[..., Tuple[str, str, int]], sudo: bool = True
+) -> BatchRunner:
+    """Create a runner that sends each batch as one in-band shell script.
+
+    The whole batch travels in a single remote command (the script is
+    passed on stdin), so a batch costs one SSH round trip instead of one
+    per ipmitool invocation.
+
+    Args:
+        exec_command: ``SSHClient.exec_command``-style callable taking a
+            command and ``stdin_data`` and returning (stdout, stderr, code)
+        sudo: Run the script with sudo
+
+    Returns:
+        Batch runner
+    """
+
+    def run(commands: Sequence[List[str]]) -> List[Tuple[int, str]]:
+        if not commands:
+            return []
+        script = "".join(
+            f"ipmitool {' '.join(shlex.quote(arg) for arg in command)} 2>&1; "
+            f'echo "{_MARKER} $?"\n'
+            for command in commands
+        )
+        stdout, stderr, _ = exec_command(
+            "sudo sh -s" if sudo else "sh -s", stdin_data=script
+        )
+
+        results: List[Tuple[int, str]] = []
+        lines: List[str] = []
+        for line in stdout.splitlines():
+            if line.startswith(_MARKER):
+                results.append((int(line.split()[1]), "\n".join(lines)))
+                lines = []
+            else:
+                lines.append(line)
+        # Commands that never reported (e.g. the shell failed) count as failed
+        while len(results) < len(commands):
+            results.append((1, stderr or "\n".join(lines)))
+        return results
+
+    return run
+
+
+def transport_batch_runner(
+    transport: IPMITransport, credentials: IPMICredentials, timeout: int = 30
+) -> BatchRunner:
+    """Create a runner that sends batches over an out-of-band IPMI transport.
+
+    With the native transport every command of a batch reuses one pooled
+    RMCP+ session.
+
+    Args:
+        transport: IPMI transport
+        credentials: BMC credentials
+        timeout: Per-command timeout in seconds
+
+    Returns:
+        Batch runner
+    """
+
+    def run(commands: Sequence[List[str]]) -> List[Tuple[int, str]]:
+        results = []
+        for command in commands:
+            try:
+                completed = transport.execute(credentials, command, timeout=timeout)
+                results.append(
+                    (completed.returncode, completed.stdout or completed.stderr)
+                )
+            except Exception as e:
+                results.append((1, str(e)))
+        return results
+
+    return run
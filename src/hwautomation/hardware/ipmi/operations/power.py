@@ -18,20 +18,40 @@ from ..base import (
     PowerState,
     PowerStatus,
 )
+from ...power_watch import PowerStateWatcher, get_power_watcher
+from ..transport import IPMITransport, get_default_transport
 
 logger = get_logger(__name__)
 
+# Power state reported once each action has completed. Reset and cycle are
+# absent: they start and end in "on", and the off period is too short to be
+# seen reliably by polling, so their completion cannot be observed.
+_SETTLED_STATES = {
+    PowerState.ON: "on",
+    PowerState.OFF: "off",
+    PowerState.SOFT: "off",
+}
+
 
 class PowerManager:
     """Manages IPMI power operations."""
 
-    def __init__(self, timeout: int = 30):
+    def __init__(
+        self,
+        timeout: int = 30,
+        transport: Optional[IPMITransport] = None,
+        watcher: Optional[PowerStateWatcher] = None,
+    ):
         """Initialize power manager.
 
         Args:
             timeout: Command timeout in seconds
+            transport: IPMI transport (defaults to the ipmitool transport)
+            watcher: Power-state watcher (defaults to the shared watcher)
         """
         self.timeout = timeout
+        self.transport = transport or get_default_transport()
+        self.watcher = watcher or get_power_watcher()
 
     def get_power_status(self, credentials: IPMICredentials) -> PowerStatus:
         """Get current power status.
@@ -84,7 +104,9 @@ class PowerManager:
         Args:
             credentials: IPMI connection credentials
             state: Target power state
-            wait_for_completion: Wait for power state change to complete
+            wait_for_completion: Wait for the new power state to be reported;
+                ignored for RESET and CYCLE, which return once the BMC has
+                accepted the command
 
         Returns:
             True if successful, False otherwise
@@ -181,26 +203,7 @@ class PowerManager:
         Returns:
             Completed process result
         """
-        cmd_args = [
-            "ipmitool",
-            "-I",
-            credentials.interface,
-            "-H",
-            credentials.ip_address,
-            "-U",
-            credentials.username,
-            "-P",
-            credentials.password,
-        ]
-
-        cmd_args.extend(command.value.split())
-
-        return subprocess.run(
-            cmd_args,
-            capture_output=True,
-            text=True,
-            timeout=self.timeout,
-        )
+        return self.transport.execute(credentials, command, timeout=self.timeout)
 
     def _parse_power_state(self, output: str) -> str:
         """Parse power state from IPMI output.
@@ -230,32 +233,32 @@ class PowerManager:
     ) -> bool:
         """Wait for power state to reach target.
 
+        The wait is scheduled on the shared power-state watcher, which
+        backs off from ``check_interval`` while the state is unchanged.
+
         Args:
             credentials: IPMI connection credentials
             target_state: Target power state to wait for
             max_wait: Maximum wait time in seconds
-            check_interval: Check interval in seconds
+            check_interval: Initial check interval in seconds
 
         Returns:
             True if target state reached, False if timeout
         """
-        start_time = time.time()
-
-        while time.time() - start_time < max_wait:
-            try:
-                current_status = self.get_power_status(credentials)
-
-                # Check if we've reached the target state
-                if target_state == PowerState.ON and current_status.state == "on":
-                    return True
-                elif target_state == PowerState.OFF and current_status.state == "off":
-                    return True
-
-                time.sleep(check_interval)
+        expected = _SETTLED_STATES.get(target_state)
+        if expected is None:
+            return True
 
-            except Exception as e:
-                logger.warning(f"Error checking power state: {e}")
-                time.sleep(check_interval)
+        def probe() -> str:
+            return self.get_power_status(credentials).state
 
-        logger.warning(f"Timeout waiting for power state {target_state.value}")
-        return False
+        reached = self.watcher.wait_for(
+            ("ipmi", credentials.ip_address, credentials.port),
+            probe,
+            [expected],
+            timeout=max_wait,
+            interval=check_interval,
+        )
+        if not reached:
+            logger.warning(f"Timeout waiting for power state {target_state.value}")
+        return reached
@@ -0,0 +1,269 @@
+"""Column-oriented sensor readings for batch parsing and threshold checks.
+
+``SensorFrame`` holds the sensors of one or many BMCs as parallel typed
+columns (``array('d')`` for numeric values and thresholds, with NaN for
+missing data) instead of one ``SensorReading`` object per line, so large
+fleets can be parsed and evaluated in a single pass over flat arrays.
+"""
+
+import math
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..base import SensorReading
+
+SEVERITY_OK = 0
+SEVERITY_WARNING = 1
+SEVERITY_CRITICAL = 2
+SEVERITY_NAMES = {SEVERITY_WARNING: "warning", SEVERITY_CRITICAL: "critical"}
+
+NAN = float("nan")
+_MISSING = frozenset(["", "na", "n/a", "disabled", "no reading"])
+_MISSING_TEXT = frozenset(["na", "n/a", "unspecified"])
+
+
+def classify_sensor_status(status: Optional[str]) -> Optional[str]:
+    """Classify an ipmitool sensor status as ``"warning"``, ``"critical"`` or None.
+
+    Args:
+        status: Sensor status column (e.g. ``ok``, ``nc``, ``cr``)
+
+    Returns:
+        Severity string, or None for healthy or unknown status
+    """
+    if not status:
+        return None
+    status_lower = status.lower()
+    if status_lower == "nc" or any(
+        keyword in status_lower for keyword in ["warn", "caution"]
+    ):
+        return "warning"
+    if status_lower in ("cr", "nr") or any(
+        keyword in status_lower for keyword in ["crit", "fail", "error"]
+    ):
+        return "critical"
+    return None
+
+
+def _status_severity(status: Optional[str]) -> int:
+    """Map a sensor status column to a severity code."""
+    severity = classify_sensor_status(status)
+    if severity == "critical":
+        return SEVERITY_CRITICAL
+    if severity == "warning":
+        return SEVERITY_WARNING
+    return SEVERITY_OK
+
+
+class SensorFrame:
+    """Sensor readings of one or more BMCs stored as parallel columns."""
+
+    def __init__(self):
+        """Initialize an empty frame."""
+        self.hosts: List[str] = []
+        self._host_ids: Dict[str, int] = {}
+        self.host_index = array("I")
+        self.names: List[str] = []
+        self.units: List[Optional[str]] = []
+        self.statuses: List[Optional[str]] = []
+        self.values = array("d")
+        self.lower_critical = array("d")
+        self.lower_warning = array("d")
+        self.upper_warning = array("d")
+        self.upper_critical = array("d")
+        self.status_severity = array("b")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def parse(cls, output: str, host: str = "") -> "SensorFrame":
+        """Parse ``ipmitool sensor list`` output into a frame.
+
+        Ten-column output (``LNR LCR LNC UNC UCR UNR``) fills the warning and
+        critical threshold columns; shorter output is read as
+        ``name | value | unit | status | lower | upper`` with both
+        thresholds treated as critical.
+
+        Args:
+            output: Raw sensor list output
+            host: BMC the output came from
+
+        Returns:
+            Parsed frame
+        """
+        frame = cls()
+        frame.append_output(output, host)
+        return frame
+
+    @classmethod
+    def concat(cls, frames: Iterable["SensorFrame"]) -> "SensorFrame":
+        """Combine frames (typically one per BMC) into one frame."""
+        combined = cls()
+        for frame in frames:
+            combined.extend(frame)
+        return combined
+
+    def _host_id(self, host: str) -> int:
+        host_id = self._host_ids.get(host)
+        if host_id is None:
+            host_id = self._host_ids[host] = len(self.hosts)
+            self.hosts.append(host)
+        return host_id
+
+    def append_output(self, output: str, host: str = "") -> int:
+        """Parse sensor list output and append its rows.
+
+        Args:
+            output: Raw sensor list output
+            host: BMC the output came from
+
+        Returns:
+            Number of rows appended
+        """
+        host_id = self._host_id(host)
+        severity_cache: Dict[Optional[str], int] = {}
+        missing = _MISSING
+
+        def number(text: str) -> float:
+            if text.lower() in missing:
+                return NAN
+            try:
+                return float(text)
+            except ValueError:
+                return NAN
+
+        names, units, statuses = self.names, self.units, self.statuses
+        values, severities = self.values, self.status_severity
+        lcr, lnc = self.lower_critical, self.lower_warning
+        unc, ucr = self.upper_warning, self.upper_critical
+        start = len(names)
+
+        for line in output.splitlines():
+            parts = line.split("|")
+            if len(parts) < 2:
+                continue
+            parts = [part.strip() for part in parts]
+            if not parts[0]:
+                continue
+
+            count = len(parts)
+            status = parts[3] if count > 3 and parts[3] else None
+            if status is not None and status.lower() in _MISSING_TEXT:
+                status = None
+            unit = parts[2] if count > 2 and parts[2] else None
+            if unit is not None and unit.lower() in _MISSING_TEXT:
+                unit = None
+
+            severity = severity_cache.get(status)
+            if severity is None:
+                severity = severity_cache[status] = _status_severity(status)
+
+            names.append(parts[0])
+            units.append(unit)
+            statuses.append(status)
+            values.append(number(parts[1]))
+            severities.append(severity)
+            if count >= 10:
+                lcr.append(number(parts[5]))
+                lnc.append(number(parts[6]))
+                unc.append(number(parts[7]))
+                ucr.append(number(parts[8]))
+            else:
+                lcr.append(number(parts[4]) if count > 4 else NAN)
+                lnc.append(NAN)
+                unc.append(NAN)
+                ucr.append(number(parts[5]) if count > 5 else NAN)
+
+        added = len(names) - start
+        self.host_index.extend([host_id] * added)
+        return added
+
+    def extend(self, other: "SensorFrame") -> None:
+        """Append all rows of another frame."""
+        remap = [self._host_id(host) for host in other.hosts]
+        self.host_index.extend(remap[i] for i in other.host_index)
+        self.names.extend(other.names)
+        self.units.extend(other.units)
+        self.statuses.extend(other.statuses)
+        self.values.extend(other.values)
+        self.lower_critical.extend(other.lower_critical)
+        self.lower_warning.extend(other.lower_warning)
+        self.upper_warning.extend(other.upper_warning)
+        self.upper_critical.extend(other.upper_critical)
+        self.status_severity.extend(other.status_severity)
+
+    def evaluate_thresholds(self) -> array:
+        """Evaluate every row against its status and numeric thresholds.
+
+        A reading at or beyond a critical threshold is critical, at or
+        beyond a warning threshold is a warning; NaN values or thresholds
+        never trigger. The BMC-reported status can only raise the result.
+
+        Returns:
+            ``array('b')`` of severity codes, one per row
+        """
+        result = array("b", self.status_severity)
+        for i, (value, lc, lw, uw, uc) in enumerate(
+            zip(
+                self.values,
+                self.lower_critical,
+                self.lower_warning,
+                self.upper_warning,
+                self.upper_critical,
+            )
+        ):
+            if value >= uc or value <= lc:
+                result[i] = SEVERITY_CRITICAL
+            elif (value >= uw or value <= lw) and result[i] < SEVERITY_WARNING:
+                result[i] = SEVERITY_WARNING
+        return result
+
+    def alerts(
+        self, min_severity: int = SEVERITY_WARNING
+    ) -> List[Tuple[str, str, str, float]]:
+        """List rows at or above a severity.
+
+        Args:
+            min_severity: Lowest severity code to include
+
+        Returns:
+            ``(host, sensor, severity name, value)`` tuples in row order
+        """
+        severities = self.evaluate_thresholds()
+        return [
+            (
+                self.hosts[self.host_index[i]],
+                self.names[i],
+                SEVERITY_NAMES[severity],
+                self.values[i],
+            )
+            for i, severity in enumerate(severities)
+            if severity >= min_severity
+        ]
+
+    def host_rows(self, host: str) -> List[int]:
+        """Get the row indices belonging to a BMC."""
+        host_id = self._host_ids.get(host)
+        if host_id is None:
+            return []
+        return [i for i, h in enumerate(self.host_index) if h == host_id]
+
+    def to_readings(self, host: Optional[str] = None) -> List[SensorReading]:
+        """Convert rows (optionally of one BMC) to SensorReading objects."""
+
+        def text(value: float) -> Optional[str]:
+            return None if math.isnan(value) else f"{value:.3f}"
+
+        rows = range(len(self)) if host is None else self.host_rows(host)
+        return [
+            SensorReading(
+                name=self.names[i],
+                value=text(self.values[i]),
+                unit=self.units[i],
+                status=self.statuses[i],
+                lower_threshold=text(self.lower_critical[i]),
+                upper_threshold=text(self.upper_critical[i]),
+            )
+            for i in rows
+        ]
@@ -4,8 +4,11 @@ This module handles all sensor-related IPMI operations including
 sensor data collection, monitoring, and threshold management.
 """
 
+import os
 import subprocess
-from typing import Dict, List, Optional
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 
 from hwautomation.logging import get_logger
 
@@ -15,35 +18,154 @@ from ..base import (
     IPMICredentials,
     SensorReading,
 )
+from ..transport import IpmitoolTransport, IPMITransport, get_default_transport
+from .sensor_frame import SensorFrame
 
 logger = get_logger(__name__)
 
 
+class _SensorSnapshot:
+    """Raw sensor list output of one BMC with lazily parsed views."""
+
+    def __init__(self, output: str, host: str):
+        self.taken = time.monotonic()
+        self.output = output
+        self.host = host
+        self.readings: Optional[List[SensorReading]] = None
+        self.frame: Optional[SensorFrame] = None
+
+
 class SensorManager:
     """Manages IPMI sensor operations."""
 
-    def __init__(self, timeout: int = 30):
+    def __init__(
+        self,
+        timeout: int = 30,
+        transport: Optional[IPMITransport] = None,
+        cache_ttl: float = 5.0,
+        sdr_cache_dir: Optional[str] = None,
+    ):
         """Initialize sensor manager.
 
         Args:
             timeout: Command timeout in seconds
+            transport: IPMI transport (defaults to the ipmitool transport)
+            cache_ttl: Seconds a per-BMC sensor snapshot is reused (0 disables)
+            sdr_cache_dir: Directory for ``ipmitool sdr dump`` files passed
+                back with ``-S`` so ipmitool skips the SDR repository scan
         """
         self.timeout = timeout
+        self.transport = transport or get_default_transport()
+        self.cache_ttl = cache_ttl
+        self.sdr_cache_dir = sdr_cache_dir
 
-    def get_sensor_data(self, credentials: IPMICredentials) -> List[SensorReading]:
+        self._snapshots: Dict[Tuple[str, int], _SensorSnapshot] = {}
+        self._fetch_locks: Dict[Tuple[str, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_sensor_data(
+        self, credentials: IPMICredentials, max_age: Optional[float] = None
+    ) -> List[SensorReading]:
         """Get all sensor readings.
 
+        Readings come from a per-BMC snapshot no older than ``max_age``
+        (default ``cache_ttl``); concurrent callers share a single fetch.
+
         Args:
             credentials: IPMI connection credentials
+            max_age: Maximum snapshot age in seconds (0 forces a fresh read)
 
         Returns:
             List of sensor readings
 
+        Raises:
+            IPMICommandError: If command execution fails
+        """
+        snapshot = self._get_snapshot(credentials, max_age)
+        if snapshot.readings is None:
+            snapshot.readings = self._parse_sensor_output(snapshot.output)
+        return list(snapshot.readings)
+
+    def get_sensor_frame(
+        self, credentials: IPMICredentials, max_age: Optional[float] = None
+    ) -> SensorFrame:
+        """Get all sensor readings as typed columns.
+
+        Shares the snapshot used by get_sensor_data.
+
+        Args:
+            credentials: IPMI connection credentials
+            max_age: Maximum snapshot age in seconds (0 forces a fresh read)
+
+        Returns:
+            Sensor frame for this BMC (do not modify; it is cached)
+
+        Raises:
+            IPMICommandError: If command execution fails
+        """
+        snapshot = self._get_snapshot(credentials, max_age)
+        if snapshot.frame is None:
+            snapshot.frame = SensorFrame.parse(snapshot.output, snapshot.host)
+        return snapshot.frame
+
+    def _get_snapshot(
+        self, credentials: IPMICredentials, max_age: Optional[float]
+    ) -> _SensorSnapshot:
+        """Get a sensor snapshot no older than max_age, fetching if needed."""
+        max_age = self.cache_ttl if max_age is None else max_age
+        key = (credentials.ip_address, credentials.port)
+
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+
+        with fetch_lock:
+            cached = self._snapshots.get(key)
+            if cached and max_age > 0 and time.monotonic() - cached.taken < max_age:
+                return cached
+
+            snapshot = _SensorSnapshot(
+                self._fetch_sensor_output(credentials), credentials.ip_address
+            )
+            if self.cache_ttl > 0:
+                self._snapshots[key] = snapshot
+            return snapshot
+
+    def invalidate_cache(self, credentials: Optional[IPMICredentials] = None) -> None:
+        """Drop cached sensor snapshots for one BMC, or for all BMCs.
+
+        Args:
+            credentials: BMC whose snapshot to drop; None drops every snapshot
+        """
+        with self._lock:
+            if credentials is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop((credentials.ip_address, credentials.port), None)
+
+    def _fetch_sensor_output(self, credentials: IPMICredentials) -> str:
+        """Read all sensors from the BMC, bypassing the snapshot cache.
+
+        Args:
+            credentials: IPMI connection credentials
+
+        Returns:
+            Raw sensor list output
+
         Raises:
             IPMICommandError: If command execution fails
         """
         try:
-            result = self._execute_sensor_command(credentials, IPMICommand.SENSOR_LIST)
+            sdr_args = self._sdr_cache_args(credentials)
+            result = self._execute_sensor_command(
+                credentials, IPMICommand.SENSOR_LIST, sdr_args
+            )
+
+            if result.returncode != 0 and sdr_args:
+                # A stale or corrupt SDR dump; rebuild it on the next read
+                self._remove_sdr_cache(credentials)
+                result = self._execute_sensor_command(
+                    credentials, IPMICommand.SENSOR_LIST
+                )
 
             if result.returncode != 0:
                 raise IPMICommandError(
@@ -52,7 +174,7 @@ class SensorManager:
                     result.returncode,
                 )
 
-            return self._parse_sensor_output(result.stdout)
+            return result.stdout
 
         except subprocess.TimeoutExpired:
             raise IPMICommandError(
@@ -180,6 +302,9 @@ class SensorManager:
     ) -> Dict[str, List[str]]:
         """Check for sensors exceeding thresholds.
 
+        Uses both the BMC-reported status and the numeric warning/critical
+        thresholds of each sensor.
+
         Args:
             credentials: IPMI connection credentials
 
@@ -189,18 +314,12 @@ class SensorManager:
         result = {"warnings": [], "critical": []}
 
         try:
-            sensors = self.get_sensor_data(credentials)
-
-            for sensor in sensors:
-                if sensor.status:
-                    status_lower = sensor.status.lower()
-
-                    if any(keyword in status_lower for keyword in ["warn", "caution"]):
-                        result["warnings"].append(sensor.name)
-                    elif any(
-                        keyword in status_lower for keyword in ["crit", "fail", "error"]
-                    ):
-                        result["critical"].append(sensor.name)
+            frame = self.get_sensor_frame(credentials)
+            for _, name, severity, _ in frame.alerts():
+                if severity == "critical":
+                    result["critical"].append(name)
+                else:
+                    result["warnings"].append(name)
 
         except Exception as e:
             logger.error(f"Failed to check sensor thresholds: {e}")
@@ -211,37 +330,67 @@ class SensorManager:
         self,
         credentials: IPMICredentials,
         command: IPMICommand,
+        additional_args: Optional[List[str]] = None,
     ) -> subprocess.CompletedProcess:
         """Execute a sensor-related IPMI command.
 
         Args:
             credentials: IPMI connection credentials
             command: IPMI command to execute
+            additional_args: Extra ipmitool arguments placed before the command
 
         Returns:
             Completed process result
         """
-        cmd_args = [
-            "ipmitool",
-            "-I",
-            credentials.interface,
-            "-H",
-            credentials.ip_address,
-            "-U",
-            credentials.username,
-            "-P",
-            credentials.password,
-        ]
-
-        cmd_args.extend(command.value.split())
-
-        return subprocess.run(
-            cmd_args,
-            capture_output=True,
-            text=True,
-            timeout=self.timeout,
+        return self.transport.execute(
+            credentials, command, timeout=self.timeout, additional_args=additional_args
         )
 
+    def _sdr_cache_path(self, credentials: IPMICredentials) -> str:
+        """Get the SDR dump file path for a BMC."""
+        name = f"{credentials.ip_address}_{credentials.port}.sdr".replace(":", "_")
+        return os.path.join(self.sdr_cache_dir, name)
+
+    def _sdr_cache_args(self, credentials: IPMICredentials) -> Optional[List[str]]:
+        """Get ``-S <file>`` arguments, dumping the SDR repository if needed.
+
+        Only the ipmitool transport uses SDR dump files; the native transport
+        keeps its own in-memory SDR cache.
+
+        Args:
+            credentials: IPMI connection credentials
+
+        Returns:
+            Extra ipmitool arguments, or None when SDR caching is unavailable
+        """
+        if not self.sdr_cache_dir or not isinstance(self.transport, IpmitoolTransport):
+            return None
+
+        path = self._sdr_cache_path(credentials)
+        if not os.path.exists(path):
+            try:
+                os.makedirs(self.sdr_cache_dir, exist_ok=True)
+                result = self.transport.execute(
+                    credentials, ["sdr", "dump", path], timeout=self.timeout
+                )
+            except (OSError, subprocess.TimeoutExpired) as e:
+                logger.debug(f"SDR dump for {credentials.ip_address} failed: {e}")
+                return None
+            if result.returncode != 0 or not os.path.exists(path):
+                logger.debug(
+                    f"SDR dump for {credentials.ip_address} failed: {result.stderr}"
+                )
+                return None
+
+        return ["-S", path]
+
+    def _remove_sdr_cache(self, credentials: IPMICredentials) -> None:
+        """Delete a BMC's SDR dump file."""
+        try:
+            os.remove(self._sdr_cache_path(credentials))
+        except OSError:
+            pass
+
     def _parse_sensor_output(self, output: str) -> List[SensorReading]:
         """Parse sensor data from IPMI output.
 
@@ -279,18 +428,31 @@ class SensorManager:
         """
         # IPMI sensor output format is typically:
         # Sensor Name | Value | Units | Status | Lower Threshold | Upper Threshold
+        # while ``sensor list`` prints all six thresholds after the status:
+        # Sensor Name | Value | Units | Status | LNR | LCR | LNC | UNC | UCR | UNR
 
         parts = [part.strip() for part in line.split("|")]
 
         if len(parts) < 2:
             return None
 
+        # Thresholds are the critical ones in either layout
+        lower_index, upper_index = (5, 8) if len(parts) >= 10 else (4, 5)
+
         name = parts[0]
         value = parts[1] if len(parts) > 1 and parts[1] else None
         unit = parts[2] if len(parts) > 2 and parts[2] else None
         status = parts[3] if len(parts) > 3 and parts[3] else None
-        lower_threshold = parts[4] if len(parts) > 4 and parts[4] else None
-        upper_threshold = parts[5] if len(parts) > 5 and parts[5] else None
+        lower_threshold = (
+            parts[lower_index]
+            if len(parts) > lower_index and parts[lower_index]
+            else None
+        )
+        upper_threshold = (
+            parts[upper_index]
+            if len(parts) > upper_index and parts[upper_index]
+            else None
+        )
 
         # Clean up values
         if value and value.lower() in ["na", "n/a", "disabled", "no reading"]:
@@ -0,0 +1,575 @@
+"""Native IPMI v2.0 RMCP+ (lanplus) sessions.
+
+This module implements the client side of the RMCP+ protocol over UDP:
+the RAKP session handshake, HMAC integrity and AES-CBC-128 confidentiality.
+A session stays authenticated across calls, so each IPMI request costs a
+single UDP round trip instead of an ``ipmitool`` process start plus a full
+handshake.
+
+Supported cipher suites are 17 (RAKP-HMAC-SHA256, HMAC-SHA256-128,
+AES-CBC-128) and 3 (RAKP-HMAC-SHA1, HMAC-SHA1-96, AES-CBC-128).
+"""
+
+import atexit
+import hashlib
+import hmac
+import os
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from hwautomation.logging import get_logger
+
+from .base import IPMICommandError, IPMIConnectionError
+
+logger = get_logger(__name__)
+
+RMCP_HEADER = b"\x06\x00\xff\x07"
+AUTH_TYPE_RMCPPLUS = 0x06
+
+PAYLOAD_IPMI = 0x00
+PAYLOAD_OPEN_SESSION_REQUEST = 0x10
+PAYLOAD_OPEN_SESSION_RESPONSE = 0x11
+PAYLOAD_RAKP1 = 0x12
+PAYLOAD_RAKP2 = 0x13
+PAYLOAD_RAKP3 = 0x14
+PAYLOAD_RAKP4 = 0x15
+
+PAYLOAD_ENCRYPTED = 0x80
+PAYLOAD_AUTHENTICATED = 0x40
+
+BMC_ADDRESS = 0x20
+REMOTE_CONSOLE_ADDRESS = 0x81
+
+NETFN_APP = 0x06
+CMD_SET_SESSION_PRIVILEGE = 0x3B
+CMD_CLOSE_SESSION = 0x3C
+
+PRIVILEGE_ADMINISTRATOR = 0x04
+NAME_ONLY_LOOKUP = 0x10
+
+# RMCP+ status codes that mean "try another cipher suite"
+UNSUPPORTED_ALGORITHM_STATUS = {0x04, 0x05, 0x06, 0x07, 0x10, 0x11}
+
+RMCP_STATUS_MESSAGES = {
+    0x01: "insufficient resources to create a session",
+    0x02: "invalid session ID",
+    0x04: "invalid authentication algorithm",
+    0x05: "invalid integrity algorithm",
+    0x09: "invalid role",
+    0x0A: "unauthorized role or privilege level requested",
+    0x0C: "invalid name length",
+    0x0D: "unauthorized name",
+    0x0F: "invalid integrity check value",
+    0x10: "invalid confidentiality algorithm",
+    0x11: "no cipher suite match with proposed security algorithms",
+}
+
+
+@dataclass(frozen=True)
+class CipherSuite:
+    """RMCP+ authentication, integrity and confidentiality algorithms."""
+
+    suite_id: int
+    auth_algorithm: int
+    integrity_algorithm: int
+    confidentiality_algorithm: int
+    digest: str
+    integrity_length: int
+
+
+CIPHER_SUITES = {
+    3: CipherSuite(3, 0x01, 0x01, 0x01, "sha1", 12),
+    17: CipherSuite(17, 0x03, 0x04, 0x01, "sha256", 16),
+}
+
+DEFAULT_CIPHER_SUITES = (17, 3)
+
+
+class UnsupportedCipherSuiteError(IPMIConnectionError):
+    """Raised when the BMC accepts none of the offered cipher suites."""
+
+    pass
+
+
+def _checksum(data: bytes) -> int:
+    """Two's complement checksum used in IPMI message headers."""
+    return (-sum(data)) & 0xFF
+
+
+def build_ipmi_message(netfn: int, cmd: int, rq_seq: int, data: bytes = b"") -> bytes:
+    """Build an IPMI LAN request message (payload type 0)."""
+    header = bytes([BMC_ADDRESS, netfn << 2])
+    body = bytes([REMOTE_CONSOLE_ADDRESS, (rq_seq & 0x3F) << 2, cmd]) + data
+    return header + bytes([_checksum(header)]) + body + bytes([_checksum(body)])
+
+
+def parse_ipmi_response(message: bytes) -> Tuple[int, int, int, int, bytes]:
+    """
+    Parse an IPMI LAN response message.
+
+    Returns:
+        Tuple of (netfn, rq_seq, cmd, completion_code, data)
+    """
+    if len(message) < 8:
+        raise IPMICommandError("Truncated IPMI response", "response")
+    netfn = message[1] >> 2
+    rq_seq = message[4] >> 2
+    cmd = message[5]
+    return netfn, rq_seq, cmd, message[6], bytes(message[7:-1])
+
+
+class RmcpSession:
+    """One authenticated RMCP+ session with a BMC."""
+
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        port: int = 623,
+        timeout: float = 2.0,
+        retries: int = 3,
+        cipher_suites: Sequence[int] = DEFAULT_CIPHER_SUITES,
+        privilege: int = PRIVILEGE_ADMINISTRATOR,
+    ):
+        """
+        Initialize session (the handshake happens on first use).
+
+        Args:
+            host: BMC address
+            username: IPMI username
+            password: IPMI password (up to 20 bytes)
+            port: RMCP port
+            timeout: Seconds to wait for each UDP response
+            retries: Send attempts per request before giving up
+            cipher_suites: Cipher suite IDs to offer, in order of preference
+            privilege: Requested maximum privilege level
+        """
+        self.host = host
+        self.port = port
+        self.username = username.encode("utf-8")
+        self.password = password.encode("utf-8")
+        self.timeout = timeout
+        self.retries = retries
+        self.cipher_suites = tuple(cipher_suites)
+        self.privilege = privilege
+
+        self.suite: Optional[CipherSuite] = None
+        self.remote_session_id = 0
+        self.managed_session_id = 0
+        self.bmc_guid = b""
+        self.last_used = 0.0
+
+        self._sock: Optional[socket.socket] = None
+        self._sequence = 0
+        self._rq_seq = 0
+        self._k1 = b""
+        self._k2 = b""
+        self._deadline: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the handshake has completed."""
+        return self.managed_session_id != 0
+
+    def open(self) -> None:
+        """Open the session, trying each cipher suite until one is accepted."""
+        with self._lock:
+            self._open()
+
+    def _open(self) -> None:
+        if self._sock is None:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._sock.connect((self.host, self.port))
+
+        last_error: Optional[Exception] = None
+        for suite_id in self.cipher_suites:
+            suite = CIPHER_SUITES[suite_id]
+            try:
+                self._handshake(suite)
+                self.suite = suite
+                self._set_privilege()
+                logger.debug(
+                    f"Opened RMCP+ session to {self.host} with cipher suite {suite_id}"
+                )
+                return
+            except UnsupportedCipherSuiteError as e:
+                last_error = e
+                continue
+        raise UnsupportedCipherSuiteError(
+            f"{self.host} rejected cipher suites {list(self.cipher_suites)}: "
+            f"{last_error}"
+        )
+
+    def _handshake(self, suite: CipherSuite) -> None:
+        """Run Open Session and RAKP 1-4 for a cipher suite."""
+        self.managed_session_id = 0
+        self._sequence = 0
+        remote_sid = struct.unpack("<I", os.urandom(4))[0] | 1
+        tag = os.urandom(1)[0]
+
+        request = (
+            bytes([tag, self.privilege, 0, 0])
+            + struct.pack("<I", remote_sid)
+            + bytes([0x00, 0, 0, 8, suite.auth_algorithm, 0, 0, 0])
+            + bytes([0x01, 0, 0, 8, suite.integrity_algorithm, 0, 0, 0])
+            + bytes([0x02, 0, 0, 8, suite.confidentiality_algorithm, 0, 0, 0])
+        )
+        response = self._exchange_setup(
+            PAYLOAD_OPEN_SESSION_REQUEST, request, PAYLOAD_OPEN_SESSION_RESPONSE
+        )
+        self._check_status(response[1], "Open Session", suite)
+        managed_sid = struct.unpack("<I", response[8:12])[0]
+
+        # RAKP 1/2: exchange randoms and authenticate the BMC
+        console_random = os.urandom(16)
+        role = self.privilege | NAME_ONLY_LOOKUP
+        user_block = bytes([role, len(self.username)]) + self.username
+        rakp1 = (
+            bytes([tag, 0, 0, 0])
+            + struct.pack("<I", managed_sid)
+            + console_random
+            + bytes([role, 0, 0, len(self.username)])
+            + self.username
+        )
+        rakp2 = self._exchange_setup(PAYLOAD_RAKP1, rakp1, PAYLOAD_RAKP2)
+        self._check_status(rakp2[1], "RAKP 2", suite)
+        bmc_random = rakp2[8:24]
+        bmc_guid = rakp2[24:40]
+        kuid = self.password.ljust(20, b"\x00")
+
+        expected = self._hmac(
+            suite,
+            kuid,
+            struct.pack("<II", remote_sid, managed_sid)
+            + console_random
+            + bmc_random
+            + bmc_guid
+            + user_block,
+        )
+        if not hmac.compare_digest(rakp2[40 : 40 + len(expected)], expected):
+            raise IPMIConnectionError(
+                f"RAKP 2 authentication failed for {self.host}: "
+                "check username and password"
+            )
+
+        # RAKP 3/4: prove our key and confirm the session integrity key
+        sik = self._hmac(suite, kuid, console_random + bmc_random + user_block)
+        rakp3 = (
+            bytes([tag, 0, 0, 0])
+            + struct.pack("<I", managed_sid)
+            + self._hmac(
+                suite, kuid, bmc_random + struct.pack("<I", remote_sid) + user_block
+            )
+        )
+        rakp4 = self._exchange_setup(PAYLOAD_RAKP3, rakp3, PAYLOAD_RAKP4)
+        self._check_status(rakp4[1], "RAKP 4", suite)
+        icv = self._hmac(
+            suite, sik, console_random + struct.pack("<I", managed_sid) + bmc_guid
+        )[: suite.integrity_length]
+        if not hmac.compare_digest(rakp4[8 : 8 + suite.integrity_length], icv):
+            raise IPMIConnectionError(f"RAKP 4 integrity check failed for {self.host}")
+
+        self.remote_session_id = remote_sid
+        self.managed_session_id = managed_sid
+        self.bmc_guid = bmc_guid
+        self._k1 = self._hmac(suite, sik, b"\x01" * 20)
+        self._k2 = self._hmac(suite, sik, b"\x02" * 20)
+        self.suite = suite
+
+    def _check_status(self, status: int, stage: str, suite: CipherSuite) -> None:
+        if status == 0:
+            return
+        message = RMCP_STATUS_MESSAGES.get(status, f"status 0x{status:02x}")
+        if status in UNSUPPORTED_ALGORITHM_STATUS:
+            raise UnsupportedCipherSuiteError(
+                f"{stage} rejected cipher suite {suite.suite_id}: {message}"
+            )
+        raise IPMIConnectionError(f"{stage} failed for {self.host}: {message}")
+
+    @staticmethod
+    def _hmac(suite: CipherSuite, key: bytes, data: bytes) -> bytes:
+        return hmac.new(key, data, getattr(hashlib, suite.digest)).digest()
+
+    def _set_privilege(self) -> None:
+        """Activate the session at the requested privilege level."""
+        cc, _ = self._request(
+            NETFN_APP, CMD_SET_SESSION_PRIVILEGE, bytes([self.privilege])
+        )
+        if cc != 0:
+            self.managed_session_id = 0
+            raise IPMIConnectionError(
+                f"Set Session Privilege Level failed for {self.host}: cc=0x{cc:02x}"
+            )
+
+    def _exchange_setup(
+        self, payload_type: int, payload: bytes, response_type: int
+    ) -> bytes:
+        """Send a pre-session packet and wait for its response payload."""
+        packet = (
+            RMCP_HEADER
+            + bytes([AUTH_TYPE_RMCPPLUS, payload_type])
+            + struct.pack("<IIH", 0, 0, len(payload))
+            + payload
+        )
+        for attempt in range(self.retries):
+            if self._expired():
+                break
+            self._sock.send(packet)
+            deadline = self._packet_deadline()
+            while True:
+                data = self._receive(deadline)
+                if data is None:
+                    break
+                if len(data) >= 16 and data[5] & 0x3F == response_type:
+                    length = struct.unpack("<H", data[14:16])[0]
+                    return data[16 : 16 + length]
+        raise IPMIConnectionError(
+            f"No response from {self.host}:{self.port} during session setup"
+        )
+
+    def _expired(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def _packet_deadline(self) -> float:
+        """When to stop waiting for a response to the packet just sent."""
+        deadline = time.monotonic() + self.timeout
+        if self._deadline is not None:
+            return min(deadline, self._deadline)
+        return deadline
+
+    def _receive(self, deadline: float) -> Optional[bytes]:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        self._sock.settimeout(remaining)
+        try:
+            return self._sock.recv(65536)
+        except socket.timeout:
+            return None
+        except ConnectionRefusedError as e:
+            raise IPMIConnectionError(f"{self.host}:{self.port} refused: {e}")
+
+    def _wrap(self, message: bytes) -> bytes:
+        """Encrypt and sign an IPMI message for the active session."""
+        iv = os.urandom(16)
+        pad_length = (15 - len(message) % 16) % 16
+        plaintext = message + bytes(range(1, pad_length + 1)) + bytes([pad_length])
+        encryptor = Cipher(algorithms.AES(self._k2[:16]), modes.CBC(iv)).encryptor()
+        payload = iv + encryptor.update(plaintext) + encryptor.finalize()
+
+        self._sequence = (self._sequence + 1) & 0xFFFFFFFF or 1
+        header = bytes(
+            [AUTH_TYPE_RMCPPLUS, PAYLOAD_ENCRYPTED | PAYLOAD_AUTHENTICATED]
+        ) + struct.pack("<IIH", self.managed_session_id, self._sequence, len(payload))
+        integrity_pad = (4 - (len(header) + len(payload) + 2) % 4) % 4
+        signed = header + payload + b"\xff" * integrity_pad + bytes([integrity_pad, 7])
+        auth_code = self._hmac(self.suite, self._k1, signed)
+        return RMCP_HEADER + signed + auth_code[: self.suite.integrity_length]
+
+    def _unwrap(self, data: bytes) -> Optional[bytes]:
+        """Verify and decrypt a session packet, returning the IPMI message."""
+        if len(data) < 16 or data[4] != AUTH_TYPE_RMCPPLUS:
+            return None
+        payload_type = data[5]
+        session_id, _, length = struct.unpack("<IIH", data[6:16])
+        if session_id != self.remote_session_id or payload_type & 0x3F != 0:
+            return None
+
+        payload = data[16 : 16 + length]
+        if payload_type & PAYLOAD_AUTHENTICATED:
+            icv_length = self.suite.integrity_length
+            signed, auth_code = data[4:-icv_length], data[-icv_length:]
+            expected = self._hmac(self.suite, self._k1, signed)[:icv_length]
+            if not hmac.compare_digest(auth_code, expected):
+                logger.debug(f"Dropping packet with bad integrity from {self.host}")
+                return None
+
+        if payload_type & PAYLOAD_ENCRYPTED:
+            iv, ciphertext = payload[:16], payload[16:]
+            decryptor = Cipher(algorithms.AES(self._k2[:16]), modes.CBC(iv)).decryptor()
+            plaintext = decryptor.update(ciphertext) + decryptor.finalize()
+            payload = plaintext[: -plaintext[-1] - 1]
+        return payload
+
+    def _request(self, netfn: int, cmd: int, data: bytes) -> Tuple[int, bytes]:
+        """Send one IPMI request within the session (lock must be held)."""
+        for attempt in range(self.retries):
+            if self._expired():
+                break
+            self._rq_seq = (self._rq_seq + 1) & 0x3F
+            rq_seq = self._rq_seq
+            self._sock.send(self._wrap(build_ipmi_message(netfn, cmd, rq_seq, data)))
+            deadline = self._packet_deadline()
+            while True:
+                packet = self._receive(deadline)
+                if packet is None:
+                    break
+                message = self._unwrap(packet)
+                if message is None:
+                    continue
+                r_netfn, r_seq, r_cmd, cc, payload = parse_ipmi_response(message)
+                if r_seq == rq_seq and r_cmd == cmd and r_netfn == netfn | 1:
+                    self.last_used = time.monotonic()
+                    return cc, payload
+        raise IPMIConnectionError(
+            f"No response from {self.host} for netfn=0x{netfn:02x} cmd=0x{cmd:02x}"
+        )
+
+    def request(
+        self,
+        netfn: int,
+        cmd: int,
+        data: bytes = b"",
+        deadline: Optional[float] = None,
+    ) -> Tuple[int, bytes]:
+        """
+        Send an IPMI request and return its completion code and data.
+
+        The session is opened on first use. If the BMC stops answering
+        (e.g. it expired an idle session) the session is re-established
+        once and the request retried.
+
+        Args:
+            netfn: Network function (request, even)
+            cmd: Command number
+            data: Request data bytes
+            deadline: ``time.monotonic()`` value after which no more packets
+                are sent or waited for, including any re-established session
+
+        Returns:
+            Tuple of (completion_code, response_data)
+
+        Raises:
+            IPMIConnectionError: If the BMC cannot be reached or authenticated
+                (or does not answer before the deadline)
+        """
+        with self._lock:
+            self._deadline = deadline
+            try:
+                if not self.is_active:
+                    self._open()
+                try:
+                    return self._request(netfn, cmd, data)
+                except IPMIConnectionError:
+                    if self._expired():
+                        raise
+                    logger.debug(f"Re-establishing RMCP+ session to {self.host}")
+                    self._open()
+                    return self._request(netfn, cmd, data)
+            finally:
+                self._deadline = None
+
+    def close(self) -> None:
+        """Close the session on the BMC and release the socket."""
+        with self._lock:
+            if self.is_active:
+                try:
+                    saved_retries, self.retries = self.retries, 1
+                    self._request(
+                        NETFN_APP,
+                        CMD_CLOSE_SESSION,
+                        struct.pack("<I", self.managed_session_id),
+                    )
+                except (IPMIConnectionError, IPMICommandError, OSError):
+                    pass
+                finally:
+                    self.retries = saved_retries
+                self.managed_session_id = 0
+            if self._sock is not None:
+                self._sock.close()
+                self._sock = None
+
+
+class RmcpSessionPool:
+    """Persistent RMCP+ sessions shared per BMC and credential set."""
+
+    def __init__(
+        self,
+        idle_timeout: float = 50.0,
+        timeout: float = 2.0,
+        retries: int = 3,
+        cipher_suites: Sequence[int] = DEFAULT_CIPHER_SUITES,
+    ):
+        """
+        Initialize session pool.
+
+        Args:
+            idle_timeout: Seconds after which an unused session is assumed
+                expired by the BMC and transparently reopened
+            timeout: Per-packet response timeout for new sessions
+            retries: Send attempts per request for new sessions
+            cipher_suites: Cipher suite IDs to offer, in order of preference
+        """
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.retries = retries
+        self.cipher_suites = tuple(cipher_suites)
+        self._sessions: Dict[Tuple[str, int, str, str], RmcpSession] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, host: str, username: str, password: str, port: int = 623
+    ) -> RmcpSession:
+        """Return the pooled session for a BMC, creating it if needed."""
+        key = (host, port, username, password)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = RmcpSession(
+                    host,
+                    username,
+                    password,
+                    port=port,
+                    timeout=self.timeout,
+                    retries=self.retries,
+                    cipher_suites=self.cipher_suites,
+                )
+                self._sessions[key] = session
+
+        # BMCs silently drop idle sessions (typically after 60s)
+        if (
+            session.is_active
+            and time.monotonic() - session.last_used > self.idle_timeout
+        ):
+            session.close()
+        return session
+
+    def discard(self, host: str, username: str, password: str, port: int = 623):
+        """Close and forget the session for a BMC."""
+        with self._lock:
+            session = self._sessions.pop((host, port, username, password), None)
+        if session:
+            session.close()
+
+    def close_all(self) -> None:
+        """Close every pooled session."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+_default_pool: Optional[RmcpSessionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> RmcpSessionPool:
+    """Process-wide session pool; sessions are closed at interpreter exit."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = RmcpSessionPool()
+            atexit.register(_default_pool.close_all)
+        return _default_pool
@@ -0,0 +1,553 @@
+"""Fleet-wide IPMI sensor telemetry.
+
+This module polls sensor readings from many BMCs in the background and
+keeps them in compact array-backed ring buffers with downsampled rollups,
+so trends and threshold alerts can be served without a live IPMI call
+per query.
+"""
+
+import threading
+import time
+from array import array
+from dataclasses import asdict, dataclass
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from hwautomation.logging import get_logger
+
+from .base import IPMICredentials, SensorReading
+from .operations.bulk import BulkIPMIExecutor, BulkResult
+from .operations.sensor_frame import classify_sensor_status
+from .operations.sensors import SensorManager
+
+logger = get_logger(__name__)
+
+# (bucket seconds, bucket count): one day of minutes, one month of hours
+DEFAULT_ROLLUPS: Sequence[Tuple[int, int]] = ((60, 1440), (3600, 720))
+
+
+def _to_float(value: Optional[str]) -> Optional[float]:
+    """Convert a sensor value or threshold string to float."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _ring_indices(next_index: int, count: int, capacity: int) -> Iterable[int]:
+    """Yield ring buffer indices from oldest to newest."""
+    start = next_index - count
+    return ((start + i) % capacity for i in range(count))
+
+
+@dataclass
+class TelemetryPoint:
+    """A raw sample or a rollup bucket of one sensor."""
+
+    timestamp: float
+    value: float
+    minimum: float
+    maximum: float
+    count: int = 1
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class TelemetryAlert:
+    """A sensor in warning or critical state."""
+
+    host: str
+    sensor: str
+    severity: str
+    value: Optional[float]
+    status: Optional[str]
+    threshold: Optional[float]
+    timestamp: float
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class _Rollup:
+    """Fixed-size ring of min/max/sum/count buckets at one resolution."""
+
+    def __init__(self, resolution: int, capacity: int):
+        self.resolution = resolution
+        self.capacity = capacity
+        self.starts = array("d", bytes(8 * capacity))
+        self.mins = array("d", bytes(8 * capacity))
+        self.maxs = array("d", bytes(8 * capacity))
+        self.sums = array("d", bytes(8 * capacity))
+        self.counts = array("L", [0]) * capacity
+        self.next = 0
+        self.count = 0
+
+    def add(self, timestamp: float, value: float) -> None:
+        bucket = timestamp - timestamp % self.resolution
+        current = (self.next - 1) % self.capacity
+        if self.count and self.starts[current] == bucket:
+            self.mins[current] = min(self.mins[current], value)
+            self.maxs[current] = max(self.maxs[current], value)
+            self.sums[current] += value
+            self.counts[current] += 1
+            return
+        if self.count and bucket < self.starts[current]:
+            return  # Out-of-order sample for a closed bucket
+
+        index = self.next
+        self.starts[index] = bucket
+        self.mins[index] = self.maxs[index] = self.sums[index] = value
+        self.counts[index] = 1
+        self.next = (index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def points(self, start: float, end: float) -> List[TelemetryPoint]:
+        return [
+            TelemetryPoint(
+                timestamp=self.starts[i],
+                value=self.sums[i] / self.counts[i],
+                minimum=self.mins[i],
+                maximum=self.maxs[i],
+                count=self.counts[i],
+            )
+            for i in _ring_indices(self.next, self.count, self.capacity)
+            if start <= self.starts[i] <= end
+        ]
+
+
+class SensorSeries:
+    """Time series of one numeric sensor backed by ring buffers."""
+
+    def __init__(
+        self,
+        capacity: int = 720,
+        rollups: Sequence[Tuple[int, int]] = DEFAULT_ROLLUPS,
+        unit: Optional[str] = None,
+    ):
+        """Initialize sensor series.
+
+        Args:
+            capacity: Number of raw samples kept
+            rollups: (bucket seconds, bucket count) pairs for downsampled data
+            unit: Sensor unit
+        """
+        self.capacity = capacity
+        self.unit = unit
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._next = 0
+        self._count = 0
+        self._rollups = sorted(
+            (_Rollup(resolution, buckets) for resolution, buckets in rollups),
+            key=lambda rollup: rollup.resolution,
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample."""
+        self._times[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        for rollup in self._rollups:
+            rollup.add(timestamp, value)
+
+    def latest(self) -> Optional[TelemetryPoint]:
+        """Get the newest raw sample."""
+        if not self._count:
+            return None
+        i = (self._next - 1) % self.capacity
+        value = self._values[i]
+        return TelemetryPoint(self._times[i], value, value, value)
+
+    def points(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        resolution: Optional[int] = None,
+    ) -> List[TelemetryPoint]:
+        """Get samples in a time range.
+
+        Args:
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+            resolution: Bucket size in seconds; None returns raw samples,
+                otherwise the finest rollup at least this coarse is used
+
+        Returns:
+            Points ordered oldest first
+        """
+        start = float("-inf") if start is None else start
+        end = float("inf") if end is None else end
+
+        if resolution:
+            rollup = next(
+                (r for r in self._rollups if r.resolution >= resolution),
+                self._rollups[-1] if self._rollups else None,
+            )
+            if rollup is not None:
+                return rollup.points(start, end)
+
+        points = []
+        for i in _ring_indices(self._next, self._count, self.capacity):
+            if start <= self._times[i] <= end:
+                value = self._values[i]
+                points.append(TelemetryPoint(self._times[i], value, value, value))
+        return points
+
+
+class SensorTelemetryStore:
+    """In-memory per-BMC, per-sensor time-series store."""
+
+    def __init__(
+        self,
+        capacity: int = 720,
+        rollups: Sequence[Tuple[int, int]] = DEFAULT_ROLLUPS,
+    ):
+        """Initialize telemetry store.
+
+        Args:
+            capacity: Raw samples kept per sensor
+            rollups: (bucket seconds, bucket count) pairs kept per sensor
+        """
+        self.capacity = capacity
+        self.rollups = tuple(rollups)
+        self._series: Dict[Tuple[str, str], SensorSeries] = {}
+        self._latest: Dict[str, Dict[str, SensorReading]] = {}
+        self._updated: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    def record(
+        self,
+        host: str,
+        readings: Iterable[SensorReading],
+        timestamp: Optional[float] = None,
+    ) -> int:
+        """Store one poll of a BMC's sensors.
+
+        Args:
+            host: BMC address
+            readings: Sensor readings from the poll
+            timestamp: Poll time (defaults to now)
+
+        Returns:
+            Number of numeric samples stored
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        stored = 0
+        with self._lock:
+            latest = self._latest.setdefault(host, {})
+            for reading in readings:
+                latest[reading.name] = reading
+                value = _to_float(reading.value)
+                if value is None:
+                    continue
+                series = self._series.get((host, reading.name))
+                if series is None:
+                    series = SensorSeries(self.capacity, self.rollups, reading.unit)
+                    self._series[(host, reading.name)] = series
+                series.append(timestamp, value)
+                stored += 1
+            self._updated[host] = timestamp
+        return stored
+
+    def hosts(self) -> List[str]:
+        """Get BMCs with stored telemetry."""
+        with self._lock:
+            return sorted(self._latest)
+
+    def sensors(self, host: str) -> List[str]:
+        """Get sensor names with stored readings for a BMC."""
+        with self._lock:
+            return sorted(self._latest.get(host, {}))
+
+    def last_updated(self, host: str) -> Optional[float]:
+        """Get the time of the last stored poll for a BMC."""
+        with self._lock:
+            return self._updated.get(host)
+
+    def latest(self, host: str) -> Dict[str, SensorReading]:
+        """Get the most recent reading of every sensor on a BMC."""
+        with self._lock:
+            return dict(self._latest.get(host, {}))
+
+    def query(
+        self,
+        host: str,
+        sensor: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        resolution: Optional[int] = None,
+    ) -> List[TelemetryPoint]:
+        """Get a sensor's time series.
+
+        Args:
+            host: BMC address
+            sensor: Sensor name
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+            resolution: Bucket size in seconds (None for raw samples)
+
+        Returns:
+            Points ordered oldest first (empty if the sensor is unknown)
+
+        Raises:
+            ValueError: If resolution is not a positive number of seconds
+        """
+        if resolution is not None and resolution <= 0:
+            raise ValueError(f"resolution must be positive, got {resolution}")
+        with self._lock:
+            series = self._series.get((host, sensor))
+            if series is None:
+                return []
+            return series.points(start, end, resolution)
+
+    def fleet_trend(
+        self,
+        match: Union[str, Callable[[str], bool]],
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        resolution: int = 60,
+    ) -> List[TelemetryPoint]:
+        """Aggregate matching sensors across all BMCs into one trend.
+
+        Args:
+            match: Case-insensitive substring of the sensor name, or a
+                predicate on the sensor name
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+            resolution: Bucket size in seconds
+
+        Returns:
+            One point per bucket with the fleet mean, minimum and maximum
+
+        Raises:
+            ValueError: If resolution is not a positive number of seconds
+        """
+        if resolution <= 0:
+            raise ValueError(f"resolution must be positive, got {resolution}")
+        if isinstance(match, str):
+            needle = match.lower()
+
+            def match(name: str) -> bool:
+                return needle in name.lower()
+
+        buckets: Dict[float, List[float]] = {}
+        with self._lock:
+            for (_, sensor), series in self._series.items():
+                if not match(sensor):
+                    continue
+                for point in series.points(start, end, resolution):
+                    bucket_start = point.timestamp - point.timestamp % resolution
+                    bucket = buckets.setdefault(
+                        bucket_start, [0.0, 0, point.minimum, point.maximum]
+                    )
+                    bucket[0] += point.value * point.count
+                    bucket[1] += point.count
+                    bucket[2] = min(bucket[2], point.minimum)
+                    bucket[3] = max(bucket[3], point.maximum)
+
+        return [
+            TelemetryPoint(ts, total / count, low, high, count)
+            for ts, (total, count, low, high) in sorted(buckets.items())
+        ]
+
+    def alerts(self, hosts: Optional[Iterable[str]] = None) -> List[TelemetryAlert]:
+        """Get sensors whose latest reading is in warning or critical state.
+
+        A sensor alerts if its status is non-nominal or its value is above
+        its upper threshold.
+
+        Args:
+            hosts: BMCs to check (defaults to all)
+
+        Returns:
+            Active alerts, critical first
+        """
+        alerts = []
+        with self._lock:
+            for host in hosts if hosts is not None else list(self._latest):
+                timestamp = self._updated.get(host, 0.0)
+                for reading in self._latest.get(host, {}).values():
+                    value = _to_float(reading.value)
+                    threshold = _to_float(reading.upper_threshold)
+                    severity = classify_sensor_status(reading.status)
+                    if (
+                        severity is None
+                        and value is not None
+                        and threshold is not None
+                        and value > threshold
+                    ):
+                        severity = "critical"
+                    if severity:
+                        alerts.append(
+                            TelemetryAlert(
+                                host=host,
+                                sensor=reading.name,
+                                severity=severity,
+                                value=value,
+                                status=reading.status,
+                                threshold=threshold,
+                                timestamp=timestamp,
+                            )
+                        )
+        alerts.sort(key=lambda a: (a.severity != "critical", a.host, a.sensor))
+        return alerts
+
+
+class SensorTelemetryCollector:
+    """Background poller feeding a SensorTelemetryStore."""
+
+    def __init__(
+        self,
+        targets: Union[
+            Iterable[IPMICredentials], Callable[[], Iterable[IPMICredentials]]
+        ],
+        store: Optional[SensorTelemetryStore] = None,
+        sensor_manager: Optional[SensorManager] = None,
+        interval: float = 60.0,
+        executor: Optional[BulkIPMIExecutor] = None,
+        alert_callback: Optional[Callable[[List[TelemetryAlert]], None]] = None,
+    ):
+        """Initialize telemetry collector.
+
+        Args:
+            targets: BMC credentials, or a callable returning them on each
+                poll so newly known BMCs are picked up
+            store: Telemetry store (a new one is created if omitted)
+            sensor_manager: Sensor manager used to read BMCs
+            interval: Seconds between poll starts
+            executor: Bulk executor used to poll BMCs concurrently
+            alert_callback: Called with alerts that became active in a poll
+        """
+        self._targets = targets if callable(targets) else list(targets)
+        self.store = store or SensorTelemetryStore()
+        self.sensor_manager = sensor_manager or SensorManager(cache_ttl=0)
+        self.interval = interval
+        self.executor = executor or BulkIPMIExecutor(max_workers=16, timeout=interval)
+        self.alert_callback = alert_callback
+
+        self._active_alerts: Set[Tuple[str, str, str]] = set()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def poll_once(self) -> BulkResult:
+        """Poll every target BMC once and store the readings.
+
+        Returns:
+            Per-BMC results of the poll
+        """
+        targets = self._targets() if callable(self._targets) else self._targets
+        credentials = {c.ip_address: c for c in targets}
+
+        def poll(host: str) -> int:
+            readings = self.sensor_manager.get_sensor_data(credentials[host], max_age=0)
+            return self.store.record(host, readings)
+
+        results = self.executor.run(list(credentials), poll)
+        if results.failed:
+            logger.warning(
+                f"Sensor telemetry poll failed for {len(results.failed)} BMCs"
+            )
+        self._dispatch_alerts(results.succeeded)
+        return results
+
+    def _dispatch_alerts(self, hosts: List[str]) -> None:
+        """Report alerts that became active on the polled hosts."""
+        polled = set(hosts)
+        current = self.store.alerts(hosts)
+        keys = {(a.host, a.sensor, a.severity) for a in current}
+        new_alerts = [
+            a
+            for a in current
+            if (a.host, a.sensor, a.severity) not in self._active_alerts
+        ]
+        self._active_alerts = {
+            key for key in self._active_alerts if key[0] not in polled
+        } | keys
+
+        if new_alerts and self.alert_callback:
+            try:
+                self.alert_callback(new_alerts)
+            except Exception as e:
+                logger.warning(f"Telemetry alert callback failed: {e}")
+
+    def _run(self) -> None:
+        """Poll until stopped."""
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.error(f"Sensor telemetry poll failed: {e}")
+            delay = max(0.0, self.interval - (time.monotonic() - started))
+            self._stop_event.wait(delay)
+
+    def start(self) -> None:
+        """Start polling in a background thread."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="ipmi-telemetry", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Started sensor telemetry collector (interval {self.interval}s)")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling and wait for the background thread.
+
+        Args:
+            timeout: Seconds to wait for the current poll to finish
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("Stopped sensor telemetry collector")
+
+
+def targets_from_database(
+    db_helper, username: str, password: str, working_only: bool = True
+) -> Callable[[], List[IPMICredentials]]:
+    """Build a collector target provider from the servers table.
+
+    Args:
+        db_helper: DbHelper instance
+        username: IPMI username for all BMCs
+        password: IPMI password for all BMCs
+        working_only: Only include BMCs marked as working
+
+    Returns:
+        Callable returning credentials for the current set of BMCs
+    """
+
+    def provider() -> List[IPMICredentials]:
+        return [
+            IPMICredentials(ip_address=ip, username=username, password=password)
+            for ip in db_helper.get_ipmi_addresses(working_only=working_only)
+        ]
+
+    return provider
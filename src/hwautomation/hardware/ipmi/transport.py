@@ -0,0 +1,751 @@
+"""IPMI command transports.
+
+Every IPMI operation is issued as an ``ipmitool``-style command string
+(``power status``, ``sensor list``, ``raw 0x30 0x70 ...``) and returns a
+``subprocess.CompletedProcess`` so existing output parsers keep working.
+
+``IpmitoolTransport`` forks ``ipmitool`` for each call and is the default.
+``NativeIPMITransport`` is opt-in (``transport: native`` in the IPMI config,
+or :func:`set_default_transport`): it serves the common commands over a
+persistent in-process RMCP+ session (see :mod:`.rmcp`) and renders
+``ipmitool``-compatible output. Any other command, a non-lanplus interface,
+a BMC without a supported cipher suite, or a session that cannot be
+established falls back to ``ipmitool``.
+"""
+
+import math
+import struct
+import subprocess
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+from hwautomation.logging import get_logger
+
+from .base import IPMICommand, IPMICommandError, IPMIConnectionError, IPMICredentials
+from .rmcp import (
+    RmcpSession,
+    RmcpSessionPool,
+    UnsupportedCipherSuiteError,
+    get_session_pool,
+)
+
+logger = get_logger(__name__)
+
+NETFN_CHASSIS = 0x00
+NETFN_SENSOR = 0x04
+NETFN_APP = 0x06
+NETFN_STORAGE = 0x0A
+
+CHASSIS_CONTROLS = {
+    "off": (0x00, "Down/Off"),
+    "on": (0x01, "Up/On"),
+    "cycle": (0x02, "Cycle"),
+    "reset": (0x03, "Reset"),
+    "soft": (0x05, "Soft"),
+}
+
+MANUFACTURERS = {
+    2: "IBM",
+    11: "Hewlett-Packard",
+    343: "Intel Corporation",
+    674: "Dell Inc.",
+    10876: "Supermicro",
+    19046: "Lenovo",
+    47196: "Hewlett Packard Enterprise",
+}
+
+SENSOR_UNITS = {
+    0: "unspecified",
+    1: "degrees C",
+    2: "degrees F",
+    3: "degrees K",
+    4: "Volts",
+    5: "Amps",
+    6: "Watts",
+    7: "Joules",
+    18: "RPM",
+    19: "Hz",
+}
+
+LINEARIZATION = {
+    0: lambda x: x,
+    1: math.log,
+    2: math.log10,
+    3: math.log2,
+    4: math.exp,
+    5: lambda x: 10**x,
+    6: lambda x: 2**x,
+    7: lambda x: 1 / x,
+    8: lambda x: x**2,
+    9: lambda x: x**3,
+    10: math.sqrt,
+    11: lambda x: x ** (1 / 3),
+}
+
+COMPLETION_CODES = {
+    0xC0: "Node busy",
+    0xC1: "Invalid command",
+    0xC3: "Timeout",
+    0xC5: "Reservation cancelled or invalid",
+    0xC7: "Request data length invalid",
+    0xC9: "Parameter out of range",
+    0xCC: "Invalid data field in request",
+    0xD4: "Insufficient privilege level",
+    0xD5: "Command not supported in present state",
+}
+
+
+def completion_code_text(cc: int) -> str:
+    """Human readable text for an IPMI completion code."""
+    return COMPLETION_CODES.get(cc, f"Unknown (0x{cc:02x})")
+
+
+def _command_args(command: Union[str, IPMICommand, List[str]]) -> List[str]:
+    if isinstance(command, IPMICommand):
+        command = command.value
+    if isinstance(command, str):
+        return command.split()
+    return list(command)
+
+
+class IPMITransport(ABC):
+    """Executes ipmitool-style commands against a BMC."""
+
+    @abstractmethod
+    def execute(
+        self,
+        credentials: IPMICredentials,
+        command: Union[str, IPMICommand, List[str]],
+        timeout: int = 30,
+        additional_args: Optional[List[str]] = None,
+    ) -> subprocess.CompletedProcess:
+        """Execute an IPMI command.
+
+        Args:
+            credentials: IPMI connection credentials
+            command: ipmitool command, e.g. ``"power status"``
+            timeout: Command timeout in seconds
+            additional_args: Extra ipmitool options placed before the command
+
+        Returns:
+            Completed process result with ipmitool-compatible output
+
+        Raises:
+            subprocess.TimeoutExpired: If the command times out
+        """
+        pass
+
+
+class IpmitoolTransport(IPMITransport):
+    """Runs each command as an ``ipmitool`` subprocess."""
+
+    def __init__(self, binary: str = "ipmitool"):
+        """Initialize transport.
+
+        Args:
+            binary: ipmitool executable
+        """
+        self.binary = binary
+
+    def build_args(
+        self,
+        credentials: IPMICredentials,
+        command: Union[str, IPMICommand, List[str]],
+        additional_args: Optional[List[str]] = None,
+    ) -> List[str]:
+        """Build the ipmitool argument list for a command."""
+        cmd_args = [
+            self.binary,
+            "-I",
+            credentials.interface,
+            "-H",
+            credentials.ip_address,
+            "-U",
+            credentials.username,
+            "-P",
+            credentials.password,
+        ]
+        if credentials.port != 623:
+            cmd_args.extend(["-p", str(credentials.port)])
+        if additional_args:
+            cmd_args.extend(additional_args)
+        cmd_args.extend(_command_args(command))
+        return cmd_args
+
+    def execute(
+        self,
+        credentials: IPMICredentials,
+        command: Union[str, IPMICommand, List[str]],
+        timeout: int = 30,
+        additional_args: Optional[List[str]] = None,
+    ) -> subprocess.CompletedProcess:
+        """Execute a command with ipmitool."""
+        return subprocess.run(
+            self.build_args(credentials, command, additional_args),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+
+
+@dataclass
+class SensorRecord:
+    """Analog conversion data from an SDR full or compact sensor record."""
+
+    record_id: int
+    sensor_number: int
+    name: str
+    owner_id: int = 0x20
+    analog: bool = False
+    analog_format: int = 0
+    unit: str = "discrete"
+    percentage: bool = False
+    m: int = 1
+    b: int = 0
+    b_exp: int = 0
+    r_exp: int = 0
+    linearization: int = 0
+    readable_thresholds: int = 0
+    thresholds: Tuple[int, ...] = ()
+
+    def convert(self, raw: int) -> float:
+        """Convert a raw reading to engineering units."""
+        if self.analog_format == 1:
+            value = raw - 0xFF if raw & 0x80 else raw
+        elif self.analog_format == 2:
+            value = raw - 0x100 if raw & 0x80 else raw
+        else:
+            value = raw
+        result = (self.m * value + self.b * 10**self.b_exp) * 10**self.r_exp
+        try:
+            return LINEARIZATION.get(self.linearization, LINEARIZATION[0])(result)
+        except (ValueError, ZeroDivisionError, OverflowError):
+            return float("nan")
+
+
+def _signed(value: int, bits: int) -> int:
+    return value - (1 << bits) if value & (1 << (bits - 1)) else value
+
+
+def parse_sdr_record(record_id: int, record: bytes) -> Optional[SensorRecord]:
+    """
+    Decode a full (type 1) or compact (type 2) SDR sensor record.
+
+    Args:
+        record_id: SDR record ID
+        record: Complete record bytes including the 5-byte header
+
+    Returns:
+        SensorRecord, or None for record types without sensors
+    """
+    if len(record) < 5:
+        return None
+    record_type = record[3]
+
+    if record_type == 0x01 and len(record) >= 48:
+        units_1 = record[20]
+        analog_format = units_1 >> 6
+        name_length = record[47] & 0x1F
+        return SensorRecord(
+            record_id=record_id,
+            sensor_number=record[7],
+            name=record[48 : 48 + name_length].decode("latin-1").strip(),
+            owner_id=record[5],
+            analog=analog_format != 3 and record[13] == 0x01,
+            analog_format=analog_format,
+            unit=SENSOR_UNITS.get(record[21], "unspecified"),
+            percentage=bool(units_1 & 0x01),
+            m=_signed(record[24] | ((record[25] & 0xC0) << 2), 10),
+            b=_signed(record[26] | ((record[27] & 0xC0) << 2), 10),
+            r_exp=_signed(record[29] >> 4, 4),
+            b_exp=_signed(record[29] & 0x0F, 4),
+            linearization=record[23] & 0x7F,
+            readable_thresholds=record[18] & 0x3F,
+            # LNC, LCR, LNR, UNC, UCR, UNR as ordered by the readable mask
+            thresholds=(
+                record[41],
+                record[40],
+                record[39],
+                record[38],
+                record[37],
+                record[36],
+            ),
+        )
+
+    if record_type == 0x02 and len(record) >= 32:
+        name_length = record[31] & 0x1F
+        return SensorRecord(
+            record_id=record_id,
+            sensor_number=record[7],
+            name=record[32 : 32 + name_length].decode("latin-1").strip(),
+            owner_id=record[5],
+        )
+
+    return None
+
+
+def _decode_fru_field(data: bytes, offset: int) -> Tuple[Optional[str], int]:
+    """Decode one FRU type/length field, returning (value, next offset)."""
+    if offset >= len(data) or data[offset] == 0xC1:
+        return None, len(data)
+    type_length = data[offset]
+    field_type, length = type_length >> 6, type_length & 0x3F
+    raw = data[offset + 1 : offset + 1 + length]
+    offset += 1 + length
+
+    if field_type == 3:
+        return raw.decode("latin-1").rstrip("\x00 "), offset
+    if field_type == 2:
+        bits = int.from_bytes(raw, "little")
+        chars = (len(raw) * 8) // 6
+        text = "".join(chr(((bits >> (6 * i)) & 0x3F) + 0x20) for i in range(chars))
+        return text.rstrip(), offset
+    if field_type == 1:
+        digits = "0123456789 -.:,_"
+        # High nibble first, as ipmitool decodes it
+        text = "".join(digits[b >> 4] + digits[b & 0x0F] for b in raw)
+        return text.rstrip(), offset
+    return raw.hex(), offset
+
+
+def _decode_fru_area(data: bytes, start: int, skip: int, names: List[str]) -> Dict:
+    fields: Dict[str, str] = {}
+    offset = start + skip
+    for name in names:
+        value, offset = _decode_fru_field(data, offset)
+        if value is None:
+            break
+        if value:
+            fields[name] = value
+    return fields
+
+
+CHASSIS_TYPES = {
+    0x01: "Other",
+    0x03: "Desktop",
+    0x11: "Main Server Chassis",
+    0x17: "Rack Mount Chassis",
+    0x1C: "Blade",
+}
+
+
+def parse_fru_inventory(data: bytes) -> Dict[str, str]:
+    """
+    Decode chassis, board and product areas of a FRU inventory.
+
+    Returns:
+        Mapping of ipmitool ``fru print`` labels to values
+    """
+    fields: Dict[str, str] = {}
+    if len(data) < 8 or data[0] & 0x0F != 0x01:
+        return fields
+    chassis, board, product = data[2] * 8, data[3] * 8, data[4] * 8
+
+    if chassis:
+        fields["Chassis Type"] = CHASSIS_TYPES.get(data[chassis + 2], "Unknown")
+        fields.update(
+            _decode_fru_area(
+                data, chassis, 3, ["Chassis Part Number", "Chassis Serial"]
+            )
+        )
+    if board:
+        minutes = int.from_bytes(data[board + 3 : board + 6], "little")
+        if minutes:
+            mfg_date = datetime(1996, 1, 1) + timedelta(minutes=minutes)
+            fields["Board Mfg Date"] = mfg_date.strftime("%a %b %d %H:%M:%S %Y")
+        fields.update(
+            _decode_fru_area(
+                data,
+                board,
+                6,
+                ["Board Mfg", "Board Product", "Board Serial", "Board Part Number"],
+            )
+        )
+    if product:
+        fields.update(
+            _decode_fru_area(
+                data,
+                product,
+                3,
+                [
+                    "Product Manufacturer",
+                    "Product Name",
+                    "Product Part Number",
+                    "Product Version",
+                    "Product Serial",
+                    "Product Asset Tag",
+                ],
+            )
+        )
+    return fields
+
+
+def _remaining(deadline: float, args: List[str], timeout: float) -> float:
+    """Time left before ``deadline``, raising TimeoutExpired once it passed."""
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise subprocess.TimeoutExpired(["native", *args], timeout)
+    return remaining
+
+
+class _DeadlineSession:
+    """Session view that bounds every request of one command by a deadline."""
+
+    def __init__(self, session: RmcpSession, deadline: float):
+        self._session = session
+        self._deadline = deadline
+
+    def request(self, netfn: int, cmd: int, data: bytes = b"") -> Tuple[int, bytes]:
+        return self._session.request(netfn, cmd, data, deadline=self._deadline)
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+
+def _format_value(value: Optional[float]) -> str:
+    if value is None or math.isnan(value):
+        return "na"
+    return f"{value:.3f}"
+
+
+class NativeIPMITransport(IPMITransport):
+    """Serves common commands over persistent RMCP+ sessions."""
+
+    def __init__(
+        self,
+        pool: Optional[RmcpSessionPool] = None,
+        fallback: Optional[IPMITransport] = None,
+    ):
+        """Initialize native transport.
+
+        Args:
+            pool: RMCP+ session pool (defaults to the process-wide pool)
+            fallback: Transport for commands and BMCs not handled natively
+        """
+        self.pool = pool or get_session_pool()
+        self.fallback = fallback or IpmitoolTransport()
+        self._unsupported_hosts: Set[Tuple[str, int]] = set()
+        self._sdr_cache: Dict[Tuple[str, int], Tuple[bytes, List[SensorRecord]]] = {}
+        self._lock = threading.Lock()
+        self._handlers: Dict[
+            Tuple[str, ...], Callable[[RmcpSession, List[str]], Tuple[int, str, str]]
+        ] = {
+            ("power",): self._power,
+            ("chassis", "power"): self._power,
+            ("mc", "info"): self._mc_info,
+            ("sensor", "list"): self._sensor_list,
+            ("fru", "print"): self._fru_print,
+            ("fru", "list"): self._fru_print,
+            ("raw",): self._raw,
+            ("user", "set", "password"): self._set_user_password,
+        }
+
+    def _find_handler(self, args: List[str]):
+        for length in (3, 2, 1):
+            handler = self._handlers.get(tuple(args[:length]))
+            if handler:
+                return handler, args[length:]
+        return None, args
+
+    def execute(
+        self,
+        credentials: IPMICredentials,
+        command: Union[str, IPMICommand, List[str]],
+        timeout: int = 30,
+        additional_args: Optional[List[str]] = None,
+    ) -> subprocess.CompletedProcess:
+        """Execute a command natively when possible, else via the fallback."""
+        args = _command_args(command)
+        handler, handler_args = self._find_handler(args)
+        host_key = (credentials.ip_address, credentials.port)
+
+        if (
+            handler is None
+            or additional_args
+            or credentials.interface != "lanplus"
+            or host_key in self._unsupported_hosts
+        ):
+            return self.fallback.execute(credentials, args, timeout, additional_args)
+
+        deadline = time.monotonic() + timeout
+        session = _DeadlineSession(
+            self.pool.get(
+                credentials.ip_address,
+                credentials.username,
+                credentials.password,
+                credentials.port,
+            ),
+            deadline,
+        )
+        try:
+            returncode, stdout, stderr = handler(session, handler_args)
+        except UnsupportedCipherSuiteError as e:
+            logger.info(f"Using ipmitool for {credentials.ip_address}: {e}")
+            with self._lock:
+                self._unsupported_hosts.add(host_key)
+            return self.fallback.execute(
+                credentials, args, _remaining(deadline, args, timeout)
+            )
+        except IPMIConnectionError as e:
+            self.pool.discard(
+                credentials.ip_address,
+                credentials.username,
+                credentials.password,
+                credentials.port,
+            )
+            logger.info(f"Native IPMI failed for {credentials.ip_address}: {e}")
+            return self.fallback.execute(
+                credentials, args, _remaining(deadline, args, timeout)
+            )
+        except (IPMICommandError, ValueError) as e:
+            returncode, stdout, stderr = 1, "", f"{e}\n"
+
+        return subprocess.CompletedProcess(
+            ["native", *args], returncode, stdout, stderr
+        )
+
+    # Command handlers return (returncode, stdout, stderr)
+
+    def _call(
+        self, session: RmcpSession, netfn: int, cmd: int, data: bytes = b""
+    ) -> bytes:
+        cc, payload = session.request(netfn, cmd, data)
+        if cc != 0:
+            raise IPMICommandError(
+                f"netfn=0x{netfn:02x} cmd=0x{cmd:02x} failed: "
+                f"{completion_code_text(cc)}",
+                f"0x{netfn:02x} 0x{cmd:02x}",
+                cc,
+            )
+        return payload
+
+    def _power(self, session: RmcpSession, args: List[str]) -> Tuple[int, str, str]:
+        action = args[0] if args else "status"
+        if action == "status":
+            status = self._call(session, NETFN_CHASSIS, 0x01)
+            state = "on" if status[0] & 0x01 else "off"
+            return 0, f"Chassis Power is {state}\n", ""
+        if action not in CHASSIS_CONTROLS:
+            return 1, "", f"Invalid chassis power command: {action}\n"
+        control, label = CHASSIS_CONTROLS[action]
+        self._call(session, NETFN_CHASSIS, 0x02, bytes([control]))
+        return 0, f"Chassis Power Control: {label}\n", ""
+
+    def _mc_info(self, session: RmcpSession, args: List[str]) -> Tuple[int, str, str]:
+        data = self._call(session, NETFN_APP, 0x01)
+        manufacturer_id = int.from_bytes(data[6:9], "little") & 0x0FFFFF
+        product_id = int.from_bytes(data[9:11], "little")
+        firmware = f"{data[2] & 0x7F}.{data[3]:02x}"
+        ipmi_version = f"{data[4] & 0x0F}.{data[4] >> 4}"
+        lines = [
+            ("Device ID", str(data[0])),
+            ("Device Revision", str(data[1] & 0x0F)),
+            ("Firmware Revision", firmware),
+            ("IPMI Version", ipmi_version),
+            ("Manufacturer ID", str(manufacturer_id)),
+            ("Manufacturer Name", MANUFACTURERS.get(manufacturer_id, "Unknown")),
+            ("Product ID", f"{product_id} (0x{product_id:04x})"),
+            ("Device Available", "no" if data[2] & 0x80 else "yes"),
+        ]
+        return 0, "".join(f"{k:<26}: {v}\n" for k, v in lines), ""
+
+    def _read_sdr(self, session: RmcpSession) -> List[SensorRecord]:
+        """Read the SDR repository, reusing it while it is unchanged."""
+        info = self._call(session, NETFN_STORAGE, 0x20)
+        host_key = (session.host, session.port)
+        # Most recent addition/erase timestamps identify the repository state
+        stamp = bytes(info[5:13])
+        with self._lock:
+            cached = self._sdr_cache.get(host_key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        records: List[SensorRecord] = []
+        reservation = self._call(session, NETFN_STORAGE, 0x22)[:2]
+        record_id = 0
+        while record_id != 0xFFFF:
+            header = None
+            for _ in range(3):
+                try:
+                    header = self._get_sdr(session, reservation, record_id, 0, 5)
+                    break
+                except IPMICommandError as e:
+                    if e.exit_code != 0xC5:
+                        raise
+                    reservation = self._call(session, NETFN_STORAGE, 0x22)[:2]
+            if header is None:
+                break
+            next_id, chunk = header
+            record = bytearray(chunk)
+            total = 5 + chunk[4]
+            while len(record) < total:
+                count = min(16, total - len(record))
+                _, chunk = self._get_sdr(
+                    session, reservation, record_id, len(record), count
+                )
+                record.extend(chunk)
+            sensor = parse_sdr_record(record_id, bytes(record))
+            if sensor:
+                records.append(sensor)
+            record_id = next_id
+
+        with self._lock:
+            self._sdr_cache[host_key] = (stamp, records)
+        return records
+
+    def _get_sdr(
+        self,
+        session: RmcpSession,
+        reservation: bytes,
+        record_id: int,
+        offset: int,
+        count: int,
+    ) -> Tuple[int, bytes]:
+        data = self._call(
+            session,
+            NETFN_STORAGE,
+            0x23,
+            reservation + struct.pack("<HBB", record_id, offset, count),
+        )
+        return struct.unpack("<H", data[:2])[0], data[2:]
+
+    def _sensor_list(
+        self, session: RmcpSession, args: List[str]
+    ) -> Tuple[int, str, str]:
+        lines = []
+        for sensor in self._read_sdr(session):
+            if sensor.owner_id != 0x20:
+                # Sensors owned by satellite controllers need IPMB bridging
+                continue
+            cc, reading = session.request(
+                NETFN_SENSOR, 0x2D, bytes([sensor.sensor_number])
+            )
+            if cc != 0 or len(reading) < 2 or reading[1] & 0x20:
+                value, status = "na", "na"
+                columns = ["na"] * 6
+                unit = sensor.unit if sensor.analog else "discrete"
+            elif sensor.analog:
+                state = reading[2] if len(reading) > 2 else 0
+                value = _format_value(sensor.convert(reading[0]))
+                status = (
+                    "nr"
+                    if state & 0x24
+                    else "cr" if state & 0x12 else "nc" if state & 0x09 else "ok"
+                )
+                # ipmitool column order: LNR LCR LNC UNC UCR UNR
+                columns = [
+                    (
+                        _format_value(sensor.convert(sensor.thresholds[bit]))
+                        if sensor.readable_thresholds & (1 << bit)
+                        else "na"
+                    )
+                    for bit in (2, 1, 0, 3, 4, 5)
+                ]
+                unit = "percent" if sensor.percentage else sensor.unit
+            else:
+                state = reading[2] if len(reading) > 2 else 0
+                extra = reading[3] if len(reading) > 3 else 0
+                value, unit = f"0x{state:x}", "discrete"
+                status = f"0x{state:02x}{extra:02x}"
+                columns = ["na"] * 6
+            lines.append(
+                " | ".join(
+                    [f"{sensor.name:<16}", f"{value:<10}", f"{unit:<10}", status]
+                    + [f"{c:<10}" for c in columns]
+                )
+            )
+        return 0, "\n".join(lines) + ("\n" if lines else ""), ""
+
+    def _fru_print(self, session: RmcpSession, args: List[str]) -> Tuple[int, str, str]:
+        fru_id = int(args[0], 0) if args else 0
+        info = self._call(session, NETFN_STORAGE, 0x10, bytes([fru_id]))
+        size = struct.unpack("<H", info[:2])[0]
+        data = bytearray()
+        while len(data) < size:
+            count = min(32, size - len(data))
+            chunk = self._call(
+                session,
+                NETFN_STORAGE,
+                0x11,
+                bytes([fru_id]) + struct.pack("<HB", len(data), count),
+            )
+            if not chunk or chunk[0] == 0:
+                break
+            data.extend(chunk[1 : 1 + chunk[0]])
+
+        fields = parse_fru_inventory(bytes(data))
+        description = "Builtin FRU Device" if fru_id == 0 else "FRU Device"
+        lines = [f"FRU Device Description : {description} (ID {fru_id})"]
+        lines.extend(f" {key:<22}: {value}" for key, value in fields.items())
+        return 0, "\n".join(lines) + "\n", ""
+
+    def _raw(self, session: RmcpSession, args: List[str]) -> Tuple[int, str, str]:
+        if len(args) < 2:
+            return 1, "", "Not enough parameters given.\n"
+        values = [int(a, 0) for a in args]
+        netfn, cmd, data = values[0], values[1], bytes(values[2:])
+        cc, payload = session.request(netfn, cmd, data)
+        if cc != 0:
+            return (
+                1,
+                "",
+                f"Unable to send RAW command (channel=0x0 netfn=0x{netfn:x} lun=0x0 "
+                f"cmd=0x{cmd:x} rsp=0x{cc:x}): {completion_code_text(cc)}\n",
+            )
+        lines = [
+            " " + " ".join(f"{b:02x}" for b in payload[i : i + 16])
+            for i in range(0, len(payload), 16)
+        ]
+        return 0, "\n".join(lines) + "\n", ""
+
+    def _set_user_password(
+        self, session: RmcpSession, args: List[str]
+    ) -> Tuple[int, str, str]:
+        if len(args) < 2:
+            return 1, "", "Not enough parameters given.\n"
+        user_id, password = int(args[0]), " ".join(args[1:]).encode("utf-8")
+        if len(password) > 20:
+            return 1, "", "Password is too long (> 20 bytes)\n"
+        # Bit 7 selects a 20-byte password field
+        wide = len(password) > 16
+        field = password.ljust(20 if wide else 16, b"\x00")
+        self._call(
+            session,
+            NETFN_APP,
+            0x47,
+            bytes([user_id | (0x80 if wide else 0), 0x02]) + field,
+        )
+        return 0, f"Set User Password command successful (user {user_id})\n", ""
+
+
+_default_transport: Optional[IPMITransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> IPMITransport:
+    """Transport used by IPMI operations that are not given one explicitly."""
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = IpmitoolTransport()
+        return _default_transport
+
+
+def set_default_transport(transport: IPMITransport) -> None:
+    """Replace the process-wide default transport."""
+    global _default_transport
+    with _default_transport_lock:
+        _default_transport = transport
+
+
+def create_transport(name: str) -> IPMITransport:
+    """Create a transport by name (``"native"`` or ``"ipmitool"``)."""
+    if name == "ipmitool":
+        return IpmitoolTransport()
+    if name == "native":
+        return NativeIPMITransport()
+    raise ValueError(f"Unknown IPMI transport: {name}")
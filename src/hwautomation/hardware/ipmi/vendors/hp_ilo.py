@@ -4,6 +4,7 @@ This module provides HP iLO-specific IPMI configuration and management.
 """
 
 import subprocess
+from typing import Optional
 
 from hwautomation.logging import get_logger
 
@@ -16,6 +17,7 @@ from ..base import (
     IPMISystemInfo,
     IPMIVendor,
 )
+from ..transport import IPMITransport, get_default_transport
 
 logger = get_logger(__name__)
 
@@ -23,9 +25,10 @@ logger = get_logger(__name__)
 class HPiLOHandler(BaseVendorHandler):
     """HP iLO-specific IPMI handler."""
 
-    def __init__(self, vendor: IPMIVendor):
+    def __init__(self, vendor: IPMIVendor, transport: Optional[IPMITransport] = None):
         """Initialize HP iLO handler."""
         super().__init__(vendor)
+        self.transport = transport or get_default_transport()
         self.timeout = 30
 
     def detect_vendor(self, credentials: IPMICredentials) -> bool:
@@ -100,26 +103,7 @@ class HPiLOHandler(BaseVendorHandler):
         self, credentials: IPMICredentials, command: str
     ) -> subprocess.CompletedProcess:
         """Execute IPMI command."""
-        cmd_args = [
-            "ipmitool",
-            "-I",
-            credentials.interface,
-            "-H",
-            credentials.ip_address,
-            "-U",
-            credentials.username,
-            "-P",
-            credentials.password,
-        ]
-
-        cmd_args.extend(command.split())
-
-        return subprocess.run(
-            cmd_args,
-            capture_output=True,
-            text=True,
-            timeout=self.timeout,
-        )
+        return self.transport.execute(credentials, command, timeout=self.timeout)
 
     def _parse_mc_info(self, output: str, info: IPMISystemInfo) -> None:
         """Parse MC info output."""
@@ -4,7 +4,7 @@ This module provides Supermicro-specific IPMI configuration and management.
 """
 
 import subprocess
-from typing import List
+from typing import List, Optional
 
 from hwautomation.logging import get_logger
 
@@ -17,6 +17,7 @@ from ..base import (
     IPMISystemInfo,
     IPMIVendor,
 )
+from ..transport import IPMITransport, get_default_transport
 
 logger = get_logger(__name__)
 
@@ -24,9 +25,10 @@ logger = get_logger(__name__)
 class SupermicroHandler(BaseVendorHandler):
     """Supermicro-specific IPMI handler."""
 
-    def __init__(self, vendor: IPMIVendor):
+    def __init__(self, vendor: IPMIVendor, transport: Optional[IPMITransport] = None):
         """Initialize Supermicro handler."""
         super().__init__(vendor)
+        self.transport = transport or get_default_transport()
         self.timeout = 30
 
     def detect_vendor(self, credentials: IPMICredentials) -> bool:
@@ -229,26 +231,7 @@ class SupermicroHandler(BaseVendorHandler):
         Returns:
             Completed process
         """
-        cmd_args = [
-            "ipmitool",
-            "-I",
-            credentials.interface,
-            "-H",
-            credentials.ip_address,
-            "-U",
-            credentials.username,
-            "-P",
-            credentials.password,
-        ]
-
-        cmd_args.extend(command.split())
-
-        return subprocess.run(
-            cmd_args,
-            capture_output=True,
-            text=True,
-            timeout=self.timeout,
-        )
+        return self.transport.execute(credentials, command, timeout=self.timeout)
 
     def _parse_mc_info(self, output: str, info: IPMISystemInfo) -> None:
         """Parse MC info output.
@@ -0,0 +1,302 @@
+"""Shared power-state watcher for BMC operations.
+
+Waiting for a BMC to reach a power state used to be a busy loop per
+caller, each sleeping a fixed interval between polls. This module
+multiplexes those waits onto a single scheduler thread: each BMC is
+probed by a small worker pool with adaptive backoff, and event sources
+(such as Redfish server-sent events) can wake a wait early.
+"""
+
+import atexit
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set
+
+from hwautomation.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class PowerWatch:
+    """Handle for one caller waiting on a BMC power state."""
+
+    def __init__(self, key: Hashable, targets: Set[str], deadline: float):
+        self.key = key
+        self.targets = targets
+        self.deadline = deadline
+        self.state: Optional[str] = None
+        self.reached = False
+        self._event = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        """Whether the wait has finished (target reached or timed out)."""
+        return self._event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the wait finishes.
+
+        Args:
+            timeout: Seconds to block (None waits until the watch deadline)
+
+        Returns:
+            True if a target state was reached
+        """
+        self._event.wait(timeout)
+        return self.reached
+
+    def _finish(self, reached: bool) -> None:
+        self.reached = reached
+        self._event.set()
+
+
+class _Target:
+    """Probe schedule of one BMC shared by all of its watches."""
+
+    def __init__(self, probe: Callable[[], Optional[str]], interval: float):
+        self.probe = probe
+        self.interval = interval
+        self.due = 0.0
+        self.in_flight = False
+        self.last_state: Optional[str] = None
+        self.watches: List[PowerWatch] = []
+
+
+class PowerStateWatcher:
+    """Multiplexes power-state waits for many BMCs onto one scheduler."""
+
+    def __init__(
+        self,
+        max_workers: int = 32,
+        initial_interval: float = 1.0,
+        max_interval: float = 15.0,
+        backoff: float = 1.5,
+    ):
+        """Initialize power-state watcher.
+
+        Args:
+            max_workers: Maximum concurrent power-state probes
+            initial_interval: Seconds between probes right after a wait
+                starts or the observed state changes
+            max_interval: Upper bound for the probe interval
+            backoff: Interval multiplier while the state is unchanged
+        """
+        self.max_workers = max_workers
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+
+        self._targets: Dict[Hashable, _Target] = {}
+        self._schedule: List = []
+        self._deadlines: List = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def watch(
+        self,
+        key: Hashable,
+        probe: Callable[[], Optional[str]],
+        targets: Iterable[str],
+        timeout: float,
+        interval: Optional[float] = None,
+    ) -> PowerWatch:
+        """Start waiting for a BMC to reach one of the target states.
+
+        Args:
+            key: Identifies the BMC (and system); watches with the same key
+                share one probe schedule
+            probe: Returns the current power state string (or None)
+            targets: Power states that end the wait (case-insensitive)
+            timeout: Seconds before the wait fails
+            interval: Initial probe interval (defaults to initial_interval)
+
+        Returns:
+            PowerWatch handle
+        """
+        now = time.monotonic()
+        watch = PowerWatch(key, {t.lower() for t in targets}, now + timeout)
+
+        with self._condition:
+            self._ensure_started()
+            target = self._targets.get(key)
+            if target is None:
+                target = _Target(probe, interval or self.initial_interval)
+                self._targets[key] = target
+                self._reschedule(key, target, now)
+            else:
+                target.probe = probe
+            target.watches.append(watch)
+            heapq.heappush(
+                self._deadlines, (watch.deadline, next(self._sequence), watch)
+            )
+            self._condition.notify()
+
+        return watch
+
+    def wait_for(
+        self,
+        key: Hashable,
+        probe: Callable[[], Optional[str]],
+        targets: Iterable[str],
+        timeout: float,
+        interval: Optional[float] = None,
+    ) -> bool:
+        """Block until a BMC reaches one of the target states.
+
+        Args:
+            key: Identifies the BMC
+            probe: Returns the current power state string (or None)
+            targets: Power states that end the wait
+            timeout: Seconds before giving up
+            interval: Initial probe interval
+
+        Returns:
+            True if a target state was reached before the timeout
+        """
+        watch = self.watch(key, probe, targets, timeout, interval)
+        return watch.wait(timeout + self.max_interval)
+
+    def notify(self, key: Hashable, state: Optional[str] = None) -> None:
+        """Wake the watches of a BMC early.
+
+        Args:
+            key: Identifies the BMC
+            state: New power state if the event carried one; otherwise the
+                BMC is probed immediately
+        """
+        with self._condition:
+            target = self._targets.get(key)
+            if target is None:
+                return
+            if state is not None:
+                self._observe(key, target, state)
+            if target.watches and not target.in_flight:
+                target.interval = self.initial_interval
+                self._reschedule(key, target, time.monotonic())
+            self._condition.notify()
+
+    def shutdown(self) -> None:
+        """Stop the scheduler and fail all pending watches."""
+        with self._condition:
+            self._stopped = True
+            for target in self._targets.values():
+                for watch in target.watches:
+                    watch._finish(False)
+            self._targets.clear()
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="power-probe"
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="power-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def _reschedule(self, key: Hashable, target: _Target, due: float) -> None:
+        target.due = due
+        heapq.heappush(self._schedule, (due, next(self._sequence), key))
+
+    def _observe(self, key: Hashable, target: _Target, state: Optional[str]) -> None:
+        """Record a state and finish watches that reached a target."""
+        state = state.lower() if state else None
+        if state != target.last_state:
+            target.interval = self.initial_interval
+        else:
+            target.interval = min(target.interval * self.backoff, self.max_interval)
+        target.last_state = state
+
+        remaining = []
+        for watch in target.watches:
+            watch.state = state
+            if state in watch.targets:
+                watch._finish(True)
+            elif not watch.done:
+                remaining.append(watch)
+        target.watches = remaining
+        if not remaining:
+            self._targets.pop(key, None)
+
+    def _run(self) -> None:
+        with self._condition:
+            while not self._stopped:
+                now = time.monotonic()
+                self._expire(now)
+                wake = self._dispatch(now)
+                if self._deadlines:
+                    deadline = self._deadlines[0][0]
+                    wake = deadline if wake is None else min(wake, deadline)
+                self._condition.wait(None if wake is None else max(0.0, wake - now))
+
+    def _expire(self, now: float) -> None:
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, watch = heapq.heappop(self._deadlines)
+            if watch.done:
+                continue
+            watch._finish(False)
+            target = self._targets.get(watch.key)
+            if target is not None:
+                target.watches = [w for w in target.watches if w is not watch]
+                if not target.watches and not target.in_flight:
+                    self._targets.pop(watch.key, None)
+
+    def _dispatch(self, now: float) -> Optional[float]:
+        """Submit due probes; return the next due time."""
+        while self._schedule:
+            due, _, key = self._schedule[0]
+            target = self._targets.get(key)
+            if target is None or target.due != due or target.in_flight:
+                heapq.heappop(self._schedule)
+                continue
+            if due > now:
+                return due
+            heapq.heappop(self._schedule)
+            target.in_flight = True
+            self._executor.submit(self._probe, key, target)
+        return None
+
+    def _probe(self, key: Hashable, target: _Target) -> None:
+        try:
+            state = target.probe()
+        except Exception as e:
+            logger.debug(f"Power state probe for {key} failed: {e}")
+            state = None
+
+        with self._condition:
+            target.in_flight = False
+            if self._targets.get(key) is not target:
+                return
+            self._observe(key, target, state)
+            if target.watches:
+                self._reschedule(key, target, time.monotonic() + target.interval)
+            self._condition.notify()
+
+
+_watcher: Optional[PowerStateWatcher] = None
+_watcher_lock = threading.Lock()
+
+
+def get_power_watcher() -> PowerStateWatcher:
+    """Get the process-wide power-state watcher."""
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = PowerStateWatcher()
+            atexit.register(_watcher.shutdown)
+        return _watcher
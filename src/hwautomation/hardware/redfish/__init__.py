@@ -6,13 +6,14 @@ a clean, extensible architecture.
 
 The package is organized as follows:
 - base: Core abstractions, data models, and exceptions
-- client: HTTP session management and service discovery
+- client: HTTP session management, service discovery and the async client
 - operations: Specific operation implementations (power, BIOS, firmware, system)
 - manager: Unified interface maintaining backward compatibility
 """
 
 from .base import (
     BiosAttribute,
+    BiosSettingsDiff,
     FirmwareComponent,
     HealthStatus,
     PowerAction,
@@ -24,13 +25,24 @@ from .base import (
     RedfishResponse,
     SystemInfo,
 )
-from .client import RedfishDiscovery, RedfishSession, ServiceRoot
+from .client import (
+    AsyncRedfishClient,
+    RedfishDiscovery,
+    RedfishSession,
+    RedfishSessionPool,
+    ServiceRoot,
+    get_redfish_session_pool,
+)
 from .manager import RedfishManager
 from .operations import (
     RedfishBiosOperation,
     RedfishFirmwareOperation,
     RedfishPowerOperation,
     RedfishSystemOperation,
+    bulk_bios_attributes,
+    bulk_firmware_inventory,
+    bulk_power_state,
+    bulk_push_firmware,
 )
 
 # Legacy compatibility - export main class
@@ -47,12 +59,16 @@ __all__ = [
     "RedfishCapabilities",
     "SystemInfo",
     "BiosAttribute",
+    "BiosSettingsDiff",
     "FirmwareComponent",
     "PowerState",
     "PowerAction",
     "HealthStatus",
     # Client modules
     "RedfishSession",
+    "RedfishSessionPool",
+    "get_redfish_session_pool",
+    "AsyncRedfishClient",
     "RedfishDiscovery",
     "ServiceRoot",
     # Operation modules
@@ -60,4 +76,9 @@ __all__ = [
     "RedfishSystemOperation",
     "RedfishBiosOperation",
     "RedfishFirmwareOperation",
+    # Fleet-wide operations
+    "bulk_power_state",
+    "bulk_firmware_inventory",
+    "bulk_bios_attributes",
+    "bulk_push_firmware",
 ]
@@ -44,6 +44,9 @@ class PowerAction(Enum):
     RESUME = "Resume"
     SUSPEND = "Suspend"
     RESET = "Reset"
+    # Aliases used by the power operations
+    GRACEFUL_SHUTDOWN = "GracefulShutdown"
+    GRACEFUL_RESTART = "GracefulRestart"
 
 
 class PowerState(Enum):
@@ -133,6 +136,31 @@ class BiosAttribute:
     max_value: Optional[Union[int, float]] = None
 
 
+@dataclass
+class BiosSettingsDiff:
+    """Desired BIOS attributes compared with current and pending values."""
+
+    # Differ from the current value and are not staged yet
+    changes: Dict[str, Any] = field(default_factory=dict)
+    # Differ from the current value and are already staged
+    pending: Dict[str, Any] = field(default_factory=dict)
+    # Match the current value but another value is staged
+    reverts: Dict[str, Any] = field(default_factory=dict)
+    unchanged: List[str] = field(default_factory=list)
+    # Not attributes of this system; skipped
+    unknown: List[str] = field(default_factory=list)
+
+    @property
+    def patch(self) -> Dict[str, Any]:
+        """Attributes that need to be written to the settings object."""
+        return {**self.changes, **self.reverts}
+
+    @property
+    def reboot_required(self) -> bool:
+        """Whether a reboot is needed for the desired values to take effect."""
+        return bool(self.changes or self.pending)
+
+
 @dataclass
 class FirmwareComponent:
     """Firmware component information."""
@@ -4,12 +4,43 @@ This package provides HTTP session management and service discovery
 for Redfish operations.
 """
 
+from .async_client import (
+    AsyncRedfishClient,
+    AsyncRedfishSession,
+    LimitedSession,
+    LimitedSessionPool,
+    SessionPool,
+)
 from .discovery import RedfishDiscovery, ServiceRoot, SystemInfo
-from .session import RedfishSession
+from .expand import fetch_collection
+from .registry import AttributeRegistryCache, get_registry_cache
+from .session import RedfishSession, RedfishSessionPool, get_redfish_session_pool
+from .subscriptions import EventSource, RedfishEventReceiver, get_event_receiver
+from .tasks import RedfishTaskMonitor, TaskHandle, get_task_monitor
+from .upload import FileUploadBody, MultipartUploadBody, UploadProgress
 
 __all__ = [
     "RedfishSession",
+    "RedfishSessionPool",
+    "get_redfish_session_pool",
+    "AsyncRedfishClient",
+    "AsyncRedfishSession",
+    "LimitedSessionPool",
+    "LimitedSession",
+    "SessionPool",
     "RedfishDiscovery",
     "ServiceRoot",
     "SystemInfo",
+    "fetch_collection",
+    "AttributeRegistryCache",
+    "get_registry_cache",
+    "RedfishTaskMonitor",
+    "TaskHandle",
+    "get_task_monitor",
+    "RedfishEventReceiver",
+    "EventSource",
+    "get_event_receiver",
+    "FileUploadBody",
+    "MultipartUploadBody",
+    "UploadProgress",
 ]
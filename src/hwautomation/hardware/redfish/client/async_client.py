@@ -0,0 +1,322 @@
+"""Asyncio Redfish client for fleet-scale operations.
+
+``AsyncRedfishClient`` lets a single event loop drive thousands of BMCs.
+Requests go through the pooled per-BMC ``RedfishSession`` objects (one login
+and keep-alive connection pool per BMC) and run on a bounded executor, so
+the blocking HTTP stack and its token refresh, ETag cache and error handling
+are shared with the synchronous code. The client enforces a global
+concurrency budget, a per-BMC concurrency limit and a per-BMC request rate;
+the per-BMC limits apply to every HTTP request, including each request of a
+multi-request operation run through ``AsyncRedfishClient.run``.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional, TypeVar, Union
+
+from hwautomation.logging import get_logger
+
+from ..base import RedfishCredentials, RedfishResponse
+from .session import RedfishSession, RedfishSessionPool, get_redfish_session_pool
+from .upload import FileUploadBody
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class _HostLimiter:
+    """Concurrency limit and request spacing for one BMC."""
+
+    def __init__(self, concurrency: int, rate: Optional[float]):
+        self.semaphore = threading.BoundedSemaphore(concurrency)
+        self.interval = 1.0 / rate if rate else 0.0
+        self.next_slot = 0.0
+        self.users = 0
+        self._lock = threading.Lock()
+
+    def throttle(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class AsyncRedfishClient:
+    """Concurrency-limited asyncio access to many BMCs."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 64,
+        per_host_concurrency: int = 4,
+        per_host_rate: Optional[float] = 10.0,
+        pool: Optional[RedfishSessionPool] = None,
+    ):
+        """Initialize async client.
+
+        Args:
+            max_concurrency: Requests in flight across all BMCs
+            per_host_concurrency: Requests in flight to one BMC
+            per_host_rate: Requests started per second against one BMC
+                (None for no limit)
+            pool: Session pool (defaults to the shared pool)
+        """
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_rate = per_host_rate
+        self.pool = pool or get_redfish_session_pool()
+        self.limited_pool = LimitedSessionPool(self)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="redfish-async"
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._budget: Optional[asyncio.Semaphore] = None
+        self._hosts: Dict[str, _HostLimiter] = {}
+        self._hosts_lock = threading.Lock()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        self.close()
+
+    def session(self, credentials: RedfishCredentials) -> "AsyncRedfishSession":
+        """Get an async session for a BMC.
+
+        Args:
+            credentials: Redfish connection credentials
+
+        Returns:
+            Session mirroring RedfishSession's request methods
+        """
+        return AsyncRedfishSession(self, credentials)
+
+    async def run(
+        self,
+        credentials: RedfishCredentials,
+        func: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run a blocking Redfish call for a BMC within the global budget.
+
+        The per-BMC limits apply to the requests the call makes through
+        ``limited_pool``; operations should be given that pool so every
+        request they send is limited.
+
+        Args:
+            credentials: BMC the call talks to
+            func: Blocking callable
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            Result of ``func``
+        """
+        self._bind_loop()
+        async with self._budget:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+
+    async def request(
+        self, credentials: RedfishCredentials, method: str, uri: str, **kwargs
+    ) -> RedfishResponse:
+        """Perform a request on the BMC's pooled session.
+
+        Args:
+            credentials: Redfish connection credentials
+            method: HTTP method
+            uri: Request URI
+            **kwargs: Additional request parameters
+
+        Returns:
+            Redfish response
+        """
+        return await self.run(
+            credentials, self._request, credentials, method, uri, kwargs
+        )
+
+    def close(self) -> None:
+        """Stop the executor (pooled sessions stay open)."""
+        self._executor.shutdown(wait=False)
+
+    def _request(
+        self,
+        credentials: RedfishCredentials,
+        method: str,
+        uri: str,
+        kwargs: Dict[str, Any],
+    ) -> RedfishResponse:
+        with self.limited_pool.get(credentials) as session:
+            if method == "GET":
+                return session.get(uri, **kwargs)
+            if method == "POST":
+                return session.post(uri, **kwargs)
+            if method == "PATCH":
+                return session.patch(uri, **kwargs)
+            if method == "DELETE":
+                return session.delete(uri, **kwargs)
+        raise ValueError(f"Unsupported method: {method}")
+
+    @contextmanager
+    def _host_slot(self, host: str):
+        with self._hosts_lock:
+            limiter = self._hosts.get(host)
+            if limiter is None:
+                limiter = _HostLimiter(self.per_host_concurrency, self.per_host_rate)
+                self._hosts[host] = limiter
+            limiter.users += 1
+        try:
+            with limiter.semaphore:
+                limiter.throttle()
+                yield
+        finally:
+            with self._hosts_lock:
+                limiter.users -= 1
+                if not limiter.users and limiter.next_slot <= time.monotonic():
+                    # Keep the map small when sweeping thousands of BMCs
+                    self._hosts.pop(host, None)
+
+    def _bind_loop(self) -> None:
+        # asyncio primitives belong to the loop that first uses them
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._budget = asyncio.Semaphore(self.max_concurrency)
+
+
+class LimitedSessionPool:
+    """Session pool whose sessions obey an AsyncRedfishClient's per-BMC limits.
+
+    Pass it to the operation classes run through ``AsyncRedfishClient.run`` so
+    each of their requests waits for a slot on its BMC.
+    """
+
+    def __init__(self, client: AsyncRedfishClient):
+        """Initialize limited pool.
+
+        Args:
+            client: Client whose pool and limits are used
+        """
+        self.client = client
+
+    def get(self, credentials: RedfishCredentials) -> "LimitedSession":
+        """Return the BMC's pooled session wrapped in the client's limits."""
+        return LimitedSession(
+            self.client, credentials, self.client.pool.get(credentials)
+        )
+
+
+class LimitedSession:
+    """Pooled RedfishSession whose requests each take a per-BMC slot."""
+
+    def __init__(
+        self,
+        client: AsyncRedfishClient,
+        credentials: RedfishCredentials,
+        session: RedfishSession,
+    ):
+        """Initialize limited session.
+
+        Args:
+            client: Client enforcing the per-BMC limits
+            credentials: Redfish connection credentials
+            session: Pooled session the requests are sent on
+        """
+        self.client = client
+        self.credentials = credentials
+        self.session = session
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.session.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        return self.session.__exit__(exc_type, exc_val, exc_tb)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    def _limited(self, method: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self.client._host_slot(self.credentials.host):
+            return method(*args, **kwargs)
+
+    def get(self, uri: str, **kwargs) -> RedfishResponse:
+        """Perform GET request."""
+        return self._limited(self.session.get, uri, **kwargs)
+
+    def post(self, uri: str, data: Optional[Dict] = None, **kwargs) -> RedfishResponse:
+        """Perform POST request."""
+        return self._limited(self.session.post, uri, data, **kwargs)
+
+    def patch(self, uri: str, data: Optional[Dict] = None, **kwargs) -> RedfishResponse:
+        """Perform PATCH request."""
+        return self._limited(self.session.patch, uri, data, **kwargs)
+
+    def put(self, uri: str, data: Optional[Dict] = None, **kwargs) -> RedfishResponse:
+        """Perform PUT request."""
+        return self._limited(self.session.put, uri, data, **kwargs)
+
+    def delete(self, uri: str, **kwargs) -> RedfishResponse:
+        """Perform DELETE request."""
+        return self._limited(self.session.delete, uri, **kwargs)
+
+    def upload(
+        self, uri: str, body: FileUploadBody, read_timeout: Optional[float] = None
+    ) -> RedfishResponse:
+        """POST a streaming firmware upload."""
+        return self._limited(self.session.upload, uri, body, read_timeout)
+
+
+SessionPool = Union[RedfishSessionPool, LimitedSessionPool]
+
+
+class AsyncRedfishSession:
+    """Async counterpart of RedfishSession for one BMC."""
+
+    def __init__(self, client: AsyncRedfishClient, credentials: RedfishCredentials):
+        """Initialize async session.
+
+        Args:
+            client: Client enforcing the concurrency and rate limits
+            credentials: Redfish connection credentials
+        """
+        self.client = client
+        self.credentials = credentials
+
+    async def get(self, uri: str, **kwargs) -> RedfishResponse:
+        """Perform GET request."""
+        return await self.client.request(self.credentials, "GET", uri, **kwargs)
+
+    async def post(
+        self, uri: str, data: Optional[Dict] = None, **kwargs
+    ) -> RedfishResponse:
+        """Perform POST request."""
+        return await self.client.request(
+            self.credentials, "POST", uri, data=data, **kwargs
+        )
+
+    async def patch(
+        self, uri: str, data: Optional[Dict] = None, **kwargs
+    ) -> RedfishResponse:
+        """Perform PATCH request."""
+        return await self.client.request(
+            self.credentials, "PATCH", uri, data=data, **kwargs
+        )
+
+    async def delete(self, uri: str, **kwargs) -> RedfishResponse:
+        """Perform DELETE request."""
+        return await self.client.request(self.credentials, "DELETE", uri, **kwargs)
@@ -2,16 +2,21 @@
 
 This module provides functionality to discover and validate
 Redfish services on BMC endpoints.
+
+What the service root reveals (Redfish version and supported features) is
+recorded in the shared BMC capability record, and BMCs recorded as not
+serving Redfish are not probed again.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from urllib.parse import urljoin
 
 from hwautomation.logging import get_logger
 
+from ...ipmi.capabilities import get_capability_cache
 from ..base import RedfishCredentials, RedfishError
-from .session import RedfishSession
+from .session import RedfishSession, get_redfish_session_pool
 
 logger = get_logger(__name__)
 
@@ -34,6 +39,7 @@ class ServiceRoot:
     account_service_uri: Optional[str] = None
     update_service_uri: Optional[str] = None
     task_service_uri: Optional[str] = None
+    event_service_uri: Optional[str] = None
 
 
 @dataclass
@@ -58,6 +64,24 @@ class SystemInfo:
     memory_summary: Optional[Dict] = None
 
 
+def service_root_features(data: Dict[str, Any]) -> Dict[str, bool]:
+    """Features a service root advertises.
+
+    Args:
+        data: Service root JSON
+
+    Returns:
+        ``expand``, ``sessions`` and ``events`` support flags
+    """
+    protocol_features = data.get("ProtocolFeaturesSupported") or {}
+    expand = protocol_features.get("ExpandQuery")
+    return {
+        "expand": isinstance(expand, dict) and any(expand.values()),
+        "sessions": "SessionService" in data,
+        "events": "EventService" in data,
+    }
+
+
 class RedfishDiscovery:
     """Redfish service discovery."""
 
@@ -75,15 +99,29 @@ class RedfishDiscovery:
         Returns:
             Service root information if available
         """
+        capabilities = get_capability_cache()
+        known = capabilities.lookup(self.credentials.host)
+        if known is not None and known.redfish_available is False:
+            logger.debug(f"{self.credentials.host} is recorded as not serving Redfish")
+            return None
+
         try:
-            with RedfishSession(self.credentials) as session:
+            with get_redfish_session_pool().get(self.credentials) as session:
                 response = session.get("/redfish/v1/")
 
                 if not response.success or not response.data:
                     logger.warning("Failed to get service root")
+                    if response.status_code == 404:
+                        capabilities.update_redfish(self.credentials.host, False)
                     return None
 
                 data = response.data
+                capabilities.update_redfish(
+                    self.credentials.host,
+                    available=True,
+                    version=data.get("RedfishVersion"),
+                    features=service_root_features(data),
+                )
 
                 return ServiceRoot(
                     redfish_version=data.get("RedfishVersion", "Unknown"),
@@ -100,6 +138,7 @@ class RedfishDiscovery:
                     account_service_uri=self._get_uri(data, "AccountService"),
                     update_service_uri=self._get_uri(data, "UpdateService"),
                     task_service_uri=self._get_uri(data, "TaskService"),
+                    event_service_uri=self._get_uri(data, "EventService"),
                 )
 
         except Exception as e:
@@ -115,7 +154,7 @@ class RedfishDiscovery:
         systems = []
 
         try:
-            with RedfishSession(self.credentials) as session:
+            with get_redfish_session_pool().get(self.credentials) as session:
                 # Get service root first
                 service_root = self.discover_service_root()
                 if not service_root or not service_root.systems_uri:
@@ -163,7 +202,7 @@ class RedfishDiscovery:
         }
 
         try:
-            with RedfishSession(self.credentials) as session:
+            with get_redfish_session_pool().get(self.credentials) as session:
                 # Test service root
                 service_root = self.discover_service_root()
                 if service_root:
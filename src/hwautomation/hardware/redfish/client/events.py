@@ -0,0 +1,184 @@
+"""Redfish event delivery.
+
+This module consumes the Redfish EventService server-sent event (SSE)
+stream so callers can react to BMC events instead of polling.
+"""
+
+import json
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urljoin
+
+import requests
+from requests.auth import HTTPBasicAuth
+
+from hwautomation.logging import get_logger
+
+from ..base import RedfishCredentials
+from .session import RedfishSession
+
+logger = get_logger(__name__)
+
+EVENT_SERVICE_URI = "/redfish/v1/EventService"
+
+
+def iter_sse_events(lines: Iterable[str]) -> Iterator[Dict]:
+    """Parse server-sent event lines into JSON payloads.
+
+    Args:
+        lines: Decoded lines of an SSE stream
+
+    Yields:
+        Parsed JSON payload of each event (non-JSON payloads are skipped)
+    """
+    data: List[str] = []
+    for line in lines:
+        line = line.rstrip("\r")
+        if not line:
+            if data:
+                try:
+                    yield json.loads("\n".join(data))
+                except json.JSONDecodeError:
+                    logger.debug("Ignoring non-JSON server-sent event")
+                data = []
+            continue
+        if line.startswith(":"):
+            continue  # Comment / keep-alive
+        field, _, value = line.partition(":")
+        if field == "data":
+            data.append(value[1:] if value.startswith(" ") else value)
+    if data:
+        try:
+            yield json.loads("\n".join(data))
+        except json.JSONDecodeError:
+            pass
+
+
+def event_records(payload: Dict) -> List[Dict]:
+    """Get the individual event records of a Redfish Event payload."""
+    events = payload.get("Events")
+    if isinstance(events, list):
+        return [event for event in events if isinstance(event, dict)]
+    return [payload]
+
+
+def event_origin(record: Dict) -> Optional[str]:
+    """Get the resource URI an event record refers to, if any."""
+    origin = record.get("OriginOfCondition")
+    if isinstance(origin, dict):
+        origin = origin.get("@odata.id")
+    return origin if isinstance(origin, str) else None
+
+
+def discover_sse_uri(session: RedfishSession) -> Optional[str]:
+    """Get the EventService ServerSentEventUri, if the BMC supports SSE.
+
+    Args:
+        session: Redfish session
+
+    Returns:
+        SSE stream URI or None
+    """
+    try:
+        response = session.get(EVENT_SERVICE_URI)
+    except Exception as e:
+        logger.debug(f"EventService lookup failed: {e}")
+        return None
+    if not response.success or not response.data:
+        return None
+    if response.data.get("ServiceEnabled") is False:
+        return None
+    return response.data.get("ServerSentEventUri")
+
+
+class RedfishEventStream:
+    """Background reader of a Redfish SSE stream."""
+
+    def __init__(
+        self,
+        credentials: RedfishCredentials,
+        uri: str,
+        callback: Callable[[Dict], None],
+    ):
+        """Initialize event stream.
+
+        Args:
+            credentials: Redfish connection credentials
+            uri: ServerSentEventUri of the EventService
+            callback: Called with each event record
+        """
+        self.credentials = credentials
+        self.uri = uri
+        self.callback = callback
+
+        protocol = "https" if credentials.use_ssl else "http"
+        self.url = urljoin(
+            f"{protocol}://{credentials.host}:{credentials.port}", uri.lstrip("/")
+        )
+        self._session: Optional[requests.Session] = None
+        self._response: Optional[requests.Response] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the reader thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Open the stream in a background thread."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"redfish-sse-{self.credentials.host}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Close the stream and stop the reader thread."""
+        self._stop_event.set()
+        response, session = self._response, self._session
+        if response is not None:
+            response.close()
+        if session is not None:
+            session.close()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1)
+        self._thread = None
+
+    def _run(self) -> None:
+        session = requests.Session()
+        session.auth = HTTPBasicAuth(
+            self.credentials.username, self.credentials.password
+        )
+        session.verify = self.credentials.verify_ssl
+        self._session = session
+        try:
+            response = session.get(
+                self.url,
+                headers={"Accept": "text/event-stream"},
+                stream=True,
+                timeout=(self.credentials.timeout, None),
+            )
+            self._response = response
+            if not response.ok:
+                logger.debug(
+                    f"SSE stream on {self.credentials.host} returned "
+                    f"{response.status_code}"
+                )
+                return
+            lines = response.iter_lines(decode_unicode=True)
+            for payload in iter_sse_events(line or "" for line in lines):
+                if self._stop_event.is_set():
+                    break
+                for record in event_records(payload):
+                    try:
+                        self.callback(record)
+                    except Exception as e:
+                        logger.warning(f"Redfish event callback failed: {e}")
+        except Exception as e:
+            if not self._stop_event.is_set():
+                logger.debug(f"SSE stream on {self.credentials.host} ended: {e}")
+        finally:
+            session.close()
@@ -0,0 +1,128 @@
+"""Redfish collection fetching.
+
+Reading a collection member by member costs one round trip per member.
+``fetch_collection`` asks for the members inline with ``$expand`` when the
+service advertises support for it in ``ProtocolFeaturesSupported``, and
+otherwise fetches the members concurrently on the shared session.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from hwautomation.logging import get_logger
+
+from ..base import RedfishResponse
+from .session import RedfishSession
+
+logger = get_logger(__name__)
+
+# Upper bound for follow-up pages of a paginated collection
+MAX_PAGES = 50
+
+
+def expand_query(protocol_features: Dict[str, Any]) -> Optional[str]:
+    """Build the ``$expand`` query for one level of collection members.
+
+    Args:
+        protocol_features: ProtocolFeaturesSupported from the service root
+
+    Returns:
+        Query string without the leading ``?``, or None if unsupported
+    """
+    expand = protocol_features.get("ExpandQuery")
+    if not isinstance(expand, dict):
+        return None
+
+    # "." expands subordinate resources (collection members) but not Links
+    if expand.get("NoLinks"):
+        level = "."
+    elif expand.get("ExpandAll"):
+        level = "*"
+    else:
+        return None
+
+    if expand.get("Levels"):
+        return f"$expand={level}($levels=1)"
+    return f"$expand={level}"
+
+
+def _is_expanded(member: Dict[str, Any]) -> bool:
+    return any(key != "@odata.id" for key in member)
+
+
+def _with_query(uri: str, query: str) -> str:
+    return f"{uri}{'&' if '?' in uri else '?'}{query}"
+
+
+def fetch_collection(
+    session: RedfishSession,
+    uri: str,
+    limit: Optional[int] = None,
+    max_workers: int = 8,
+) -> Tuple[RedfishResponse, List[Dict[str, Any]]]:
+    """Fetch a collection and the full resource of each member.
+
+    Args:
+        session: Redfish session
+        uri: Collection URI
+        limit: Maximum number of members to return
+        max_workers: Concurrent member requests when ``$expand`` is not
+            available
+
+    Returns:
+        Tuple of the collection response and member resources in
+        collection order; members that fail to load are skipped
+    """
+    query = expand_query(session.protocol_features)
+    response = None
+    if query:
+        response = session.get(_with_query(uri, query))
+        if not response.success:
+            logger.debug(f"$expand rejected for {uri}: {response.error_message}")
+            response = None
+    if response is None:
+        response = session.get(uri)
+    if not response.success or not isinstance(response.data, dict):
+        return response, []
+
+    members = list(response.data.get("Members", []))
+    next_link = response.data.get("Members@odata.nextLink")
+    pages = 0
+    while next_link and pages < MAX_PAGES and (limit is None or len(members) < limit):
+        page = session.get(next_link)
+        if not page.success or not isinstance(page.data, dict):
+            break
+        members.extend(page.data.get("Members", []))
+        next_link = page.data.get("Members@odata.nextLink")
+        pages += 1
+
+    members = [m for m in members if isinstance(m, dict)][:limit]
+    pending = [
+        index
+        for index, member in enumerate(members)
+        if not _is_expanded(member) and member.get("@odata.id")
+    ]
+    if pending:
+        workers = max(1, min(max_workers, len(pending)))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="redfish-member"
+        ) as executor:
+            fetched = executor.map(
+                lambda index: _fetch_member(session, members[index]["@odata.id"]),
+                pending,
+            )
+            for index, data in zip(pending, fetched):
+                members[index] = data
+
+    return response, [m for m in members if m and _is_expanded(m)]
+
+
+def _fetch_member(session: RedfishSession, uri: str) -> Optional[Dict[str, Any]]:
+    try:
+        response = session.get(uri)
+    except Exception as e:
+        logger.warning(f"Failed to get collection member {uri}: {e}")
+        return None
+    if response.success and isinstance(response.data, dict):
+        return response.data
+    return None
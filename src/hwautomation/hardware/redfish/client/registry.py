@@ -0,0 +1,275 @@
+"""Redfish attribute registry cache.
+
+BIOS attribute registries are often several megabytes and identical for
+every server of the same model and BIOS version. ``AttributeRegistryCache``
+keeps them indexed by ``AttributeName`` in memory and gzip-compressed on
+disk, keyed by registry ID. The disk cache is shared between worker
+processes, and a lock file keeps concurrent workers from downloading the
+same registry together, so a homogeneous rack downloads it once.
+"""
+
+import gzip
+import json
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from hwautomation.logging import get_logger
+
+from .session import RedfishSession
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = get_logger(__name__)
+
+RegistryIndex = Dict[str, Dict[str, Any]]
+
+
+def registry_entries(data: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """Get the attribute entries of an AttributeRegistry resource.
+
+    Args:
+        data: AttributeRegistry JSON
+
+    Returns:
+        Attribute entries, or None if the document is not an attribute registry
+    """
+    for section in ("RegistryEntries", "Registry"):
+        entries = data.get(section)
+        if isinstance(entries, dict) and isinstance(entries.get("Attributes"), list):
+            return entries["Attributes"]
+    return None
+
+
+def fetch_attribute_registry(
+    session: RedfishSession, registry_id: str
+) -> Optional[List[Dict[str, Any]]]:
+    """Download an attribute registry from the BMC.
+
+    ``/redfish/v1/Registries/{id}`` is usually a MessageRegistryFile whose
+    ``Location`` points at the registry document; some services return the
+    registry itself.
+
+    Args:
+        session: Redfish session
+        registry_id: Registry identifier (the BIOS ``AttributeRegistry`` value)
+
+    Returns:
+        Attribute entries, or None if the registry is unavailable
+    """
+    response = session.get(f"/redfish/v1/Registries/{registry_id}")
+    if not response.success or not isinstance(response.data, dict):
+        return None
+
+    entries = registry_entries(response.data)
+    if entries is not None:
+        return entries
+
+    locations = [
+        location
+        for location in response.data.get("Location", [])
+        if isinstance(location, dict) and location.get("Uri")
+    ]
+    # Prefer the English document
+    locations.sort(key=lambda location: location.get("Language", "en") != "en")
+    for location in locations:
+        document = session.get(location["Uri"])
+        if document.success and isinstance(document.data, dict):
+            entries = registry_entries(document.data)
+            if entries is not None:
+                return entries
+    return None
+
+
+class AttributeRegistryCache:
+    """Attribute registries indexed by name, cached in memory and on disk."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 16):
+        """Initialize registry cache.
+
+        Args:
+            cache_dir: Directory for compressed registries shared between
+                processes (None keeps registries in memory only)
+            max_entries: Registries kept in memory
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.downloads = 0
+        self._memory: "OrderedDict[str, RegistryIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, registry_id: str) -> Optional[RegistryIndex]:
+        """Get a cached registry index without contacting a BMC.
+
+        Args:
+            registry_id: Registry identifier
+
+        Returns:
+            Mapping of AttributeName to registry entry, or None on miss
+        """
+        with self._lock:
+            index = self._memory.get(registry_id)
+            if index is not None:
+                self._memory.move_to_end(registry_id)
+                return index
+
+        index = self._read(registry_id)
+        if index is not None:
+            self._remember(registry_id, index)
+        return index
+
+    def put(self, registry_id: str, entries: List[Dict[str, Any]]) -> RegistryIndex:
+        """Index and cache registry entries.
+
+        Args:
+            registry_id: Registry identifier
+            entries: Attribute entries of the registry
+
+        Returns:
+            Mapping of AttributeName to registry entry
+        """
+        index = {
+            entry["AttributeName"]: entry
+            for entry in entries
+            if isinstance(entry, dict) and entry.get("AttributeName")
+        }
+        self._write(registry_id, index)
+        self._remember(registry_id, index)
+        return index
+
+    def get_or_fetch(
+        self, session: RedfishSession, registry_id: str
+    ) -> Optional[RegistryIndex]:
+        """Get a registry index, downloading it once on a miss.
+
+        Args:
+            session: Redfish session used on a miss
+            registry_id: Registry identifier
+
+        Returns:
+            Mapping of AttributeName to registry entry, or None if unavailable
+        """
+        index = self.get(registry_id)
+        if index is not None:
+            return index
+
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(registry_id, threading.Lock())
+        with fetch_lock, self._process_lock(registry_id):
+            # Another thread or worker may have fetched it meanwhile
+            index = self.get(registry_id)
+            if index is not None:
+                return index
+
+            entries = fetch_attribute_registry(session, registry_id)
+            if entries is None:
+                return None
+            self.downloads += 1
+            logger.info(
+                f"Cached attribute registry {registry_id} ({len(entries)} attributes)"
+            )
+            return self.put(registry_id, entries)
+
+    def clear(self) -> None:
+        """Drop registries held in memory (the disk cache is kept)."""
+        with self._lock:
+            self._memory.clear()
+
+    def _remember(self, registry_id: str, index: RegistryIndex) -> None:
+        with self._lock:
+            self._memory[registry_id] = index
+            self._memory.move_to_end(registry_id)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _path(self, registry_id: str) -> str:
+        name = re.sub(r"[^A-Za-z0-9._-]", "_", registry_id)
+        return os.path.join(self.cache_dir, f"{name}.json.gz")
+
+    def _read(self, registry_id: str) -> Optional[RegistryIndex]:
+        if not self.cache_dir:
+            return None
+        try:
+            with gzip.open(self._path(registry_id), "rt", encoding="utf-8") as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable registry cache {registry_id}: {e}")
+            return None
+        return index if isinstance(index, dict) else None
+
+    def _write(self, registry_id: str, index: RegistryIndex) -> None:
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as raw:
+                    with gzip.open(raw, "wt", encoding="utf-8") as f:
+                        json.dump(index, f, separators=(",", ":"))
+                # Atomic so readers in other processes never see a partial file
+                os.replace(tmp_path, self._path(registry_id))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write registry cache {registry_id}: {e}")
+
+    def _process_lock(self, registry_id: str):
+        """Exclusive lock across worker processes for one registry download."""
+        return _FileLock(
+            self._path(registry_id) + ".lock" if self.cache_dir and fcntl else None
+        )
+
+
+class _FileLock:
+    """flock-based lock; a no-op without a path."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        if self.path:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._file = open(self.path, "a")
+                fcntl.flock(self._file, fcntl.LOCK_EX)
+            except OSError as e:
+                logger.debug(f"Registry cache lock unavailable: {e}")
+                self._close()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._file:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+        self._close()
+
+    def _close(self) -> None:
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+_registry_cache: Optional[AttributeRegistryCache] = None
+_registry_cache_lock = threading.Lock()
+
+
+def get_registry_cache() -> AttributeRegistryCache:
+    """Process-wide registry cache backed by ``REDFISH_REGISTRY_CACHE_DIR``."""
+    global _registry_cache
+    with _registry_cache_lock:
+        if _registry_cache is None:
+            _registry_cache = AttributeRegistryCache(
+                os.getenv("REDFISH_REGISTRY_CACHE_DIR", "data/redfish_registries")
+            )
+        return _registry_cache
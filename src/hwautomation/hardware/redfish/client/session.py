@@ -2,12 +2,26 @@
 
 This module provides HTTP session management for Redfish operations
 with proper authentication, error handling, and connection management.
+
+``RedfishSessionPool`` keeps one session per BMC and credential set. Pooled
+sessions log in once through ``SessionService`` (``X-Auth-Token``), keep
+their TLS connections alive between operations, log in again when the BMC
+expires the token, and log out when evicted.
+
+Each session also caches GET responses: resources carrying an ``ETag`` are
+revalidated with ``If-None-Match`` (a ``304`` reuses the cached body), and
+resources that do not change while a workflow runs, such as the service
+root, are served from a short-lived memo without a request.
 """
 
+import atexit
+import copy
 import json
+import threading
 import time
-from typing import Any, Dict, Optional
-from urllib.parse import urljoin
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urljoin, urlparse
 
 import requests
 from requests.auth import HTTPBasicAuth
@@ -22,20 +36,64 @@ from ..base import (
     RedfishError,
     RedfishResponse,
 )
+from .upload import FileUploadBody
 
 logger = get_logger(__name__)
 
 
+SESSIONS_URI = "/redfish/v1/SessionService/Sessions"
+
+# Resources that do not change during a workflow
+MEMO_PATHS = {"/redfish/v1", "/redfish/v1/", "/redfish/v1/odata"}
+
+
+class _CachedResource:
+    """GET response kept for conditional requests."""
+
+    def __init__(self, response: RedfishResponse, etag: Optional[str], expires: float):
+        self.response = response
+        self.etag = etag
+        self.memo_expires = expires
+
+
 class RedfishSession(BaseRedfishClient):
     """Redfish HTTP session management."""
 
-    def __init__(self, credentials: RedfishCredentials):
+    def __init__(
+        self,
+        credentials: RedfishCredentials,
+        pooled: bool = False,
+        cache_size: int = 256,
+        memo_ttl: float = 300.0,
+    ):
         """Initialize Redfish session.
 
         Args:
             credentials: Redfish connection credentials
+            pooled: Session is owned by a RedfishSessionPool; it authenticates
+                with an X-Auth-Token and is not closed when a ``with`` block
+                exits. Each open ``with`` block counts as a checkout and keeps
+                the pool from evicting the session
+            cache_size: GET responses kept for conditional requests
+                (0 disables the resource cache)
+            memo_ttl: Seconds immutable resources such as the service root
+                are served without a request
         """
         super().__init__(credentials)
+        self.pooled = pooled
+        self.cache_size = cache_size
+        self.memo_ttl = memo_ttl
+        self.cache_hits = 0
+        self._resource_cache: "OrderedDict[str, _CachedResource]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.token: Optional[str] = None
+        self.session_uri: Optional[str] = None
+        self.last_used = time.monotonic()
+        self.checkouts = 0
+        self._checkout_lock = threading.Lock()
+        self._token_supported = pooled
+        self._login_lock = threading.Lock()
+        self._protocol_features: Optional[Dict[str, Any]] = None
         self.session = requests.Session()
         self.session.auth = HTTPBasicAuth(credentials.username, credentials.password)
 
@@ -59,11 +117,19 @@ class RedfishSession(BaseRedfishClient):
 
     def __enter__(self):
         """Context manager entry."""
+        if self.pooled:
+            with self._checkout_lock:
+                self.checkouts += 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.close()
+        if self.pooled:
+            with self._checkout_lock:
+                self.checkouts -= 1
+                self.last_used = time.monotonic()
+        else:
+            self.close()
 
     def get(self, uri: str, **kwargs) -> RedfishResponse:
         """Perform GET request.
@@ -128,12 +194,112 @@ class RedfishSession(BaseRedfishClient):
         """
         return self._make_request("DELETE", uri, **kwargs)
 
+    def upload(
+        self, uri: str, body: FileUploadBody, read_timeout: Optional[float] = None
+    ) -> RedfishResponse:
+        """POST a streaming firmware upload.
+
+        Args:
+            uri: Push URI from the UpdateService
+            body: Streaming upload body
+            read_timeout: Seconds to wait for the BMC's response once the
+                image is sent (BMCs often verify the image first); defaults
+                to the credentials' timeout
+
+        Returns:
+            Redfish response
+        """
+        return self._make_request(
+            "POST",
+            uri,
+            data=body,
+            headers={"Content-Type": body.content_type},
+            timeout=(
+                self.credentials.timeout,
+                read_timeout or self.credentials.timeout,
+            ),
+        )
+
     def close(self) -> None:
         """Close the session."""
         if self.session:
             self.session.close()
             logger.debug("Closed Redfish session")
 
+    def login(self) -> bool:
+        """Create a SessionService session and authenticate with its token.
+
+        Services without session support keep using HTTP Basic auth.
+
+        Returns:
+            True if token authentication is active
+        """
+        with self._login_lock:
+            if not self._token_supported:
+                return False
+            self._clear_token()
+
+            url = urljoin(self.base_url, SESSIONS_URI.lstrip("/"))
+            try:
+                response = self.session.request(
+                    "POST",
+                    url,
+                    json={
+                        "UserName": self.credentials.username,
+                        "Password": self.credentials.password,
+                    },
+                    timeout=self.credentials.timeout,
+                )
+                token = response.headers.get("X-Auth-Token")
+            except (requests.exceptions.RequestException, AttributeError) as e:
+                logger.debug(f"Redfish session login to {self.credentials.host}: {e}")
+                return False
+
+            if not response.ok or not isinstance(token, str):
+                if response.status_code != 401:
+                    # No session support; don't try again for this session
+                    self._token_supported = False
+                logger.debug(
+                    f"Redfish sessions unavailable on {self.credentials.host} "
+                    f"({response.status_code}), using basic auth"
+                )
+                return False
+
+            self.token = token
+            location = response.headers.get("Location")
+            self.session_uri = location if isinstance(location, str) else None
+            self.session.headers["X-Auth-Token"] = token
+            self.session.auth = None
+            logger.debug(f"Created Redfish session on {self.credentials.host}")
+            return True
+
+    def logout(self) -> None:
+        """Delete the SessionService session, if one is active."""
+        with self._login_lock:
+            session_uri = self.session_uri
+            if session_uri:
+                try:
+                    url = (
+                        session_uri
+                        if session_uri.startswith("http")
+                        else urljoin(self.base_url, session_uri.lstrip("/"))
+                    )
+                    self.session.request(
+                        "DELETE", url, timeout=self.credentials.timeout
+                    )
+                    logger.debug(f"Deleted Redfish session on {self.credentials.host}")
+                except requests.exceptions.RequestException as e:
+                    logger.debug(f"Redfish session logout failed: {e}")
+            self._clear_token()
+
+    def _clear_token(self) -> None:
+        self.session.headers.pop("X-Auth-Token", None)
+        self.session.auth = HTTPBasicAuth(
+            self.credentials.username, self.credentials.password
+        )
+        self.token = None
+        self.session_uri = None
+
     def _make_request(self, method: str, uri: str, **kwargs) -> RedfishResponse:
         """Make HTTP request to Redfish service.
 
@@ -156,17 +322,44 @@ class RedfishSession(BaseRedfishClient):
         else:
             url = urljoin(self.base_url, uri.lstrip("/"))
 
+        cached = None
+        if method == "GET":
+            cached = self._cached_resource(url)
+            if cached and cached.memo_expires > time.monotonic():
+                self.cache_hits += 1
+                return copy.deepcopy(cached.response)
+            if cached and cached.etag:
+                kwargs["headers"] = {
+                    "If-None-Match": cached.etag,
+                    **(kwargs.get("headers") or {}),
+                }
+        else:
+            self._invalidate(url)
+
         logger.debug(f"Redfish {method} request to {url}")
 
+        if self._token_supported and self.token is None:
+            self.login()
+
         try:
             response = self.session.request(method, url, **kwargs)
 
+            # Expired or revoked token: log in again and retry once
+            if response.status_code == 401 and self.token is not None:
+                if self.login():
+                    response = self.session.request(method, url, **kwargs)
+
             # Handle authentication errors
             if response.status_code == 401:
                 raise RedfishAuthenticationError(
                     "Authentication failed - invalid credentials", response.status_code
                 )
 
+            # Unchanged since the cached copy
+            if response.status_code == 304 and cached is not None:
+                self.cache_hits += 1
+                return copy.deepcopy(cached.response)
+
             # Parse response data
             response_data = None
             if response.content:
@@ -193,6 +386,8 @@ class RedfishSession(BaseRedfishClient):
                     logger.error(f"Server error {response.status_code}: {error_msg}")
                 elif response.status_code >= 400:
                     logger.warning(f"Client error {response.status_code}: {error_msg}")
+            elif method == "GET":
+                self._store_resource(url, redfish_response)
 
             return redfish_response
 
@@ -203,6 +398,57 @@ class RedfishSession(BaseRedfishClient):
         except requests.exceptions.RequestException as e:
             raise RedfishError(f"Request failed: {e}")
 
+    def clear_cache(self) -> None:
+        """Forget cached GET responses."""
+        with self._cache_lock:
+            self._resource_cache.clear()
+
+    def _cached_resource(self, url: str) -> Optional[_CachedResource]:
+        with self._cache_lock:
+            cached = self._resource_cache.get(url)
+            if cached:
+                self._resource_cache.move_to_end(url)
+            return cached
+
+    def _store_resource(self, url: str, response: RedfishResponse) -> None:
+        """Cache a GET response that has an ETag or is immutable."""
+        if self.cache_size <= 0:
+            return
+        etag = next(
+            (
+                value
+                for name, value in (response.headers or {}).items()
+                if name.lower() == "etag" and isinstance(value, str)
+            ),
+            None,
+        )
+        memo = urlparse(url).path in MEMO_PATHS
+        if not etag and not memo:
+            return
+
+        expires = time.monotonic() + self.memo_ttl if memo else 0.0
+        with self._cache_lock:
+            self._resource_cache[url] = _CachedResource(
+                copy.deepcopy(response), etag, expires
+            )
+            self._resource_cache.move_to_end(url)
+            while len(self._resource_cache) > self.cache_size:
+                self._resource_cache.popitem(last=False)
+
+    def _invalidate(self, url: str) -> None:
+        """Drop cached copies of a resource being modified.
+
+        Actions and settings objects also invalidate the resource they
+        belong to.
+        """
+        targets = {url}
+        for marker in ("/Actions/", "/Settings"):
+            if marker in url:
+                targets.add(url.split(marker, 1)[0])
+        with self._cache_lock:
+            for target in targets:
+                self._resource_cache.pop(target, None)
+
     def _extract_error_message(self, response_data: Optional[Dict]) -> str:
         """Extract error message from response data.
 
@@ -257,6 +503,25 @@ class RedfishSession(BaseRedfishClient):
         except (KeyError, IndexError, TypeError, ValueError):
             return None
 
+    @property
+    def protocol_features(self) -> Dict[str, Any]:
+        """ProtocolFeaturesSupported from the service root (cached per session).
+
+        Returns:
+            Protocol features, empty if the service does not advertise any
+        """
+        if self._protocol_features is None:
+            try:
+                response = self.get("/redfish/v1/")
+            except RedfishError as e:
+                logger.debug(f"Failed to read protocol features: {e}")
+                return {}
+            features = None
+            if response.success and isinstance(response.data, dict):
+                features = response.data.get("ProtocolFeaturesSupported")
+            self._protocol_features = features if isinstance(features, dict) else {}
+        return self._protocol_features
+
     def test_connection(self) -> bool:
         """Test connection to Redfish service.
 
@@ -269,3 +534,94 @@ class RedfishSession(BaseRedfishClient):
         except Exception as e:
             logger.error(f"Connection test failed: {e}")
             return False
+
+
+class RedfishSessionPool:
+    """Persistent Redfish sessions shared per BMC and credential set."""
+
+    def __init__(self, idle_timeout: float = 300.0):
+        """Initialize session pool.
+
+        Args:
+            idle_timeout: Seconds after which an unused session is logged
+                out and evicted
+        """
+        self.idle_timeout = idle_timeout
+        self._sessions: Dict[Tuple, RedfishSession] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(credentials: RedfishCredentials) -> Tuple:
+        return (
+            credentials.host,
+            credentials.port,
+            credentials.username,
+            credentials.password,
+            credentials.use_ssl,
+            credentials.verify_ssl,
+        )
+
+    def get(self, credentials: RedfishCredentials) -> RedfishSession:
+        """Return the pooled session for a BMC, creating it if needed.
+
+        Use the returned session as a context manager for the duration of the
+        work; sessions checked out that way are never evicted as idle.
+        """
+        key = self._key(credentials)
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                k
+                for k, session in self._sessions.items()
+                if k != key
+                and not session.checkouts
+                and now - session.last_used > self.idle_timeout
+            ]
+            evicted = [self._sessions.pop(k) for k in expired]
+            session = self._sessions.get(key)
+            if session is None:
+                session = RedfishSession(credentials, pooled=True)
+                self._sessions[key] = session
+            session.last_used = now
+
+        for stale in evicted:
+            self._evict(stale)
+        return session
+
+    def discard(self, credentials: RedfishCredentials) -> None:
+        """Log out and forget the session for a BMC."""
+        with self._lock:
+            session = self._sessions.pop(self._key(credentials), None)
+        if session:
+            self._evict(session)
+
+    def close_all(self) -> None:
+        """Log out and close every pooled session."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            self._evict(session)
+
+    def _evict(self, session: RedfishSession) -> None:
+        try:
+            session.logout()
+        finally:
+            session.close()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+_default_pool: Optional[RedfishSessionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_redfish_session_pool() -> RedfishSessionPool:
+    """Process-wide session pool; sessions are logged out at interpreter exit."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = RedfishSessionPool()
+            atexit.register(_default_pool.close_all)
+        return _default_pool
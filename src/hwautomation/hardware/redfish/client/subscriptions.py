@@ -0,0 +1,432 @@
+"""Redfish EventService subscriptions.
+
+``RedfishEventReceiver`` runs a small HTTP(S) listener and registers it with
+each BMC through ``/redfish/v1/EventService/Subscriptions``, so BMCs push
+their events instead of being polled. Each subscription carries a random
+``Context`` that identifies the BMC and authenticates its events, so the
+listener only accepts connections from other hosts over TLS. Received events
+wake power-state and task waits and are passed to listeners such as the web
+UI's server status broadcasts.
+"""
+
+import atexit
+import ipaddress
+import json
+import os
+import re
+import secrets
+import socket
+import ssl
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+from hwautomation.logging import get_logger
+
+from ..base import RedfishCredentials
+from .events import event_origin, event_records
+from .expand import fetch_collection
+from .session import RedfishSessionPool, get_redfish_session_pool
+
+logger = get_logger(__name__)
+
+SUBSCRIPTIONS_URI = "/redfish/v1/EventService/Subscriptions"
+
+# Sent to services that reject a subscription without EventTypes
+LEGACY_EVENT_TYPES = [
+    "StatusChange",
+    "ResourceUpdated",
+    "ResourceAdded",
+    "ResourceRemoved",
+    "Alert",
+]
+
+MAX_EVENT_BYTES = 1024 * 1024
+
+SYSTEM_URI = re.compile(r"^(/redfish/v1/Systems/[^/]+)")
+
+
+@dataclass
+class EventSource:
+    """BMC subscribed to the receiver."""
+
+    credentials: RedfishCredentials
+    context: str
+    server_id: Optional[str] = None
+    subscription_uri: Optional[str] = None
+
+
+EventListener = Callable[[EventSource, Dict], None]
+
+
+class RedfishEventReceiver:
+    """Local listener for events pushed by subscribed BMCs."""
+
+    def __init__(
+        self,
+        listen_host: Optional[str] = None,
+        listen_port: int = 8443,
+        destination: Optional[str] = None,
+        certfile: Optional[str] = None,
+        keyfile: Optional[str] = None,
+        path: str = "/redfish/events",
+        route_waits: bool = True,
+        pool: Optional[RedfishSessionPool] = None,
+    ):
+        """Initialize event receiver.
+
+        Args:
+            listen_host: Address the listener binds to (defaults to all
+                addresses with a certificate, otherwise to localhost)
+            listen_port: Port the listener binds to (0 picks a free port)
+            destination: URL BMCs post events to (defaults to the listen
+                address, or this host's name when listening on all
+                addresses, with the bound port and ``path``)
+            certfile: TLS certificate; without it the listener speaks plain
+                HTTP and only binds to loopback addresses
+            keyfile: TLS private key (defaults to ``certfile``)
+            path: URL path events are posted to
+            route_waits: Wake power-state and task waits on matching events
+            pool: Session pool used for subscription requests
+        """
+        if listen_host is None:
+            listen_host = "0.0.0.0" if certfile else "127.0.0.1"
+        self.listen_host = listen_host
+        self.listen_port = listen_port
+        self.certfile = certfile
+        self.keyfile = keyfile
+        self.path = path
+        self.pool = pool
+        self.events_received = 0
+        self._destination = destination
+        self._listeners: List[EventListener] = []
+        self._sources: Dict[Tuple, EventSource] = {}
+        self._contexts: Dict[str, EventSource] = {}
+        self._lock = threading.Lock()
+        self._subscribe_locks: Dict[Tuple, threading.Lock] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        if route_waits:
+            self._listeners.append(route_to_waits)
+
+    @property
+    def running(self) -> bool:
+        """Whether the listener is accepting events."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def destination(self) -> str:
+        """URL subscribed BMCs post events to."""
+        if self._destination:
+            return self._destination
+        scheme = "https" if self.certfile else "http"
+        host = self.listen_host
+        if host in ("", "0.0.0.0", "::"):
+            host = socket.getfqdn()
+        port = self._server.server_port if self._server else self.listen_port
+        return f"{scheme}://{host}:{port}{self.path}"
+
+    def start(self) -> None:
+        """Start the listener in a background thread.
+
+        Raises:
+            ValueError: If asked to listen on a non-loopback address without
+                a TLS certificate
+        """
+        if self.running:
+            return
+        if not self.certfile and not _is_loopback(self.listen_host):
+            # Event contexts authenticate the BMCs and must not cross the
+            # network in cleartext
+            raise ValueError(
+                f"Redfish event receiver needs a TLS certificate to listen on "
+                f"{self.listen_host}"
+            )
+        server = ThreadingHTTPServer(
+            (self.listen_host, self.listen_port), _handler_for(self)
+        )
+        server.daemon_threads = True
+        if self.certfile:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(self.certfile, self.keyfile)
+            server.socket = context.wrap_socket(server.socket, server_side=True)
+        self._server = server
+        self._thread = threading.Thread(
+            target=server.serve_forever, name="redfish-event-receiver", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Redfish event receiver listening for {self.destination}")
+
+    def stop(self) -> None:
+        """Stop the listener (subscriptions are kept)."""
+        server, self._server = self._server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def close(self) -> None:
+        """Remove every subscription and stop the listener."""
+        with self._lock:
+            sources = list(self._sources.values())
+        for source in sources:
+            self.unsubscribe(source.credentials)
+        self.stop()
+
+    def add_listener(self, listener: EventListener) -> Callable[[], None]:
+        """Register a callback for every received event record.
+
+        Args:
+            listener: Called with the event source and the event record
+
+        Returns:
+            Callable that removes the listener
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+        def remove() -> None:
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return remove
+
+    def is_subscribed(self, credentials: RedfishCredentials) -> bool:
+        """Whether the BMC currently pushes events to this receiver."""
+        return _key(credentials) in self._sources
+
+    def subscribe(
+        self,
+        credentials: RedfishCredentials,
+        server_id: Optional[str] = None,
+        event_types: Optional[List[str]] = None,
+    ) -> Optional[EventSource]:
+        """Subscribe the receiver to a BMC's events.
+
+        Earlier subscriptions of this receiver on the BMC are removed first,
+        so restarts do not leave stale subscriptions behind.
+
+        Args:
+            credentials: Redfish connection credentials
+            server_id: Server the BMC belongs to (used for UI broadcasts)
+            event_types: EventTypes to request (None subscribes to all)
+
+        Returns:
+            Event source, or None if the BMC rejected the subscription
+        """
+        context = secrets.token_urlsafe(16)
+        body = {
+            "Destination": self.destination,
+            "Protocol": "Redfish",
+            "Context": context,
+        }
+        if event_types:
+            body["EventTypes"] = event_types
+        with (self.pool or get_redfish_session_pool()).get(credentials) as session:
+            self._remove_stale(session)
+            response = session.post(SUBSCRIPTIONS_URI, body)
+            if not response.success and not event_types and response.status_code == 400:
+                body["EventTypes"] = LEGACY_EVENT_TYPES
+                response = session.post(SUBSCRIPTIONS_URI, body)
+        if not response.success:
+            logger.warning(
+                f"Event subscription on {credentials.host} failed: "
+                f"{response.error_message}"
+            )
+            return None
+
+        source = EventSource(
+            credentials,
+            context,
+            server_id,
+            (response.headers or {}).get("Location"),
+        )
+        with self._lock:
+            previous = self._sources.pop(_key(credentials), None)
+            if previous:
+                self._contexts.pop(previous.context, None)
+            self._sources[_key(credentials)] = source
+            self._contexts[context] = source
+        logger.info(f"Subscribed to Redfish events from {credentials.host}")
+        return source
+
+    def ensure_subscription(
+        self, credentials: RedfishCredentials, server_id: Optional[str] = None
+    ) -> bool:
+        """Subscribe to a BMC unless it is already subscribed.
+
+        Args:
+            credentials: Redfish connection credentials
+            server_id: Server the BMC belongs to
+
+        Returns:
+            True if the BMC pushes events to this receiver
+        """
+        with self._lock:
+            lock = self._subscribe_locks.setdefault(_key(credentials), threading.Lock())
+        with lock:
+            source = self._sources.get(_key(credentials))
+            if source is not None:
+                if server_id and not source.server_id:
+                    source.server_id = server_id
+                return True
+            return self.subscribe(credentials, server_id) is not None
+
+    def unsubscribe(self, credentials: RedfishCredentials) -> bool:
+        """Remove the receiver's subscription from a BMC.
+
+        Args:
+            credentials: Redfish connection credentials
+
+        Returns:
+            True if the subscription was deleted
+        """
+        with self._lock:
+            source = self._sources.pop(_key(credentials), None)
+            if source is not None:
+                self._contexts.pop(source.context, None)
+        if source is None or not source.subscription_uri:
+            return False
+        try:
+            with (self.pool or get_redfish_session_pool()).get(credentials) as session:
+                return session.delete(source.subscription_uri).success
+        except Exception as e:
+            logger.debug(f"Failed to delete subscription on {credentials.host}: {e}")
+            return False
+
+    def deliver(self, payload: Dict, client_host: Optional[str] = None) -> int:
+        """Dispatch a posted event payload to the listeners.
+
+        Events are only accepted with the Context of a subscription; the
+        sender's address is not trusted to identify a BMC.
+
+        Args:
+            payload: Event JSON posted by a BMC
+            client_host: Address the payload came from (used for logging)
+
+        Returns:
+            Number of event records dispatched (0 if the sender is unknown)
+        """
+        source = self._contexts.get(payload.get("Context") or "")
+        if source is None:
+            logger.debug(f"Ignoring Redfish event from unknown sender {client_host}")
+            return 0
+
+        records = event_records(payload)
+        with self._lock:
+            listeners = list(self._listeners)
+            self.events_received += len(records)
+        for record in records:
+            for listener in listeners:
+                try:
+                    listener(source, record)
+                except Exception as e:
+                    logger.warning(f"Redfish event listener failed: {e}")
+        return len(records)
+
+    def _remove_stale(self, session) -> None:
+        try:
+            _, members = fetch_collection(session, SUBSCRIPTIONS_URI)
+        except Exception as e:
+            logger.debug(f"Listing event subscriptions failed: {e}")
+            return
+        for member in members:
+            if member.get("Destination") == self.destination and member.get(
+                "@odata.id"
+            ):
+                session.delete(member["@odata.id"])
+
+
+def route_to_waits(source: EventSource, record: Dict) -> None:
+    """Wake power-state and task waits affected by an event record.
+
+    Args:
+        source: BMC the event came from
+        record: Event record
+    """
+    from ...power_watch import get_power_watcher
+    from .tasks import get_task_monitor
+
+    credentials = source.credentials
+    origin = event_origin(record)
+    match = SYSTEM_URI.match(origin.rstrip("/")) if origin else None
+    if match:
+        get_power_watcher().notify(
+            ("redfish", credentials.host, credentials.port, match.group(1))
+        )
+    get_task_monitor().handle_event(credentials, record)
+
+
+def _key(credentials: RedfishCredentials) -> Tuple:
+    return (credentials.host, credentials.port)
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _handler_for(receiver: RedfishEventReceiver):
+    class EventHandler(BaseHTTPRequestHandler):
+        """Accepts event POSTs from BMCs."""
+
+        def do_POST(self):
+            if self.path.split("?", 1)[0] != receiver.path:
+                self.send_error(404)
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            if length <= 0 or length > MAX_EVENT_BYTES:
+                self.send_error(413 if length else 400)
+                return
+            try:
+                payload = json.loads(self.rfile.read(length))
+            except ValueError:
+                self.send_error(400)
+                return
+            if not isinstance(payload, dict):
+                self.send_error(400)
+                return
+            receiver.deliver(payload, self.client_address[0])
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            logger.debug(f"Event receiver: {format % args}")
+
+    return EventHandler
+
+
+_event_receiver: Optional[RedfishEventReceiver] = None
+_event_receiver_lock = threading.Lock()
+
+
+def get_event_receiver() -> RedfishEventReceiver:
+    """Process-wide event receiver configured from the environment.
+
+    ``REDFISH_EVENT_HOST``, ``REDFISH_EVENT_PORT``,
+    ``REDFISH_EVENT_DESTINATION``, ``REDFISH_EVENT_CERTFILE`` and
+    ``REDFISH_EVENT_KEYFILE`` configure the listener; it only listens once
+    ``start()`` is called (the web app does so when ``REDFISH_EVENT_RECEIVER``
+    is set). Without a certificate it listens on localhost only, e.g. behind
+    a TLS-terminating proxy named by ``REDFISH_EVENT_DESTINATION``.
+    """
+    global _event_receiver
+    with _event_receiver_lock:
+        if _event_receiver is None:
+            _event_receiver = RedfishEventReceiver(
+                listen_host=os.getenv("REDFISH_EVENT_HOST"),
+                listen_port=int(os.getenv("REDFISH_EVENT_PORT", "8443")),
+                destination=os.getenv("REDFISH_EVENT_DESTINATION"),
+                certfile=os.getenv("REDFISH_EVENT_CERTFILE"),
+                keyfile=os.getenv("REDFISH_EVENT_KEYFILE"),
+            )
+            atexit.register(_event_receiver.close)
+        return _event_receiver
@@ -0,0 +1,508 @@
+"""Redfish task monitoring.
+
+Long-running Redfish operations (firmware updates, BIOS applies) return a
+task or task monitor URI. Polling each one in its own sleep loop ties up a
+thread per operation. ``RedfishTaskMonitor`` tracks every outstanding task
+across BMCs on one scheduler thread: polls run on a small worker pool with
+adaptive intervals that honor ``Retry-After``, task events pushed to the
+event receiver or read from the EventService stream trigger an immediate
+poll, and completion resolves a future and optional callback.
+"""
+
+import atexit
+import email.utils
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from hwautomation.logging import get_logger
+
+from ..base import RedfishCredentials, RedfishOperation, RedfishResponse
+from .events import RedfishEventStream, discover_sse_uri, event_origin
+from .session import RedfishSessionPool, get_redfish_session_pool
+
+logger = get_logger(__name__)
+
+COMPLETED_STATES = {"Completed", "CompletedWithWarnings"}
+FAILED_STATES = {"Exception", "Cancelled", "Interrupted", "Killed"}
+
+TaskCallback = Callable[[RedfishOperation[Dict[str, Any]]], None]
+
+
+def task_status(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize a Task resource.
+
+    Args:
+        data: Task JSON
+
+    Returns:
+        Task state, status, progress, times and messages
+    """
+    status = {
+        "task_state": data.get("TaskState", "Unknown"),
+        "task_status": data.get("TaskStatus", "Unknown"),
+        "percent_complete": str(data.get("PercentComplete", 0)),
+        "start_time": data.get("StartTime", ""),
+        "end_time": data.get("EndTime", ""),
+    }
+    messages = data.get("Messages", [])
+    if messages:
+        status["messages"] = [msg.get("Message", "") for msg in messages]
+    return status
+
+
+def retry_after(headers: Optional[Dict[str, str]]) -> Optional[float]:
+    """Parse a ``Retry-After`` header in seconds or HTTP-date form.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Seconds to wait, or None if absent or unparseable
+    """
+    value = next(
+        (v for k, v in (headers or {}).items() if k.lower() == "retry-after"), None
+    )
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class TaskHandle:
+    """Handle for one caller waiting on a Redfish task."""
+
+    def __init__(self, key: Hashable, task_uri: str, deadline: float):
+        self.key = key
+        self.task_uri = task_uri
+        self.deadline = deadline
+        self.status: Dict[str, Any] = {}
+        self.future: "Future[RedfishOperation[Dict[str, Any]]]" = Future()
+
+    @property
+    def done(self) -> bool:
+        """Whether the task finished or the wait timed out."""
+        return self.future.done()
+
+    def result(
+        self, timeout: Optional[float] = None
+    ) -> RedfishOperation[Dict[str, Any]]:
+        """Block until the task finishes.
+
+        Args:
+            timeout: Seconds to block (None waits until the handle deadline)
+
+        Returns:
+            Operation result with the final task status
+        """
+        return self.future.result(timeout)
+
+
+class _Task:
+    """Poll schedule of one task shared by all of its handles."""
+
+    def __init__(
+        self,
+        credentials: RedfishCredentials,
+        task_uri: str,
+        host: Tuple,
+        interval: float,
+    ):
+        self.credentials = credentials
+        self.task_uri = task_uri
+        self.host = host
+        self.interval = interval
+        self.due = 0.0
+        self.in_flight = False
+        self.progress: Optional[Tuple] = None
+        self.handles: List[TaskHandle] = []
+
+
+class RedfishTaskMonitor:
+    """Tracks outstanding Redfish tasks for many BMCs on one scheduler."""
+
+    def __init__(
+        self,
+        max_workers: int = 16,
+        initial_interval: float = 2.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        use_events: bool = True,
+        pool: Optional[RedfishSessionPool] = None,
+    ):
+        """Initialize task monitor.
+
+        Args:
+            max_workers: Maximum concurrent task polls
+            initial_interval: Seconds between polls after tracking starts or
+                the task makes progress
+            max_interval: Upper bound for the poll interval (a longer
+                ``Retry-After`` from the BMC takes precedence)
+            backoff: Interval multiplier while the task shows no progress
+            use_events: Poll immediately on task events from the BMC's
+                server-sent event stream when the EventService offers one
+            pool: Session pool (defaults to the shared pool)
+        """
+        self.max_workers = max_workers
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.use_events = use_events
+        self.pool = pool
+
+        self._tasks: Dict[Hashable, _Task] = {}
+        self._streams: Dict[Tuple, Optional[RedfishEventStream]] = {}
+        self._schedule: List = []
+        self._deadlines: List = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def track(
+        self,
+        credentials: RedfishCredentials,
+        task_uri: str,
+        timeout: float = 1800,
+        callback: Optional[TaskCallback] = None,
+    ) -> TaskHandle:
+        """Start tracking a task.
+
+        Args:
+            credentials: Credentials of the BMC running the task
+            task_uri: Task or task monitor URI
+            timeout: Seconds before the wait fails
+            callback: Called with the operation result when the task
+                finishes (from a monitor thread)
+
+        Returns:
+            TaskHandle whose future resolves on completion
+        """
+        host = (credentials.host, credentials.port)
+        key = (*host, task_uri.rstrip("/"))
+        now = time.monotonic()
+        handle = TaskHandle(key, task_uri, now + timeout)
+        if callback is not None:
+            handle.future.add_done_callback(lambda f: callback(f.result()))
+
+        with self._condition:
+            self._ensure_started()
+            task = self._tasks.get(key)
+            if task is None:
+                task = _Task(credentials, task_uri, host, self.initial_interval)
+                self._tasks[key] = task
+                self._reschedule(key, task, now)
+            task.handles.append(handle)
+            heapq.heappush(
+                self._deadlines, (handle.deadline, next(self._sequence), handle)
+            )
+            if self.use_events and host not in self._streams:
+                self._streams[host] = None
+                self._executor.submit(self._open_stream, host, credentials)
+            self._condition.notify()
+
+        return handle
+
+    def wait(
+        self,
+        credentials: RedfishCredentials,
+        task_uri: str,
+        timeout: float = 1800,
+    ) -> RedfishOperation[Dict[str, Any]]:
+        """Block until a task finishes.
+
+        Args:
+            credentials: Credentials of the BMC running the task
+            task_uri: Task or task monitor URI
+            timeout: Seconds before giving up
+
+        Returns:
+            Operation result with the final task status
+        """
+        handle = self.track(credentials, task_uri, timeout)
+        return handle.result(timeout + self.max_interval)
+
+    def notify(self, credentials: RedfishCredentials, task_uri: str) -> None:
+        """Poll a tracked task immediately.
+
+        Args:
+            credentials: Credentials of the BMC running the task
+            task_uri: Task or task monitor URI
+        """
+        key = (credentials.host, credentials.port, task_uri.rstrip("/"))
+        with self._condition:
+            self._wake([key])
+
+    def handle_event(self, credentials: RedfishCredentials, record: Dict) -> None:
+        """Poll the tasks an event record refers to.
+
+        Args:
+            credentials: Credentials of the BMC that sent the event
+            record: Event record
+        """
+        self._on_event((credentials.host, credentials.port), record)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def shutdown(self) -> None:
+        """Stop the scheduler and fail all pending waits."""
+        with self._condition:
+            self._stopped = True
+            handles = [h for task in self._tasks.values() for h in task.handles]
+            self._tasks.clear()
+            streams = [s for s in self._streams.values() if s is not None]
+            self._streams.clear()
+            self._condition.notify()
+        self._resolve(
+            [(h, _failure(h, "Task monitor stopped")) for h in handles], streams
+        )
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="redfish-task"
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="redfish-task-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def _reschedule(self, key: Hashable, task: _Task, due: float) -> None:
+        task.due = due
+        heapq.heappush(self._schedule, (due, next(self._sequence), key))
+
+    def _wake(self, keys: List[Hashable]) -> None:
+        now = time.monotonic()
+        for key in keys:
+            task = self._tasks.get(key)
+            if task is not None and not task.in_flight:
+                task.interval = self.initial_interval
+                self._reschedule(key, task, now)
+        self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if self._stopped:
+                    return
+                now = time.monotonic()
+                expired = self._expire(now)
+                wake = self._dispatch(now)
+                if not expired:
+                    if self._deadlines:
+                        deadline = self._deadlines[0][0]
+                        wake = deadline if wake is None else min(wake, deadline)
+                    self._condition.wait(None if wake is None else max(0.0, wake - now))
+                    continue
+                streams = self._release_streams()
+            self._resolve(expired, streams)
+
+    def _expire(self, now: float) -> List[Tuple[TaskHandle, RedfishOperation]]:
+        expired = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, handle = heapq.heappop(self._deadlines)
+            if handle.done:
+                continue
+            task = self._tasks.get(handle.key)
+            if task is not None:
+                task.handles = [h for h in task.handles if h is not handle]
+                if not task.handles and not task.in_flight:
+                    self._tasks.pop(handle.key, None)
+            expired.append((handle, _failure(handle, "Timed out waiting for task")))
+        return expired
+
+    def _dispatch(self, now: float) -> Optional[float]:
+        """Submit due polls; return the next due time."""
+        while self._schedule:
+            due, _, key = self._schedule[0]
+            task = self._tasks.get(key)
+            if task is None or task.due != due or task.in_flight:
+                heapq.heappop(self._schedule)
+                continue
+            if due > now:
+                return due
+            heapq.heappop(self._schedule)
+            task.in_flight = True
+            self._executor.submit(self._poll, key, task)
+        return None
+
+    def _poll(self, key: Hashable, task: _Task) -> None:
+        response = None
+        try:
+            pool = self.pool or get_redfish_session_pool()
+            with pool.get(task.credentials) as session:
+                response = session.get(task.task_uri)
+        except Exception as e:
+            # BMCs often drop off the network while applying firmware
+            logger.debug(f"Poll of task {task.task_uri} on {task.host[0]} failed: {e}")
+
+        with self._condition:
+            task.in_flight = False
+            if self._tasks.get(key) is not task:
+                return
+            outcome = self._interpret(task, response) if task.handles else None
+            if task.handles and outcome is None:
+                delay = max(task.interval, retry_after(_headers(response)) or 0.0)
+                self._reschedule(key, task, time.monotonic() + delay)
+                self._condition.notify()
+                return
+
+            # Finished, or every wait on it timed out while it was polled
+            self._tasks.pop(key, None)
+            finished = [(handle, outcome) for handle in task.handles if outcome]
+            streams = self._release_streams()
+            self._condition.notify()
+        self._resolve(finished, streams)
+
+    def _interpret(
+        self, task: _Task, response: Optional[RedfishResponse]
+    ) -> Optional[RedfishOperation[Dict[str, Any]]]:
+        """Update a task from a poll; return its outcome once finished."""
+        data = response.data if response is not None else None
+        if response is not None and response.status_code == 404:
+            return RedfishOperation(
+                success=False,
+                error_message=f"Task {task.task_uri} not found",
+                response=response,
+            )
+        if response is None or not response.success:
+            task.interval = min(task.interval * self.backoff, self.max_interval)
+            return None
+
+        if not isinstance(data, dict) or "TaskState" not in data:
+            if response.status_code == 202:
+                task.interval = min(task.interval * self.backoff, self.max_interval)
+                return None
+            # A task monitor returns the operation's own response once done
+            return RedfishOperation(
+                success=True,
+                result={"task_state": "Completed"},
+                response=response,
+            )
+
+        status = task_status(data)
+        for handle in task.handles:
+            handle.status = status
+        state = status["task_state"]
+        if state in COMPLETED_STATES:
+            return RedfishOperation(success=True, result=status, response=response)
+        if state in FAILED_STATES:
+            return RedfishOperation(
+                success=False,
+                result=status,
+                error_message=f"Task ended in state {state}",
+                response=response,
+            )
+
+        progress = (state, status["percent_complete"])
+        if progress != task.progress:
+            task.interval = self.initial_interval
+        else:
+            task.interval = min(task.interval * self.backoff, self.max_interval)
+        task.progress = progress
+        return None
+
+    def _open_stream(self, host: Tuple, credentials: RedfishCredentials) -> None:
+        from .subscriptions import get_event_receiver
+
+        # Events pushed to the receiver need no stream of their own
+        receiver = get_event_receiver()
+        if receiver.running and receiver.ensure_subscription(credentials):
+            return
+
+        pool = self.pool or get_redfish_session_pool()
+        try:
+            with pool.get(credentials) as session:
+                uri = discover_sse_uri(session)
+        except Exception as e:
+            logger.debug(f"EventService lookup on {host[0]} failed: {e}")
+            uri = None
+        if not uri:
+            return
+
+        stream = RedfishEventStream(
+            credentials, uri, lambda record: self._on_event(host, record)
+        )
+        with self._condition:
+            if host not in self._streams or self._stopped:
+                return
+            self._streams[host] = stream
+        stream.start()
+
+    def _on_event(self, host: Tuple, record: Dict) -> None:
+        message_id = record.get("MessageId") or ""
+        origin = event_origin(record)
+        with self._condition:
+            keys = [
+                key
+                for key, task in self._tasks.items()
+                if task.host == host
+                and (
+                    (origin and origin.rstrip("/") == key[2])
+                    or (not origin and "TaskEvent" in message_id)
+                )
+            ]
+            if keys:
+                self._wake(keys)
+
+    def _release_streams(self) -> List[RedfishEventStream]:
+        """Forget streams of BMCs without tracked tasks (lock held)."""
+        active = {task.host for task in self._tasks.values()}
+        idle = [host for host in self._streams if host not in active]
+        return [s for s in (self._streams.pop(h) for h in idle) if s is not None]
+
+    def _resolve(
+        self,
+        finished: List[Tuple[TaskHandle, RedfishOperation]],
+        streams: List[RedfishEventStream],
+    ) -> None:
+        # Outside the lock: callbacks may track further tasks
+        for stream in streams:
+            stream.stop()
+        for handle, outcome in finished:
+            if not handle.future.done():
+                handle.future.set_result(outcome)
+
+
+def _failure(handle: TaskHandle, message: str) -> RedfishOperation[Dict[str, Any]]:
+    return RedfishOperation(
+        success=False, result=handle.status or None, error_message=message
+    )
+
+
+def _headers(response: Optional[RedfishResponse]) -> Optional[Dict[str, str]]:
+    return response.headers if response is not None else None
+
+
+_task_monitor: Optional[RedfishTaskMonitor] = None
+_task_monitor_lock = threading.Lock()
+
+
+def get_task_monitor() -> RedfishTaskMonitor:
+    """Get the process-wide Redfish task monitor."""
+    global _task_monitor
+    with _task_monitor_lock:
+        if _task_monitor is None:
+            _task_monitor = RedfishTaskMonitor()
+            atexit.register(_task_monitor.shutdown)
+        return _task_monitor
@@ -0,0 +1,121 @@
+"""Streaming request bodies for Redfish firmware uploads.
+
+Firmware images are often hundreds of megabytes. The bodies here read the
+image from disk in fixed-size chunks while the request is sent, so an upload
+uses the same small amount of memory regardless of the image size and many
+uploads can run side by side. Each body knows its total length, so it is sent
+with a ``Content-Length`` (which BMCs expect) rather than chunked transfer
+encoding, and it can be iterated again if the request has to be repeated.
+"""
+
+import json
+import os
+import secrets
+from typing import Callable, Dict, Iterator, List, Optional
+
+# Called with (bytes sent, total bytes) as an upload progresses
+UploadProgress = Callable[[int, int], None]
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class FileUploadBody:
+    """Firmware image sent as the raw request body (``HttpPushUri``)."""
+
+    content_type = "application/octet-stream"
+
+    def __init__(
+        self,
+        path: str,
+        progress: Optional[UploadProgress] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        """Initialize upload body.
+
+        Args:
+            path: Path of the firmware image
+            progress: Called with bytes sent and total bytes after each chunk
+            chunk_size: Bytes read from the image at a time
+        """
+        self.path = path
+        self.progress = progress
+        self.chunk_size = chunk_size
+        self.file_size = os.path.getsize(path)
+
+    def __len__(self) -> int:
+        return self.file_size
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._stream([], [])
+
+    def _stream(self, head: List[bytes], tail: List[bytes]) -> Iterator[bytes]:
+        total = len(self)
+        sent = 0
+        for part in head:
+            sent += len(part)
+            yield part
+        with open(self.path, "rb") as image:
+            while True:
+                chunk = image.read(self.chunk_size)
+                if not chunk:
+                    break
+                sent += len(chunk)
+                yield chunk
+                if self.progress:
+                    self.progress(sent, total)
+        for part in tail:
+            sent += len(part)
+            yield part
+        if self.progress and tail:
+            self.progress(sent, total)
+
+
+class MultipartUploadBody(FileUploadBody):
+    """Firmware image and update parameters (``MultipartHttpPushUri``).
+
+    The body carries an ``UpdateParameters`` JSON part followed by the
+    ``UpdateFile`` part holding the image, as defined for multipart HTTP push
+    updates in the Redfish specification.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        parameters: Dict,
+        progress: Optional[UploadProgress] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        """Initialize multipart upload body.
+
+        Args:
+            path: Path of the firmware image
+            parameters: UpdateParameters such as Targets and
+                @Redfish.OperationApplyTime
+            progress: Called with bytes sent and total bytes after each chunk
+            chunk_size: Bytes read from the image at a time
+        """
+        super().__init__(path, progress, chunk_size)
+        self.boundary = secrets.token_hex(16)
+        filename = os.path.basename(path).replace('"', "")
+        self._head = (
+            f"--{self.boundary}\r\n"
+            'Content-Disposition: form-data; name="UpdateParameters"\r\n'
+            "Content-Type: application/json\r\n\r\n"
+            f"{json.dumps(parameters)}\r\n"
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="UpdateFile"; '
+            f'filename="{filename}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+
+    @property
+    def content_type(self) -> str:
+        """Content-Type header including the part boundary."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return len(self._head) + self.file_size + len(self._tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._stream([self._head], [self._tail])
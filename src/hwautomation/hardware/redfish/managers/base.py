@@ -10,7 +10,7 @@ from typing import Any, Dict, Optional
 from hwautomation.logging import get_logger
 
 from ..base import RedfishCredentials, RedfishError, RedfishOperation
-from ..client import RedfishSession
+from ..client import RedfishSession, get_redfish_session_pool
 
 logger = get_logger(__name__)
 
@@ -34,8 +34,8 @@ class BaseRedfishManager(ABC):
         return f"{protocol}://{self.credentials.host}:{self.credentials.port}"
 
     def create_session(self) -> RedfishSession:
-        """Create a new Redfish session."""
-        return RedfishSession(self.credentials)
+        """Get the shared Redfish session for this BMC."""
+        return get_redfish_session_pool().get(self.credentials)
 
     def test_connection(self) -> bool:
         """Test connection to Redfish service."""
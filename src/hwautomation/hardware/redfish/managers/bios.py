@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional
 
 from hwautomation.logging import get_logger
 
-from ..base import BiosAttribute, RedfishCredentials
+from ..base import BiosAttribute, BiosSettingsDiff, RedfishCredentials
 from ..operations import RedfishBiosOperation
 from .base import BaseRedfishManager, RedfishManagerError
 
@@ -29,6 +29,7 @@ class RedfishBiosManager(BaseRedfishManager):
             "get_bios_attribute": True,
             "set_bios_attributes": True,
             "set_bios_attribute": True,
+            "apply_bios_attributes": True,
             "reset_bios_to_defaults": True,
             "get_pending_bios_settings": True,
             "apply_pending_settings": True,
@@ -99,19 +100,31 @@ class RedfishBiosManager(BaseRedfishManager):
         Returns:
             True if successful
         """
+        return self.apply_bios_attributes(attributes, system_id) is not None
+
+    def apply_bios_attributes(
+        self, attributes: Dict[str, Any], system_id: str = "1"
+    ) -> Optional[BiosSettingsDiff]:
+        """Set BIOS attributes, writing only values that would change.
+
+        Args:
+            attributes: Dictionary of attribute names and values
+            system_id: System identifier
+
+        Returns:
+            Attribute diff (with ``reboot_required``), or None on failure
+        """
         try:
-            with self.create_session() as session:
-                result = self.bios_ops.set_bios_attributes(
-                    session, attributes, system_id
+            result = self.bios_ops.apply_bios_attributes(attributes, system_id)
+            if not result.success:
+                self.logger.error(
+                    f"Failed to set BIOS attributes: {result.error_message}"
                 )
-                if not result.success:
-                    self.logger.error(
-                        f"Failed to set BIOS attributes: {result.error_message}"
-                    )
-                return result.success
+                return None
+            return result.result
         except Exception as e:
             self.logger.error(f"Error setting BIOS attributes: {e}")
-            return False
+            return None
 
     def set_bios_attribute(
         self, attribute_name: str, value: Any, system_id: str = "1"
@@ -11,6 +11,7 @@ from hwautomation.logging import get_logger
 
 from ..base import (
     BiosAttribute,
+    BiosSettingsDiff,
     FirmwareComponent,
     PowerAction,
     PowerState,
@@ -18,7 +19,7 @@ from ..base import (
     RedfishCredentials,
     SystemInfo,
 )
-from ..client import ServiceRoot
+from ..client import ServiceRoot, UploadProgress
 from .base import BaseRedfishManager, RedfishManagerError
 from .bios import RedfishBiosManager
 from .firmware import RedfishFirmwareManager
@@ -271,6 +272,12 @@ class RedfishCoordinator(BaseRedfishManager):
         """Set BIOS attributes."""
         return self.bios.set_bios_attributes(attributes, system_id)
 
+    def apply_bios_attributes(
+        self, attributes: Dict[str, Any], system_id: str = "1"
+    ) -> Optional[BiosSettingsDiff]:
+        """Set BIOS attributes that differ; report whether a reboot is needed."""
+        return self.bios.apply_bios_attributes(attributes, system_id)
+
     def set_bios_attribute(
         self, attribute_name: str, value: Any, system_id: str = "1"
     ) -> bool:
@@ -312,6 +319,16 @@ class RedfishCoordinator(BaseRedfishManager):
             image_uri, component_id, system_id, transfer_protocol
         )
 
+    def push_firmware(
+        self,
+        image_path: str,
+        targets: Optional[List[str]] = None,
+        apply_time: str = "Immediate",
+        progress: Optional[UploadProgress] = None,
+    ) -> Optional[str]:
+        """Upload a local firmware image to the BMC."""
+        return self.firmware.push_firmware(image_path, targets, apply_time, progress)
+
     def get_update_status(self, task_uri: str) -> Optional[Dict[str, str]]:
         """Get firmware update status."""
         return self.firmware.get_update_status(task_uri)
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional
 from hwautomation.logging import get_logger
 
 from ..base import FirmwareComponent, RedfishCredentials
+from ..client.upload import UploadProgress
 from ..operations import RedfishFirmwareOperation
 from .base import BaseRedfishManager, RedfishManagerError
 
@@ -28,6 +29,7 @@ class RedfishFirmwareManager(BaseRedfishManager):
             "get_firmware_inventory": True,
             "get_firmware_component": True,
             "update_firmware": True,
+            "push_firmware": True,
             "get_update_status": True,
             "wait_for_update_completion": True,
             "schedule_firmware_update": False,  # Implementation dependent
@@ -66,15 +68,14 @@ class RedfishFirmwareManager(BaseRedfishManager):
             Firmware component if found
         """
         try:
-            with self.create_session() as session:
-                result = self.firmware_ops.get_firmware_component(session, component_id)
-                if result.success:
-                    return result.result
-                else:
-                    self.logger.error(
-                        f"Failed to get firmware component {component_id}: {result.error_message}"
-                    )
-                    return None
+            result = self.firmware_ops.get_firmware_component(component_id)
+            if result.success:
+                return result.result
+            else:
+                self.logger.error(
+                    f"Failed to get firmware component {component_id}: {result.error_message}"
+                )
+                return None
         except Exception as e:
             self.logger.error(f"Error getting firmware component {component_id}: {e}")
             return None
@@ -98,21 +99,54 @@ class RedfishFirmwareManager(BaseRedfishManager):
             Task URI for monitoring update progress
         """
         try:
-            with self.create_session() as session:
-                result = self.firmware_ops.update_firmware(
-                    session, image_uri, component_id, system_id, transfer_protocol
+            targets = None
+            if component_id:
+                targets = [
+                    f"/redfish/v1/UpdateService/FirmwareInventory/{component_id}"
+                ]
+            result = self.firmware_ops.update_firmware(image_uri, targets)
+            if result.success:
+                return result.result  # Task URI
+            else:
+                self.logger.error(
+                    f"Failed to start firmware update: {result.error_message}"
                 )
-                if result.success:
-                    return result.result  # Task URI
-                else:
-                    self.logger.error(
-                        f"Failed to start firmware update: {result.error_message}"
-                    )
-                    return None
+                return None
         except Exception as e:
             self.logger.error(f"Error starting firmware update: {e}")
             return None
 
+    def push_firmware(
+        self,
+        image_path: str,
+        targets: Optional[List[str]] = None,
+        apply_time: str = "Immediate",
+        progress: Optional[UploadProgress] = None,
+    ) -> Optional[str]:
+        """Upload a local firmware image to the BMC.
+
+        Args:
+            image_path: Path of the firmware image
+            targets: List of target URIs to update
+            apply_time: When to apply the update
+            progress: Called with bytes sent and total bytes during the upload
+
+        Returns:
+            Task URI for monitoring update progress
+        """
+        try:
+            result = self.firmware_ops.push_firmware(
+                image_path, targets, apply_time, progress
+            )
+            if result.success:
+                return result.result
+            else:
+                self.logger.error(f"Failed to push firmware: {result.error_message}")
+                return None
+        except Exception as e:
+            self.logger.error(f"Error pushing firmware: {e}")
+            return None
+
     def get_update_status(self, task_uri: str) -> Optional[Dict[str, str]]:
         """Get firmware update status.
 
@@ -123,15 +157,14 @@ class RedfishFirmwareManager(BaseRedfishManager):
             Update status information
         """
         try:
-            with self.create_session() as session:
-                result = self.firmware_ops.get_update_status(session, task_uri)
-                if result.success:
-                    return result.result
-                else:
-                    self.logger.error(
-                        f"Failed to get update status: {result.error_message}"
-                    )
-                    return None
+            result = self.firmware_ops.get_update_status(task_uri)
+            if result.success:
+                return result.result
+            else:
+                self.logger.error(
+                    f"Failed to get update status: {result.error_message}"
+                )
+                return None
         except Exception as e:
             self.logger.error(f"Error getting update status: {e}")
             return None
@@ -147,15 +180,12 @@ class RedfishFirmwareManager(BaseRedfishManager):
             True if update completed successfully
         """
         try:
-            with self.create_session() as session:
-                result = self.firmware_ops.wait_for_update_completion(
-                    session, task_uri, timeout
+            result = self.firmware_ops.wait_for_update_completion(task_uri, timeout)
+            if not result.success:
+                self.logger.error(
+                    f"Firmware update failed or timed out: {result.error_message}"
                 )
-                if not result.success:
-                    self.logger.error(
-                        f"Firmware update failed or timed out: {result.error_message}"
-                    )
-                return result.success
+            return result.success
         except Exception as e:
             self.logger.error(f"Error waiting for update completion: {e}")
             return False
@@ -129,7 +129,8 @@ class RedfishPowerManager(BaseRedfishManager):
 
         Args:
             system_id: System identifier
-            wait: Wait for restart to complete
+            wait: Ignored; a restart begins and ends powered on, so the call
+                returns once the BMC has accepted the reset
             force: Force immediate restart
 
         Returns:
@@ -143,7 +144,8 @@ class RedfishPowerManager(BaseRedfishManager):
 
         Args:
             system_id: System identifier
-            wait: Wait for power cycle to complete
+            wait: Ignored; a power cycle begins and ends powered on, so the
+                call returns once the BMC has accepted the reset
 
         Returns:
             True if successful
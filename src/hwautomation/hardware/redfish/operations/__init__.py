@@ -5,6 +5,12 @@ for different Redfish functionalities.
 """
 
 from .bios import RedfishBiosOperation
+from .bulk import (
+    bulk_bios_attributes,
+    bulk_firmware_inventory,
+    bulk_power_state,
+    bulk_push_firmware,
+)
 from .firmware import RedfishFirmwareOperation
 from .power import RedfishPowerOperation
 from .system import RedfishSystemOperation
@@ -14,4 +20,8 @@ __all__ = [
     "RedfishSystemOperation",
     "RedfishBiosOperation",
     "RedfishFirmwareOperation",
+    "bulk_power_state",
+    "bulk_firmware_inventory",
+    "bulk_bios_attributes",
+    "bulk_push_firmware",
 ]
@@ -5,17 +5,25 @@ This module provides BIOS settings management through the Redfish API.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from hwautomation.logging import get_logger
 
+from ...ipmi.capabilities import get_capability_cache
 from ..base import (
     BaseRedfishOperation,
     BiosAttribute,
+    BiosSettingsDiff,
     RedfishCredentials,
     RedfishOperation,
+    RedfishOperationError,
+)
+from ..client import (
+    RedfishSession,
+    SessionPool,
+    get_redfish_session_pool,
+    get_registry_cache,
 )
-from ..client import RedfishSession
 
 logger = get_logger(__name__)
 
@@ -23,19 +31,26 @@ logger = get_logger(__name__)
 class RedfishBiosOperation(BaseRedfishOperation):
     """Redfish BIOS configuration operations."""
 
-    def __init__(self, credentials: RedfishCredentials):
+    def __init__(
+        self, credentials: RedfishCredentials, pool: Optional[SessionPool] = None
+    ):
         """Initialize BIOS operations.
 
         Args:
             credentials: Redfish connection credentials
+            pool: Session pool (defaults to the shared pool)
         """
         self.credentials = credentials
+        self.pool = pool
 
     @property
     def operation_name(self) -> str:
         """Get operation name."""
         return "BIOS Configuration"
 
+    def _session_pool(self) -> SessionPool:
+        return self.pool or get_redfish_session_pool()
+
     def get_bios_attributes(
         self, system_id: str = "1"
     ) -> RedfishOperation[Dict[str, BiosAttribute]]:
@@ -48,7 +63,7 @@ class RedfishBiosOperation(BaseRedfishOperation):
             Operation result with BIOS attributes
         """
         try:
-            with RedfishSession(self.credentials) as session:
+            with self._session_pool().get(self.credentials) as session:
                 # Get BIOS URI from system
                 system_uri = f"/redfish/v1/Systems/{system_id}"
                 system_response = session.get(system_uri)
@@ -129,33 +144,67 @@ class RedfishBiosOperation(BaseRedfishOperation):
                 error_message=str(e),
             )
 
-    def set_bios_attributes(
+    def diff_bios_attributes(
         self, attributes: Dict[str, Any], system_id: str = "1"
-    ) -> RedfishOperation[bool]:
-        """Set BIOS attributes.
+    ) -> RedfishOperation[BiosSettingsDiff]:
+        """Compare desired BIOS attributes with current and pending values.
 
         Args:
-            attributes: Dictionary of attribute names and values
+            attributes: Dictionary of attribute names and desired values
             system_id: System identifier
 
         Returns:
-            Operation result
+            Operation result with the attribute diff
         """
         try:
-            with RedfishSession(self.credentials) as session:
-                # Get BIOS settings URI
-                bios_settings_uri = self._get_bios_settings_uri(session, system_id)
-                if not bios_settings_uri:
-                    return RedfishOperation(
-                        success=False,
-                        error_message="BIOS settings URI not found",
-                    )
+            with self._session_pool().get(self.credentials) as session:
+                _, current, pending = self._read_bios_state(session, system_id)
+                diff = self._diff_attributes(attributes, current, pending)
+                return RedfishOperation(success=True, result=diff)
+
+        except Exception as e:
+            logger.error(f"Failed to compare BIOS attributes: {e}")
+            return RedfishOperation(
+                success=False,
+                error_message=str(e),
+            )
 
-                # Prepare BIOS settings data
-                settings_data = {"Attributes": attributes}
+    def apply_bios_attributes(
+        self, attributes: Dict[str, Any], system_id: str = "1"
+    ) -> RedfishOperation[BiosSettingsDiff]:
+        """Set BIOS attributes, writing only values that would change.
 
-                # Send PATCH request to update settings
-                response = session.patch(bios_settings_uri, settings_data)
+        Current and pending values are read once; attributes that already
+        have the desired value, or have it staged, are left out of the PATCH
+        and no request is sent when nothing differs. Attributes the system
+        does not have are skipped and listed in the diff's ``unknown``.
+
+        Args:
+            attributes: Dictionary of attribute names and desired values
+            system_id: System identifier
+
+        Returns:
+            Operation result with the attribute diff; its
+            ``reboot_required`` tells whether a reboot is needed
+        """
+        try:
+            with self._session_pool().get(self.credentials) as session:
+                settings_uri, current, pending = self._read_bios_state(
+                    session, system_id
+                )
+                diff = self._diff_attributes(attributes, current, pending)
+                if diff.unknown:
+                    logger.warning(
+                        f"Skipping unknown BIOS attributes: {', '.join(diff.unknown)}"
+                    )
+                if not diff.patch:
+                    logger.info(
+                        "BIOS attributes already set"
+                        + (" (pending reboot)" if diff.pending else "")
+                    )
+                    return RedfishOperation(success=True, result=diff)
+
+                response = session.patch(settings_uri, {"Attributes": diff.patch})
 
                 if not response.success:
                     return RedfishOperation(
@@ -164,10 +213,10 @@ class RedfishBiosOperation(BaseRedfishOperation):
                         response=response,
                     )
 
-                logger.info(f"BIOS attributes updated: {list(attributes.keys())}")
+                logger.info(f"BIOS attributes updated: {list(diff.patch)}")
                 return RedfishOperation(
                     success=True,
-                    result=True,
+                    result=diff,
                     response=response,
                 )
 
@@ -178,6 +227,29 @@ class RedfishBiosOperation(BaseRedfishOperation):
                 error_message=str(e),
             )
 
+    def set_bios_attributes(
+        self, attributes: Dict[str, Any], system_id: str = "1"
+    ) -> RedfishOperation[bool]:
+        """Set BIOS attributes.
+
+        Only attributes whose value would change are written; see
+        ``apply_bios_attributes``.
+
+        Args:
+            attributes: Dictionary of attribute names and values
+            system_id: System identifier
+
+        Returns:
+            Operation result
+        """
+        result = self.apply_bios_attributes(attributes, system_id)
+        return RedfishOperation(
+            success=result.success,
+            result=result.success,
+            error_message=result.error_message,
+            response=result.response,
+        )
+
     def get_bios_attribute(
         self, attribute_name: str, system_id: str = "1"
     ) -> RedfishOperation[BiosAttribute]:
@@ -239,7 +311,7 @@ class RedfishBiosOperation(BaseRedfishOperation):
             Operation result
         """
         try:
-            with RedfishSession(self.credentials) as session:
+            with self._session_pool().get(self.credentials) as session:
                 # Get BIOS URI and check for reset action
                 system_uri = f"/redfish/v1/Systems/{system_id}"
                 system_response = session.get(system_uri)
@@ -331,7 +403,7 @@ class RedfishBiosOperation(BaseRedfishOperation):
             Operation result with pending settings
         """
         try:
-            with RedfishSession(self.credentials) as session:
+            with self._session_pool().get(self.credentials) as session:
                 bios_settings_uri = self._get_bios_settings_uri(session, system_id)
                 if not bios_settings_uri:
                     return RedfishOperation(
@@ -370,6 +442,92 @@ class RedfishBiosOperation(BaseRedfishOperation):
                 error_message=str(e),
             )
 
+    def _read_bios_state(
+        self, session: RedfishSession, system_id: str
+    ) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+        """Read the settings URI and the current and pending attributes.
+
+        Args:
+            session: Redfish session
+            system_id: System identifier
+
+        Returns:
+            Tuple of settings URI, current attributes and pending attributes
+
+        Raises:
+            RedfishOperationError: If the BIOS resource cannot be read
+        """
+        system_response = session.get(f"/redfish/v1/Systems/{system_id}")
+        if not system_response.success or not system_response.data:
+            raise RedfishOperationError(
+                "Failed to get system information",
+                self.operation_name,
+                system_response.status_code,
+            )
+
+        bios_uri = (system_response.data.get("Bios") or {}).get("@odata.id")
+        if not bios_uri:
+            raise RedfishOperationError(
+                "BIOS information not available", self.operation_name
+            )
+
+        bios_response = session.get(bios_uri)
+        if not bios_response.success or not bios_response.data:
+            raise RedfishOperationError(
+                "Failed to get BIOS attributes",
+                self.operation_name,
+                bios_response.status_code,
+            )
+        current = bios_response.data.get("Attributes") or {}
+        self._record_registry(bios_response.data)
+
+        settings = bios_response.data.get("@Redfish.Settings") or {}
+        settings_uri = (settings.get("SettingsObject") or {}).get(
+            "@odata.id"
+        ) or f"{bios_uri}/Settings"
+
+        # Not every service exposes the settings object before a change
+        settings_response = session.get(settings_uri)
+        pending = {}
+        if settings_response.success and settings_response.data:
+            pending = settings_response.data.get("Attributes") or {}
+        return settings_uri, current, pending
+
+    def _diff_attributes(
+        self,
+        attributes: Dict[str, Any],
+        current: Dict[str, Any],
+        pending: Dict[str, Any],
+    ) -> BiosSettingsDiff:
+        """Sort desired attributes by what writing them would change.
+
+        Args:
+            attributes: Desired attribute values
+            current: Current attribute values (empty if not reported)
+            pending: Staged attribute values
+
+        Returns:
+            Attribute diff
+        """
+        diff = BiosSettingsDiff()
+        for name, value in attributes.items():
+            if current and name not in current:
+                diff.unknown.append(name)
+                continue
+            staged = name in pending and not _same_value(
+                pending[name], current.get(name)
+            )
+            if name in current and _same_value(current[name], value):
+                if staged:
+                    diff.reverts[name] = value
+                else:
+                    diff.unchanged.append(name)
+            elif staged and _same_value(pending[name], value):
+                diff.pending[name] = value
+            else:
+                diff.changes[name] = value
+        return diff
+
     def _get_bios_settings_uri(
         self, session: RedfishSession, system_id: str
     ) -> Optional[str]:
@@ -416,6 +574,18 @@ class RedfishBiosOperation(BaseRedfishOperation):
             logger.warning(f"Failed to get BIOS settings URI: {e}")
             return None
 
+    def _record_registry(self, bios_data: Dict) -> None:
+        """Record the BIOS attribute registry ID in the BMC capabilities.
+
+        Args:
+            bios_data: BIOS resource data
+        """
+        registry_id = bios_data.get("AttributeRegistry")
+        if isinstance(registry_id, str) and registry_id:
+            get_capability_cache().update_redfish(
+                self.credentials.host, bios_registry_id=registry_id
+            )
+
     def _enrich_attributes_from_registry(
         self,
         session: RedfishSession,
@@ -434,21 +604,17 @@ class RedfishBiosOperation(BaseRedfishOperation):
             registry_data = bios_data.get("AttributeRegistry")
             if not registry_data:
                 return
+            self._record_registry(bios_data)
 
-            registry_uri = f"/redfish/v1/Registries/{registry_data}"
-            registry_response = session.get(registry_uri)
-
-            if not registry_response.success or not registry_response.data:
+            # Registries are shared by every server of a model and BIOS version
+            registry = get_registry_cache().get_or_fetch(session, registry_data)
+            if not registry:
                 return
 
-            # Get registry entries
-            entries = registry_response.data.get("Registry", {}).get("Attributes", [])
-
-            for entry in entries:
-                attr_name = entry.get("AttributeName")
-                if attr_name in attributes:
+            for attr_name, attribute in attributes.items():
+                entry = registry.get(attr_name)
+                if entry:
                     # Enrich with registry metadata
-                    attribute = attributes[attr_name]
                     attribute.description = entry.get("HelpText", attribute.description)
                     attribute.possible_values = entry.get("Value", [])
                     attribute.data_type = entry.get("Type", "Unknown")
@@ -456,3 +622,17 @@ class RedfishBiosOperation(BaseRedfishOperation):
         except Exception as e:
             logger.debug(f"Failed to enrich attributes from registry: {e}")
             # Not critical, continue without registry metadata
+
+
+def _same_value(current: Any, desired: Any) -> bool:
+    """Compare BIOS values, tolerating string forms of numbers and booleans."""
+    if current == desired:
+        return True
+    if isinstance(current, bool) or isinstance(desired, bool):
+        return str(current).lower() == str(desired).lower()
+    if isinstance(current, (int, float)) or isinstance(desired, (int, float)):
+        try:
+            return float(current) == float(desired)
+        except (TypeError, ValueError):
+            return False
+    return False
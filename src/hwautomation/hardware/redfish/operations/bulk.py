@@ -0,0 +1,168 @@
+"""Fleet-wide Redfish reads and firmware staging.
+
+These helpers run the regular operation classes against many BMCs at once
+through an ``AsyncRedfishClient``, returning one ``RedfishOperation`` per
+host. The operations send their requests through the client's limited pool,
+so every request counts against the per-BMC limits. Those limits are
+``threading.BoundedSemaphore`` slots and request spacing taken inside the
+executor threads, around each HTTP request rather than around the whole
+operation. A BMC that fails does not affect the others.
+"""
+
+import asyncio
+import functools
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
+
+from hwautomation.logging import get_logger
+
+from ..base import (
+    BiosAttribute,
+    FirmwareComponent,
+    PowerState,
+    RedfishCredentials,
+    RedfishOperation,
+)
+from ..client.async_client import AsyncRedfishClient, SessionPool
+from .bios import RedfishBiosOperation
+from .firmware import RedfishFirmwareOperation
+from .power import RedfishPowerOperation
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+async def bulk_power_state(
+    credentials: Iterable[RedfishCredentials],
+    client: Optional[AsyncRedfishClient] = None,
+    system_id: str = "1",
+) -> Dict[str, RedfishOperation[PowerState]]:
+    """Read the power state of many systems.
+
+    Args:
+        credentials: Credentials of each BMC
+        client: Async client (a temporary one is used if omitted)
+        system_id: System identifier
+
+    Returns:
+        Operation result per BMC host
+    """
+    return await _run_bulk(
+        credentials,
+        client,
+        lambda creds, pool: RedfishPowerOperation(
+            creds, use_events=False, pool=pool
+        ).get_power_state(system_id),
+    )
+
+
+async def bulk_firmware_inventory(
+    credentials: Iterable[RedfishCredentials],
+    client: Optional[AsyncRedfishClient] = None,
+    system_id: str = "1",
+) -> Dict[str, RedfishOperation[List[FirmwareComponent]]]:
+    """Read the firmware inventory of many systems.
+
+    Args:
+        credentials: Credentials of each BMC
+        client: Async client (a temporary one is used if omitted)
+        system_id: System identifier
+
+    Returns:
+        Operation result per BMC host
+    """
+    return await _run_bulk(
+        credentials,
+        client,
+        lambda creds, pool: RedfishFirmwareOperation(
+            creds, pool
+        ).get_firmware_inventory(system_id),
+    )
+
+
+async def bulk_bios_attributes(
+    credentials: Iterable[RedfishCredentials],
+    client: Optional[AsyncRedfishClient] = None,
+    system_id: str = "1",
+) -> Dict[str, RedfishOperation[Dict[str, BiosAttribute]]]:
+    """Read the BIOS attributes of many systems.
+
+    Args:
+        credentials: Credentials of each BMC
+        client: Async client (a temporary one is used if omitted)
+        system_id: System identifier
+
+    Returns:
+        Operation result per BMC host
+    """
+    return await _run_bulk(
+        credentials,
+        client,
+        lambda creds, pool: RedfishBiosOperation(creds, pool).get_bios_attributes(
+            system_id
+        ),
+    )
+
+
+async def bulk_push_firmware(
+    credentials: Iterable[RedfishCredentials],
+    image_path: str,
+    client: Optional[AsyncRedfishClient] = None,
+    targets: Optional[List[str]] = None,
+    apply_time: str = "Immediate",
+    progress: Optional[Callable[[str, int, int], None]] = None,
+) -> Dict[str, RedfishOperation[str]]:
+    """Upload a local firmware image to many BMCs.
+
+    Each upload streams the image from disk, so memory use does not grow
+    with the image size or the number of BMCs uploaded to at once.
+
+    Args:
+        credentials: Credentials of each BMC
+        image_path: Path of the firmware image
+        client: Async client (a temporary one is used if omitted)
+        targets: List of target URIs to update
+        apply_time: When to apply the update
+        progress: Called with the BMC host, bytes sent and total bytes
+
+    Returns:
+        Operation result with task URI per BMC host
+    """
+
+    def push(creds: RedfishCredentials, pool: SessionPool) -> RedfishOperation[str]:
+        host_progress = None
+        if progress:
+            host_progress = functools.partial(progress, creds.host)
+        return RedfishFirmwareOperation(creds, pool).push_firmware(
+            image_path, targets, apply_time, host_progress
+        )
+
+    return await _run_bulk(credentials, client, push)
+
+
+async def _run_bulk(
+    credentials: Iterable[RedfishCredentials],
+    client: Optional[AsyncRedfishClient],
+    read: Callable[[RedfishCredentials, SessionPool], RedfishOperation[T]],
+) -> Dict[str, RedfishOperation[T]]:
+    targets = list(credentials)
+    owned = client is None
+    client = client or AsyncRedfishClient()
+    try:
+        results = await asyncio.gather(
+            *(client.run(creds, read, creds, client.limited_pool) for creds in targets),
+            return_exceptions=True,
+        )
+    finally:
+        if owned:
+            client.close()
+
+    operations: Dict[str, RedfishOperation[T]] = {}
+    for creds, result in zip(targets, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Bulk Redfish operation failed for {creds.host}: {result}")
+            result = RedfishOperation(success=False, error_message=str(result))
+        elif isinstance(result, BaseException):
+            raise result
+        operations[creds.host] = result
+    return operations
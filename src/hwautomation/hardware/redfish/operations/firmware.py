@@ -6,18 +6,31 @@ through the Redfish API.
 
 from __future__ import annotations
 
-import time
 from typing import Dict, List, Optional
 
 from hwautomation.logging import get_logger
 
+from ...ipmi.capabilities import get_capability_cache
 from ..base import (
     BaseRedfishOperation,
     FirmwareComponent,
     RedfishCredentials,
     RedfishOperation,
 )
-from ..client import RedfishSession
+from ..client import (
+    RedfishSession,
+    SessionPool,
+    fetch_collection,
+    get_redfish_session_pool,
+)
+from ..client.tasks import (
+    FAILED_STATES,
+    TaskCallback,
+    TaskHandle,
+    get_task_monitor,
+    task_status,
+)
+from ..client.upload import FileUploadBody, MultipartUploadBody, UploadProgress
 
 logger = get_logger(__name__)
 
@@ -25,19 +38,26 @@ logger = get_logger(__name__)
 class RedfishFirmwareOperation(BaseRedfishOperation):
     """Redfish firmware management operations."""
 
-    def __init__(self, credentials: RedfishCredentials):
+    def __init__(
+        self, credentials: RedfishCredentials, pool: Optional[SessionPool] = None
+    ):
         """Initialize firmware operations.
 
         Args:
             credentials: Redfish connection credentials
+            pool: Session pool (defaults to the shared pool)
         """
         self.credentials = credentials
+        self.pool = pool
 
     @property
     def operation_name(self) -> str:
         """Get operation name."""
         return "Firmware Management"
 
+    def _session_pool(self) -> SessionPool:
+        return self.pool or get_redfish_session_pool()
+
     def get_firmware_inventory(
         self, system_id: str = "1"
     ) -> RedfishOperation[List[FirmwareComponent]]:
@@ -50,7 +70,7 @@ class RedfishFirmwareOperation(BaseRedfishOperation):
             Operation result with firmware inventory
         """
         try:
-            with RedfishSession(self.credentials) as session:
+            with self._session_pool().get(self.credentials) as session:
                 # Get update service
                 update_service_response = session.get("/redfish/v1/UpdateService")
                 if not update_service_response.success:
@@ -83,8 +103,10 @@ class RedfishFirmwareOperation(BaseRedfishOperation):
                         response=update_service_response,
                     )
 
-                # Get firmware inventory collection
-                inventory_response = session.get(firmware_inventory_uri)
+                # Get firmware inventory collection with its members
+                inventory_response, members = fetch_collection(
+                    session, firmware_inventory_uri
+                )
                 if not inventory_response.success:
                     return RedfishOperation(
                         success=False,
@@ -100,17 +122,9 @@ class RedfishFirmwareOperation(BaseRedfishOperation):
                     )
 
                 # Process firmware components
-                members = inventory_response.data.get("Members", [])
-                firmware_components = []
-
-                for member in members:
-                    component_uri = member.get("@odata.id")
-                    if not component_uri:
-                        continue
-
-                    component = self._get_firmware_component(session, component_uri)
-                    if component:
-                        firmware_components.append(component)
+                firmware_components = [
+                    self._parse_firmware_component(member) for member in members
+                ]
 
                 return RedfishOperation(
                     success=True,
@@ -137,7 +151,7 @@ class RedfishFirmwareOperation(BaseRedfishOperation):
             Operation result with firmware component
         """
         try:
-            with RedfishSession(self.credentials) as session:
+            with self._session_pool().get(self.credentials) as session:
                 component_uri = (
                     f"/redfish/v1/UpdateService/FirmwareInventory/{component_id}"
                 )
@@ -178,7 +192,7 @@ class RedfishFirmwareOperation(BaseRedfishOperation):
             Operation result with task URI if async
         """
         try:
-            with RedfishSession(self.credentials) as session:
+            with self._session_pool().get(self.credentials) as session:
                 # Get update service
                 update_service_response = session.get("/redfish/v1/UpdateService")
                 if (
@@ -251,6 +265,115 @@ class RedfishFirmwareOperation(BaseRedfishOperation):
                 error_message=str(e),
             )
 
+    def push_firmware(
+        self,
+        image_path: str,
+        targets: Optional[List[str]] = None,
+        apply_time: str = "Immediate",
+        progress: Optional[UploadProgress] = None,
+        timeout: int = 1800,
+    ) -> RedfishOperation[str]:
+        """Upload a local firmware image to the BMC.
+
+        The image is streamed from disk to ``MultipartHttpPushUri`` when the
+        service offers it, otherwise to the legacy ``HttpPushUri``.
+
+        Args:
+            image_path: Path of the firmware image
+            targets: List of target URIs to update
+            apply_time: When to apply the update ("Immediate", "OnReset", "AtMaintenanceWindowStart")
+            progress: Called with bytes sent and total bytes during the upload
+            timeout: Seconds to wait for the BMC to accept the uploaded image
+
+        Returns:
+            Operation result with task URI if async
+        """
+        try:
+            with self._session_pool().get(self.credentials) as session:
+                update_service_response = session.get("/redfish/v1/UpdateService")
+                if (
+                    not update_service_response.success
+                    or not update_service_response.data
+                ):
+                    return RedfishOperation(
+                        success=False,
+                        error_message="Update service not available",
+                        response=update_service_response,
+                    )
+
+                update_service = update_service_response.data
+                multipart_uri = update_service.get("MultipartHttpPushUri")
+                push_uri = update_service.get("HttpPushUri")
+                get_capability_cache().update_redfish(
+                    self.credentials.host,
+                    features={"push_update": bool(multipart_uri or push_uri)},
+                )
+
+                if multipart_uri:
+                    parameters = {"@Redfish.OperationApplyTime": apply_time}
+                    if targets:
+                        parameters["Targets"] = targets
+                    upload_uri = multipart_uri
+                    body = MultipartUploadBody(image_path, parameters, progress)
+                elif push_uri:
+                    # HttpPushUri takes its options from the UpdateService; they
+                    # persist there, so always overwrite what an earlier push set
+                    options = {
+                        "HttpPushUriTargets": targets or [],
+                        "HttpPushUriOptions": {
+                            "HttpPushUriApplyTime": {"ApplyTime": apply_time}
+                        },
+                    }
+                    options_response = session.patch(
+                        "/redfish/v1/UpdateService", options
+                    )
+                    if not options_response.success:
+                        return RedfishOperation(
+                            success=False,
+                            error_message=f"Failed to set push options: {options_response.error_message}",
+                            response=options_response,
+                        )
+                    upload_uri = push_uri
+                    body = FileUploadBody(image_path, progress)
+                else:
+                    return RedfishOperation(
+                        success=False,
+                        error_message="HTTP push update not supported",
+                        response=update_service_response,
+                    )
+
+                logger.info(
+                    f"Uploading {image_path} ({len(body)} bytes) to {self.credentials.host}"
+                )
+                upload_response = session.upload(upload_uri, body, timeout)
+
+                if not upload_response.success:
+                    return RedfishOperation(
+                        success=False,
+                        error_message=f"Firmware upload failed: {upload_response.error_message}",
+                        response=upload_response,
+                    )
+
+                # Task monitor in Location, or the Task resource in the body
+                task_uri = (upload_response.headers or {}).get("Location")
+                if not task_uri and "TaskState" in (upload_response.data or {}):
+                    task_uri = upload_response.data.get("@odata.id")
+
+                logger.info(f"Firmware upload to {self.credentials.host} accepted")
+
+                return RedfishOperation(
+                    success=True,
+                    result=task_uri or "Update initiated",
+                    response=upload_response,
+                )
+
+        except Exception as e:
+            logger.error(f"Failed to push firmware: {e}")
+            return RedfishOperation(
+                success=False,
+                error_message=str(e),
+            )
+
     def get_update_status(self, task_uri: str) -> RedfishOperation[Dict[str, str]]:
         """Get firmware update task status.
 
@@ -261,7 +384,7 @@ class RedfishFirmwareOperation(BaseRedfishOperation):
             Operation result with task status
         """
         try:
-            with RedfishSession(self.credentials) as session:
+            with self._session_pool().get(self.credentials) as session:
                 response = session.get(task_uri)
 
                 if not response.success:
@@ -278,23 +401,9 @@ class RedfishFirmwareOperation(BaseRedfishOperation):
                         response=response,
                     )
 
-                data = response.data
-                status = {
-                    "task_state": data.get("TaskState", "Unknown"),
-                    "task_status": data.get("TaskStatus", "Unknown"),
-                    "percent_complete": str(data.get("PercentComplete", 0)),
-                    "start_time": data.get("StartTime", ""),
-                    "end_time": data.get("EndTime", ""),
-                }
-
-                # Add messages if available
-                messages = data.get("Messages", [])
-                if messages:
-                    status["messages"] = [msg.get("Message", "") for msg in messages]
-
                 return RedfishOperation(
                     success=True,
-                    result=status,
+                    result=task_status(response.data),
                     response=response,
                 )
 
@@ -305,6 +414,24 @@ class RedfishFirmwareOperation(BaseRedfishOperation):
                 error_message=str(e),
             )
 
+    def track_update(
+        self,
+        task_uri: str,
+        timeout: int = 1800,
+        callback: Optional[TaskCallback] = None,
+    ) -> TaskHandle:
+        """Track a firmware update task on the shared task monitor.
+
+        Args:
+            task_uri: Task URI from update operation
+            timeout: Timeout in seconds
+            callback: Called with the final task result
+
+        Returns:
+            Handle whose future resolves when the update finishes
+        """
+        return get_task_monitor().track(self.credentials, task_uri, timeout, callback)
+
     def wait_for_update_completion(
         self, task_uri: str, timeout: int = 1800
     ) -> RedfishOperation[bool]:
@@ -317,46 +444,31 @@ class RedfishFirmwareOperation(BaseRedfishOperation):
         Returns:
             Operation result with completion status
         """
-        start_time = time.time()
-        check_interval = 30  # seconds
-
         logger.info(f"Waiting for firmware update completion (timeout: {timeout}s)")
 
-        while time.time() - start_time < timeout:
-            status_result = self.get_update_status(task_uri)
-
-            if not status_result.success:
-                return RedfishOperation(
-                    success=False,
-                    error_message=f"Failed to check update status: {status_result.error_message}",
-                )
-
-            status = status_result.result or {}
-            task_state = status.get("task_state", "Unknown")
-            percent = status.get("percent_complete", "0")
+        handle = self.track_update(task_uri, timeout)
+        outcome = handle.result()
 
-            logger.info(f"Update progress: {task_state} ({percent}%)")
-
-            # Check for completion states
-            if task_state in ["Completed", "CompletedWithWarnings"]:
-                logger.info("Firmware update completed successfully")
-                return RedfishOperation(
-                    success=True,
-                    result=True,
-                )
-            elif task_state in ["Exception", "Cancelled", "Interrupted"]:
-                logger.error(f"Firmware update failed: {task_state}")
-                return RedfishOperation(
-                    success=False,
-                    error_message=f"Update failed with state: {task_state}",
-                )
+        if outcome.success:
+            logger.info("Firmware update completed successfully")
+            # New firmware may change the Redfish version and BIOS registry
+            get_capability_cache().forget_redfish(self.credentials.host)
+            return RedfishOperation(success=True, result=True)
 
-            time.sleep(check_interval)
+        task_state = (outcome.result or {}).get("task_state")
+        if task_state in FAILED_STATES:
+            logger.error(f"Firmware update failed: {task_state}")
+            return RedfishOperation(
+                success=False,
+                error_message=f"Update failed with state: {task_state}",
+                response=outcome.response,
+            )
 
-        logger.warning(f"Firmware update timeout after {timeout}s")
+        logger.warning(f"Firmware update did not complete: {outcome.error_message}")
         return RedfishOperation(
             success=False,
-            error_message="Update timeout",
+            error_message=outcome.error_message or "Update timeout",
+            response=outcome.response,
         )
 
     def _get_firmware_component(
@@ -376,23 +488,7 @@ class RedfishFirmwareOperation(BaseRedfishOperation):
             if not response.success or not response.data:
                 return None
 
-            data = response.data
-
-            # Determine component type from name/description
-            name = data.get("Name", "Unknown")
-            description = data.get("Description", "")
-            component_type = self._determine_component_type(name, description)
-
-            return FirmwareComponent(
-                id=data.get("Id", "Unknown"),
-                name=name,
-                version=data.get("Version", "Unknown"),
-                component_type=component_type,
-                description=description,
-                updateable=data.get("Updateable", False),
-                manufacturer=data.get("Manufacturer"),
-                release_date=data.get("ReleaseDate"),
-            )
+            return self._parse_firmware_component(response.data)
 
         except Exception as e:
             logger.warning(
@@ -400,6 +496,30 @@ class RedfishFirmwareOperation(BaseRedfishOperation):
             )
             return None
 
+    def _parse_firmware_component(self, data: Dict) -> FirmwareComponent:
+        """Build a firmware component from a SoftwareInventory resource.
+
+        Args:
+            data: SoftwareInventory resource
+
+        Returns:
+            Firmware component
+        """
+        # Determine component type from name/description
+        name = data.get("Name", "Unknown")
+        description = data.get("Description", "")
+        component_type = self._determine_component_type(name, description)
+
+        return FirmwareComponent(
+            name=name,
+            version=data.get("Version", "Unknown"),
+            component_type=component_type,
+            description=description,
+            updateable=data.get("Updateable", False),
+            manufacturer=data.get("Manufacturer"),
+            release_date=data.get("ReleaseDate"),
+        )
+
     def _determine_component_type(self, name: str, description: str) -> str:
         """Determine component type from name and description.
 
@@ -6,7 +6,6 @@ through the Redfish API.
 
 from __future__ import annotations
 
-import time
 from typing import Optional
 
 from hwautomation.logging import get_logger
@@ -21,7 +20,10 @@ from ..base import (
     RedfishOperation,
     RedfishResponse,
 )
-from ..client import RedfishSession
+from ...power_watch import PowerStateWatcher, get_power_watcher
+from ..client import RedfishSession, SessionPool, get_redfish_session_pool
+from ..client.events import RedfishEventStream, discover_sse_uri, event_origin
+from ..client.subscriptions import get_event_receiver
 
 logger = get_logger(__name__)
 
@@ -29,19 +31,35 @@ logger = get_logger(__name__)
 class RedfishPowerOperation(BaseRedfishOperation):
     """Redfish power management operations."""
 
-    def __init__(self, credentials: RedfishCredentials):
+    def __init__(
+        self,
+        credentials: RedfishCredentials,
+        watcher: Optional[PowerStateWatcher] = None,
+        use_events: bool = True,
+        pool: Optional[SessionPool] = None,
+    ):
         """Initialize power operations.
 
         Args:
             credentials: Redfish connection credentials
+            watcher: Power-state watcher (defaults to the shared watcher)
+            use_events: Wake power-state waits from the BMC's server-sent
+                event stream when the EventService offers one
+            pool: Session pool (defaults to the shared pool)
         """
         self.credentials = credentials
+        self.watcher = watcher or get_power_watcher()
+        self.use_events = use_events
+        self.pool = pool
 
     @property
     def operation_name(self) -> str:
         """Get operation name."""
         return "Power Management"
 
+    def _session_pool(self) -> SessionPool:
+        return self.pool or get_redfish_session_pool()
+
     def get_power_state(self, system_id: str = "1") -> RedfishOperation[PowerState]:
         """Get current power state of the system.
 
@@ -52,7 +70,7 @@ class RedfishPowerOperation(BaseRedfishOperation):
             Operation result with power state
         """
         try:
-            with RedfishSession(self.credentials) as session:
+            with self._session_pool().get(self.credentials) as session:
                 system_uri = f"/redfish/v1/Systems/{system_id}"
                 response = session.get(system_uri)
 
@@ -104,14 +122,16 @@ class RedfishPowerOperation(BaseRedfishOperation):
         Args:
             action: Power action to perform
             system_id: System identifier (default: "1")
-            wait_for_completion: Wait for action to complete
+            wait_for_completion: Wait for the new power state to be reported;
+                ignored for restarts, which return once the BMC has accepted
+                the reset
             timeout: Timeout in seconds for completion
 
         Returns:
             Operation result with success status
         """
         try:
-            with RedfishSession(self.credentials) as session:
+            with self._session_pool().get(self.credentials) as session:
                 # Get system info and reset action URI
                 system_uri = f"/redfish/v1/Systems/{system_id}"
                 response = session.get(system_uri)
@@ -240,7 +260,8 @@ class RedfishPowerOperation(BaseRedfishOperation):
 
         Args:
             system_id: System identifier
-            wait: Wait for restart to complete
+            wait: Ignored; a restart begins and ends powered on, so the call
+                returns once the BMC has accepted the reset
             force: Force immediate restart
 
         Returns:
@@ -288,6 +309,10 @@ class RedfishPowerOperation(BaseRedfishOperation):
     ) -> bool:
         """Wait for power state to change after action.
 
+        The wait runs on the shared power-state watcher; when the BMC
+        offers a server-sent event stream, system events trigger an
+        immediate re-check instead of waiting for the next poll.
+
         Args:
             session: Redfish session
             system_uri: System URI
@@ -297,43 +322,72 @@ class RedfishPowerOperation(BaseRedfishOperation):
         Returns:
             True if expected state reached
         """
-        # Determine expected final state
+        # Determine expected final state. Restarts are absent: the system is
+        # On before and after, so PowerState cannot show when one completed.
         expected_states = {
             PowerAction.ON: [PowerState.ON],
-            PowerAction.GRACEFUL_SHUTDOWN: [PowerState.OFF],
+            PowerAction.FORCE_ON: [PowerState.ON],
+            PowerAction.OFF: [PowerState.OFF],
             PowerAction.FORCE_OFF: [PowerState.OFF],
-            PowerAction.GRACEFUL_RESTART: [PowerState.ON],
-            PowerAction.FORCE_RESTART: [PowerState.ON],
         }
 
         target_states = expected_states.get(action, [])
         if not target_states:
             return True  # No specific state to wait for
 
-        start_time = time.time()
-        check_interval = 5  # seconds
+        key = ("redfish", self.credentials.host, self.credentials.port, system_uri)
+
+        def probe() -> Optional[str]:
+            response = session.get(system_uri)
+            if response.success and response.data:
+                return response.data.get("PowerState")
+            return None
 
         logger.info(f"Waiting for power state change to {target_states}")
 
-        while time.time() - start_time < timeout:
-            try:
-                response = session.get(system_uri)
-                if response.success and response.data:
-                    power_state_str = response.data.get("PowerState", "Unknown")
+        stream = self._open_event_stream(session, key, system_uri)
+        try:
+            reached = self.watcher.wait_for(
+                key, probe, [state.value for state in target_states], timeout
+            )
+        finally:
+            if stream is not None:
+                stream.stop()
 
-                    try:
-                        current_state = PowerState(power_state_str)
-                        if current_state in target_states:
-                            logger.info(f"Power state reached: {current_state.value}")
-                            return True
-                    except ValueError:
-                        pass  # Unknown state, continue waiting
+        if reached:
+            logger.info(f"Power state reached: {target_states}")
+        else:
+            logger.warning(f"Timeout waiting for power state change after {timeout}s")
+        return reached
 
-                time.sleep(check_interval)
+    def _open_event_stream(
+        self, session: RedfishSession, key: tuple, system_uri: str
+    ) -> Optional[RedfishEventStream]:
+        """Start an SSE stream that wakes the watcher on system events.
 
-            except Exception as e:
-                logger.warning(f"Error checking power state: {e}")
-                time.sleep(check_interval)
+        Args:
+            session: Redfish session
+            key: Watcher key of the wait
+            system_uri: System URI being watched
 
-        logger.warning(f"Timeout waiting for power state change after {timeout}s")
-        return False
+        Returns:
+            Running event stream, or None if events are disabled or unsupported
+        """
+        if not self.use_events:
+            return None
+        # Events pushed to the receiver already wake the watcher
+        receiver = get_event_receiver()
+        if receiver.running and receiver.ensure_subscription(self.credentials):
+            return None
+        uri = discover_sse_uri(session)
+        if not uri:
+            return None
+
+        def on_event(record) -> None:
+            origin = event_origin(record)
+            if origin is None or origin.rstrip("/").startswith(system_uri):
+                self.watcher.notify(key)
+
+        stream = RedfishEventStream(self.credentials, uri, on_event)
+        stream.start()
+        return stream
@@ -17,7 +17,7 @@ from ..base import (
     RedfishOperation,
     SystemInfo,
 )
-from ..client import RedfishSession
+from ..client import RedfishSession, fetch_collection, get_redfish_session_pool
 
 logger = get_logger(__name__)
 
@@ -48,7 +48,7 @@ class RedfishSystemOperation(BaseRedfishOperation):
             Operation result with system information
         """
         try:
-            with RedfishSession(self.credentials) as session:
+            with get_redfish_session_pool().get(self.credentials) as session:
                 system_uri = f"/redfish/v1/Systems/{system_id}"
                 response = session.get(system_uri)
 
@@ -138,7 +138,7 @@ class RedfishSystemOperation(BaseRedfishOperation):
             Operation result with status information
         """
         try:
-            with RedfishSession(self.credentials) as session:
+            with get_redfish_session_pool().get(self.credentials) as session:
                 system_uri = f"/redfish/v1/Systems/{system_id}"
                 response = session.get(system_uri)
 
@@ -187,8 +187,8 @@ class RedfishSystemOperation(BaseRedfishOperation):
             Operation result with list of systems
         """
         try:
-            with RedfishSession(self.credentials) as session:
-                response = session.get("/redfish/v1/Systems")
+            with get_redfish_session_pool().get(self.credentials) as session:
+                response, members = fetch_collection(session, "/redfish/v1/Systems")
 
                 if not response.success:
                     return RedfishOperation(
@@ -204,31 +204,19 @@ class RedfishSystemOperation(BaseRedfishOperation):
                         response=response,
                     )
 
-                members = response.data.get("Members", [])
-                systems = []
-
                 # Get basic info for each system
-                for member in members:
-                    system_uri = member.get("@odata.id")
-                    if not system_uri:
-                        continue
-
-                    system_response = session.get(system_uri)
-                    if system_response.success and system_response.data:
-                        data = system_response.data
-                        systems.append(
-                            {
-                                "id": data.get("Id", "Unknown"),
-                                "name": data.get("Name", "Unknown"),
-                                "uri": system_uri,
-                                "manufacturer": data.get("Manufacturer", "Unknown"),
-                                "model": data.get("Model", "Unknown"),
-                                "power_state": data.get("PowerState", "Unknown"),
-                                "health": data.get("Status", {}).get(
-                                    "Health", "Unknown"
-                                ),
-                            }
-                        )
+                systems = [
+                    {
+                        "id": data.get("Id", "Unknown"),
+                        "name": data.get("Name", "Unknown"),
+                        "uri": data.get("@odata.id"),
+                        "manufacturer": data.get("Manufacturer", "Unknown"),
+                        "model": data.get("Model", "Unknown"),
+                        "power_state": data.get("PowerState", "Unknown"),
+                        "health": data.get("Status", {}).get("Health", "Unknown"),
+                    }
+                    for data in members
+                ]
 
                 return RedfishOperation(
                     success=True,
@@ -263,7 +251,7 @@ class RedfishSystemOperation(BaseRedfishOperation):
             )
 
         try:
-            with RedfishSession(self.credentials) as session:
+            with get_redfish_session_pool().get(self.credentials) as session:
                 system_uri = f"/redfish/v1/Systems/{system_id}"
                 data = {"IndicatorLED": state}
 
@@ -366,23 +354,17 @@ class RedfishSystemOperation(BaseRedfishOperation):
             return interfaces
 
         try:
-            response = session.get(network_interfaces_uri)
-            if response.success and response.data:
-                members = response.data.get("Members", [])
-                for member in members[:5]:  # Limit to first 5 interfaces
-                    interface_uri = member.get("@odata.id")
-                    if interface_uri:
-                        interface_data = session.get(interface_uri)
-                        if interface_data.success and interface_data.data:
-                            data = interface_data.data
-                            interfaces.append(
-                                {
-                                    "id": data.get("Id", "Unknown"),
-                                    "name": data.get("Name", "Unknown"),
-                                    "mac_address": data.get("MACAddress"),
-                                    "status": data.get("Status", {}).get("Health"),
-                                }
-                            )
+            # Limit to first 5 interfaces
+            _, members = fetch_collection(session, network_interfaces_uri, limit=5)
+            for data in members:
+                interfaces.append(
+                    {
+                        "id": data.get("Id", "Unknown"),
+                        "name": data.get("Name", "Unknown"),
+                        "mac_address": data.get("MACAddress"),
+                        "status": data.get("Status", {}).get("Health"),
+                    }
+                )
         except Exception as e:
             logger.warning(f"Failed to get network interfaces: {e}")
 
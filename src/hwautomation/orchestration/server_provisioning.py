@@ -37,6 +37,13 @@ warnings.warn(
     stacklevel=2,
 )
 
+from ..hardware.ipmi.base import IPMICredentials
+from ..hardware.ipmi.console import (
+    POST_COMPLETE_PATTERN,
+    SOLConsoleService,
+    get_console_service,
+)
+from ..hardware.ipmi.operations.plan import IPMIConfigPlan, shell_batch_runner
 from ..logging import get_logger
 from .exceptions import (
     BiosConfigurationError,
@@ -49,6 +56,11 @@ from .workflow_manager import Workflow, WorkflowContext, WorkflowManager, Workfl
 
 logger = get_logger(__name__)
 
+# Seconds to wait for a rebooting server's SOL console to show output (the
+# fixed reboot wait used without a console) and then for POST to complete
+SOL_OUTPUT_TIMEOUT = 60
+POST_COMPLETE_TIMEOUT = 600
+
 
 class ServerProvisioningWorkflow:
     """
@@ -1524,6 +1536,10 @@ class ServerProvisioningWorkflow:
             if exit_code != 0:
                 raise BiosConfigurationError(f"Failed to push BIOS config: {stderr}")
 
+            # Watch the serial console across the reboot when IPMI is known
+            console = self._start_console_capture(context)
+            since = console.get_buffer(context.server_id).end if console else None
+
             # Reboot server to apply changes
             logger.info("Rebooting server to apply BIOS changes")
             ssh_client.exec_command("sudo reboot")
@@ -1531,15 +1547,71 @@ class ServerProvisioningWorkflow:
             ssh_client.close()
 
             # Wait for server to come back up
-            time.sleep(60)  # Wait for reboot
+            post_complete = False
+            if console:
+                try:
+                    # Servers without console redirection print nothing, so
+                    # only wait for POST once the console shows output
+                    if console.wait_for(
+                        context.server_id,
+                        r"\S",
+                        timeout=SOL_OUTPUT_TIMEOUT,
+                        since=since,
+                    ):
+                        post_complete = bool(
+                            console.wait_for(
+                                context.server_id,
+                                POST_COMPLETE_PATTERN,
+                                timeout=POST_COMPLETE_TIMEOUT,
+                                since=since,
+                            )
+                        )
+                    else:
+                        logger.info("No SOL console output, assuming reboot done")
+                finally:
+                    console.stop(context.server_id)
+                if not post_complete:
+                    logger.warning("POST completion not seen on the SOL console")
+            else:
+                time.sleep(SOL_OUTPUT_TIMEOUT)  # Wait for reboot
 
             logger.info("BIOS configuration pushed successfully")
-            return {"status": "applied", "reboot_required": True}
+            return {
+                "status": "applied",
+                "reboot_required": True,
+                "post_complete": post_complete,
+            }
 
         except Exception as e:
             logger.error(f"Failed to push Supermicro BIOS config: {e}")
             raise BiosConfigurationError(f"Supermicro BIOS config push failed: {e}")
 
+    def _start_console_capture(
+        self, context: WorkflowContext
+    ) -> Optional[SOLConsoleService]:
+        """Start capturing the server's SOL console if its BMC is known."""
+        ipmi_ip = (context.server_data or {}).get(
+            "ipmi_address"
+        ) or context.discovered_ipmi_ip
+        ipmi_config = self.manager.config.get("ipmi", {})
+        if not ipmi_ip or not ipmi_config.get("password"):
+            return None
+
+        try:
+            console = get_console_service()
+            console.start(
+                context.server_id,
+                IPMICredentials(
+                    ip_address=ipmi_ip,
+                    username=ipmi_config.get("username", "ADMIN"),
+                    password=ipmi_config["password"],
+                ),
+            )
+            return console
+        except Exception as e:
+            logger.warning(f"SOL console capture unavailable for {ipmi_ip}: {e}")
+            return None
+
     def _configure_ipmi_conditional(self, context: WorkflowContext) -> Dict[str, Any]:
         """Step 7: Configure IPMI settings (only if target IP is provided)."""
 
@@ -1567,18 +1639,23 @@ class ServerProvisioningWorkflow:
         logger.info(f"Configuring IPMI with IP {context.target_ipmi_ip}")
 
         try:
-            # Wait for server to be accessible after reboot
-            time.sleep(30)
-
             if not context.server_ip:
                 raise WorkflowError(
                     "Server IP address not available for IPMI configuration"
                 )
 
-            # Configure IPMI via SSH
-            ssh_client = self.manager.ssh_manager.connect(
-                host=context.server_ip, username="ubuntu", timeout=60
-            )
+            # Configure IPMI via SSH, retrying while the server finishes rebooting
+            deadline = time.monotonic() + 60
+            while True:
+                try:
+                    ssh_client = self.manager.ssh_manager.connect(
+                        host=context.server_ip, username="ubuntu", timeout=60
+                    )
+                    break
+                except Exception:
+                    if time.monotonic() >= deadline:
+                        raise
+                    time.sleep(5)
 
             # Set IPMI IP address with dynamic network configuration
             subnet_mask = getattr(
@@ -1588,25 +1665,21 @@ class ServerProvisioningWorkflow:
                 context, "gateway", "192.168.100.1"
             )  # Default if not provided
 
-            ipmi_commands = [
-                f"ipmitool lan set 1 ipsrc static",
-                f"ipmitool lan set 1 ipaddr {context.target_ipmi_ip}",
-                f"ipmitool lan set 1 netmask {subnet_mask}",
-                f"ipmitool lan set 1 defgw ipaddr {gateway_ip}",
-                f"ipmitool lan set 1 access on",
-            ]
-
-            for cmd in ipmi_commands:
-                stdout, stderr, exit_code = ssh_client.exec_command(f"sudo {cmd}")
-                if exit_code != 0:
-                    logger.warning(f"IPMI command failed: {cmd} - {stderr}")
-
-            # Verify IPMI configuration
-            stdout, stderr, exit_code = ssh_client.exec_command(
-                "sudo ipmitool lan print 1"
+            # Only settings that differ from the BMC are written, in one batch
+            plan = IPMIConfigPlan.for_vendor(
+                "generic",
+                ipmi_ip=context.target_ipmi_ip,
+                netmask=subnet_mask,
+                gateway=gateway_ip,
+                lan_access=True,
             )
+            try:
+                plan_result = plan.apply(shell_batch_runner(ssh_client.exec_command))
+            finally:
+                ssh_client.close()
 
-            ssh_client.close()
+            for error in plan_result.errors:
+                logger.warning(f"IPMI command failed: {error}")
 
             # Update database with IPMI configuration
             if context.db_helper:
@@ -1618,7 +1691,11 @@ class ServerProvisioningWorkflow:
                 )
 
             logger.info("IPMI configuration completed")
-            return {"ipmi_ip": context.target_ipmi_ip, "status": "configured"}
+            return {
+                "ipmi_ip": context.target_ipmi_ip,
+                "status": "configured",
+                "plan": plan_result.to_dict(),
+            }
 
         except Exception as e:
             logger.error(f"IPMI configuration failed: {e}")
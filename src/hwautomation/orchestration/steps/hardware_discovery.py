@@ -9,8 +9,10 @@ from typing import Any, Dict, Optional
 
 from hwautomation.logging import get_logger
 
-from ...hardware.discovery import HardwareDiscoveryManager
+from ...hardware.discovery import DiscoveryCache, HardwareDiscoveryManager
+from ...hardware.discovery.parsers import DiscoverySnapshot
 from ...utils.network import SSHClient, SSHManager
+from ..utils.vendor_detection import VendorDetector
 from ..workflows.base import (
     BaseWorkflowStep,
     ConditionalWorkflowStep,
@@ -99,8 +101,10 @@ class DiscoverHardwareStep(BaseWorkflowStep):
         try:
             context.add_sub_task("Initializing hardware discovery")
 
-            # Initialize discovery manager
-            self.discovery_manager = HardwareDiscoveryManager()
+            # Reuse cached inventory for hosts whose identity is unchanged
+            self.discovery_manager = HardwareDiscoveryManager(
+                SSHManager(), discovery_cache=self._get_discovery_cache()
+            )
 
             context.add_sub_task("Performing hardware discovery")
 
@@ -111,123 +115,109 @@ class DiscoverHardwareStep(BaseWorkflowStep):
             time.sleep(15)  # 15 second delay for debugging
 
             # Perform discovery
-            discovery_result = self.discovery_manager.discover_system(
-                target_ip=context.server_ip,
+            discovery = self.discovery_manager.discover_hardware(
+                host=context.server_ip,
                 username=context.get_data("ssh_username", "ubuntu"),
             )
 
-            if not discovery_result.success:
+            if not discovery.ssh_accessible:
                 return StepExecutionResult.failure(
-                    f"Hardware discovery failed: {discovery_result.error_message}"
+                    "Hardware discovery failed: "
+                    f"{'; '.join(discovery.discovery_errors)}"
                 )
 
-            hardware_info = discovery_result.hardware_info
+            system_info = discovery.system_info
 
             # Update context with discovered information
-            if hardware_info:
-                context.manufacturer = hardware_info.manufacturer
-                context.model = hardware_info.model
-                context.serial_number = hardware_info.serial_number
+            context.manufacturer = system_info.manufacturer
+            context.model = system_info.product_name
+            context.serial_number = system_info.serial_number
+
+            context.set_data(
+                "hardware_info",
+                {
+                    "manufacturer": system_info.manufacturer,
+                    "model": system_info.product_name,
+                    "serial_number": system_info.serial_number,
+                    "cpu_info": {
+                        "model": system_info.cpu_model,
+                        "cores": system_info.cpu_cores,
+                    },
+                    "memory_info": {"total": system_info.memory_total},
+                    "network_interfaces": [
+                        {
+                            "name": iface.name,
+                            "mac_address": iface.mac_address,
+                            "ip_address": iface.ip_address,
+                        }
+                        for iface in discovery.network_interfaces
+                    ],
+                },
+            )
+            if discovery.ipmi_info.ip_address:
+                context.ipmi_ip = discovery.ipmi_info.ip_address
+            if discovery.snapshot is not None:
+                # Lets vendor detection reuse the parsed DMI data
+                context.set_data("discovery_snapshot", discovery.snapshot)
+
+            source = "cached inventory" if discovery.from_cache else "discovery"
+            context.add_sub_task(
+                f"Discovered {system_info.manufacturer} {system_info.product_name} "
+                f"({source})"
+            )
 
+            # Device classification ran as part of discovery
+            if system_info.device_type:
+                context.set_data("device_type", system_info.device_type)
                 context.set_data(
-                    "hardware_info",
-                    {
-                        "manufacturer": hardware_info.manufacturer,
-                        "model": hardware_info.model,
-                        "serial_number": hardware_info.serial_number,
-                        "cpu_info": hardware_info.cpu_info,
-                        "memory_info": hardware_info.memory_info,
-                        "network_interfaces": [
-                            {
-                                "name": iface.name,
-                                "mac_address": iface.mac_address,
-                                "speed": iface.speed,
-                            }
-                            for iface in hardware_info.network_interfaces
-                        ],
-                    },
+                    "classification_confidence",
+                    system_info.classification_confidence,
                 )
-
                 context.add_sub_task(
-                    f"Discovered {hardware_info.manufacturer} {hardware_info.model}"
+                    f"Device classified as '{system_info.device_type}' with "
+                    f"{system_info.classification_confidence} confidence"
                 )
+            else:
+                context.add_sub_task("Device classification inconclusive")
 
-                # Enhanced device classification (if unified configuration available)
-                try:
-                    context.add_sub_task("Performing intelligent device classification")
-
-                    # Check if enhanced discovery is available through context
-                    if (
-                        hasattr(context, "enhanced_discovery")
-                        and context.enhanced_discovery
-                    ):
-                        # Use enhanced discovery manager for device classification
-                        from ...hardware.discovery.base import SystemInfo
-
-                        # Create system info for classification
-                        sys_info = SystemInfo(
-                            manufacturer=hardware_info.manufacturer,
-                            product_name=hardware_info.model,
-                            cpu_model=(
-                                hardware_info.cpu_info.get("model")
-                                if hardware_info.cpu_info
-                                else None
-                            ),
-                            cpu_cores=(
-                                hardware_info.cpu_info.get("cores")
-                                if hardware_info.cpu_info
-                                else None
-                            ),
-                            memory_total=(
-                                hardware_info.memory_info.get("total")
-                                if hardware_info.memory_info
-                                else None
-                            ),
-                        )
-
-                        # Classify device type
-                        classification = self.discovery_manager.classify_device_type(
-                            sys_info
-                        )
-
-                        if classification and classification.get("device_type"):
-                            device_type = classification["device_type"]
-                            confidence = classification["confidence"]
-
-                            context.set_data("device_type", device_type)
-                            context.set_data("classification_confidence", confidence)
-                            context.set_data("classification_result", classification)
-
-                            context.add_sub_task(
-                                f"Device classified as '{device_type}' with {confidence} confidence"
-                            )
-
-                            logger.info(
-                                f"Server {context.server_ip} classified as {device_type} "
-                                f"(confidence: {confidence})"
-                            )
-                        else:
-                            context.add_sub_task("Device classification inconclusive")
-                            logger.warning(
-                                f"Could not classify device type for {context.server_ip}"
-                            )
-
-                except Exception as e:
-                    logger.warning(f"Device classification failed: {e}")
-                    context.add_sub_task(f"Device classification failed: {str(e)}")
+            for error in discovery.discovery_errors:
+                logger.warning(
+                    f"Hardware discovery error for {context.server_ip}: {error}"
+                )
 
             return StepExecutionResult.success(
                 "Hardware discovery completed successfully",
-                {"discovery_result": discovery_result},
+                {"discovery_result": discovery.to_dict()},
             )
 
         except Exception as e:
             return StepExecutionResult.failure(f"Hardware discovery failed: {e}")
 
+    def _get_discovery_cache(self) -> Optional[DiscoveryCache]:
+        """Open the discovery cache in the workflow database."""
+        import os
+
+        from ...database.helper import DbHelper
+
+        try:
+            db_path = os.getenv("DATABASE_PATH", "data/hw_automation.db")
+            return DiscoveryCache(DbHelper(db_path))
+        except Exception as e:
+            logger.warning(f"Discovery cache unavailable, discovering fully: {e}")
+            return None
+
 
 class DetectServerVendorStep(BaseWorkflowStep):
     """Step to detect server vendor through SSH commands."""
 
+    # VendorDetector vendor keys mapped to the names used by this step
+    VENDOR_NAMES = {
+        "supermicro": "Supermicro",
+        "hp": "HP",
+        "dell": "Dell",
+        "lenovo": "Lenovo",
+    }
+
     def __init__(self):
         super().__init__(
             name="detect_server_vendor",
@@ -246,12 +236,15 @@ class DetectServerVendorStep(BaseWorkflowStep):
         try:
             context.add_sub_task("Detecting server vendor")
 
-            ssh_client = SSHClient(
-                hostname=context.server_ip,
-                username=context.get_data("ssh_username", "ubuntu"),
+            vendor = self._detect_vendor_from_snapshot(
+                context.get_data("discovery_snapshot")
             )
-
-            vendor = self._detect_vendor(ssh_client)
+            if not vendor:
+                ssh_client = SSHClient(
+                    hostname=context.server_ip,
+                    username=context.get_data("ssh_username", "ubuntu"),
+                )
+                vendor = self._detect_vendor(ssh_client)
 
             if vendor:
                 context.manufacturer = vendor
@@ -267,6 +260,15 @@ class DetectServerVendorStep(BaseWorkflowStep):
         except Exception as e:
             return StepExecutionResult.failure(f"Vendor detection failed: {e}")
 
+    def _detect_vendor_from_snapshot(
+        self, snapshot: Optional[DiscoverySnapshot]
+    ) -> Optional[str]:
+        """Detect vendor from the DMI snapshot collected by hardware discovery."""
+        if snapshot is None:
+            return None
+        detected = VendorDetector().detect_vendor(snapshot=snapshot)["vendor"]
+        return self.VENDOR_NAMES.get(detected)
+
     def _detect_vendor(self, ssh_client: SSHClient) -> Optional[str]:
         """Detect vendor using various system commands."""
 
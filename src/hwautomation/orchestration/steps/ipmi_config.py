@@ -10,7 +10,9 @@ from typing import Any, Dict, Optional
 
 from hwautomation.logging import get_logger
 
-from ...hardware.ipmi import IpmiManager
+from ...hardware.ipmi import AddressPoolExhaustedError, IPMIConfigPlan, IpmiManager
+from ...hardware.ipmi.ipam import get_ipmi_allocator
+from ...hardware.ipmi.operations.plan import shell_batch_runner
 from ...utils.network import SSHClient
 from ..workflows.base import (
     BaseWorkflowStep,
@@ -88,46 +90,9 @@ class ConfigureIpmiStep(ConditionalWorkflowStep):
 
     def _configure_supermicro_ipmi(self, context: StepContext) -> Dict[str, Any]:
         """Configure IPMI on Supermicro server."""
-        try:
-            ssh_client = SSHClient(
-                hostname=context.server_ip,
-                username=context.get_data("ssh_username", "ubuntu"),
-            )
-
-            # Calculate network settings
-            network_config = self._calculate_network_config(context)
-
-            # Configure IPMI using ipmitool
-            ipmi_commands = [
-                f"sudo ipmitool lan set 1 ipsrc static",
-                f"sudo ipmitool lan set 1 ipaddr {context.ipmi_ip}",
-                f"sudo ipmitool lan set 1 netmask {network_config['netmask']}",
-                f"sudo ipmitool lan set 1 defgw ipaddr {network_config['gateway']}",
-                f"sudo ipmitool user set name 2 ADMIN",
-                f"sudo ipmitool user set password 2 ADMIN",
-                f"sudo ipmitool user enable 2",
-                f"sudo ipmitool channel setaccess 1 2 privilege=4",
-            ]
-
-            for command in ipmi_commands:
-                result = ssh_client.execute_command(command)
-                if not result["success"]:
-                    return {
-                        "success": False,
-                        "error": f"IPMI command failed: {command} - {result.get('stderr', 'Unknown error')}",
-                    }
-
-            return {
-                "success": True,
-                "ipmi_ip": context.ipmi_ip,
-                "username": "ADMIN",
-                "password": "ADMIN",
-                "vendor": "supermicro",
-                "network_config": network_config,
-            }
-
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        return self._apply_ipmi_plan(
+            context, "supermicro", username="ADMIN", password="ADMIN"
+        )
 
     def _configure_hp_ipmi(self, context: StepContext) -> Dict[str, Any]:
         """Configure IPMI on HP/HPE server."""
@@ -165,37 +130,56 @@ class ConfigureIpmiStep(ConditionalWorkflowStep):
 
     def _configure_generic_ipmi(self, context: StepContext) -> Dict[str, Any]:
         """Configure IPMI using generic commands."""
+        return self._apply_ipmi_plan(context, "generic")
+
+    def _apply_ipmi_plan(
+        self,
+        context: StepContext,
+        vendor: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Apply the vendor's IPMI plan in-band, writing only changed settings."""
         try:
             ssh_client = SSHClient(
-                hostname=context.server_ip,
+                host=context.server_ip,
                 username=context.get_data("ssh_username", "ubuntu"),
             )
+            ssh_client.connect()
 
             # Calculate network settings
             network_config = self._calculate_network_config(context)
 
-            # Generic IPMI configuration
-            ipmi_commands = [
-                f"sudo ipmitool lan set 1 ipsrc static",
-                f"sudo ipmitool lan set 1 ipaddr {context.ipmi_ip}",
-                f"sudo ipmitool lan set 1 netmask {network_config['netmask']}",
-                f"sudo ipmitool lan set 1 defgw ipaddr {network_config['gateway']}",
-            ]
-
-            for command in ipmi_commands:
-                result = ssh_client.execute_command(command)
-                if not result["success"]:
-                    return {
-                        "success": False,
-                        "error": f"IPMI command failed: {command} - {result.get('stderr', 'Unknown error')}",
-                    }
-
-            return {
+            plan = IPMIConfigPlan.for_vendor(
+                vendor,
+                ipmi_ip=context.ipmi_ip,
+                netmask=network_config["netmask"],
+                gateway=network_config["gateway"],
+                username=username,
+                password=password,
+            )
+            try:
+                plan_result = plan.apply(shell_batch_runner(ssh_client.exec_command))
+            finally:
+                ssh_client.close()
+
+            if not plan_result.success:
+                return {
+                    "success": False,
+                    "error": f"IPMI command failed: {'; '.join(plan_result.errors)}",
+                }
+
+            config_result = {
                 "success": True,
                 "ipmi_ip": context.ipmi_ip,
-                "vendor": "generic",
+                "vendor": vendor,
                 "network_config": network_config,
+                "plan": plan_result.to_dict(),
             }
+            if username:
+                config_result["username"] = username
+                config_result["password"] = password
+            return config_result
 
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -398,8 +382,8 @@ class AssignIpmiIpStep(BaseWorkflowStep):
                 f"Assigning IPMI IP from range {self.ip_range_start} - {self.ip_range_end}"
             )
 
-            # Find next available IP
-            assigned_ip = self._find_next_available_ip()
+            # Lease the next free, unanswered IP from the range
+            assigned_ip = self._find_next_available_ip(context)
 
             if not assigned_ip:
                 return StepExecutionResult.failure(
@@ -419,35 +403,24 @@ class AssignIpmiIpStep(BaseWorkflowStep):
         except Exception as e:
             return StepExecutionResult.failure(f"Failed to assign IPMI IP: {e}")
 
-    def _find_next_available_ip(self) -> Optional[str]:
-        """Find the next available IP in the range."""
+    def _find_next_available_ip(self, context: StepContext) -> Optional[str]:
+        """Lease the next available IP in the range for this server."""
         try:
             import os
 
-            from ...database.helper import DbHelper
-
-            # Get all assigned IPMI IPs from database
             # Use DATABASE_PATH from environment, defaulting to data/hw_automation.db
             db_path = os.getenv("DATABASE_PATH", "data/hw_automation.db")
-            db_helper = DbHelper(db_path)
-            assigned_ips = set()
-
-            # Query existing IPMI IPs (this would need to be implemented in DbHelper)
-            # For now, use a simple increment approach
-
-            start_ip = ipaddress.IPv4Address(self.ip_range_start)
-            end_ip = ipaddress.IPv4Address(self.ip_range_end)
+            allocator = get_ipmi_allocator(
+                db_path, self.ip_range_start, self.ip_range_end
+            )
 
-            current_ip = start_ip
-            while current_ip <= end_ip:
-                ip_str = str(current_ip)
-                if ip_str not in assigned_ips:
-                    # TODO: Check if IP is actually available (ping test)
-                    return ip_str
-                current_ip += 1
+            lease = allocator.allocate(context.server_id)
+            context.set_data("ipmi_lease", lease.to_dict())
+            return lease.ip_address
 
+        except AddressPoolExhaustedError as e:
+            logger.error(str(e))
             return None
-
         except Exception as e:
             logger.error(f"Failed to find available IP: {e}")
             return None
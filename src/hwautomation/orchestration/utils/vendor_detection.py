@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from hwautomation.logging import get_logger
 
+from ...hardware.discovery.parsers import DiscoverySnapshot, StructuredParser
 from ...utils.network import SSHClient
 
 logger = get_logger(__name__)
@@ -144,13 +145,25 @@ class VendorDetector:
         return cls(ssh_client)
 
     def detect_vendor(
-        self, system_info: Optional[Dict[str, Any]] = None
+        self,
+        system_info: Optional[Dict[str, Any]] = None,
+        snapshot: Optional[DiscoverySnapshot] = None,
     ) -> Dict[str, Any]:
-        """Detect hardware vendor from system information."""
+        """Detect hardware vendor from system information.
+
+        A DiscoverySnapshot already collected by hardware discovery can be
+        passed in so the DMI data is neither fetched nor parsed again.
+        """
         try:
             # Use provided system info or gather it
             if system_info is None:
-                system_info = self._gather_vendor_detection_info()
+                system_info = (
+                    {"snapshot": snapshot}
+                    if snapshot
+                    else self._gather_vendor_detection_info()
+                )
+            elif snapshot is not None:
+                system_info = {**system_info, "snapshot": snapshot}
 
             detection_results = {
                 "vendor": "unknown",
@@ -208,20 +221,14 @@ class VendorDetector:
 
         info = {}
 
-        # DMI decode information
-        dmi_result = self.ssh_client.execute_command("sudo dmidecode -t system")
+        # System, baseboard and BIOS DMI tables in a single call and parse
+        dmi_result = self.ssh_client.execute_command(
+            "sudo dmidecode -t bios -t system -t baseboard"
+        )
         if dmi_result.get("success"):
-            info["dmidecode_system"] = dmi_result.get("stdout", "")
-
-        # BIOS information
-        bios_result = self.ssh_client.execute_command("sudo dmidecode -t bios")
-        if bios_result.get("success"):
-            info["dmidecode_bios"] = bios_result.get("stdout", "")
-
-        # Motherboard information
-        board_result = self.ssh_client.execute_command("sudo dmidecode -t baseboard")
-        if board_result.get("success"):
-            info["dmidecode_baseboard"] = board_result.get("stdout", "")
+            info["snapshot"] = StructuredParser().parse_snapshot(
+                dmidecode=dmi_result.get("stdout", "")
+            )
 
         # lshw information
         lshw_result = self.ssh_client.execute_command("sudo lshw -short")
@@ -242,11 +249,15 @@ class VendorDetector:
 
     def _detect_from_dmidecode(self, system_info: Dict[str, Any]) -> Dict[str, Any]:
         """Detect vendor from DMI decode information."""
-        dmi_data = (
-            system_info.get("dmidecode_system", "")
-            + " "
-            + system_info.get("dmidecode_baseboard", "")
-        )
+        snapshot = system_info.get("snapshot")
+        if snapshot is not None:
+            dmi_data = snapshot.vendor_text()
+        else:
+            dmi_data = (
+                system_info.get("dmidecode_system", "")
+                + " "
+                + system_info.get("dmidecode_baseboard", "")
+            )
 
         if not dmi_data.strip():
             return {"vendor": "unknown", "confidence": 0.0, "method": "dmidecode"}
@@ -285,7 +296,11 @@ class VendorDetector:
 
     def _detect_from_bios_info(self, system_info: Dict[str, Any]) -> Dict[str, Any]:
         """Detect vendor from BIOS information."""
-        bios_data = system_info.get("dmidecode_bios", "")
+        snapshot = system_info.get("snapshot")
+        if snapshot is not None:
+            bios_data = snapshot.bios_text()
+        else:
+            bios_data = system_info.get("dmidecode_bios", "")
 
         if not bios_data.strip():
             return {"vendor": "unknown", "confidence": 0.0, "method": "bios"}
@@ -155,6 +155,12 @@ class Config:
                 "password": self._get_env("IPMI_PASSWORD", ""),
                 "timeout": self._get_env("IPMI_TIMEOUT", 60, var_type=int),
                 "retries": self._get_env("IPMI_RETRIES", 2, var_type=int),
+                "telemetry_enabled": self._get_env(
+                    "IPMI_TELEMETRY_ENABLED", False, var_type=bool
+                ),
+                "telemetry_interval": self._get_env(
+                    "IPMI_TELEMETRY_INTERVAL", 60, var_type=int
+                ),
             },
             # SSH Configuration
             "ssh": {
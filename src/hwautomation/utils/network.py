@@ -5,12 +5,15 @@ Network utility functions for hardware automation.
 import platform
 import subprocess
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
 
 import paramiko
 
 from hwautomation.logging import get_logger
 
+if TYPE_CHECKING:
+    from .transfer import TransferResult, TransferSettings
+
 logger = get_logger(__name__)
 
 
@@ -253,12 +256,15 @@ class SSHClient:
             logger.error(f"SSH connection failed to {self.host}: {e}")
             raise
 
-    def exec_command(self, command: str) -> Tuple[str, str, int]:
+    def exec_command(
+        self, command: str, stdin_data: Optional[str] = None
+    ) -> Tuple[str, str, int]:
         """
         Execute command on remote host
 
         Args:
             command: Command to execute
+            stdin_data: Optional data written to the command's stdin
 
         Returns:
             Tuple of (stdout, stderr, exit_code)
@@ -268,6 +274,10 @@ class SSHClient:
 
         try:
             stdin, stdout, stderr = self.client.exec_command(command)
+            if stdin_data is not None:
+                stdin.write(stdin_data)
+                stdin.flush()
+                stdin.channel.shutdown_write()
             exit_code = stdout.channel.recv_exit_status()
 
             stdout_text = stdout.read().decode("utf-8")
@@ -279,49 +289,75 @@ class SSHClient:
             logger.error(f"Command execution failed: {e}")
             raise
 
-    def upload_file(self, local_path: str, remote_path: str):
+    def upload_file(
+        self,
+        local_path: str,
+        remote_path: str,
+        settings: Optional["TransferSettings"] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> "TransferResult":
         """
         Upload file to remote host
 
+        Uses the SFTP transfer engine: tuned window sizes, pipelined writes,
+        and checksum-verified resume of a previously interrupted upload.
+
         Args:
             local_path: Local file path
             remote_path: Remote file path
+            settings: Optional transfer tuning settings
+            progress_callback: Optional callable(bytes_done, bytes_total)
+
+        Returns:
+            TransferResult describing the transfer
         ."""
         if not self.client:
             raise Exception("SSH client not connected")
 
-        try:
-            if not self.sftp:
-                self.sftp = self.client.open_sftp()
+        from .transfer import SFTPTransferEngine
 
-            self.sftp.put(local_path, remote_path)
+        try:
+            engine = SFTPTransferEngine(self, settings)
+            result = engine.upload(local_path, remote_path, progress_callback)
             logger.info(f"File uploaded: {local_path} -> {remote_path}")
+            return result
 
         except Exception as e:
             logger.error(f"File upload failed: {e}")
             raise
 
-    def download_file(self, remote_path: str, local_path: str):
+    def download_file(
+        self,
+        remote_path: str,
+        local_path: str,
+        settings: Optional["TransferSettings"] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> "TransferResult":
         """
         Download file from remote host
 
+        Uses the SFTP transfer engine: tuned window sizes, prefetched reads,
+        and checksum-verified resume of a previously interrupted download.
+
         Args:
             remote_path: Remote file path
             local_path: Local file path
+            settings: Optional transfer tuning settings
+            progress_callback: Optional callable(bytes_done, bytes_total)
+
+        Returns:
+            TransferResult describing the transfer
         ."""
         if not self.client:
             raise Exception("SSH client not connected")
 
-        try:
-            if not self.sftp:
-                self.sftp = self.client.open_sftp()
+        from .transfer import SFTPTransferEngine
 
-            # Ensure local directory exists
-            local_dir = Path(local_path).parent
-            local_dir.mkdir(parents=True, exist_ok=True)
-
-            self.sftp.get(remote_path, local_path)
+        try:
+            engine = SFTPTransferEngine(self, settings)
+            result = engine.download(remote_path, local_path, progress_callback)
             logger.info(f"File downloaded: {remote_path} -> {local_path}")
+            return result
 
         except Exception as e:
             logger.error(f"File download failed: {e}")
@@ -345,7 +381,9 @@ class SSHClient:
 
     def __enter__(self):
         """Context manager entry."""
-        self.connect()
+        # SSHManager.connect() hands back an already-connected client
+        if not self.client:
+            self.connect()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
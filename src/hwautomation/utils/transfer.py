@@ -0,0 +1,745 @@
+"""
+High-throughput SFTP transfer engine.
+
+Provides pipelined/prefetching SFTP transfers with tuned channel window and
+packet sizes, checksum-verified resume of partial transfers, optional
+parallel ranged reads/writes and fan-out to many hosts with bandwidth caps.
+."""
+
+import hashlib
+import os
+import shlex
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+import paramiko
+
+from hwautomation.logging import get_logger
+
+if TYPE_CHECKING:
+    from .network import SSHClient
+
+logger = get_logger(__name__)
+
+ProgressCallback = Callable[[int, int], None]
+
+# 16 MiB channel window keeps a long-haul link busy; 32 KiB is the largest
+# packet OpenSSH's sftp-server accepts without renegotiation.
+DEFAULT_WINDOW_SIZE = 16 * 1024 * 1024
+DEFAULT_MAX_PACKET_SIZE = 32 * 1024
+DEFAULT_BLOCK_SIZE = 256 * 1024
+DEFAULT_CHUNK_SIZE = 32 * 1024 * 1024
+
+
+class TransferError(Exception):
+    """Exception raised when an SFTP transfer fails or cannot be verified."""
+
+    pass
+
+
+@dataclass
+class TransferSettings:
+    """Tuning knobs for SFTP transfers."""
+
+    window_size: int = DEFAULT_WINDOW_SIZE
+    max_packet_size: int = DEFAULT_MAX_PACKET_SIZE
+    block_size: int = DEFAULT_BLOCK_SIZE
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    parallel_chunks: int = 1
+    resume: bool = True
+    verify_checksum: bool = True
+    bandwidth_limit: Optional[int] = None  # bytes per second, per transfer
+    partial_suffix: str = ".part"
+    max_concurrent_prefetch_requests: Optional[int] = None
+
+
+@dataclass
+class TransferResult:
+    """Outcome of a single file transfer."""
+
+    host: str
+    source: str
+    destination: str
+    success: bool
+    bytes_total: int = 0
+    bytes_transferred: int = 0
+    resumed_from: int = 0
+    checksum: Optional[str] = None
+    verified: bool = False
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second moved over the wire."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.bytes_transferred / self.elapsed
+
+
+class BandwidthLimiter:
+    """
+    Thread-safe token bucket used to cap transfer bandwidth
+
+    A single limiter may be shared between transfers to cap the aggregate
+    rate of a fan-out, while each transfer can also carry its own cap.
+    ."""
+
+    def __init__(self, rate: int, burst: Optional[int] = None):
+        """
+        Initialize bandwidth limiter
+
+        Args:
+            rate: Allowed bytes per second
+            burst: Bucket capacity in bytes (defaults to one second of rate)
+        ."""
+        if rate <= 0:
+            raise ValueError("Bandwidth rate must be positive")
+        self.rate = rate
+        self.capacity = burst or rate
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: int):
+        """
+        Block until amount bytes may be sent
+
+        Args:
+            amount: Number of bytes about to be transferred
+        ."""
+        while amount > 0:
+            # Large blocks are drawn in capacity-sized slices so they never
+            # wait on a bucket that can't hold them.
+            take = min(amount, self.capacity)
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= take:
+                    self._tokens -= take
+                    amount -= take
+                    continue
+                wait = (take - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def file_sha256(path: str, length: Optional[int] = None) -> str:
+    """
+    Calculate SHA256 of a local file or of its first length bytes
+
+    Args:
+        path: Local file path
+        length: Optional prefix length
+
+    Returns:
+        Hex digest
+    ."""
+    digest = hashlib.sha256()
+    remaining = length
+    with open(path, "rb") as f:
+        while remaining is None or remaining > 0:
+            size = (
+                DEFAULT_BLOCK_SIZE
+                if remaining is None
+                else min(DEFAULT_BLOCK_SIZE, remaining)
+            )
+            block = f.read(size)
+            if not block:
+                break
+            digest.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+    return digest.hexdigest()
+
+
+def _split_ranges(start: int, end: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """Split [start, end) into (offset, length) chunks."""
+    ranges = []
+    offset = start
+    while offset < end:
+        length = min(chunk_size, end - offset)
+        ranges.append((offset, length))
+        offset += length
+    return ranges
+
+
+def _contiguous_end(start: int, ranges: List[Tuple[int, int]], done: set) -> int:
+    """Return the end of the contiguous run of completed ranges from start."""
+    end = start
+    for offset, length in ranges:
+        if offset != end or offset not in done:
+            break
+        end = offset + length
+    return end
+
+
+class SFTPTransferEngine:
+    """
+    SFTP transfer engine bound to a connected SSH client
+
+    Transfers are written to a partial file first and renamed into place only
+    after the checksum matches, so an interrupted transfer can be resumed from
+    the verified prefix instead of restarting from zero.
+    ."""
+
+    def __init__(
+        self,
+        ssh_client: "SSHClient",
+        settings: Optional[TransferSettings] = None,
+        shared_limiter: Optional[BandwidthLimiter] = None,
+    ):
+        """
+        Initialize transfer engine
+
+        Args:
+            ssh_client: Connected SSHClient instance
+            settings: Transfer tuning settings
+            shared_limiter: Optional limiter shared with other transfers
+        ."""
+        self.ssh_client = ssh_client
+        self.settings = settings or TransferSettings()
+        self._limiters = [shared_limiter] if shared_limiter else []
+        if self.settings.bandwidth_limit:
+            self._limiters.append(BandwidthLimiter(self.settings.bandwidth_limit))
+        self._progress_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def upload(
+        self,
+        local_path: str,
+        remote_path: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> TransferResult:
+        """
+        Upload a local file to the remote host
+
+        Args:
+            local_path: Local file path
+            remote_path: Remote file path
+            progress_callback: Optional callable(bytes_done, bytes_total)
+
+        Returns:
+            TransferResult describing the transfer
+
+        Raises:
+            TransferError: If the transfer fails or the checksum does not match
+        ."""
+        start = time.monotonic()
+        total = os.path.getsize(local_path)
+        partial = remote_path + self.settings.partial_suffix
+        result = TransferResult(
+            host=self.ssh_client.host,
+            source=local_path,
+            destination=remote_path,
+            success=False,
+            bytes_total=total,
+        )
+
+        sftp = self._open_sftp()
+        try:
+            offset = self._upload_resume_offset(sftp, local_path, partial, total)
+            if offset == 0:
+                sftp.open(partial, "wb").close()
+            result.resumed_from = offset
+
+            progress = self._progress_tracker(offset, total, progress_callback)
+            if self._use_ranges(offset, total):
+                self._parallel_ranges(
+                    offset,
+                    total,
+                    lambda off, length, sftp_client: self._upload_range(
+                        sftp_client, local_path, partial, off, length, progress
+                    ),
+                    lambda end: sftp.truncate(partial, end),
+                )
+            else:
+                self._upload_range(
+                    sftp, local_path, partial, offset, total - offset, progress
+                )
+            result.bytes_transferred = total - offset
+
+            if self.settings.verify_checksum:
+                result.checksum = file_sha256(local_path)
+                remote_checksum = self._remote_sha256(partial)
+                if remote_checksum is not None:
+                    if remote_checksum != result.checksum:
+                        sftp.remove(partial)
+                        raise TransferError(
+                            f"Checksum mismatch uploading {local_path} to "
+                            f"{self.ssh_client.host}:{remote_path}"
+                        )
+                    result.verified = True
+
+            self._rename_remote(sftp, partial, remote_path)
+            result.success = True
+        finally:
+            result.elapsed = time.monotonic() - start
+            sftp.close()
+
+        logger.info(
+            f"Uploaded {local_path} -> {self.ssh_client.host}:{remote_path} "
+            f"({result.bytes_transferred} bytes, resumed at {result.resumed_from}, "
+            f"{result.throughput / 1024 / 1024:.1f} MiB/s)"
+        )
+        return result
+
+    def download(
+        self,
+        remote_path: str,
+        local_path: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> TransferResult:
+        """
+        Download a remote file to the local host
+
+        Args:
+            remote_path: Remote file path
+            local_path: Local file path
+            progress_callback: Optional callable(bytes_done, bytes_total)
+
+        Returns:
+            TransferResult describing the transfer
+
+        Raises:
+            TransferError: If the transfer fails or the checksum does not match
+        ."""
+        start = time.monotonic()
+        Path(local_path).parent.mkdir(parents=True, exist_ok=True)
+        partial = local_path + self.settings.partial_suffix
+
+        sftp = self._open_sftp()
+        try:
+            total = sftp.stat(remote_path).st_size
+            result = TransferResult(
+                host=self.ssh_client.host,
+                source=remote_path,
+                destination=local_path,
+                success=False,
+                bytes_total=total,
+            )
+            offset = self._download_resume_offset(remote_path, partial, total)
+            if offset == 0:
+                open(partial, "wb").close()
+            result.resumed_from = offset
+
+            progress = self._progress_tracker(offset, total, progress_callback)
+            if self._use_ranges(offset, total):
+                self._parallel_ranges(
+                    offset,
+                    total,
+                    lambda off, length, sftp_client: self._download_range(
+                        sftp_client, remote_path, partial, off, length, progress
+                    ),
+                    lambda end: os.truncate(partial, end),
+                )
+            else:
+                self._download_stream(
+                    sftp, remote_path, partial, offset, total, progress
+                )
+            result.bytes_transferred = total - offset
+
+            if self.settings.verify_checksum:
+                result.checksum = file_sha256(partial)
+                remote_checksum = self._remote_sha256(remote_path)
+                if remote_checksum is not None:
+                    if remote_checksum != result.checksum:
+                        os.remove(partial)
+                        raise TransferError(
+                            f"Checksum mismatch downloading "
+                            f"{self.ssh_client.host}:{remote_path} to {local_path}"
+                        )
+                    result.verified = True
+
+            os.replace(partial, local_path)
+            result.success = True
+        finally:
+            sftp.close()
+
+        result.elapsed = time.monotonic() - start
+        logger.info(
+            f"Downloaded {self.ssh_client.host}:{remote_path} -> {local_path} "
+            f"({result.bytes_transferred} bytes, resumed at {result.resumed_from}, "
+            f"{result.throughput / 1024 / 1024:.1f} MiB/s)"
+        )
+        return result
+
+    # ------------------------------------------------------------------
+    # SFTP channel helpers
+    # ------------------------------------------------------------------
+
+    def _open_sftp(self) -> paramiko.SFTPClient:
+        """Open an SFTP channel with tuned window and packet sizes."""
+        if not self.ssh_client.client:
+            raise Exception("SSH client not connected")
+        transport = self.ssh_client.client.get_transport()
+        return paramiko.SFTPClient.from_transport(
+            transport,
+            window_size=self.settings.window_size,
+            max_packet_size=self.settings.max_packet_size,
+        )
+
+    def _use_ranges(self, offset: int, total: int) -> bool:
+        """Whether the remaining bytes warrant parallel ranged transfer."""
+        return (
+            self.settings.parallel_chunks > 1
+            and total - offset > self.settings.chunk_size
+        )
+
+    def _throttle(self, amount: int):
+        """Apply all configured bandwidth limiters."""
+        for limiter in self._limiters:
+            limiter.consume(amount)
+
+    def _progress_tracker(
+        self, done: int, total: int, callback: Optional[ProgressCallback]
+    ) -> Callable[[int], None]:
+        """Build a thread-safe progress accumulator."""
+        state = {"done": done}
+
+        def advance(amount: int):
+            with self._progress_lock:
+                state["done"] += amount
+                current = state["done"]
+            if callback:
+                callback(current, total)
+
+        return advance
+
+    def _parallel_ranges(
+        self,
+        start: int,
+        end: int,
+        worker: Callable[[int, int, paramiko.SFTPClient], None],
+        truncate: Callable[[int], None],
+    ):
+        """
+        Transfer [start, end) as concurrent ranged chunks
+
+        Each worker gets its own SFTP channel on the shared transport. On
+        failure the partial file is truncated to the contiguous completed
+        prefix so a later resume picks up from a consistent offset.
+        ."""
+        ranges = _split_ranges(start, end, self.settings.chunk_size)
+        done = set()
+        done_lock = threading.Lock()
+
+        def run(offset: int, length: int):
+            sftp_client = self._open_sftp()
+            try:
+                worker(offset, length, sftp_client)
+            finally:
+                sftp_client.close()
+            with done_lock:
+                done.add(offset)
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=self.settings.parallel_chunks) as pool:
+            futures = [pool.submit(run, offset, length) for offset, length in ranges]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append(e)
+
+        if errors:
+            resume_at = _contiguous_end(start, ranges, done)
+            try:
+                truncate(resume_at)
+            except Exception as e:
+                logger.warning(f"Could not truncate partial file to {resume_at}: {e}")
+            raise TransferError(
+                f"{len(errors)} of {len(ranges)} chunks failed "
+                f"(resumable at {resume_at}): {errors[0]}"
+            ) from errors[0]
+
+    def _upload_range(
+        self,
+        sftp: paramiko.SFTPClient,
+        local_path: str,
+        remote_path: str,
+        offset: int,
+        length: int,
+        progress: Callable[[int], None],
+    ):
+        """Write length bytes at offset of the remote file with pipelining."""
+        with open(local_path, "rb") as src, sftp.open(remote_path, "r+b") as dst:
+            dst.set_pipelined(True)
+            src.seek(offset)
+            dst.seek(offset)
+            remaining = length
+            while remaining > 0:
+                block = src.read(min(self.settings.block_size, remaining))
+                if not block:
+                    break
+                self._throttle(len(block))
+                dst.write(block)
+                remaining -= len(block)
+                progress(len(block))
+
+    def _download_stream(
+        self,
+        sftp: paramiko.SFTPClient,
+        remote_path: str,
+        local_path: str,
+        offset: int,
+        total: int,
+        progress: Callable[[int], None],
+    ):
+        """Read the remote file from offset to EOF using SFTP prefetch."""
+        with sftp.open(remote_path, "rb") as src, open(local_path, "r+b") as dst:
+            src.seek(offset)
+            dst.seek(offset)
+            prefetch_kwargs = {}
+            if self.settings.max_concurrent_prefetch_requests:
+                prefetch_kwargs["max_concurrent_requests"] = (
+                    self.settings.max_concurrent_prefetch_requests
+                )
+            src.prefetch(total, **prefetch_kwargs)
+            while True:
+                block = src.read(self.settings.block_size)
+                if not block:
+                    break
+                self._throttle(len(block))
+                dst.write(block)
+                progress(len(block))
+
+    def _download_range(
+        self,
+        sftp: paramiko.SFTPClient,
+        remote_path: str,
+        local_path: str,
+        offset: int,
+        length: int,
+        progress: Callable[[int], None],
+    ):
+        """Read length bytes at offset with a pipelined readv."""
+        blocks = _split_ranges(offset, offset + length, self.settings.block_size)
+        with sftp.open(remote_path, "rb") as src, open(local_path, "r+b") as dst:
+            dst.seek(offset)
+            for block in src.readv(blocks):
+                self._throttle(len(block))
+                dst.write(block)
+                progress(len(block))
+
+    def _rename_remote(self, sftp: paramiko.SFTPClient, source: str, target: str):
+        """Atomically move the verified partial file into place."""
+        try:
+            sftp.posix_rename(source, target)
+        except IOError:
+            # Servers without the posix-rename extension refuse to overwrite
+            try:
+                sftp.remove(target)
+            except IOError:
+                pass
+            sftp.rename(source, target)
+
+    # ------------------------------------------------------------------
+    # Resume and checksum helpers
+    # ------------------------------------------------------------------
+
+    def _remote_sha256(self, path: str, length: Optional[int] = None) -> Optional[str]:
+        """
+        Calculate SHA256 of a remote file (or prefix) with sha256sum
+
+        Returns:
+            Hex digest, or None if the remote host could not compute it
+        ."""
+        quoted = shlex.quote(path)
+        if length is None:
+            command = f"sha256sum {quoted}"
+        else:
+            command = f"head -c {int(length)} {quoted} | sha256sum"
+        try:
+            stdout, stderr, exit_code = self.ssh_client.exec_command(command)
+        except Exception as e:
+            logger.debug(f"Remote checksum failed on {self.ssh_client.host}: {e}")
+            return None
+        if exit_code != 0 or not stdout.strip():
+            logger.debug(
+                f"Remote checksum unavailable on {self.ssh_client.host}: {stderr}"
+            )
+            return None
+        return stdout.split()[0]
+
+    def _upload_resume_offset(
+        self, sftp: paramiko.SFTPClient, local_path: str, partial: str, total: int
+    ) -> int:
+        """Return the verified byte offset to resume an upload from."""
+        if not self.settings.resume:
+            return 0
+        try:
+            existing = sftp.stat(partial).st_size
+        except IOError:
+            return 0
+        if existing <= 0 or existing > total:
+            return 0
+        if not self.settings.verify_checksum:
+            return existing
+        if self._remote_sha256(partial, existing) == file_sha256(local_path, existing):
+            logger.info(f"Resuming upload of {local_path} at byte {existing}")
+            return existing
+        logger.info(f"Partial upload {partial} does not match source, restarting")
+        return 0
+
+    def _download_resume_offset(
+        self, remote_path: str, partial: str, total: int
+    ) -> int:
+        """Return the verified byte offset to resume a download from."""
+        if not self.settings.resume or not os.path.exists(partial):
+            return 0
+        existing = os.path.getsize(partial)
+        if existing <= 0 or existing > total:
+            return 0
+        if not self.settings.verify_checksum:
+            return existing
+        if self._remote_sha256(remote_path, existing) == file_sha256(partial, existing):
+            logger.info(f"Resuming download of {remote_path} at byte {existing}")
+            return existing
+        logger.info(f"Partial download {partial} does not match source, restarting")
+        return 0
+
+
+@dataclass
+class TransferTarget:
+    """A host to fan a transfer out to."""
+
+    host: str
+    username: str = "ubuntu"
+    password: Optional[str] = None
+    key_file: Optional[str] = None
+    remote_path: Optional[str] = None
+
+
+@dataclass
+class FanOutResult:
+    """Aggregated outcome of a fan-out transfer."""
+
+    results: Dict[str, TransferResult] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> List[str]:
+        """Hosts that received the file."""
+        return [host for host, r in self.results.items() if r.success]
+
+    @property
+    def failed(self) -> List[str]:
+        """Hosts where the transfer failed."""
+        return [host for host, r in self.results.items() if not r.success]
+
+
+class SFTPFanOut:
+    """
+    Push one local file to many hosts concurrently
+
+    Each host gets its own SSH connection and SFTPTransferEngine. An optional
+    aggregate bandwidth cap is shared by all transfers; per-host caps come
+    from TransferSettings.bandwidth_limit.
+    ."""
+
+    def __init__(
+        self,
+        settings: Optional[TransferSettings] = None,
+        max_hosts: int = 8,
+        total_bandwidth_limit: Optional[int] = None,
+        connect: Optional[Callable[[TransferTarget], "SSHClient"]] = None,
+    ):
+        """
+        Initialize fan-out transfer
+
+        Args:
+            settings: Per-transfer tuning settings
+            max_hosts: Maximum number of hosts transferred to at once
+            total_bandwidth_limit: Aggregate bytes per second across all hosts
+            connect: Optional factory returning a connected SSHClient
+        ."""
+        self.settings = settings or TransferSettings()
+        self.max_hosts = max_hosts
+        self.shared_limiter = (
+            BandwidthLimiter(total_bandwidth_limit) if total_bandwidth_limit else None
+        )
+        self._connect = connect or self._default_connect
+
+    @staticmethod
+    def _default_connect(target: TransferTarget) -> "SSHClient":
+        """Connect to a target with SSHClient."""
+        from .network import SSHClient
+
+        client = SSHClient(
+            target.host,
+            target.username,
+            password=target.password,
+            key_file=target.key_file,
+        )
+        client.connect()
+        return client
+
+    def upload(
+        self,
+        targets: List[TransferTarget],
+        local_path: str,
+        remote_path: str,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    ) -> FanOutResult:
+        """
+        Upload local_path to every target
+
+        Args:
+            targets: Hosts to upload to
+            local_path: Local file path
+            remote_path: Default remote path (overridden per target)
+            progress_callback: Optional callable(host, bytes_done, bytes_total)
+
+        Returns:
+            FanOutResult keyed by host; failures never abort other hosts
+        ."""
+        outcome = FanOutResult()
+        if not targets:
+            return outcome
+
+        def transfer(target: TransferTarget) -> TransferResult:
+            destination = target.remote_path or remote_path
+            client = None
+            try:
+                client = self._connect(target)
+                engine = SFTPTransferEngine(
+                    client, self.settings, shared_limiter=self.shared_limiter
+                )
+                callback = None
+                if progress_callback:
+                    callback = lambda done, total: progress_callback(  # noqa: E731
+                        target.host, done, total
+                    )
+                return engine.upload(local_path, destination, callback)
+            except Exception as e:
+                logger.error(f"Upload to {target.host} failed: {e}")
+                return TransferResult(
+                    host=target.host,
+                    source=local_path,
+                    destination=destination,
+                    success=False,
+                    error=str(e),
+                )
+            finally:
+                if client:
+                    client.close()
+
+        with ThreadPoolExecutor(max_workers=min(self.max_hosts, len(targets))) as pool:
+            futures = {pool.submit(transfer, t): t.host for t in targets}
+            for future in as_completed(futures):
+                outcome.results[futures[future]] = future.result()
+
+        logger.info(
+            f"Fan-out of {local_path}: {len(outcome.succeeded)} succeeded, "
+            f"{len(outcome.failed)} failed"
+        )
+        return outcome
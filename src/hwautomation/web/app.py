@@ -38,6 +38,11 @@ def create_app():
     from hwautomation.database.helper import DbHelper
     from hwautomation.hardware.bios import BiosConfigManager
     from hwautomation.hardware.firmware.manager import FirmwareManager
+    from hwautomation.hardware.ipmi.telemetry import (
+        SensorTelemetryCollector,
+        SensorTelemetryStore,
+        targets_from_database,
+    )
     from hwautomation.maas.client import create_maas_client
     from hwautomation.orchestration.device_selection import DeviceSelectionService
     from hwautomation.orchestration.server_provisioning import (
@@ -120,6 +125,24 @@ def create_app():
             logger.error(f"Failed to create fallback FirmwareManager: {e2}")
             firmware_manager = None
 
+    # Sensor telemetry (background polling is opt-in)
+    telemetry_store = SensorTelemetryStore()
+    ipmi_config = config.get("ipmi", {})
+    if ipmi_config.get("telemetry_enabled"):
+        try:
+            telemetry_collector = SensorTelemetryCollector(
+                targets=targets_from_database(
+                    db_helper,
+                    ipmi_config.get("username", "admin"),
+                    ipmi_config.get("password", ""),
+                ),
+                store=telemetry_store,
+                interval=ipmi_config.get("telemetry_interval", 60),
+            )
+            telemetry_collector.start()
+        except Exception as e:
+            logger.warning(f"Sensor telemetry collector failed to start: {e}")
+
     # MaaS Client (if configured) - WorkflowManager already initializes MaaS client
     maas_client = None
     try:
@@ -236,9 +259,11 @@ def create_app():
         init_logs_routes,
         init_maas_routes,
         init_orchestration_routes,
+        init_telemetry_routes,
         logs_bp,
         maas_bp,
         orchestration_bp,
+        telemetry_bp,
     )
 
     # Register blueprints
@@ -274,6 +299,11 @@ def create_app():
                 firmware_manager, workflow_manager, db_helper, socketio
             )
 
+    if telemetry_bp:
+        app.register_blueprint(telemetry_bp)
+        if init_telemetry_routes is not None:
+            init_telemetry_routes(telemetry_store)
+
     # WebSocket event handlers
     @socketio.on("connect")
     def handle_connect():
@@ -291,6 +321,17 @@ def create_app():
         workflow_id = data.get("workflow_id")
         logger.info(f"Client subscribed to workflow {workflow_id}")
 
+    # Receive Redfish events pushed by BMCs instead of polling them
+    if os.environ.get("REDFISH_EVENT_RECEIVER", "").lower() in ("1", "true", "yes"):
+        from hwautomation.hardware.redfish.client.subscriptions import (
+            get_event_receiver,
+        )
+
+        try:
+            get_event_receiver().start()
+        except (OSError, ValueError) as e:
+            logger.error(f"Redfish event receiver failed to start: {e}")
+
     logger.info("HWAutomation Web Interface initialized with blueprint architecture")
     return app, socketio
 
@@ -227,11 +227,16 @@ class ServerStatusManager(WebSocketManager):
     - Server status broadcasting
     - Hardware monitoring
     - Real-time alerts
+    - Redfish events pushed by subscribed BMCs
     """
 
-    def __init__(self, socketio: SocketIO):
+    def __init__(self, socketio: SocketIO, event_receiver: Any = None):
         super().__init__(socketio)
         self._register_server_handlers()
+        self.event_receiver = event_receiver
+        self._remove_event_listener = self._get_event_receiver().add_listener(
+            self.handle_redfish_event
+        )
 
     def _register_server_handlers(self):
         """Register server-specific event handlers."""
@@ -302,6 +307,37 @@ class ServerStatusManager(WebSocketManager):
             {"server_id": server_id, "alert": alert_data, "timestamp": time.time()},
         )
 
+    def _get_event_receiver(self):
+        """Get the Redfish event receiver, defaulting to the process-wide one."""
+        if self.event_receiver is None:
+            from hwautomation.hardware.redfish.client.subscriptions import (
+                get_event_receiver,
+            )
+
+            self.event_receiver = get_event_receiver()
+        return self.event_receiver
+
+    def handle_redfish_event(self, source: Any, record: Dict[str, Any]):
+        """Broadcast a Redfish event as a server alert or status update."""
+        server_id = source.server_id or source.credentials.host
+        origin = record.get("OriginOfCondition")
+        if isinstance(origin, dict):
+            origin = origin.get("@odata.id")
+        severity = record.get("MessageSeverity") or record.get("Severity")
+        event = {
+            "event_type": record.get("EventType"),
+            "message_id": record.get("MessageId"),
+            "message": record.get("Message"),
+            "severity": severity,
+            "origin": origin,
+            "event_time": record.get("EventTimestamp"),
+        }
+
+        if record.get("EventType") == "Alert" or severity in ("Warning", "Critical"):
+            self.broadcast_server_alert(server_id, event)
+        else:
+            self.broadcast_server_status(server_id, {"redfish_event": event})
+
 
 class WorkflowManager(WebSocketManager):
     """
@@ -427,11 +463,15 @@ class LogStreamManager(WebSocketManager):
     - Log level filtering
     - Component filtering
     - Real-time updates
+    - Serial-over-LAN console streaming
     """
 
-    def __init__(self, socketio: SocketIO):
+    def __init__(self, socketio: SocketIO, console_service: Any = None):
         super().__init__(socketio)
+        self.console_service = console_service
+        self._console_subscriptions: Dict[str, Callable[[], None]] = {}
         self._register_log_handlers()
+        self._register_console_handlers()
 
     def _register_log_handlers(self):
         """Register log streaming event handlers."""
@@ -473,6 +513,88 @@ class LogStreamManager(WebSocketManager):
             component_room, "log_entry", {"entry": log_entry, "timestamp": time.time()}
         )
 
+    def _register_console_handlers(self):
+        """Register SOL console streaming event handlers."""
+
+        @self.socketio.on("subscribe_console")
+        def handle_subscribe_console(data):
+            client_id = self._get_client_id_by_session(request.sid)
+            server_id = data.get("server_id")
+
+            if client_id and server_id:
+                self.subscribe_console(client_id, server_id)
+
+        @self.socketio.on("unsubscribe_console")
+        def handle_unsubscribe_console(data):
+            client_id = self._get_client_id_by_session(request.sid)
+            server_id = data.get("server_id")
+
+            if client_id and server_id:
+                self.unsubscribe_console(client_id, server_id)
+
+    def _get_console_service(self):
+        """Get the console service, defaulting to the process-wide one."""
+        if self.console_service is None:
+            from hwautomation.hardware.ipmi.console import get_console_service
+
+            self.console_service = get_console_service()
+        return self.console_service
+
+    def subscribe_console(self, client_id: str, server_id: str) -> bool:
+        """Stream a server's console to a client, starting with the backlog."""
+        room_name = f"console_{server_id}"
+        if not self.join_room(client_id, room_name):
+            return False
+
+        service = self._get_console_service()
+        buffer = service.get_buffer(server_id, create=True)
+        backlog = buffer.read(buffer.start)
+
+        # One service subscription per server feeds the whole room
+        if server_id not in self._console_subscriptions:
+            self._console_subscriptions[server_id] = service.subscribe(
+                server_id, self.broadcast_console_output, offset=backlog.next_offset
+            )
+
+        self.send_to_client(
+            client_id,
+            "console_output",
+            {
+                "server_id": server_id,
+                "chunk": backlog.to_dict(),
+                "capturing": service.is_capturing(server_id),
+                "timestamp": time.time(),
+            },
+        )
+        return True
+
+    def unsubscribe_console(self, client_id: str, server_id: str) -> bool:
+        """Stop streaming a server's console to a client."""
+        return self.leave_room(client_id, f"console_{server_id}")
+
+    def leave_room(self, client_id: str, room_name: str) -> bool:
+        """Remove client from a room, releasing idle console subscriptions."""
+        left = super().leave_room(client_id, room_name)
+
+        if room_name.startswith("console_") and not self.get_room_clients(room_name):
+            server_id = room_name[len("console_") :]
+            unsubscribe = self._console_subscriptions.pop(server_id, None)
+            if unsubscribe:
+                unsubscribe()
+        return left
+
+    def broadcast_console_output(self, server_id: str, chunk: Any):
+        """Broadcast a batch of console output to a server's subscribers."""
+        self.broadcast_to_room(
+            f"console_{server_id}",
+            "console_output",
+            {
+                "server_id": server_id,
+                "chunk": chunk.to_dict(),
+                "timestamp": time.time(),
+            },
+        )
+
 
 class WebSocketManagerFactory:
     """
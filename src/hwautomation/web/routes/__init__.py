@@ -9,6 +9,7 @@ Organized Flask blueprints for different functional areas:
 - maas: MaaS integration APIs
 - logs: Log management APIs
 - firmware: Firmware management APIs
+- telemetry: Fleet sensor telemetry APIs
 ."""
 
 from typing import Any, Callable, Optional
@@ -58,6 +59,13 @@ try:
 except ImportError:
     pass
 
+telemetry_bp: Optional[Blueprint] = None
+init_telemetry_routes: Optional[Callable[[Any], Any]] = None
+try:
+    from .telemetry import init_telemetry_routes, telemetry_bp
+except ImportError:
+    pass
+
 __all__ = [
     "core_bp",
     "init_core_routes",
@@ -71,4 +79,6 @@ __all__ = [
     "init_logs_routes",
     "firmware_bp",
     "init_firmware_routes",
+    "telemetry_bp",
+    "init_telemetry_routes",
 ]
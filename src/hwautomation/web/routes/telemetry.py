@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Sensor telemetry routes for HWAutomation Web Interface
+
+Serves fleet sensor trends, latest readings and alerts from the in-memory
+telemetry store instead of querying BMCs per request.
+."""
+
+from flask import Blueprint, jsonify, request
+
+from hwautomation.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Create blueprint for telemetry routes
+telemetry_bp = Blueprint("telemetry", __name__, url_prefix="/api/telemetry")
+
+telemetry_store = None
+
+
+def _float_arg(name):
+    """Get an optional float query argument."""
+    value = request.args.get(name)
+    return float(value) if value not in (None, "") else None
+
+
+@telemetry_bp.route("/hosts")
+def api_telemetry_hosts():
+    """List BMCs with stored telemetry."""
+    if telemetry_store is None:
+        return jsonify({"success": False, "error": "Telemetry not available"}), 503
+
+    hosts = [
+        {
+            "host": host,
+            "last_updated": telemetry_store.last_updated(host),
+            "sensors": len(telemetry_store.sensors(host)),
+        }
+        for host in telemetry_store.hosts()
+    ]
+    return jsonify({"success": True, "hosts": hosts})
+
+
+@telemetry_bp.route("/hosts/<host>/latest")
+def api_telemetry_latest(host):
+    """Get the latest reading of every sensor on a BMC."""
+    if telemetry_store is None:
+        return jsonify({"success": False, "error": "Telemetry not available"}), 503
+
+    sensors = {
+        name: {
+            "value": reading.value,
+            "unit": reading.unit,
+            "status": reading.status,
+        }
+        for name, reading in telemetry_store.latest(host).items()
+    }
+    return jsonify(
+        {
+            "success": True,
+            "host": host,
+            "last_updated": telemetry_store.last_updated(host),
+            "sensors": sensors,
+        }
+    )
+
+
+@telemetry_bp.route("/hosts/<host>/sensors/<path:sensor>")
+def api_telemetry_series(host, sensor):
+    """Get a sensor time series (start, end, resolution query arguments)."""
+    if telemetry_store is None:
+        return jsonify({"success": False, "error": "Telemetry not available"}), 503
+
+    try:
+        resolution = request.args.get("resolution", type=int)
+        points = telemetry_store.query(
+            host, sensor, _float_arg("start"), _float_arg("end"), resolution
+        )
+        return jsonify(
+            {
+                "success": True,
+                "host": host,
+                "sensor": sensor,
+                "points": [point.to_dict() for point in points],
+            }
+        )
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+@telemetry_bp.route("/fleet")
+def api_telemetry_fleet():
+    """Get a fleet-wide trend for sensors matching ``match``."""
+    if telemetry_store is None:
+        return jsonify({"success": False, "error": "Telemetry not available"}), 503
+
+    match = request.args.get("match", "temp")
+    try:
+        resolution = request.args.get("resolution", 60, type=int)
+        points = telemetry_store.fleet_trend(
+            match, _float_arg("start"), _float_arg("end"), resolution
+        )
+        return jsonify(
+            {
+                "success": True,
+                "match": match,
+                "points": [point.to_dict() for point in points],
+            }
+        )
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+@telemetry_bp.route("/alerts")
+def api_telemetry_alerts():
+    """Get sensors currently in warning or critical state."""
+    if telemetry_store is None:
+        return jsonify({"success": False, "error": "Telemetry not available"}), 503
+
+    alerts = [alert.to_dict() for alert in telemetry_store.alerts()]
+    return jsonify({"success": True, "alerts": alerts})
+
+
+def init_telemetry_routes(store):
+    """Initialize telemetry routes with the telemetry store.
+
+    Args:
+        store: SensorTelemetryStore instance
+    """
+    global telemetry_store
+    telemetry_store = store
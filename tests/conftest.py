@@ -103,6 +103,27 @@ def setup_test_environment():
         os.environ.pop("DATABASE_PATH", None)
 
 
+@pytest.fixture(autouse=True)
+def reset_redfish_session_pool():
+    """Drop pooled Redfish sessions so mocked HTTP sessions don't leak."""
+    from hwautomation.hardware.redfish.client.session import get_redfish_session_pool
+
+    yield
+    get_redfish_session_pool().close_all()
+
+
+@pytest.fixture(autouse=True)
+def isolate_capability_cache(monkeypatch):
+    """Give each test an empty in-memory BMC capability cache."""
+    from hwautomation.hardware.ipmi import capabilities
+
+    monkeypatch.setattr(
+        capabilities,
+        "_capability_cache",
+        capabilities.BMCCapabilityCache(redfish_probe=None),
+    )
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
@@ -0,0 +1,204 @@
+"""Fake Redfish BMCs, sessions and session pools shared by the Redfish tests."""
+
+import json
+import threading
+from typing import NamedTuple
+from unittest.mock import patch
+
+from hwautomation.hardware.redfish import RedfishResponse
+
+SESSIONS = "/redfish/v1/SessionService/Sessions"
+SYSTEM = "/redfish/v1/Systems/1"
+
+
+class FakeResponse:
+    """Minimal requests.Response."""
+
+    def __init__(self, status_code=200, data=None, headers=None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = headers or {}
+        self.content = json.dumps(data).encode() if data is not None else b""
+        self._data = data
+
+    def json(self):
+        return self._data
+
+    @property
+    def text(self):
+        return self.content.decode()
+
+
+class FakeRequest(NamedTuple):
+    """Request seen by a FakeBMC."""
+
+    method: str
+    path: str
+    token: str
+    if_none_match: str
+
+
+class FakeBMC:
+    """HTTP session against a BMC serving resources with ETags.
+
+    Stands in for the ``requests.Session`` class used by RedfishSession. With
+    ``sessions`` enabled the BMC issues X-Auth-Token sessions; otherwise only
+    HTTP Basic auth is accepted.
+    """
+
+    def __init__(self, sessions=True):
+        self.sessions = sessions
+        self.resources = {
+            "/redfish/v1/": {"RedfishVersion": "1.11.0"},
+            SYSTEM: {"Id": "1", "PowerState": "On"},
+        }
+        self.versions = {path: 1 for path in self.resources}
+        self.valid_tokens = set()
+        self.logins = 0
+        self.requests = []
+        self.headers = {}
+        self.auth = None
+        self.closed = 0
+
+    def __call__(self):
+        # Stands in for the requests.Session class
+        return self
+
+    def install(self):
+        """Patch RedfishSession to talk to this BMC."""
+        return patch(
+            "hwautomation.hardware.redfish.client.session.requests.Session", self
+        )
+
+    def request(self, method, url, headers=None, **kwargs):
+        path = url.split(":443", 1)[-1]
+        token = self.headers.get("X-Auth-Token")
+        if_none_match = (headers or {}).get("If-None-Match")
+        self.requests.append(FakeRequest(method, path, token, if_none_match))
+        if path == SESSIONS and method == "POST":
+            return self._login()
+        if method == "DELETE" and path.startswith(f"{SESSIONS}/"):
+            self.valid_tokens.discard(f"token-{path.rsplit('/', 1)[1]}")
+            return FakeResponse(204)
+        if token not in self.valid_tokens and self.auth is None:
+            return FakeResponse(401, {"error": {"message": "Unauthorized"}})
+        if path not in self.resources:
+            return FakeResponse(404)
+        if method == "PATCH":
+            self.resources[path].update(kwargs.get("json") or {})
+            self.versions[path] += 1
+            return FakeResponse(204)
+
+        etag = f'W/"{self.versions[path]}"'
+        if if_none_match == etag:
+            return FakeResponse(304, headers={"ETag": etag})
+        return FakeResponse(200, self.resources[path], {"ETag": etag})
+
+    def _login(self):
+        if not self.sessions:
+            return FakeResponse(405)
+        self.logins += 1
+        token = f"token-{self.logins}"
+        self.valid_tokens.add(token)
+        return FakeResponse(
+            201,
+            {"Id": str(self.logins)},
+            {"X-Auth-Token": token, "Location": f"{SESSIONS}/{self.logins}"},
+        )
+
+    def close(self):
+        self.closed += 1
+
+    def count(self, method, path):
+        return sum(1 for r in self.requests if r.method == method and r.path == path)
+
+    def gets(self, path):
+        """If-None-Match headers sent with each GET of a path."""
+        return [
+            r.if_none_match
+            for r in self.requests
+            if r.method == "GET" and r.path == path
+        ]
+
+
+class FakeSession:
+    """Pooled RedfishSession stand-in serving canned resources.
+
+    GETs are answered from ``resources`` (404 otherwise) and recorded in
+    ``requests``; PATCHes are recorded in ``patches``. Subclasses override
+    ``respond`` to compute responses.
+    """
+
+    def __init__(self, resources=None):
+        self.resources = resources if resources is not None else {}
+        self.protocol_features = {}
+        self.requests = []
+        self.patches = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get(self, uri, **kwargs):
+        with self._lock:
+            self.requests.append(uri)
+        return self.respond(uri)
+
+    def patch(self, uri, data=None, **kwargs):
+        self.patches.append((uri, data))
+        return RedfishResponse(success=True, status_code=204)
+
+    def respond(self, uri):
+        if uri in self.resources:
+            return self._ok(self.resources[uri])
+        return RedfishResponse(success=False, status_code=404)
+
+    def _ok(self, data):
+        return RedfishResponse(success=True, status_code=200, data=data)
+
+
+class FakeSessionPool:
+    """Session pool handing out a fixed session or one built per BMC.
+
+    ``install`` makes it the shared pool of the given modules until
+    ``close``, which also runs the callbacks registered with ``add_cleanup``.
+    """
+
+    def __init__(self, session=None, factory=None):
+        self.session = session
+        self.factory = factory
+        self._cleanups = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, credentials):
+        if self.factory is not None:
+            return self.factory(credentials)
+        return self.session
+
+    def serve(self, session):
+        """Hand out ``session`` from now on and return it."""
+        self.session = session
+        return session
+
+    def install(self, *modules):
+        """Patch ``get_redfish_session_pool`` of each module to return this pool."""
+        for module in modules:
+            patcher = patch(f"{module}.get_redfish_session_pool", return_value=self)
+            patcher.start()
+            self._cleanups.append(patcher.stop)
+        return self
+
+    def add_cleanup(self, callback):
+        self._cleanups.append(callback)
+
+    def close(self):
+        while self._cleanups:
+            self._cleanups.pop()()
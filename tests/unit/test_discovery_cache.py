@@ -0,0 +1,213 @@
+"""Tests for the persistent hardware discovery cache."""
+
+import os
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from hwautomation.database.helper import DbHelper
+from hwautomation.hardware.discovery.base import (
+    HardwareDiscovery,
+    IPMIInfo,
+    NetworkInterface,
+    SystemInfo,
+)
+from hwautomation.hardware.discovery.cache import (
+    DiscoveryCache,
+    DiscoveryFingerprint,
+    discovery_content_hash,
+)
+from hwautomation.hardware.discovery.manager import HardwareDiscoveryManager
+from hwautomation.orchestration.steps.hardware_discovery import DiscoverHardwareStep
+from hwautomation.orchestration.workflows.base import StepContext
+
+UUID = "4C4C4544-0042-3510-8058-B2C04F4E3332"
+
+
+def _discovery(hostname="10.0.0.1", cpu="Xeon Gold 6248"):
+    return HardwareDiscovery(
+        hostname=hostname,
+        system_info=SystemInfo(
+            manufacturer="Dell Inc.", uuid=UUID, bios_version="2.1", cpu_model=cpu
+        ),
+        ipmi_info=IPMIInfo(ip_address="10.1.0.1"),
+        network_interfaces=[NetworkInterface(name="eno1", mac_address="aa:bb")],
+        discovered_at="2025-01-01T00:00:00",
+        discovery_errors=[],
+    )
+
+
+@pytest.fixture
+def db(tmp_path):
+    helper = DbHelper(str(tmp_path / "cache.db"))
+    yield helper
+    helper.close()
+
+
+class TestDiscoveryFingerprint:
+    """Test identity fingerprint normalization."""
+
+    def test_uuid_key_is_case_insensitive(self):
+        assert DiscoveryFingerprint(system_uuid=UUID).cache_key == (
+            f"uuid:{UUID.lower()}"
+        )
+
+    def test_placeholder_uuid_falls_back_to_serial(self):
+        fingerprint = DiscoveryFingerprint(
+            system_uuid="03000200-0400-0500-0006-000700080009",
+            serial_number="ABC123",
+        )
+        assert fingerprint.cache_key == "serial:ABC123"
+
+    def test_no_identity(self):
+        fingerprint = DiscoveryFingerprint(
+            system_uuid="Not Settable", serial_number="To Be Filled By O.E.M."
+        )
+        assert fingerprint.cache_key is None
+
+
+class TestDiscoveryCache:
+    """Test cache storage, revalidation and change detection."""
+
+    def test_hit_after_store(self, db):
+        cache = DiscoveryCache(db)
+        fingerprint = DiscoveryFingerprint(UUID, "SN1", "2.1")
+        assert cache.store(_discovery(), fingerprint) is True
+
+        cached = cache.lookup(fingerprint, hostname="10.0.0.99")
+        assert cached.from_cache is True
+        assert cached.hostname == "10.0.0.99"
+        assert cached.system_info.cpu_model == "Xeon Gold 6248"
+
+    def test_addressing_is_not_cached(self, db):
+        """IPMI and NIC addresses are re-collected, never served from cache."""
+        cache = DiscoveryCache(db)
+        fingerprint = DiscoveryFingerprint(UUID, "SN1", "2.1")
+        cache.store(_discovery(), fingerprint)
+
+        cached = cache.lookup(fingerprint)
+        assert cached.ipmi_info.ip_address is None
+        assert cached.network_interfaces == []
+        row = db.sql_db_worker.execute(
+            "SELECT discovery_json FROM discovery_cache"
+        ).fetchone()
+        assert "10.1.0.1" not in row[0]
+        assert "eno1" not in row[0]
+
+    def test_bios_change_misses(self, db):
+        cache = DiscoveryCache(db)
+        cache.store(_discovery(), DiscoveryFingerprint(UUID, "SN1", "2.1"))
+        assert cache.lookup(DiscoveryFingerprint(UUID, "SN1", "2.2")) is None
+
+    def test_expired_entry_misses(self, db):
+        cache = DiscoveryCache(db, ttl=timedelta(seconds=-1))
+        fingerprint = DiscoveryFingerprint(UUID, "SN1", "2.1")
+        cache.store(_discovery(), fingerprint)
+        assert cache.lookup(fingerprint) is None
+        assert cache.purge_expired() == 1
+
+    def test_store_reports_content_change(self, db):
+        cache = DiscoveryCache(db)
+        fingerprint = DiscoveryFingerprint(UUID, "SN1", "2.1")
+        cache.store(_discovery(), fingerprint)
+        assert cache.store(_discovery(hostname="other"), fingerprint) is False
+        assert cache.store(_discovery(cpu="EPYC 7763"), fingerprint) is True
+
+    def test_content_hash_ignores_volatile_fields(self):
+        first = _discovery()
+        second = _discovery(hostname="10.9.9.9")
+        second.discovered_at = "2030-01-01T00:00:00"
+        second.ipmi_info.ip_address = "10.1.0.2"
+        assert discovery_content_hash(first) == discovery_content_hash(second)
+
+
+class TestManagerCacheIntegration:
+    """Test HardwareDiscoveryManager uses the cache for cheap revalidation."""
+
+    @staticmethod
+    def _ssh_client():
+        ssh_client = Mock()
+        ssh_client.__enter__ = Mock(return_value=ssh_client)
+        ssh_client.__exit__ = Mock(return_value=False)
+
+        def exec_command(command):
+            if "system-uuid" in command:
+                return (f"{UUID}\nSN1\n2.1\n", "", 0)
+            if command == "ipmitool lan print 1":
+                return ("IP Address              : 10.1.0.7\n", "", 0)
+            if command == "ip -j addr show":
+                return (
+                    '[{"ifname": "eno2", "address": "cc:dd", "operstate": "UP"}]',
+                    "",
+                    0,
+                )
+            return ("", "", 0)
+
+        ssh_client.exec_command.side_effect = exec_command
+        return ssh_client
+
+    def _manager(self, db, ssh_client):
+        ssh_manager = Mock()
+        ssh_manager.connect.return_value = ssh_client
+        with patch("hwautomation.hardware.discovery.manager.ConfigurationManager"):
+            return HardwareDiscoveryManager(
+                ssh_manager, discovery_cache=DiscoveryCache(db)
+            )
+
+    def test_cached_host_skips_inventory_commands(self, db):
+        ssh_client = self._ssh_client()
+        manager = self._manager(db, ssh_client)
+        manager.discovery_cache.store(
+            _discovery(), DiscoveryFingerprint(UUID, "SN1", "2.1")
+        )
+
+        result = manager.discover_hardware("10.0.0.1")
+
+        commands = [c[0][0] for c in ssh_client.exec_command.call_args_list]
+        assert result.from_cache is True
+        assert result.system_info.cpu_model == "Xeon Gold 6248"
+        assert "sudo dmidecode" not in commands
+        assert result.ipmi_info.ip_address == "10.1.0.7"
+        assert [iface.name for iface in result.network_interfaces] == ["eno2"]
+
+    def test_use_cache_false_forces_discovery(self, db):
+        ssh_client = Mock()
+        ssh_client.__enter__ = Mock(return_value=ssh_client)
+        ssh_client.__exit__ = Mock(return_value=False)
+        ssh_client.exec_command.return_value = (f"{UUID}\nSN1\n2.1\n", "", 0)
+
+        manager = self._manager(db, ssh_client)
+        manager.discovery_cache.store(
+            _discovery(), DiscoveryFingerprint(UUID, "SN1", "2.1")
+        )
+
+        result = manager.discover_hardware("10.0.0.1", use_cache=False)
+
+        assert result.from_cache is False
+        assert ssh_client.exec_command.call_count > 1
+
+    def test_discovery_step_uses_cache(self):
+        """The workflow discovery step reuses the cached inventory."""
+        db = DbHelper(os.environ["DATABASE_PATH"])
+        DiscoveryCache(db).store(_discovery(), DiscoveryFingerprint(UUID, "SN1", "2.1"))
+        db.close()
+        ssh_manager = Mock()
+        ssh_manager.connect.return_value = self._ssh_client()
+        context = StepContext(
+            workflow_id="wf-1", server_id="srv-1", server_ip="10.0.0.1"
+        )
+
+        with (
+            patch(
+                "hwautomation.orchestration.steps.hardware_discovery.SSHManager",
+                return_value=ssh_manager,
+            ),
+            patch("time.sleep"),
+            patch("hwautomation.hardware.discovery.manager.ConfigurationManager"),
+        ):
+            result = DiscoverHardwareStep().execute(context)
+
+        assert result.data["discovery_result"]["from_cache"] is True
+        assert context.manufacturer == "Dell Inc."
+        assert context.ipmi_ip == "10.1.0.7"
@@ -0,0 +1,188 @@
+"""Tests for the agentless one-shot discovery collector."""
+
+import subprocess
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+from hwautomation.hardware.discovery import collector_payload
+from hwautomation.hardware.discovery.collector import (
+    CollectorError,
+    DiscoveryCollector,
+    decode_document,
+    payload_source,
+)
+from hwautomation.hardware.discovery.manager import HardwareDiscoveryManager
+
+DMIDECODE_OUTPUT = """Handle 0x0000, DMI type 0, 26 bytes
+BIOS Information
+\tVendor: American Megatrends Inc.
+\tVersion: 3.4
+\tRelease Date: 04/21/2021
+
+Handle 0x0001, DMI type 1, 27 bytes
+System Information
+\tManufacturer: Supermicro
+\tProduct Name: SYS-6029TP-HTR
+\tSerial Number: S123456X
+\tUUID: 00000000-0000-0000-0000-AC1F6B123456
+"""
+
+LAN_PRINT = """IP Address Source       : Static Address
+IP Address              : 10.1.0.5
+Subnet Mask             : 255.255.255.0
+MAC Address             : ac:1f:6b:00:00:01
+Default Gateway IP      : 10.1.0.1
+"""
+
+SUM_SYSTEM = """Product Name: SYS-6029TP-HTR-1
+Serial Number: S123456X
+"""
+
+
+def _command(stdout="", rc=0, stderr=""):
+    return {"cmd": "", "stdout": stdout, "stderr": stderr, "rc": rc}
+
+
+def _document(**overrides):
+    commands = {
+        "dmidecode": _command(DMIDECODE_OUTPUT),
+        "lscpu": _command("Model name: Intel Xeon Gold 6248\nCPU(s): 80\n"),
+        "lscpu_json": None,
+        "memory": _command("       total\nMem:   251Gi  10Gi\n"),
+        "ip_json": _command(
+            '[{"ifname": "eno1", "flags": ["UP"], "link_type": "ether", '
+            '"address": "ac:1f:6b:12:34:56", "addr_info": []}]'
+        ),
+        "lspci": _command(
+            '3b:00.0 "Ethernet controller" "Mellanox Technologies" '
+            '"MT27800 Family" -r00 "Mellanox Technologies" "Device 0001"\n'
+        ),
+        "ipmi_lan_8": _command(LAN_PRINT),
+        "sum_system": _command(SUM_SYSTEM),
+    }
+    commands.update(overrides)
+    return {
+        "version": collector_payload.PAYLOAD_VERSION,
+        "hostname": "node1",
+        "commands": {k: v for k, v in commands.items() if v is not None},
+    }
+
+
+@pytest.fixture
+def manager():
+    with patch("hwautomation.hardware.discovery.manager.ConfigurationManager"):
+        return HardwareDiscoveryManager(Mock(), collector=DiscoveryCollector())
+
+
+def _ssh_client(stdout="", stderr="", exit_code=0):
+    ssh_client = Mock()
+    ssh_client.__enter__ = Mock(return_value=ssh_client)
+    ssh_client.__exit__ = Mock(return_value=False)
+    ssh_client.exec_command.return_value = (stdout, stderr, exit_code)
+    return ssh_client
+
+
+class TestCollectorPayload:
+    """Test the payload script and its document encoding."""
+
+    def test_payload_runs_standalone(self):
+        result = subprocess.run(
+            [sys.executable, "-"],
+            input=payload_source(),
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        assert result.returncode == 0, result.stderr
+
+        document = decode_document(result.stdout)
+        assert document.version == collector_payload.PAYLOAD_VERSION
+        assert "dmidecode" in document.commands
+        assert "memory" in document.commands
+
+    def test_missing_tool_is_reported_not_installed(self):
+        name, result = collector_payload._run_group(
+            [("tool", ["definitely-not-a-real-tool-xyz"])]
+        )
+        assert name == "tool"
+        assert result["rc"] == 127
+        assert "not found" in result["stderr"]
+
+    def test_group_falls_back_to_next_alternative(self):
+        name, result = collector_payload._run_group(
+            [
+                ("first", ["definitely-not-a-real-tool-xyz"]),
+                ("second", [sys.executable, "-c", "print('ok')"]),
+            ]
+        )
+        assert name == "second"
+        assert result["stdout"].strip() == "ok"
+
+    def test_round_trip(self):
+        document = decode_document(collector_payload.encode(_document()))
+        assert document.output("dmidecode") == DMIDECODE_OUTPUT
+        assert document.output("ipmi_lan_1") is None
+        assert document.error("ipmi_lan_1") == "not collected"
+        assert document.pci_devices()[0]["vendor"] == "Mellanox Technologies"
+
+    def test_rejects_garbage_and_unknown_version(self):
+        with pytest.raises(CollectorError):
+            decode_document("sudo: a password is required")
+        bad_version = dict(_document(), version=99)
+        with pytest.raises(CollectorError):
+            decode_document(collector_payload.encode(bad_version))
+
+
+class TestCollectorIngest:
+    """Test HardwareDiscoveryManager ingestion of collector documents."""
+
+    def test_ingest_builds_discovery(self, manager):
+        document = decode_document(collector_payload.encode(_document()))
+        discovery = manager.ingest_collected("10.0.0.5", document)
+
+        info = discovery.system_info
+        assert info.manufacturer == "Supermicro"
+        assert info.bios_version == "3.4"
+        assert info.cpu_cores == 80
+        assert info.memory_total == "251Gi"
+        # Vendor tool output overrides the DMI product name
+        assert info.product_name == "SYS-6029TP-HTR-1"
+        assert discovery.ipmi_info.ip_address == "10.1.0.5"
+        assert discovery.ipmi_info.channel == 8
+        assert discovery.network_interfaces[0].name == "eno1"
+        assert discovery.discovery_errors == []
+
+    def test_ingest_reports_missing_tools(self, manager):
+        document = decode_document(
+            collector_payload.encode(
+                _document(
+                    ipmi_lan_8=_command(rc=127, stderr="ipmitool: command not found")
+                )
+            )
+        )
+        discovery = manager.ingest_collected("10.0.0.5", document)
+        assert discovery.discovery_errors == [
+            "IPMI lan print failed: ipmitool: command not found"
+        ]
+
+    def test_discover_hardware_uses_single_exec(self, manager):
+        ssh_client = _ssh_client(collector_payload.encode(_document()))
+        manager.ssh_manager.connect.return_value = ssh_client
+
+        discovery = manager.discover_hardware("10.0.0.5")
+
+        assert discovery.system_info.manufacturer == "Supermicro"
+        assert ssh_client.exec_command.call_count == 1
+        args, kwargs = ssh_client.exec_command.call_args
+        assert args[0] == "sudo -n python3 -"
+        assert "def collect()" in kwargs["stdin_data"]
+
+    def test_falls_back_when_collector_fails(self, manager):
+        ssh_client = _ssh_client(stderr="python3: not found", exit_code=127)
+        manager.ssh_manager.connect.return_value = ssh_client
+
+        manager.discover_hardware("10.0.0.5")
+
+        assert ssh_client.exec_command.call_count > 1
@@ -0,0 +1,143 @@
+"""Tests for concurrent multi-host hardware discovery."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from hwautomation.database.helper import DbHelper
+from hwautomation.hardware.discovery.base import (
+    HardwareDiscovery,
+    IPMIInfo,
+    NetworkInterface,
+    SystemInfo,
+)
+from hwautomation.hardware.discovery.manager import HardwareDiscoveryManager
+from hwautomation.hardware.discovery.recorder import DiscoveryRecorder
+
+
+def _discovery(host, errors=None):
+    return HardwareDiscovery(
+        hostname=host,
+        system_info=SystemInfo(
+            manufacturer="Supermicro",
+            product_name="X11DPT-B",
+            cpu_model="Xeon Gold 6248",
+            bios_version="3.4",
+        ),
+        ipmi_info=IPMIInfo(ip_address=f"10.1.0.{host.rsplit('.', 1)[-1]}"),
+        network_interfaces=[NetworkInterface(name="eth0", mac_address="aa:bb")],
+        discovered_at="2025-01-01T00:00:00",
+        discovery_errors=errors or [],
+    )
+
+
+@pytest.fixture
+def manager():
+    with patch("hwautomation.hardware.discovery.manager.ConfigurationManager"):
+        return HardwareDiscoveryManager(Mock())
+
+
+class TestDiscoverMany:
+    """Test HardwareDiscoveryManager.discover_many."""
+
+    def test_runs_hosts_concurrently(self, manager):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_discover(host, username="ubuntu", key_file=None, use_cache=True):
+            with lock:
+                active.append(host)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(host)
+            return _discovery(host)
+
+        hosts = [f"10.0.0.{i}" for i in range(8)]
+        with patch.object(manager, "discover_hardware", side_effect=fake_discover):
+            results = manager.discover_many(hosts, concurrency=4)
+
+        assert set(results) == set(hosts)
+        assert max(peak) == 4
+
+    def test_isolates_per_host_failures(self, manager):
+        def fake_discover(host, username="ubuntu", key_file=None, use_cache=True):
+            if host == "10.0.0.2":
+                raise RuntimeError("boom")
+            return _discovery(host)
+
+        with patch.object(manager, "discover_hardware", side_effect=fake_discover):
+            results = manager.discover_many(["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+
+        assert results["10.0.0.2"].discovery_errors == ["Discovery failed: boom"]
+        assert results["10.0.0.1"].discovery_errors == []
+        assert results["10.0.0.3"].discovery_errors == []
+
+    def test_progress_callback_and_dedup(self, manager):
+        progress = []
+        with patch.object(
+            manager, "discover_hardware", side_effect=lambda h, **kw: _discovery(h)
+        ):
+            manager.discover_many(
+                ["10.0.0.1", "10.0.0.2", "10.0.0.1"],
+                progress_callback=lambda done, total, host, result: progress.append(
+                    (done, total)
+                ),
+            )
+
+        assert sorted(progress) == [(1, 2), (2, 2)]
+
+    def test_empty_hosts(self, manager):
+        assert manager.discover_many([]) == {}
+
+
+class TestDiscoveryRecorder:
+    """Test streaming discovery results into the database."""
+
+    def test_records_by_ip_and_mapping(self, manager, tmp_path):
+        db = DbHelper(str(tmp_path / "fleet.db"))
+        for server_id, ip in (("srv-1", "10.0.0.1"), ("srv-2", None)):
+            db.createrowforserver(server_id)
+            if ip:
+                db.updateserverinfo(server_id, "ip_address", ip)
+
+        recorder = DiscoveryRecorder(db, server_ids={"10.0.0.2": "srv-2"})
+        with patch.object(
+            manager,
+            "discover_hardware",
+            side_effect=lambda h, **kw: _discovery(
+                h, errors=["lscpu failed"] if h.endswith("2") else None
+            ),
+        ):
+            manager.discover_many(
+                ["10.0.0.1", "10.0.0.2", "10.0.0.9"], recorder=recorder
+            )
+
+        first = db.get_server_by_id("srv-1")
+        assert first["server_model"] == "Supermicro X11DPT-B"
+        assert first["ipmi_address"] == "10.1.0.1"
+        assert first["hardware_validated"] == 1
+        assert first["network_interfaces"] == "eth0"
+
+        second = db.get_server_by_id("srv-2")
+        assert second["cpu_model"] == "Xeon Gold 6248"
+        assert second["hardware_validated"] == 0
+        db.close()
+
+    def test_unreachable_host_not_marked_accessible(self, manager, tmp_path):
+        """A failed SSH connection records the host as unreachable."""
+        db = DbHelper(str(tmp_path / "fleet.db"))
+        db.createrowforserver("srv-1")
+        db.updateserverinfo("srv-1", "ip_address", "10.0.0.1")
+        db.update_server_metadata("srv-1", last_seen="2025-01-01T00:00:00")
+        manager.ssh_manager.connect.side_effect = OSError("No route to host")
+
+        manager.discover_many(["10.0.0.1"], recorder=DiscoveryRecorder(db))
+
+        row = db.get_server_by_id("srv-1")
+        assert row["ssh_accessible"] == 0
+        assert row["last_seen"] == "2025-01-01T00:00:00"
+        db.close()
@@ -0,0 +1,135 @@
+"""Tests for concurrent bulk IPMI operations."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from hwautomation.hardware.ipmi import BulkIPMIExecutor, IpmiManager
+
+
+class TestBulkIPMIExecutor:
+    """Test fan-out, retries, rate limiting and timeouts."""
+
+    def test_runs_hosts_concurrently(self):
+        """Operations on different BMCs overlap instead of running serially."""
+        barrier = threading.Barrier(4, timeout=2)
+
+        def operation(host):
+            barrier.wait()
+            return f"ok-{host}"
+
+        executor = BulkIPMIExecutor(max_workers=4)
+        results = executor.run(["a", "b", "c", "d"], operation)
+
+        assert sorted(results.succeeded) == ["a", "b", "c", "d"]
+        assert results["c"].value == "ok-c"
+        assert results.failed == []
+
+    def test_streams_results_in_completion_order(self):
+        """Fast hosts are yielded before slow ones."""
+
+        def operation(host, delay):
+            time.sleep(delay if host == "slow" else 0)
+            return True
+
+        executor = BulkIPMIExecutor(max_workers=2)
+        hosts = [
+            r.host for r in executor.iter_results(["slow", "fast"], operation, 0.2)
+        ]
+
+        assert hosts == ["fast", "slow"]
+
+    def test_retries_failures_and_exceptions(self):
+        """Failed and raising calls are retried up to the retry limit."""
+        calls = []
+
+        def operation(host):
+            calls.append(host)
+            if host == "flaky" and len([c for c in calls if c == host]) == 1:
+                raise RuntimeError("connection reset")
+            return host != "dead"
+
+        executor = BulkIPMIExecutor(retries=2, retry_delay=0)
+        results = executor.run(["flaky", "dead", "good"], operation)
+
+        assert results["flaky"].success and results["flaky"].attempts == 2
+        assert not results["dead"].success and results["dead"].attempts == 3
+        assert results["dead"].error == "Operation reported failure"
+        assert results["good"].attempts == 1
+
+    def test_per_host_interval_spaces_calls(self):
+        """Repeated calls to one BMC are spaced by the rate limit."""
+        stamps = []
+        executor = BulkIPMIExecutor(per_host_interval=0.1, retries=2, retry_delay=0)
+
+        executor.run(["bmc"], lambda host: stamps.append(time.monotonic()) and False)
+
+        assert len(stamps) == 3
+        assert all(b - a >= 0.09 for a, b in zip(stamps, stamps[1:]))
+
+    def test_timeout_marks_slow_hosts(self):
+        """Hosts exceeding their timeout are reported as timed out."""
+        release = threading.Event()
+
+        def operation(host):
+            if host == "hung":
+                release.wait(2)
+            return True
+
+        executor = BulkIPMIExecutor(timeout=0.2)
+        try:
+            results = executor.run(["hung", "ok"], operation)
+        finally:
+            release.set()
+
+        assert results["ok"].success
+        assert results["hung"].timed_out
+        assert results.failed == ["hung"]
+
+    def test_timeout_starts_when_host_starts(self):
+        """Time spent queued for a worker does not count against a host."""
+        executor = BulkIPMIExecutor(max_workers=1, timeout=0.25)
+
+        results = executor.run(["a", "b", "c"], lambda host: time.sleep(0.15) or True)
+
+        assert results.succeeded == ["a", "b", "c"]
+
+    def test_progress_callback(self):
+        """Progress is reported once per host."""
+        progress = []
+        executor = BulkIPMIExecutor()
+
+        executor.run(
+            ["a", "b", "a"],
+            lambda host: True,
+            progress_callback=lambda done, total, r: progress.append((done, total)),
+        )
+
+        assert sorted(progress) == [(1, 2), (2, 2)]
+
+
+class TestIpmiManagerBulk:
+    """Test IpmiManager bulk helpers."""
+
+    def test_set_ipmi_passwords_bulk(self):
+        """Password changes fan out and keep the legacy result mapping."""
+        manager = IpmiManager(transport=Mock())
+        manager.set_ipmi_password = Mock(side_effect=lambda ip, *a: ip != "10.0.0.2")
+
+        results = manager.set_ipmi_passwords_bulk(
+            ["10.0.0.1", "10.0.0.2"], "old", "new"
+        )
+
+        assert results == {"10.0.0.1": True, "10.0.0.2": False}
+        manager.set_ipmi_password.assert_any_call("10.0.0.1", "old", "new", "2")
+
+    def test_run_bulk_by_method_name(self):
+        """Operations can be named by IpmiManager method."""
+        manager = IpmiManager(transport=Mock(), config={"bulk": {"max_workers": 2}})
+        manager.get_power_status = Mock(return_value="on")
+
+        results = manager.run_bulk(["10.0.0.1"], "get_power_status", "pw")
+
+        assert manager.bulk_executor.max_workers == 2
+        assert results.values_by_host() == {"10.0.0.1": "on"}
+        manager.get_power_status.assert_called_once_with("10.0.0.1", "pw")
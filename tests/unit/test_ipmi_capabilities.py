@@ -0,0 +1,322 @@
+"""Tests for cached BMC capability fingerprints."""
+
+import subprocess
+from unittest.mock import Mock
+
+from hwautomation.database.helper import DbHelper
+from hwautomation.hardware.ipmi import (
+    BMCCapabilityCache,
+    IPMICredentials,
+    IPMISettings,
+    IPMIVendor,
+    IpmiManager,
+)
+from hwautomation.hardware.ipmi.capabilities import (
+    format_guid,
+    get_capability_cache,
+    vendor_from_mc_info,
+)
+from hwautomation.hardware.ipmi.operations.config import IPMIConfigurator
+
+MC_INFO = """\
+Device ID                 : 32
+Firmware Revision         : {firmware}
+IPMI Version              : 2.0
+Manufacturer ID           : 10876
+Manufacturer Name         : Super Micro Computer Inc.
+Product ID                : 2327 (0x0917)
+"""
+
+GUID_BYTES = " ".join(f"{b:02x}" for b in range(16))
+
+
+class FakeBMC:
+    """Transport answering identity and channel commands for one BMC."""
+
+    def __init__(self, firmware="3.88", guid=GUID_BYTES):
+        self.firmware = firmware
+        self.guid = guid
+        self.calls = []
+
+    def execute(self, credentials, command, timeout=30, additional_args=None):
+        args = command
+        if not isinstance(args, list):
+            args = getattr(command, "value", command).split()
+        self.calls.append(" ".join(args))
+        if args == ["mc", "info"]:
+            return self._result(MC_INFO.format(firmware=self.firmware))
+        if args == ["raw", "0x06", "0x08"]:
+            return self._result(f" {self.guid}\n")
+        if args[:3] == ["raw", "0x06", "0x42"]:
+            number = int(args[3], 16)
+            if number == 1:
+                return self._result(" 01 04 01 82 00 f2 1b 00 00\n")
+            if number == 7:
+                return self._result(" 07 0c 05 80 00 f2 1b 00 00\n")
+        return subprocess.CompletedProcess(args, 1, "", "Invalid channel\n")
+
+    def _result(self, stdout):
+        return subprocess.CompletedProcess([], 0, stdout, "")
+
+    def count(self, prefix):
+        return sum(call.startswith(prefix) for call in self.calls)
+
+
+CREDENTIALS = IPMICredentials(ip_address="10.0.0.9", username="u", password="p")
+
+
+class TestBMCCapabilityCache:
+    """Test detection, reuse and revalidation."""
+
+    def test_detects_capabilities(self):
+        """Full detection records vendor, firmware, channels and Redfish."""
+        cache = BMCCapabilityCache(transport=FakeBMC(), redfish_probe=lambda h: True)
+
+        capabilities = cache.get(CREDENTIALS)
+
+        assert capabilities.vendor == IPMIVendor.SUPERMICRO
+        assert capabilities.firmware_revision == "3.88"
+        assert capabilities.guid == "03020100-0504-0706-0809-0a0b0c0d0e0f"
+        assert capabilities.channels == {1: "lan", 7: "system"}
+        assert capabilities.lan_channels == [1]
+        assert capabilities.redfish_available is True
+
+    def test_reused_within_revalidate_interval(self):
+        """Repeated lookups issue no BMC commands."""
+        bmc = FakeBMC()
+        cache = BMCCapabilityCache(transport=bmc, redfish_probe=None)
+
+        cache.get(CREDENTIALS)
+        calls = len(bmc.calls)
+        for _ in range(5):
+            assert cache.get_vendor(CREDENTIALS) == IPMIVendor.SUPERMICRO
+
+        assert len(bmc.calls) == calls
+
+    def test_revalidation_skips_detection_when_unchanged(self):
+        """An unchanged identity only costs the identity check."""
+        bmc = FakeBMC()
+        cache = BMCCapabilityCache(
+            transport=bmc, revalidate_interval=0, redfish_probe=None
+        )
+
+        cache.get(CREDENTIALS)
+        cache.get(CREDENTIALS)
+
+        assert bmc.count("mc info") == 2
+        assert bmc.count("raw 0x06 0x42") == len(range(1, 12))
+
+    def test_firmware_change_redetects(self):
+        """A firmware update triggers full detection."""
+        bmc = FakeBMC()
+        cache = BMCCapabilityCache(
+            transport=bmc, revalidate_interval=0, redfish_probe=None
+        )
+
+        cache.get(CREDENTIALS)
+        bmc.firmware = "3.90"
+        capabilities = cache.get(CREDENTIALS)
+
+        assert capabilities.firmware_revision == "3.90"
+        assert bmc.count("raw 0x06 0x42") == 2 * len(range(1, 12))
+
+    def test_unreachable_bmc_keeps_cached_record(self):
+        """A failed identity check returns the last known capabilities."""
+        bmc = FakeBMC()
+        cache = BMCCapabilityCache(
+            transport=bmc, revalidate_interval=0, redfish_probe=None
+        )
+        cached = cache.get(CREDENTIALS)
+
+        bmc.execute = lambda *a, **k: subprocess.CompletedProcess([], 1, "", "err")
+
+        assert cache.get(CREDENTIALS) is cached
+        assert BMCCapabilityCache(transport=bmc).get(CREDENTIALS) is None
+
+    def test_persisted_across_instances(self, tmp_path):
+        """A database-backed record is reused by a new cache instance."""
+        db = DbHelper(str(tmp_path / "bmc.db"))
+        BMCCapabilityCache(
+            transport=FakeBMC(), db_helper=db, redfish_probe=lambda h: False
+        ).get(CREDENTIALS)
+
+        bmc = FakeBMC()
+        capabilities = BMCCapabilityCache(
+            transport=bmc, db_helper=db, redfish_probe=None
+        ).get(CREDENTIALS)
+
+        assert capabilities.channels == {1: "lan", 7: "system"}
+        assert capabilities.redfish_available is False
+        assert bmc.count("raw 0x06 0x42") == 0
+
+    def test_new_guid_replaces_record(self, tmp_path):
+        """A different GUID at the same address is detected again."""
+        db = DbHelper(str(tmp_path / "bmc.db"))
+        BMCCapabilityCache(transport=FakeBMC(), db_helper=db, redfish_probe=None).get(
+            CREDENTIALS
+        )
+
+        bmc = FakeBMC(guid=" ".join(["ff"] * 16))
+        BMCCapabilityCache(transport=bmc, db_helper=db, redfish_probe=None).get(
+            CREDENTIALS
+        )
+
+        rows = db.sql_db_worker.execute("SELECT guid FROM bmc_capabilities").fetchall()
+        assert rows == [("ffffffff-ffff-ffff-ffff-ffffffffffff",)]
+        assert bmc.count("raw 0x06 0x42") == len(range(1, 12))
+
+
+class TestVendorDetection:
+    """Test vendor identification and configurator integration."""
+
+    def test_vendor_from_manufacturer_id(self):
+        """The IANA manufacturer ID wins over text matching."""
+        assert vendor_from_mc_info("Manufacturer ID : 674\n") == IPMIVendor.DELL_IDRAC
+        assert vendor_from_mc_info("Product : iLO 5\n") == IPMIVendor.HP_ILO
+        assert vendor_from_mc_info("nothing useful") == IPMIVendor.UNKNOWN
+
+    def test_format_guid_short_data(self):
+        """Truncated GUID responses produce no GUID."""
+        assert format_guid(b"\x01\x02") == ""
+
+    def test_configure_and_validate_share_detection(self):
+        """Configuration and validation reuse one detection."""
+        bmc = FakeBMC()
+        configurator = IPMIConfigurator(
+            transport=bmc,
+            capabilities=BMCCapabilityCache(transport=bmc, redfish_probe=None),
+        )
+        configurator._get_vendor_handler = lambda vendor: None
+        settings = IPMISettings(admin_password="secret")
+
+        result = configurator.configure_ipmi(CREDENTIALS, settings)
+        configurator.validate_configuration(CREDENTIALS, settings)
+        configurator.detect_vendor(CREDENTIALS)
+
+        assert result.vendor == IPMIVendor.SUPERMICRO
+        assert result.firmware_version == "3.88"
+        assert bmc.count("raw 0x06 0x42") == len(range(1, 12))
+        # One identity check plus the validation connectivity check
+        assert bmc.count("mc info") == 2
+
+
+class TestRedfishCapabilities:
+    """Test Redfish details in the capability record."""
+
+    def test_recorded_and_persisted(self, tmp_path):
+        """Redfish details are stored and found by address in a new cache."""
+        db = DbHelper(str(tmp_path / "bmc.db"))
+        cache = BMCCapabilityCache(transport=FakeBMC(), db_helper=db)
+
+        cache.update_redfish(
+            "10.0.0.9",
+            version="1.15.0",
+            features={"expand": True, "sessions": True},
+            bios_registry_id="BiosAttributeRegistry.v1_0_0",
+        )
+        record = BMCCapabilityCache(transport=FakeBMC(), db_helper=db).lookup(
+            "10.0.0.9"
+        )
+
+        assert record.redfish_available is True
+        assert record.redfish_version == "1.15.0"
+        assert record.redfish_features == {"expand": True, "sessions": True}
+        assert record.preferred_protocol == "redfish"
+        row = db.sql_db_worker.execute(
+            "SELECT redfish_version, bios_registry_id, preferred_protocol "
+            "FROM bmc_capabilities"
+        ).fetchone()
+        assert row == ("1.15.0", "BiosAttributeRegistry.v1_0_0", "redfish")
+
+    def test_ipmi_detection_keeps_recorded_redfish(self):
+        """Detecting over IPMI reuses Redfish details instead of probing."""
+        probes = []
+        cache = BMCCapabilityCache(
+            transport=FakeBMC(), redfish_probe=lambda h: probes.append(h)
+        )
+        cache.update_redfish("10.0.0.9", version="1.11.0")
+
+        capabilities = cache.get(CREDENTIALS)
+
+        assert capabilities.vendor == IPMIVendor.SUPERMICRO
+        assert capabilities.redfish_version == "1.11.0"
+        assert probes == []
+        assert cache.lookup("10.0.0.9") is capabilities
+
+    def test_firmware_change_drops_redfish(self):
+        """New firmware clears the Redfish details learned before it."""
+        bmc = FakeBMC()
+        cache = BMCCapabilityCache(
+            transport=bmc, revalidate_interval=0, redfish_probe=None
+        )
+        cache.get(CREDENTIALS)
+        cache.update_redfish("10.0.0.9", version="1.11.0", bios_registry_id="R1")
+
+        bmc.firmware = "3.90"
+        capabilities = cache.get(CREDENTIALS)
+
+        assert capabilities.redfish_version is None
+        assert capabilities.bios_registry_id is None
+        assert capabilities.preferred_protocol == "ipmi"
+
+    def test_stale_redfish_details_expire(self):
+        """Redfish details older than the TTL are treated as unknown."""
+        cache = BMCCapabilityCache(transport=FakeBMC(), redfish_ttl=0)
+        cache.update_redfish("10.0.0.9", available=False)
+
+        record = cache.lookup("10.0.0.9")
+
+        assert record.redfish_available is None
+        assert record.preferred_protocol is None
+
+    def test_failed_probe_leaves_redfish_unknown(self):
+        """A probe that raises is retried instead of recorded as no Redfish."""
+
+        def probe(host):
+            raise OSError("connection reset")
+
+        cache = BMCCapabilityCache(transport=FakeBMC(), redfish_probe=probe)
+
+        capabilities = cache.get(CREDENTIALS)
+
+        assert capabilities.redfish_available is None
+        assert capabilities.preferred_protocol == "ipmi"
+
+    def test_known_value_without_timestamp_is_stale(self):
+        """Redfish details that were never timestamped are learned again."""
+        cache = BMCCapabilityCache(transport=FakeBMC(), redfish_probe=None)
+        cache.get(CREDENTIALS).redfish_available = False
+
+        record = cache.lookup("10.0.0.9")
+
+        assert record.redfish_available is None
+
+    def test_ipmi_manager_shares_record_with_redfish(self):
+        """IPMI detection and Redfish lookups use the same record."""
+        manager = IpmiManager(username="u", password="p", transport=FakeBMC())
+        assert manager.capabilities is get_capability_cache()
+
+        detected = manager.get_bmc_capabilities("10.0.0.9", "p")
+        get_capability_cache().update_redfish(
+            "10.0.0.9", available=True, version="1.11.0"
+        )
+
+        assert get_capability_cache().lookup("10.0.0.9") is detected
+        assert detected.redfish_version == "1.11.0"
+        assert detected.preferred_protocol == "redfish"
+
+    def test_ipmi_manager_detects_over_its_own_transport(self):
+        """The shared cache detects with the manager's transport and timeout."""
+        bmc = FakeBMC()
+        bmc.execute = Mock(wraps=bmc.execute)
+        shared = get_capability_cache()
+        shared.transport = Mock()
+        manager = IpmiManager(username="u", password="p", timeout=5, transport=bmc)
+
+        vendor = manager.detect_ipmi_vendor("10.0.0.9", "p")
+        capabilities = manager.get_bmc_capabilities("10.0.0.9", "p", refresh=True)
+
+        assert vendor == capabilities.vendor == IPMIVendor.SUPERMICRO
+        assert bmc.count("mc info") == 2
+        assert {c.kwargs["timeout"] for c in bmc.execute.call_args_list} == {5}
+        shared.transport.execute.assert_not_called()
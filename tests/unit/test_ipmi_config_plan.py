@@ -0,0 +1,182 @@
+"""Tests for declarative IPMI configuration plans."""
+
+import shlex
+
+from hwautomation.hardware.ipmi import IPMIConfigPlan
+from hwautomation.hardware.ipmi.operations.plan import (
+    parse_lan_print,
+    parse_user_list,
+    shell_batch_runner,
+)
+
+LAN_PRINT = """\
+Set in Progress         : Set Complete
+IP Address Source       : Static Address
+IP Address              : 10.0.0.20
+Subnet Mask             : 255.255.255.0
+MAC Address             : 0c:c4:7a:00:00:01
+Default Gateway IP      : 10.0.0.1
+"""
+
+USER_LIST = """\
+ID  Name             Callin  Link Auth  IPMI Msg   Channel Priv Limit
+1                    true    false      false      Unknown (0x00)
+2   ADMIN            false   false      true       ADMINISTRATOR
+3                    true    false      false      NO ACCESS
+"""
+
+
+class FakeBMCShell:
+    """Remote shell running ipmitool scripts against an in-memory BMC."""
+
+    def __init__(self, password="ADMIN"):
+        self.password = password
+        self.lan = LAN_PRINT
+        self.scripts = []
+
+    def exec_command(self, command, stdin_data=None):
+        self.scripts.append(stdin_data)
+        out = []
+        for line in stdin_data.splitlines():
+            args = shlex.split(line.split(" 2>&1;")[0])[1:]
+            code, text = self._run(args)
+            out.extend([text, f"__ipmi_plan_rc__ {code}"])
+        return "\n".join(out) + "\n", "", 0
+
+    def _run(self, args):
+        if args[:2] == ["lan", "print"]:
+            return 0, self.lan
+        if args[:2] == ["user", "list"]:
+            return 0, USER_LIST
+        if args[:2] == ["user", "test"]:
+            if args[4] == self.password:
+                return 0, "Success"
+            return 1, "Failure: password incorrect"
+        if args[:3] == ["lan", "set", "1"] and args[3] == "ipaddr":
+            self.lan = self.lan.replace("10.0.0.20", args[4])
+        return 0, ""
+
+    def applied(self):
+        """Commands of the last (apply) script."""
+        return [line.split(" 2>&1;")[0] for line in self.scripts[-1].splitlines()]
+
+
+class TestPlanBuilding:
+    """Test per-vendor plans and state parsing."""
+
+    def test_vendor_sections(self):
+        """Supermicro plans include users and OEM options, generic plans do not."""
+        supermicro = IPMIConfigPlan.for_vendor(
+            "Supermicro",
+            ipmi_ip="10.0.0.20",
+            username="ADMIN",
+            password="ADMIN",
+            kcs_control="user",
+            host_interface="off",
+        )
+        generic = IPMIConfigPlan.for_vendor(
+            "unknown", ipmi_ip="10.0.0.20", username="ADMIN", kcs_control="user"
+        )
+
+        assert {item.key for item in supermicro.items} >= {
+            "user.2.name",
+            "user.2.password",
+            "bmc.kcs_control",
+            "bmc.host_interface",
+            "lan.ipaddr",
+        }
+        assert generic.vendor == "generic"
+        assert [item.key for item in generic.items] == ["lan.ipsrc", "lan.ipaddr"]
+
+    def test_parse_state(self):
+        """lan print and user list output map onto plan keys."""
+        assert parse_lan_print(LAN_PRINT) == {
+            "lan.ipsrc": "static",
+            "lan.ipaddr": "10.0.0.20",
+            "lan.netmask": "255.255.255.0",
+            "lan.defgw": "10.0.0.1",
+        }
+        users = parse_user_list(USER_LIST)
+        assert users["user.2.name"] == "ADMIN"
+        assert users["user.2.privilege"] == "4"
+        assert users["user.3.name"] == ""
+        assert users["user.3.privilege"] == "15"
+
+
+class TestPlanApply:
+    """Test diffing and batched application."""
+
+    def _plan(self, ipmi_ip="10.0.0.20", password="ADMIN"):
+        return IPMIConfigPlan.for_vendor(
+            "supermicro",
+            ipmi_ip=ipmi_ip,
+            netmask="255.255.255.0",
+            gateway="10.0.0.1",
+            username="ADMIN",
+            password=password,
+        )
+
+    def test_only_changes_are_written(self):
+        """Settings already in place are skipped."""
+        shell = FakeBMCShell()
+
+        result = self._plan(ipmi_ip="10.0.0.21").apply(
+            shell_batch_runner(shell.exec_command)
+        )
+
+        assert result.success
+        assert [change.key for change in result.applied] == [
+            "user.2.enabled",
+            "lan.ipaddr",
+        ]
+        assert "lan.netmask" in result.unchanged
+        assert shell.applied() == [
+            "ipmitool user enable 2",
+            "ipmitool lan set 1 ipaddr 10.0.0.21",
+        ]
+        # One read batch and one apply batch
+        assert len(shell.scripts) == 2
+
+    def test_password_mismatch_is_applied_and_masked(self):
+        """A password that fails user test is set, and never reported."""
+        shell = FakeBMCShell(password="old")
+
+        result = self._plan().apply(shell_batch_runner(shell.exec_command))
+
+        changes = {change.key: change for change in result.applied}
+        assert "user.2.password" in changes
+        assert changes["user.2.password"].to_dict()["desired"] == "********"
+        assert "ADMIN" not in str(result.to_dict()["applied"])
+
+    def test_dry_run(self):
+        """A dry run lists changes without an apply batch."""
+        shell = FakeBMCShell()
+
+        result = self._plan(ipmi_ip="10.0.0.30").apply(
+            shell_batch_runner(shell.exec_command), dry_run=True
+        )
+
+        assert "lan.ipaddr" in [change.key for change in result.applied]
+        assert len(shell.scripts) == 1
+
+    def test_apply_order(self):
+        """Users are written before LAN settings, and the source before the address."""
+        plan = self._plan()
+        changes = plan.diff({})
+
+        keys = [change.key for change in changes]
+        assert keys.index("user.2.password") < keys.index("user.2.privilege")
+        assert keys.index("lan.ipsrc") < keys.index("lan.ipaddr")
+
+    def test_failed_command_reported(self):
+        """A failing write marks the plan as failed."""
+
+        def runner(commands):
+            return [
+                (1, "Invalid") if c[:2] == ["lan", "set"] else (0, "") for c in commands
+            ]
+
+        result = self._plan().apply(runner)
+
+        assert not result.success
+        assert any(error.startswith("lan.") for error in result.errors)
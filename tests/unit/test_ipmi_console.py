@@ -0,0 +1,191 @@
+"""Tests for SOL console capture and streaming."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from hwautomation.hardware.ipmi import ConsoleBuffer, IPMICredentials, SOLConsoleService
+from hwautomation.hardware.ipmi.console import POST_COMPLETE_PATTERN, SOLCapture
+from hwautomation.web.core.websocket_managers import LogStreamManager
+
+CREDENTIALS = IPMICredentials(ip_address="10.0.0.9", username="u", password="p")
+
+
+class FakeTransport:
+    """ipmitool transport recording SOL commands."""
+
+    def __init__(self):
+        self.commands = []
+
+    def build_args(self, credentials, command, additional_args=None):
+        return ["ipmitool", "-H", credentials.ip_address] + command.split()
+
+    def execute(self, credentials, command, timeout=30, additional_args=None):
+        self.commands.append(command)
+
+
+class FakeStdout:
+    """Pipe returning one queued read at a time."""
+
+    def __init__(self, reads):
+        self.reads = list(reads)
+
+    def read1(self, size):
+        return self.reads.pop(0) if self.reads else b""
+
+
+class FakeProcess:
+    """SOL process whose output ends after a fixed sequence of reads."""
+
+    def __init__(self, reads):
+        self.stdout = FakeStdout(reads)
+        self.terminated = False
+
+    def poll(self):
+        return 0
+
+    def terminate(self):
+        self.terminated = True
+
+
+def _popen(*sessions):
+    remaining = list(sessions)
+
+    def popen(args, **kwargs):
+        return FakeProcess(remaining.pop(0) if remaining else [])
+
+    return popen
+
+
+class TestConsoleBuffer:
+    """Test ring buffer reads and pattern waits."""
+
+    def test_oldest_output_is_dropped(self):
+        """Reads behind the buffer start report the dropped characters."""
+        buffer = ConsoleBuffer(max_chars=8)
+        buffer.append("abcdef")
+        buffer.append("ghij")
+
+        chunk = buffer.read(0)
+
+        assert (buffer.start, buffer.end) == (2, 10)
+        assert chunk.text == "cdefghij"
+        assert chunk.dropped == 2
+        assert buffer.read(4, limit=3).text == "efg"
+
+    def test_wait_for_new_output(self):
+        """Waits match output appended later, including across appends."""
+        buffer = ConsoleBuffer()
+        buffer.append("Press <DEL> from the last boot\n")
+
+        def writer():
+            time.sleep(0.05)
+            buffer.append("Version 2.20 ... Pre")
+            buffer.append("ss <DEL> to enter setup\n")
+
+        threading.Thread(target=writer).start()
+        match = buffer.wait_for(POST_COMPLETE_PATTERN, timeout=5)
+
+        assert match is not None
+        assert match.group(1) == "DEL"
+        assert buffer.wait_for("never", timeout=0.01) is None
+
+    def test_wait_ends_when_closed(self):
+        """A stopped capture wakes waiters without a match."""
+        buffer = ConsoleBuffer()
+        threading.Timer(0.05, buffer.close).start()
+
+        started = time.monotonic()
+        assert buffer.wait_for("login:", timeout=5) is None
+        assert time.monotonic() - started < 4
+
+
+class TestSOLCapture:
+    """Test reading SOL sessions."""
+
+    def test_output_is_cleaned_and_reconnected(self):
+        """Escape sequences are stripped and a dropped session is reopened."""
+        transport = FakeTransport()
+        buffer = ConsoleBuffer()
+        capture = SOLCapture(
+            "srv1",
+            CREDENTIALS,
+            buffer,
+            transport=transport,
+            reconnect_delay=0.01,
+            popen=_popen(
+                [b"\x1b[2J\x1b[1;1HBIOS\r\n\x1b[0", b"m\xe2\x94"], [b"POST\r\n"]
+            ),
+        )
+
+        capture.start()
+        assert buffer.wait_for("POST", timeout=5, since=0)
+        capture.stop()
+
+        assert buffer.read(0).text == "BIOS\n\ufffdPOST\n"
+        assert capture.sessions >= 2
+        assert "sol deactivate" in transport.commands
+        assert buffer.closed
+
+
+class TestSOLConsoleService:
+    """Test subscriptions and backpressure."""
+
+    def test_slow_subscriber_skips_old_output(self):
+        """A busy subscriber receives coalesced output and a drop count."""
+        service = SOLConsoleService(
+            transport=FakeTransport(), buffer_size=16, flush_interval=0.01
+        )
+        buffer = service.get_buffer("srv1", create=True)
+        release = threading.Event()
+        chunks = []
+
+        def sink(server_id, chunk):
+            chunks.append(chunk)
+            release.wait(5)
+
+        service.subscribe("srv1", sink)
+        buffer.append("first\n")
+        deadline = time.monotonic() + 5
+        while not chunks and time.monotonic() < deadline:
+            time.sleep(0.01)
+        for n in range(10):
+            buffer.append(f"line {n}\n")
+        release.set()
+        while len(chunks) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        service.shutdown()
+
+        assert chunks[0].text == "first\n"
+        assert chunks[1].dropped > 0
+        assert chunks[1].text.endswith("line 9\n")
+
+    def test_log_stream_manager_streams_console(self):
+        """WebSocket clients get the backlog and share one subscription."""
+        service = SOLConsoleService(transport=FakeTransport(), flush_interval=0.01)
+        service.get_buffer("srv1", create=True).append("backlog\n")
+        socketio = Mock()
+        manager = LogStreamManager(socketio, console_service=service)
+        manager.connections = {
+            c: {"session_id": c, "connected_at": 0, "rooms": set()} for c in ("a", "b")
+        }
+        manager.join_room = (
+            lambda client, room: manager.rooms.setdefault(room, set()).add(client)
+            or True
+        )
+
+        manager.subscribe_console("a", "srv1")
+        manager.subscribe_console("b", "srv1")
+        service.get_buffer("srv1").append("live\n")
+        deadline = time.monotonic() + 5
+        while socketio.emit.call_count < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        payloads = [call.args[1]["chunk"]["text"] for call in socketio.emit.mock_calls]
+        assert payloads == ["backlog\n", "backlog\n", "live\n"]
+        assert len(service._subscriptions) == 1
+
+        manager.rooms["console_srv1"].clear()
+        manager.leave_room("a", "console_srv1")
+        assert service._subscriptions == []
+        service.shutdown()
@@ -0,0 +1,124 @@
+"""Tests for the IPMI address allocator."""
+
+import threading
+from datetime import timedelta
+
+import pytest
+
+from hwautomation.database.helper import DbHelper
+from hwautomation.hardware.ipmi import (
+    AddressPoolExhaustedError,
+    IPMIAddressAllocator,
+    IPMIConfigurationError,
+)
+from hwautomation.hardware.ipmi.ipam import FreeBitmap
+
+
+@pytest.fixture
+def db(tmp_path):
+    return DbHelper(str(tmp_path / "ipam.db"))
+
+
+def _allocator(db, start="10.0.0.10", end="10.0.0.19", **kwargs):
+    kwargs.setdefault("liveness_check", None)
+    return IPMIAddressAllocator(db, start, end, **kwargs)
+
+
+class TestFreeBitmap:
+    """Test lowest-free lookups."""
+
+    def test_next_free(self):
+        """The lowest clear bit is returned and reused after clearing."""
+        bitmap = FreeBitmap(4)
+        for index in (0, 1, 3):
+            bitmap.mark(index)
+
+        assert bitmap.next_free() == 2
+        bitmap.mark(2)
+        assert bitmap.next_free() is None
+        bitmap.clear(1)
+        assert bitmap.next_free() == 1
+        assert bitmap.free_count == 1
+
+
+class TestIPMIAddressAllocator:
+    """Test leasing, liveness and concurrency."""
+
+    def test_allocates_lowest_free_and_skips_recorded(self, db):
+        """Addresses already recorded on servers are not handed out."""
+        db.sql_db_worker.execute(
+            "INSERT INTO servers (server_id, ipmi_address) VALUES ('old', '10.0.0.10')"
+        )
+        db.sql_db_worker.commit()
+        allocator = _allocator(db)
+
+        leases = allocator.allocate_batch(["a", "b"])
+
+        assert leases["a"].ip_address == "10.0.0.11"
+        assert leases["b"].ip_address == "10.0.0.12"
+        assert leases["a"].state == "committed"
+        assert allocator.free_count == 7
+
+    def test_allocation_is_idempotent(self, db):
+        """A server keeps its lease across calls."""
+        allocator = _allocator(db)
+
+        first = allocator.allocate("a")
+
+        assert allocator.allocate("a").ip_address == first.ip_address
+        assert allocator.get_lease("a").ip_address == first.ip_address
+
+    def test_live_addresses_are_skipped(self, db):
+        """Addresses answering the liveness check are replaced."""
+        live = {"10.0.0.10", "10.0.0.12"}
+        allocator = _allocator(db, liveness_check=live.__contains__)
+        leases = allocator.allocate_batch(["a", "b"])
+
+        assert {lease.ip_address for lease in leases.values()} == {
+            "10.0.0.11",
+            "10.0.0.13",
+        }
+        assert allocator.allocate("c").ip_address == "10.0.0.14"
+
+    def test_batch_exhaustion_rolls_back(self, db):
+        """A batch that does not fit reserves nothing."""
+        allocator = _allocator(db, end="10.0.0.11")
+
+        with pytest.raises(AddressPoolExhaustedError):
+            allocator.allocate_batch(["a", "b", "c"])
+
+        assert allocator.free_count == 2
+
+    def test_release_and_expiry(self, db):
+        """Released and expired reservations return to the range."""
+        expiring = _allocator(db, reservation_ttl=timedelta(seconds=-1))
+        allocator = _allocator(db)
+
+        stale = expiring.reserve_batch(["a"])[0]
+        fresh = allocator.allocate("b")
+
+        assert fresh.ip_address == stale.ip_address
+        with pytest.raises(IPMIConfigurationError):
+            allocator.commit_batch([stale])
+        assert allocator.release(fresh)
+        assert allocator.free_count == 10
+
+    def test_concurrent_allocators_never_collide(self, tmp_path):
+        """Allocators on separate connections hand out distinct addresses."""
+        path = str(tmp_path / "shared.db")
+        DbHelper(path)
+        results = []
+
+        def worker(n):
+            allocator = _allocator(DbHelper(path), end="10.0.0.59")
+            for i in range(5):
+                results.append(allocator.allocate(f"s{n}-{i}").ip_address)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 30
+        assert len(set(results)) == 30
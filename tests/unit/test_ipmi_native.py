@@ -0,0 +1,446 @@
+"""Tests for the native RMCP+ IPMI transport against a simulated BMC."""
+
+import hashlib
+import hmac
+import os
+import socket
+import struct
+import subprocess
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from hwautomation.hardware.ipmi import IPMICredentials, PowerState
+from hwautomation.hardware.ipmi.operations.power import PowerManager
+from hwautomation.hardware.ipmi.operations.sensors import SensorManager
+from hwautomation.hardware.ipmi.rmcp import RmcpSessionPool
+from hwautomation.hardware.ipmi import transport as transport_module
+from hwautomation.hardware.ipmi.transport import (
+    IpmitoolTransport,
+    NativeIPMITransport,
+    get_default_transport,
+    parse_fru_inventory,
+)
+
+SUITES = {0x01: ("sha1", 12), 0x03: ("sha256", 16)}
+
+
+def _full_sensor_record(record_id, number, name, unc=80, ucr=90):
+    body = bytearray(48)
+    body[0:2] = struct.pack("<H", record_id)
+    body[2], body[3] = 0x51, 0x01
+    body[5], body[7] = 0x20, number
+    body[13] = 0x01  # threshold sensor
+    body[18] = 0x18  # UNC and UCR readable
+    body[20], body[21] = 0x00, 1  # unsigned, degrees C
+    body[24] = 1  # M = 1
+    body[37], body[38] = ucr, unc
+    body[47] = 0xC0 | len(name)
+    record = bytes(body) + name.encode()
+    return record[:4] + bytes([len(record) - 5]) + record[5:]
+
+
+def _compact_sensor_record(record_id, number, name):
+    body = bytearray(32)
+    body[0:2] = struct.pack("<H", record_id)
+    body[2], body[3] = 0x51, 0x02
+    body[5], body[7] = 0x20, number
+    body[31] = 0xC0 | len(name)
+    record = bytes(body) + name.encode()
+    return record[:4] + bytes([len(record) - 5]) + record[5:]
+
+
+def _fru_inventory(serial=b"\xc5SN123"):
+    fields = b"".join(bytes([0xC0 | len(v)]) + v for v in (b"Supermicro", b"X11DPT-B"))
+    fields += serial
+    board = bytes([0x01, 0, 0, 0x10, 0x27, 0x00]) + fields + b"\xc1"
+    board += b"\x00" * (-len(board) % 8)
+    board = board[:1] + bytes([len(board) // 8]) + board[2:]
+    return bytes([0x01, 0, 0, 1, 0, 0, 0, 0]) + board
+
+
+class FakeBMC:
+    """Minimal RMCP+ BMC speaking just enough IPMI for the transport."""
+
+    def __init__(self, username="ADMIN", password="secret", auth_algorithms=(1, 3)):
+        self.username = username.encode()
+        self.kuid = password.encode().ljust(20, b"\x00")
+        self.auth_algorithms = auth_algorithms
+        self.power_on = True
+        self.handshakes = 0
+        self.requests = []
+        self.sdr = [
+            _full_sensor_record(1, 0x10, "CPU Temp"),
+            _compact_sensor_record(2, 0x20, "PS1 Status"),
+        ]
+        self.fru = _fru_inventory()
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.port = self.sock.getsockname()[1]
+        self.session = {}
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.sock.close()
+
+    def _hmac(self, key, data):
+        return hmac.new(key, data, self.session["digest"]).digest()
+
+    def _serve(self):
+        while True:
+            try:
+                data, addr = self.sock.recvfrom(65536)
+            except OSError:
+                return
+            response = self._handle(data)
+            if response:
+                try:
+                    self.sock.sendto(response, addr)
+                except OSError:
+                    return
+
+    def _setup_packet(self, payload_type, payload):
+        return (
+            b"\x06\x00\xff\x07"
+            + bytes([0x06, payload_type])
+            + struct.pack("<IIH", 0, 0, len(payload))
+            + payload
+        )
+
+    def _handle(self, data):
+        payload_type = data[5] & 0x3F
+        length = struct.unpack("<H", data[14:16])[0]
+        payload = data[16 : 16 + length]
+        s = self.session
+
+        if payload_type == 0x10:
+            tag, remote_sid, auth = payload[0], payload[4:8], payload[12]
+            if auth not in self.auth_algorithms:
+                return self._setup_packet(
+                    0x11, bytes([tag, 0x11, 0, 0]) + remote_sid + bytes(4)
+                )
+            digest, length = SUITES[auth]
+            s.clear()
+            s.update(
+                remote_sid=remote_sid,
+                managed_sid=os.urandom(4),
+                digest=getattr(hashlib, digest),
+                icv=length,
+            )
+            return self._setup_packet(
+                0x11,
+                bytes([tag, 0, 4, 0]) + remote_sid + s["managed_sid"] + payload[8:],
+            )
+
+        if payload_type == 0x12:
+            tag, rm, role = payload[0], payload[8:24], payload[24]
+            uname = payload[28 : 28 + payload[27]]
+            if uname != self.username:
+                return self._setup_packet(
+                    0x13, bytes([tag, 0x0D, 0, 0]) + s["remote_sid"]
+                )
+            rc, guid = os.urandom(16), os.urandom(16)
+            user_block = bytes([role, len(uname)]) + uname
+            s.update(rm=rm, rc=rc, guid=guid, user_block=user_block)
+            auth = self._hmac(
+                self.kuid,
+                s["remote_sid"] + s["managed_sid"] + rm + rc + guid + user_block,
+            )
+            return self._setup_packet(
+                0x13, bytes([tag, 0, 0, 0]) + s["remote_sid"] + rc + guid + auth
+            )
+
+        if payload_type == 0x14:
+            expected = self._hmac(
+                self.kuid, s["rc"] + s["remote_sid"] + s["user_block"]
+            )
+            if payload[8:] != expected:
+                return self._setup_packet(
+                    0x15, bytes([payload[0], 0x0F, 0, 0]) + s["remote_sid"]
+                )
+            sik = self._hmac(self.kuid, s["rm"] + s["rc"] + s["user_block"])
+            s["k1"] = self._hmac(sik, b"\x01" * 20)
+            s["k2"] = self._hmac(sik, b"\x02" * 20)
+            self.handshakes += 1
+            icv = self._hmac(sik, s["rm"] + s["managed_sid"] + s["guid"])
+            return self._setup_packet(
+                0x15,
+                bytes([payload[0], 0, 0, 0]) + s["remote_sid"] + icv[: s["icv"]],
+            )
+
+        if payload_type == 0x00 and data[5] & 0xC0 == 0xC0 and "k1" in s:
+            signed, auth_code = data[4 : -s["icv"]], data[-s["icv"] :]
+            if self._hmac(s["k1"], signed)[: s["icv"]] != auth_code:
+                return None
+            decryptor = Cipher(
+                algorithms.AES(s["k2"][:16]), modes.CBC(payload[:16])
+            ).decryptor()
+            plain = decryptor.update(payload[16:]) + decryptor.finalize()
+            message = plain[: -plain[-1] - 1]
+            netfn, rq_seq, cmd = message[1] >> 2, message[4], message[5]
+            cc, body = self._command(netfn, cmd, message[6:-1])
+            response = self._session_packet(netfn, rq_seq, cmd, bytes([cc]) + body)
+            if (netfn, cmd) == (0x06, 0x3C):
+                s.pop("k1")
+            return response
+        return None
+
+    def _session_packet(self, netfn, rq_seq, cmd, data):
+        s = self.session
+        message = (
+            bytes([0x81, (netfn | 1) << 2, (-(0x81 + ((netfn | 1) << 2))) & 0xFF])
+            + bytes([0x20, rq_seq, cmd])
+            + data
+        )
+        message += bytes([(-sum(message[3:])) & 0xFF])
+        iv = os.urandom(16)
+        pad = (15 - len(message) % 16) % 16
+        plain = message + bytes(range(1, pad + 1)) + bytes([pad])
+        encryptor = Cipher(algorithms.AES(s["k2"][:16]), modes.CBC(iv)).encryptor()
+        payload = iv + encryptor.update(plain) + encryptor.finalize()
+        signed = (
+            bytes([0x06, 0xC0])
+            + s["remote_sid"]
+            + struct.pack("<IH", 1, len(payload))
+            + payload
+        )
+        ipad = (4 - (len(signed) + 2) % 4) % 4
+        signed += b"\xff" * ipad + bytes([ipad, 7])
+        return b"\x06\x00\xff\x07" + signed + self._hmac(s["k1"], signed)[: s["icv"]]
+
+    def _command(self, netfn, cmd, data):
+        self.requests.append((netfn, cmd))
+        if (netfn, cmd) == (0x06, 0x3B):
+            return 0, bytes([data[0]])
+        if (netfn, cmd) == (0x06, 0x3C):
+            return 0, b""
+        if (netfn, cmd) == (0x00, 0x01):
+            return 0, bytes([0x01 if self.power_on else 0x00, 0, 0])
+        if (netfn, cmd) == (0x00, 0x02):
+            self.power_on = data[0] in (0x01, 0x02, 0x03)
+            return 0, b""
+        if (netfn, cmd) == (0x06, 0x01):
+            return 0, bytes([0x20, 0x01, 0x01, 0x73, 0x02, 0xBF]) + bytes(
+                [0x7C, 0x2A, 0x00, 0x17, 0x09]
+            )
+        if (netfn, cmd) == (0x0A, 0x20):
+            return 0, bytes([0x51, 2, 0, 0, 0]) + bytes(8) + b"\x00"
+        if (netfn, cmd) == (0x0A, 0x22):
+            return 0, b"\x01\x00"
+        if (netfn, cmd) == (0x0A, 0x23):
+            record_id, offset, count = struct.unpack("<HBB", data[2:6])
+            index = (
+                0
+                if record_id == 0
+                else next(
+                    i
+                    for i, r in enumerate(self.sdr)
+                    if struct.unpack("<H", r[:2])[0] == record_id
+                )
+            )
+            record = self.sdr[index]
+            next_id = (
+                struct.unpack("<H", self.sdr[index + 1][:2])[0]
+                if index + 1 < len(self.sdr)
+                else 0xFFFF
+            )
+            return 0, struct.pack("<H", next_id) + record[offset : offset + count]
+        if (netfn, cmd) == (0x04, 0x2D):
+            if data[0] == 0x10:
+                return 0, bytes([45, 0xC0, 0x00])
+            return 0, bytes([0x00, 0xC0, 0x01, 0x00])
+        if (netfn, cmd) == (0x0A, 0x10):
+            return 0, struct.pack("<HB", len(self.fru), 0)
+        if (netfn, cmd) == (0x0A, 0x11):
+            offset, count = struct.unpack("<HB", data[1:4])
+            chunk = self.fru[offset : offset + count]
+            return 0, bytes([len(chunk)]) + chunk
+        if (netfn, cmd) == (0x06, 0x47):
+            return 0, b""
+        return 0xC1, b""
+
+
+@pytest.fixture
+def bmc():
+    server = FakeBMC()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def pool():
+    session_pool = RmcpSessionPool(timeout=0.5, retries=2)
+    yield session_pool
+    session_pool.close_all()
+
+
+def _credentials(bmc, password="secret"):
+    return IPMICredentials(
+        ip_address="127.0.0.1", username="ADMIN", password=password, port=bmc.port
+    )
+
+
+class TestNativeTransport:
+    """Test native RMCP+ commands rendered as ipmitool output."""
+
+    def test_session_is_reused_across_calls(self, bmc, pool):
+        transport = NativeIPMITransport(pool=pool, fallback=Mock())
+        credentials = _credentials(bmc)
+
+        for _ in range(3):
+            result = transport.execute(credentials, "power status")
+            assert result.returncode == 0
+            assert result.stdout == "Chassis Power is on\n"
+
+        assert bmc.handshakes == 1
+        assert bmc.requests.count((0x00, 0x01)) == 3
+
+    def test_falls_back_to_sha1_cipher_suite(self, pool):
+        server = FakeBMC(auth_algorithms=(1,))
+        try:
+            transport = NativeIPMITransport(pool=pool, fallback=Mock())
+            result = transport.execute(_credentials(server), "mc info")
+        finally:
+            server.close()
+
+        assert result.returncode == 0
+        assert "Manufacturer Name         : Supermicro" in result.stdout
+        assert "Firmware Revision         : 1.73" in result.stdout
+
+    def test_session_failure_uses_fallback(self, bmc, pool):
+        fallback = Mock()
+        fallback.execute.return_value = subprocess.CompletedProcess(
+            [], 1, "", "Error: Unable to establish IPMI v2 / RMCP+ session\n"
+        )
+        transport = NativeIPMITransport(pool=pool, fallback=fallback)
+
+        result = transport.execute(_credentials(bmc, password="wrong"), "power status")
+
+        assert result.returncode == 1
+        assert fallback.execute.call_args[0][1] == ["power", "status"]
+        assert 0 < fallback.execute.call_args[0][2] <= 30
+
+    def test_timeout_bounds_native_command(self, pool):
+        silent = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        silent.bind(("127.0.0.1", 0))
+        credentials = IPMICredentials(
+            ip_address="127.0.0.1",
+            username="ADMIN",
+            password="secret",
+            port=silent.getsockname()[1],
+        )
+        transport = NativeIPMITransport(pool=pool, fallback=Mock())
+        started = time.monotonic()
+        try:
+            with pytest.raises(subprocess.TimeoutExpired):
+                transport.execute(credentials, "power status", timeout=0.3)
+        finally:
+            silent.close()
+
+        assert time.monotonic() - started < 1.0
+        transport.fallback.execute.assert_not_called()
+
+    def test_unhandled_commands_use_fallback(self, bmc, pool):
+        fallback = Mock()
+        fallback.execute.return_value = subprocess.CompletedProcess([], 0, "ok", "")
+        transport = NativeIPMITransport(pool=pool, fallback=fallback)
+
+        result = transport.execute(_credentials(bmc), "lan print 1")
+
+        assert result.stdout == "ok"
+        assert bmc.handshakes == 0
+
+    def test_raw_and_user_password(self, bmc, pool):
+        transport = NativeIPMITransport(pool=pool, fallback=Mock())
+        credentials = _credentials(bmc)
+
+        result = transport.execute(credentials, "raw 0x30 0x70 0x0c 0x01 0x01")
+        assert result.returncode == 1
+        assert "rsp=0xc1" in result.stderr
+
+        result = transport.execute(credentials, "user set password 2 NewPassw0rd")
+        assert result.returncode == 0
+        assert "successful (user 2)" in result.stdout
+
+
+class TestOperationsOverNativeTransport:
+    """Test PowerManager and SensorManager parse native output."""
+
+    def test_power_cycle(self, bmc, pool):
+        transport = NativeIPMITransport(pool=pool, fallback=Mock())
+        power = PowerManager(transport=transport)
+        credentials = _credentials(bmc)
+
+        assert power.set_power_state(credentials, PowerState.OFF)
+        assert power.get_power_status(credentials).state == "off"
+        assert bmc.handshakes == 1
+
+    def test_sensor_list(self, bmc, pool):
+        transport = NativeIPMITransport(pool=pool, fallback=Mock())
+        sensors = {
+            s.name: s
+            for s in SensorManager(transport=transport).get_sensor_data(
+                _credentials(bmc)
+            )
+        }
+
+        assert sensors["CPU Temp"].value == "45.000"
+        assert sensors["CPU Temp"].unit == "degrees C"
+        assert sensors["CPU Temp"].status == "ok"
+        assert sensors["PS1 Status"].unit == "discrete"
+
+    def test_sdr_is_read_once(self, bmc, pool):
+        transport = NativeIPMITransport(pool=pool, fallback=Mock())
+        credentials = _credentials(bmc)
+
+        transport.execute(credentials, "sensor list")
+        reads = bmc.requests.count((0x0A, 0x23))
+        transport.execute(credentials, "sensor list")
+
+        assert bmc.requests.count((0x0A, 0x23)) == reads
+
+    def test_fru_print(self, bmc, pool):
+        transport = NativeIPMITransport(pool=pool, fallback=Mock())
+        result = transport.execute(_credentials(bmc), "fru list")
+
+        assert " Board Mfg             : Supermicro" in result.stdout
+        assert " Board Serial          : SN123" in result.stdout
+
+
+class TestTransportHelpers:
+    """Test ipmitool argument building and FRU decoding."""
+
+    def test_ipmitool_args(self):
+        credentials = IPMICredentials(ip_address="10.0.0.1", password="pw")
+        args = IpmitoolTransport().build_args(credentials, "power status")
+        assert args == [
+            "ipmitool",
+            "-I",
+            "lanplus",
+            "-H",
+            "10.0.0.1",
+            "-U",
+            "ADMIN",
+            "-P",
+            "pw",
+            "power",
+            "status",
+        ]
+
+    def test_fru_decoding(self):
+        fields = parse_fru_inventory(_fru_inventory())
+        assert fields["Board Product"] == "X11DPT-B"
+        assert fields["Board Serial"] == "SN123"
+        assert "Board Mfg Date" in fields
+
+    def test_fru_bcd_plus_high_nibble_first(self):
+        fields = parse_fru_inventory(_fru_inventory(serial=b"\x43\x12\x34\x5b"))
+        assert fields["Board Serial"] == "12345-"
+
+    def test_ipmitool_is_default_transport(self, monkeypatch):
+        monkeypatch.setattr(transport_module, "_default_transport", None)
+        assert isinstance(get_default_transport(), IpmitoolTransport)
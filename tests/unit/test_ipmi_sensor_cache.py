@@ -0,0 +1,124 @@
+"""Tests for the IPMI sensor snapshot cache."""
+
+import subprocess
+import time
+from unittest.mock import Mock
+
+from hwautomation.hardware.ipmi import IPMICredentials, IpmitoolTransport
+from hwautomation.hardware.ipmi.operations.sensors import SensorManager
+
+SENSOR_LIST = """CPU Temp         | 45.000     | degrees C  | ok    | na | 90.000
+FAN1             | 5400.000   | RPM        | ok    | 300.000 | na
+PSU1 Temp        | 92.000     | degrees C  | cr    | na | 90.000
+"""
+
+
+def _completed(stdout="", returncode=0):
+    return subprocess.CompletedProcess([], returncode, stdout=stdout, stderr="")
+
+
+class TestSensorSnapshotCache:
+    """Test that sensor views share one snapshot per BMC."""
+
+    def setup_method(self):
+        self.credentials = IPMICredentials(
+            ip_address="10.0.0.5", username="ADMIN", password="pw"
+        )
+        self.transport = Mock()
+        self.transport.execute.return_value = _completed(SENSOR_LIST)
+
+    def test_filtered_views_share_one_fetch(self):
+        """All sensor queries within the TTL are served by one sensor list."""
+        manager = SensorManager(transport=self.transport, cache_ttl=30)
+
+        assert manager.get_sensor_by_name(self.credentials, "cpu temp").value == (
+            "45.000"
+        )
+        assert len(manager.get_temperature_sensors(self.credentials)) == 2
+        assert [s.name for s in manager.get_fan_sensors(self.credentials)] == ["FAN1"]
+        manager.check_sensor_thresholds(self.credentials)
+
+        assert self.transport.execute.call_count == 1
+
+    def test_snapshot_expires(self):
+        """A snapshot older than the TTL triggers a new read."""
+        manager = SensorManager(transport=self.transport, cache_ttl=0.05)
+
+        manager.get_sensor_data(self.credentials)
+        time.sleep(0.06)
+        manager.get_sensor_data(self.credentials)
+
+        assert self.transport.execute.call_count == 2
+
+    def test_max_age_and_invalidate(self):
+        """max_age=0 forces a read and invalidate_cache drops the snapshot."""
+        manager = SensorManager(transport=self.transport, cache_ttl=30)
+
+        manager.get_sensor_data(self.credentials)
+        manager.get_sensor_data(self.credentials, max_age=0)
+        manager.invalidate_cache(self.credentials)
+        manager.get_sensor_data(self.credentials)
+
+        assert self.transport.execute.call_count == 3
+
+    def test_snapshots_are_per_bmc(self):
+        """Different BMCs are cached independently."""
+        manager = SensorManager(transport=self.transport, cache_ttl=30)
+        other = IPMICredentials(ip_address="10.0.0.6", username="ADMIN", password="pw")
+
+        manager.get_sensor_data(self.credentials)
+        manager.get_sensor_data(other)
+
+        assert self.transport.execute.call_count == 2
+
+
+class TestSdrDumpCache:
+    """Test the ipmitool SDR dump cache mode."""
+
+    def setup_method(self):
+        self.credentials = IPMICredentials(
+            ip_address="10.0.0.5", username="ADMIN", password="pw"
+        )
+
+    def _transport(self, list_returncodes):
+        transport = IpmitoolTransport()
+        codes = iter(list_returncodes)
+
+        def execute(credentials, command, timeout=30, additional_args=None):
+            if isinstance(command, list) and command[:2] == ["sdr", "dump"]:
+                with open(command[2], "wb") as f:
+                    f.write(b"\x00")
+                return _completed()
+            return _completed(SENSOR_LIST, next(codes))
+
+        transport.execute = Mock(side_effect=execute)
+        return transport
+
+    def test_sensor_list_uses_sdr_dump(self, tmp_path):
+        """The SDR repository is dumped once and reused with -S."""
+        transport = self._transport([0, 0])
+        manager = SensorManager(
+            transport=transport, cache_ttl=0, sdr_cache_dir=str(tmp_path)
+        )
+
+        manager.get_sensor_data(self.credentials)
+        manager.get_sensor_data(self.credentials)
+
+        dump_path = str(tmp_path / "10.0.0.5_623.sdr")
+        commands = [c.args[1] for c in transport.execute.call_args_list]
+        assert commands.count(["sdr", "dump", dump_path]) == 1
+        last = transport.execute.call_args_list[-1]
+        assert last.kwargs["additional_args"] == ["-S", dump_path]
+
+    def test_stale_sdr_dump_is_discarded(self, tmp_path):
+        """A failing read with a dump retries without it and removes the file."""
+        transport = self._transport([1, 0])
+        manager = SensorManager(
+            transport=transport, cache_ttl=0, sdr_cache_dir=str(tmp_path)
+        )
+
+        sensors = manager.get_sensor_data(self.credentials)
+
+        assert len(sensors) == 3
+        assert transport.execute.call_args_list[-1].kwargs["additional_args"] is None
+        assert not (tmp_path / "10.0.0.5_623.sdr").exists()
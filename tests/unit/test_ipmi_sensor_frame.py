@@ -0,0 +1,109 @@
+"""Tests for column-oriented sensor parsing and threshold evaluation."""
+
+import math
+import subprocess
+from unittest.mock import Mock
+
+from hwautomation.hardware.ipmi import IPMICredentials
+from hwautomation.hardware.ipmi.operations import SensorFrame, SensorManager
+from hwautomation.hardware.ipmi.operations.sensor_frame import (
+    SEVERITY_CRITICAL,
+    SEVERITY_OK,
+    SEVERITY_WARNING,
+)
+
+# ipmitool columns: name | value | unit | status | LNR | LCR | LNC | UNC | UCR | UNR
+SENSOR_LIST = """\
+CPU Temp         | 45.000     | degrees C  | ok    | na | 0.000 | 5.000 | 80.000 | 90.000 | 95.000
+DIMM Temp        | 82.000     | degrees C  | ok    | na | na    | na    | 80.000 | 90.000 | na
+PCH Temp         | 91.000     | degrees C  | ok    | na | na    | na    | 80.000 | 90.000 | na
+FAN1             | 300.000    | RPM        | ok    | na | 400.000 | 500.000 | na | na  | na
+PS1 Status       | 0x1        | discrete   | 0x0100| na | na    | na    | na     | na     | na
+Inlet Temp       | na         | degrees C  | na    | na | na    | na    | na     | na     | na
+"""
+
+
+class TestSensorFrame:
+    """Test parsing into typed columns."""
+
+    def test_parse_typed_columns(self):
+        """Values and thresholds become floats, missing data becomes NaN."""
+        frame = SensorFrame.parse(SENSOR_LIST, host="bmc1")
+
+        assert len(frame) == 6
+        assert frame.names[0] == "CPU Temp"
+        assert frame.values[0] == 45.0
+        assert frame.upper_warning[0] == 80.0
+        assert frame.upper_critical[0] == 90.0
+        assert frame.lower_critical[0] == 0.0
+        assert math.isnan(frame.values[4]) and frame.units[4] == "discrete"
+        assert math.isnan(frame.values[5]) and frame.statuses[5] is None
+        assert frame.hosts == ["bmc1"]
+
+    def test_short_format(self):
+        """Six-column output keeps the legacy lower/upper columns."""
+        frame = SensorFrame.parse("Fan2 | 1200 | RPM | cr | 500 | 2000\n")
+
+        assert frame.lower_critical[0] == 500.0
+        assert frame.upper_critical[0] == 2000.0
+        assert frame.status_severity[0] == SEVERITY_CRITICAL
+
+    def test_evaluate_thresholds(self):
+        """Numeric thresholds and BMC status are evaluated for every row."""
+        severities = SensorFrame.parse(SENSOR_LIST).evaluate_thresholds()
+
+        assert list(severities) == [
+            SEVERITY_OK,
+            SEVERITY_WARNING,
+            SEVERITY_CRITICAL,
+            SEVERITY_CRITICAL,
+            SEVERITY_OK,
+            SEVERITY_OK,
+        ]
+
+    def test_concat_many_hosts(self):
+        """Frames from many BMCs evaluate together and keep their host."""
+        frames = [SensorFrame.parse(SENSOR_LIST, host=f"bmc{i}") for i in range(3)]
+        fleet = SensorFrame.concat(frames)
+
+        alerts = fleet.alerts(min_severity=SEVERITY_CRITICAL)
+
+        assert len(fleet) == 18
+        assert len(fleet.hosts) == 3
+        assert [(a[0], a[1]) for a in alerts[:2]] == [
+            ("bmc0", "PCH Temp"),
+            ("bmc0", "FAN1"),
+        ]
+        assert len(alerts) == 6
+        assert len(fleet.host_rows("bmc2")) == 6
+
+    def test_to_readings(self):
+        """Rows convert back to SensorReading objects."""
+        readings = SensorFrame.parse(SENSOR_LIST, host="bmc1").to_readings("bmc1")
+
+        assert readings[0].value == "45.000"
+        assert readings[0].upper_threshold == "90.000"
+        assert readings[5].value is None
+
+
+class TestSensorManagerFrame:
+    """Test SensorManager integration."""
+
+    def test_frame_and_thresholds_share_snapshot(self):
+        """The frame view uses the same snapshot as get_sensor_data."""
+        transport = Mock()
+        transport.execute.return_value = subprocess.CompletedProcess(
+            [], 0, stdout=SENSOR_LIST, stderr=""
+        )
+        manager = SensorManager(transport=transport, cache_ttl=30)
+        credentials = IPMICredentials(ip_address="10.0.0.5", username="u", password="p")
+
+        assert len(manager.get_sensor_data(credentials)) == 6
+        assert manager.get_sensor_frame(credentials).hosts == ["10.0.0.5"]
+        result = manager.check_sensor_thresholds(credentials)
+
+        assert result == {
+            "warnings": ["DIMM Temp"],
+            "critical": ["PCH Temp", "FAN1"],
+        }
+        assert transport.execute.call_count == 1
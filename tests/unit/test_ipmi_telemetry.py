@@ -0,0 +1,220 @@
+"""Tests for fleet sensor telemetry collection and storage."""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from hwautomation.database.helper import DbHelper
+from hwautomation.hardware.ipmi import (
+    IPMICredentials,
+    SensorReading,
+    SensorTelemetryCollector,
+    SensorTelemetryStore,
+)
+from hwautomation.hardware.ipmi.operations.bulk import BulkIPMIExecutor
+from hwautomation.hardware.ipmi.operations.sensors import SensorManager
+from hwautomation.hardware.ipmi.telemetry import SensorSeries, targets_from_database
+
+
+def _reading(name, value, status="ok", upper=None, unit="degrees C"):
+    return SensorReading(
+        name=name, value=value, unit=unit, status=status, upper_threshold=upper
+    )
+
+
+class TestSensorSeries:
+    """Test the ring buffer and rollups."""
+
+    def test_ring_buffer_keeps_newest_samples(self):
+        """Old samples are overwritten once capacity is reached."""
+        series = SensorSeries(capacity=3, rollups=())
+        for ts in range(5):
+            series.append(float(ts), float(ts * 10))
+
+        assert len(series) == 3
+        assert [p.value for p in series.points()] == [20.0, 30.0, 40.0]
+        assert series.latest().timestamp == 4.0
+        assert [p.timestamp for p in series.points(start=3)] == [3.0, 4.0]
+
+    def test_rollups_downsample(self):
+        """Samples are aggregated into min/max/mean buckets."""
+        series = SensorSeries(capacity=10, rollups=((60, 4),))
+        for ts, value in [(0, 40), (30, 50), (60, 45), (119, 55), (120, 60)]:
+            series.append(float(ts), float(value))
+
+        buckets = series.points(resolution=60)
+
+        assert [b.timestamp for b in buckets] == [0.0, 60.0, 120.0]
+        assert buckets[0].value == 45.0
+        assert (buckets[1].minimum, buckets[1].maximum) == (45.0, 55.0)
+        assert buckets[1].count == 2
+
+
+class TestSensorTelemetryStore:
+    """Test the store query API."""
+
+    def test_record_and_query(self):
+        """Numeric readings become series; discrete ones only update latest."""
+        store = SensorTelemetryStore(capacity=10)
+        stored = store.record(
+            "10.0.0.1",
+            [_reading("CPU Temp", "45.0"), _reading("PS1 Status", None, "0x01")],
+            timestamp=100.0,
+        )
+
+        assert stored == 1
+        assert store.hosts() == ["10.0.0.1"]
+        assert store.sensors("10.0.0.1") == ["CPU Temp", "PS1 Status"]
+        assert store.query("10.0.0.1", "CPU Temp")[0].value == 45.0
+        assert store.query("10.0.0.1", "PS1 Status") == []
+        assert store.last_updated("10.0.0.1") == 100.0
+
+    def test_fleet_trend(self):
+        """Matching sensors are aggregated across hosts per bucket."""
+        store = SensorTelemetryStore()
+        store.record("a", [_reading("CPU Temp", "40")], timestamp=0.0)
+        store.record("b", [_reading("CPU Temp", "60")], timestamp=10.0)
+        store.record("b", [_reading("FAN1", "5000", unit="RPM")], timestamp=10.0)
+
+        trend = store.fleet_trend("temp", resolution=60)
+
+        assert len(trend) == 1
+        assert trend[0].value == 50.0
+        assert (trend[0].minimum, trend[0].maximum) == (40.0, 60.0)
+
+    def test_rejects_non_positive_resolution(self):
+        """A zero or negative bucket size is a caller error."""
+        store = SensorTelemetryStore()
+        store.record("a", [_reading("CPU Temp", "40")], timestamp=0.0)
+
+        with pytest.raises(ValueError):
+            store.fleet_trend("temp", resolution=0)
+        with pytest.raises(ValueError):
+            store.query("a", "CPU Temp", resolution=-60)
+
+    def test_fleet_route_rejects_zero_resolution(self, monkeypatch):
+        """The fleet trend route answers a zero resolution with a 400."""
+        from flask import Flask
+
+        from hwautomation.web.routes import telemetry as routes
+
+        monkeypatch.setattr(routes, "telemetry_store", SensorTelemetryStore())
+        app = Flask(__name__)
+        app.register_blueprint(routes.telemetry_bp)
+
+        response = app.test_client().get("/api/telemetry/fleet?resolution=0")
+
+        assert response.status_code == 400
+        assert response.get_json()["success"] is False
+
+    def test_alerts(self):
+        """Non-nominal status and upper threshold breaches raise alerts."""
+        store = SensorTelemetryStore()
+        store.record(
+            "a",
+            [
+                _reading("CPU Temp", "95", upper="90"),
+                _reading("Inlet Temp", "30", status="nc"),
+                _reading("FAN1", "5000", unit="RPM"),
+            ],
+        )
+
+        alerts = [(a.sensor, a.severity) for a in store.alerts()]
+
+        assert alerts == [("CPU Temp", "critical"), ("Inlet Temp", "warning")]
+
+    def test_sensor_list_thresholds(self):
+        """Readings parsed from ten-column sensor list output use UCR."""
+        output = "\n".join(
+            [
+                "CPU Temp         | 38.000     | degrees C  | ok    | 0.000     "
+                "| 0.000     | 0.000     | 95.000    | 100.000   | 105.000",
+                "FAN1             | 3000.000   | RPM        | ok    | 300.000   "
+                "| 500.000   | 700.000   | 25300.000 | 25400.000 | 25500.000",
+                "12V              | 12.100     | Volts      | ok    | 10.173    "
+                "| 10.299    | 10.740    | 13.260    | 13.386    | 13.512",
+                "PS1 Status       | 0x1        | discrete   | 0x0100| na        "
+                "| na        | na        | na        | na        | na",
+                "System Temp      | 72.000     | degrees C  | ok    | na        "
+                "| na        | na        | 60.000    | 70.000    | 75.000",
+            ]
+        )
+        store = SensorTelemetryStore()
+        store.record("a", SensorManager()._parse_sensor_output(output))
+
+        alerts = [(a.sensor, a.severity, a.threshold) for a in store.alerts()]
+
+        assert alerts == [("System Temp", "critical", 70.0)]
+
+
+class TestSensorTelemetryCollector:
+    """Test polling and alert dispatch."""
+
+    def test_poll_once_records_and_reports_new_alerts(self):
+        """Each poll stores readings; only newly active alerts are reported."""
+        sensor_manager = Mock()
+        sensor_manager.get_sensor_data.side_effect = lambda creds, max_age: [
+            _reading("CPU Temp", "95" if creds.ip_address == "a" else "40", upper="90")
+        ]
+        callback = Mock()
+        collector = SensorTelemetryCollector(
+            targets=[
+                IPMICredentials(ip_address=ip, username="ADMIN", password="pw")
+                for ip in ("a", "b")
+            ],
+            sensor_manager=sensor_manager,
+            executor=BulkIPMIExecutor(max_workers=2),
+            alert_callback=callback,
+        )
+
+        results = collector.poll_once()
+        collector.poll_once()
+
+        assert sorted(results.succeeded) == ["a", "b"]
+        assert len(collector.store.query("a", "CPU Temp")) == 2
+        callback.assert_called_once()
+        assert [a.host for a in callback.call_args.args[0]] == ["a"]
+
+    def test_start_and_stop(self):
+        """The background thread polls until stopped."""
+        sensor_manager = Mock()
+        sensor_manager.get_sensor_data.return_value = [_reading("CPU Temp", "40")]
+        collector = SensorTelemetryCollector(
+            targets=lambda: [
+                IPMICredentials(ip_address="a", username="u", password="p")
+            ],
+            sensor_manager=sensor_manager,
+            interval=0.01,
+        )
+
+        collector.start()
+        try:
+            for _ in range(200):
+                if len(collector.store.query("a", "CPU Temp")) >= 2:
+                    break
+                time.sleep(0.01)
+        finally:
+            collector.stop(timeout=1)
+
+        assert not collector.running
+        assert len(collector.store.query("a", "CPU Temp")) >= 2
+
+    def test_targets_from_database(self, tmp_path):
+        """Targets come from working IPMI addresses in the servers table."""
+        db = DbHelper(str(tmp_path / "servers.db"))
+        try:
+            for server_id, ipmi, works in [
+                ("s1", "10.1.0.1", "TRUE"),
+                ("s2", "10.1.0.2", "FALSE"),
+            ]:
+                db.createrowforserver(server_id)
+                db.updateserverinfo(server_id, "ipmi_address", ipmi)
+                db.updateserverinfo(server_id, "ipmi_address_works", works)
+
+            targets = targets_from_database(db, "ADMIN", "pw")()
+
+            assert [t.ip_address for t in targets] == ["10.1.0.1"]
+            assert targets[0].username == "ADMIN"
+        finally:
+            db.close()
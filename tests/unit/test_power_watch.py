@@ -0,0 +1,201 @@
+"""Tests for the shared power-state watcher."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from hwautomation.hardware.ipmi import IPMICredentials, PowerState, PowerStatus
+from hwautomation.hardware.ipmi.operations.power import PowerManager
+from hwautomation.hardware.power_watch import PowerStateWatcher
+from hwautomation.hardware.redfish.base import (
+    PowerAction,
+    RedfishCredentials,
+    RedfishResponse,
+)
+from hwautomation.hardware.redfish.client.events import (
+    event_origin,
+    event_records,
+    iter_sse_events,
+)
+from hwautomation.hardware.redfish.operations.power import RedfishPowerOperation
+
+
+@pytest.fixture
+def watcher():
+    watcher = PowerStateWatcher(initial_interval=0.01, max_interval=0.05)
+    yield watcher
+    watcher.shutdown()
+
+
+def _sequence_probe(states):
+    """Probe returning states in order, repeating the last one."""
+    states = list(states)
+    calls = []
+
+    def probe():
+        calls.append(time.monotonic())
+        return states.pop(0) if len(states) > 1 else states[0]
+
+    probe.calls = calls
+    return probe
+
+
+class TestPowerStateWatcher:
+    """Test scheduling, backoff and early wake-up."""
+
+    def test_reaches_target(self, watcher):
+        """A wait finishes once the probe reports a target state."""
+        probe = _sequence_probe(["Off", "Off", "On"])
+
+        assert watcher.wait_for("bmc", probe, ["on"], timeout=2)
+        assert len(probe.calls) == 3
+
+    def test_timeout(self, watcher):
+        """A wait fails after its timeout."""
+        started = time.monotonic()
+
+        assert not watcher.wait_for("bmc", lambda: "off", ["on"], timeout=0.1)
+        assert time.monotonic() - started < 1
+
+    def test_backoff_while_state_unchanged(self):
+        """Probe intervals grow while the state does not change."""
+        watcher = PowerStateWatcher(initial_interval=0.01, max_interval=1, backoff=2)
+        probe = _sequence_probe(["off"])
+        try:
+            watcher.wait_for("bmc", probe, ["on"], timeout=0.2)
+        finally:
+            watcher.shutdown()
+
+        gaps = [b - a for a, b in zip(probe.calls, probe.calls[1:])]
+        assert 3 <= len(probe.calls) <= 6
+        assert gaps[-1] > gaps[0] * 2
+
+    def test_many_bmcs_share_scheduler(self, watcher):
+        """Waits for many BMCs run concurrently on one scheduler."""
+        watches = [
+            watcher.watch(f"bmc{i}", _sequence_probe(["off", "on"]), ["on"], 2)
+            for i in range(50)
+        ]
+
+        assert all(watch.wait(2) for watch in watches)
+        assert threading.active_count() < 50 + 40
+
+    def test_watches_share_probe(self, watcher):
+        """Watches on the same BMC share one probe schedule."""
+        probe = _sequence_probe(["off", "off", "on"])
+        first = watcher.watch("bmc", probe, ["on"], 2)
+        second = watcher.watch("bmc", probe, ["on", "off"], 2)
+
+        assert second.wait(2) and second.state == "off"
+        assert first.wait(2)
+        assert len(probe.calls) == 3
+
+    def test_notify_with_state(self):
+        """An event carrying the state finishes the wait without polling."""
+        watcher = PowerStateWatcher(initial_interval=5, max_interval=5)
+        try:
+            watch = watcher.watch("bmc", lambda: "off", ["on"], timeout=10)
+            time.sleep(0.05)
+            watcher.notify("bmc", "On")
+
+            assert watch.wait(1)
+        finally:
+            watcher.shutdown()
+
+    def test_notify_triggers_probe(self):
+        """An event without a state triggers an immediate probe."""
+        watcher = PowerStateWatcher(initial_interval=5, max_interval=5)
+        state = {"value": "off"}
+        try:
+            watch = watcher.watch("bmc", lambda: state["value"], ["on"], timeout=10)
+            time.sleep(0.05)
+            state["value"] = "on"
+            watcher.notify("bmc")
+
+            assert watch.wait(1)
+        finally:
+            watcher.shutdown()
+
+
+class TestPowerManagerWait:
+    """Test IPMI power waits through the watcher."""
+
+    def test_off_waits_for_off(self, watcher):
+        """An off action settles once the BMC reports off."""
+        manager = PowerManager(transport=Mock(), watcher=watcher)
+        manager.get_power_status = Mock(
+            side_effect=[PowerStatus("on", ""), PowerStatus("off", "")]
+        )
+        credentials = IPMICredentials(ip_address="10.0.0.1", username="u", password="p")
+
+        assert manager._wait_for_power_state(
+            credentials, PowerState.OFF, max_wait=2, check_interval=0.01
+        )
+
+    def test_reset_and_cycle_do_not_wait(self, watcher):
+        """Reset and cycle have no observable settled state to wait for."""
+        manager = PowerManager(transport=Mock(), watcher=watcher)
+        manager.get_power_status = Mock()
+        credentials = IPMICredentials(ip_address="10.0.0.1", username="u", password="p")
+
+        for state in (PowerState.RESET, PowerState.CYCLE):
+            assert manager._wait_for_power_state(credentials, state)
+        manager.get_power_status.assert_not_called()
+
+
+class TestRedfishPowerWait:
+    """Test Redfish power waits and server-sent events."""
+
+    def test_sse_parsing(self):
+        """SSE data lines are joined and parsed into event records."""
+        lines = [
+            ": keep-alive",
+            'data: {"Events": [{"MessageId": "ResourceEvent.1.0.ResourceChanged",',
+            'data: "OriginOfCondition": {"@odata.id": "/redfish/v1/Systems/1"}}]}',
+            "",
+            "data: not json",
+            "",
+        ]
+
+        payloads = list(iter_sse_events(lines))
+        records = event_records(payloads[0])
+
+        assert len(payloads) == 1
+        assert event_origin(records[0]) == "/redfish/v1/Systems/1"
+
+    def test_wait_uses_watcher(self, watcher):
+        """The Redfish wait polls through the watcher when SSE is unavailable."""
+        session = Mock()
+        session.get.side_effect = lambda uri: RedfishResponse(
+            success=True,
+            status_code=200,
+            data=(
+                {}
+                if uri.endswith("EventService")
+                else {"PowerState": ["Off", "On"][min(session.get.call_count, 3) // 3]}
+            ),
+        )
+        operation = RedfishPowerOperation(
+            RedfishCredentials(host="bmc", username="u", password="p"),
+            watcher=watcher,
+        )
+
+        assert operation._wait_for_power_state_change(
+            session, "/redfish/v1/Systems/1", PowerAction.ON, timeout=2
+        )
+
+    def test_restart_does_not_wait(self, watcher):
+        """A restart is On before and after, so it is not waited for."""
+        session = Mock()
+        operation = RedfishPowerOperation(
+            RedfishCredentials(host="bmc", username="u", password="p"),
+            watcher=watcher,
+        )
+
+        for action in (PowerAction.GRACEFUL_RESTART, PowerAction.FORCE_RESTART):
+            assert operation._wait_for_power_state_change(
+                session, "/redfish/v1/Systems/1", action, timeout=2
+            )
+        session.get.assert_not_called()
@@ -0,0 +1,180 @@
+"""Tests for the asyncio Redfish client and bulk reads."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+from hwautomation.hardware.redfish import (
+    AsyncRedfishClient,
+    PowerState,
+    RedfishCredentials,
+    RedfishOperation,
+    RedfishResponse,
+    bulk_power_state,
+)
+
+
+def _credentials(n):
+    return RedfishCredentials(host=f"10.0.0.{n}", username="u", password="p")
+
+
+class FakeSession:
+    """Pooled session recording concurrency per BMC."""
+
+    def __init__(self, host, tracker, delay):
+        self.host = host
+        self.tracker = tracker
+        self.delay = delay
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get(self, uri, **kwargs):
+        self.tracker.enter(self.host)
+        try:
+            time.sleep(self.delay)
+        finally:
+            self.tracker.leave(self.host)
+        return RedfishResponse(success=True, status_code=200, data={"uri": uri})
+
+
+class FakePool:
+    """Session pool handing out FakeSessions."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+        self.total = 0
+        self.peak_total = 0
+        self.starts = {}
+
+    def get(self, credentials):
+        return FakeSession(credentials.host, self, self.delay)
+
+    def enter(self, host):
+        with self.lock:
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+            self.total += 1
+            self.peak_total = max(self.peak_total, self.total)
+            self.starts.setdefault(host, []).append(time.monotonic())
+
+    def leave(self, host):
+        with self.lock:
+            self.active[host] -= 1
+            self.total -= 1
+
+
+class TestAsyncRedfishClient:
+    """Test request limits of the async client."""
+
+    def test_global_and_per_host_concurrency(self):
+        """In-flight requests respect the global and per-BMC limits."""
+        pool = FakePool()
+
+        async def sweep():
+            async with AsyncRedfishClient(
+                max_concurrency=6, per_host_concurrency=2, per_host_rate=None, pool=pool
+            ) as client:
+                sessions = [client.session(_credentials(n)) for n in range(10)]
+                return await asyncio.gather(
+                    *(
+                        s.get(f"/redfish/v1/Systems/{i}")
+                        for s in sessions
+                        for i in range(4)
+                    )
+                )
+
+        responses = asyncio.run(sweep())
+
+        assert len(responses) == 40 and all(r.success for r in responses)
+        assert 1 < pool.peak_total <= 6
+        assert max(pool.peak.values()) <= 2
+
+    def test_per_host_rate_limit(self):
+        """Requests to one BMC are spaced by the configured rate."""
+        pool = FakePool(delay=0)
+
+        async def burst():
+            async with AsyncRedfishClient(per_host_rate=50.0, pool=pool) as client:
+                session = client.session(_credentials(1))
+                await asyncio.gather(*(session.get("/redfish/v1/") for _ in range(5)))
+
+        asyncio.run(burst())
+
+        starts = pool.starts["10.0.0.1"]
+        assert starts[-1] - starts[0] >= 4 * 0.02 * 0.9
+
+    def test_limits_apply_to_each_request_of_an_operation(self):
+        """Every request of an operation run on the client takes its own slot."""
+        pool = FakePool(delay=0.02)
+
+        def read_systems(credentials, session_pool):
+            with session_pool.get(credentials) as session:
+                return [session.get(f"/redfish/v1/Systems/{i}") for i in range(3)]
+
+        async def sweep():
+            async with AsyncRedfishClient(
+                per_host_concurrency=1, per_host_rate=50.0, pool=pool
+            ) as client:
+                credentials = _credentials(1)
+                return await asyncio.gather(
+                    client.run(
+                        credentials,
+                        read_systems,
+                        credentials,
+                        client.limited_pool,
+                    ),
+                    client.request(credentials, "GET", "/redfish/v1/"),
+                )
+
+        asyncio.run(sweep())
+
+        starts = pool.starts["10.0.0.1"]
+        assert len(starts) == 4
+        assert pool.peak["10.0.0.1"] == 1
+        assert all(b - a >= 0.02 * 0.9 for a, b in zip(starts, starts[1:]))
+
+    def test_client_reusable_across_loops(self):
+        """Limits are rebuilt for each event loop using the client."""
+        client = AsyncRedfishClient(pool=FakePool(delay=0))
+        try:
+            for _ in range(2):
+                response = asyncio.run(
+                    client.session(_credentials(1)).get("/redfish/v1/")
+                )
+                assert response.success
+        finally:
+            client.close()
+
+
+class TestBulkReads:
+    """Test fleet-wide operation helpers."""
+
+    def test_bulk_power_state_isolates_failures(self):
+        """Each BMC gets its own result; exceptions become failed results."""
+
+        def get_power_state(self, system_id="1"):
+            if self.credentials.host == "10.0.0.2":
+                raise RuntimeError("BMC unreachable")
+            return RedfishOperation(success=True, result=PowerState.ON)
+
+        with patch(
+            "hwautomation.hardware.redfish.operations.bulk.RedfishPowerOperation"
+            ".get_power_state",
+            get_power_state,
+        ):
+            results = asyncio.run(
+                bulk_power_state([_credentials(n) for n in range(1, 4)])
+            )
+
+        assert results["10.0.0.1"].result == PowerState.ON
+        assert not results["10.0.0.2"].success
+        assert "unreachable" in results["10.0.0.2"].error_message
+        assert results["10.0.0.3"].success
@@ -0,0 +1,138 @@
+"""Tests for minimal-diff BIOS attribute updates."""
+
+from hwautomation.hardware.redfish import RedfishCredentials
+from hwautomation.hardware.redfish.managers.bios import RedfishBiosManager
+from hwautomation.hardware.redfish.operations.bios import RedfishBiosOperation
+
+from mocks.redfish import FakeSession, FakeSessionPool
+
+CREDENTIALS = RedfishCredentials(host="10.0.0.5", username="u", password="p")
+BIOS = "/redfish/v1/Systems/1/Bios"
+SETTINGS = "/redfish/v1/Systems/1/Bios/SD"
+
+
+def _bios_resources(current, pending=None):
+    """BMC resources with current BIOS attributes and a settings object."""
+    resources = {
+        "/redfish/v1/Systems/1": {"Bios": {"@odata.id": BIOS}},
+        BIOS: {
+            "Attributes": dict(current),
+            "@Redfish.Settings": {"SettingsObject": {"@odata.id": SETTINGS}},
+        },
+    }
+    if pending is not None:
+        resources[SETTINGS] = {"Attributes": pending}
+    return resources
+
+
+CURRENT = {
+    "BootMode": "UEFI",
+    "Hyperthreading": True,
+    "NumaNodes": 2,
+    "SriovSupport": "Disabled",
+    "TpmState": "Enabled",
+}
+
+
+class TestBiosDiff:
+    """Test diffing and minimal PATCH requests."""
+
+    def setup_method(self):
+        """Serve BIOS resources from a fake session pool."""
+        self.pool = FakeSessionPool().install(
+            "hwautomation.hardware.redfish.operations.bios"
+        )
+
+    def teardown_method(self):
+        """Restore the shared session pool."""
+        self.pool.close()
+
+    def _bmc(self, current, pending=None):
+        return self.pool.serve(FakeSession(_bios_resources(current, pending)))
+
+    def test_compliant_system_sends_nothing(self):
+        """Re-running a compliant configuration PATCHes nothing."""
+        session = self._bmc(CURRENT, pending=dict(CURRENT))
+
+        result = RedfishBiosOperation(CREDENTIALS).apply_bios_attributes(
+            {"BootMode": "UEFI", "Hyperthreading": "True", "NumaNodes": "2"}
+        )
+
+        assert result.success
+        assert not result.result.reboot_required
+        assert sorted(result.result.unchanged) == [
+            "BootMode",
+            "Hyperthreading",
+            "NumaNodes",
+        ]
+        assert session.patches == []
+
+    def test_only_real_changes_are_patched(self):
+        """Changes and reverts go in one PATCH; staged values are skipped."""
+        session = self._bmc(
+            CURRENT,
+            pending={**CURRENT, "SriovSupport": "Enabled", "TpmState": "Disabled"},
+        )
+
+        result = RedfishBiosOperation(CREDENTIALS).apply_bios_attributes(
+            {
+                "BootMode": "UEFI",
+                "NumaNodes": 4,
+                "SriovSupport": "Enabled",
+                "TpmState": "Enabled",
+            }
+        )
+
+        diff = result.result
+        assert diff.changes == {"NumaNodes": 4}
+        assert diff.pending == {"SriovSupport": "Enabled"}
+        assert diff.reverts == {"TpmState": "Enabled"}
+        assert diff.unchanged == ["BootMode"]
+        assert diff.reboot_required
+        assert session.patches == [
+            (SETTINGS, {"Attributes": {"NumaNodes": 4, "TpmState": "Enabled"}})
+        ]
+
+    def test_already_staged_needs_reboot_only(self):
+        """Values already staged are not rewritten but still need a reboot."""
+        session = self._bmc(CURRENT, pending={"SriovSupport": "Enabled"})
+
+        result = RedfishBiosOperation(CREDENTIALS).apply_bios_attributes(
+            {"SriovSupport": "Enabled"}
+        )
+
+        assert result.result.reboot_required
+        assert session.patches == []
+
+    def test_unknown_attribute_skipped(self):
+        """Attributes the system does not have are reported, not written."""
+        session = self._bmc(CURRENT)
+
+        result = RedfishBiosOperation(CREDENTIALS).apply_bios_attributes(
+            {"BootMode": "Legacy", "Turbo": "Enabled"}
+        )
+
+        assert result.success
+        assert result.result.unknown == ["Turbo"]
+        assert session.patches == [(SETTINGS, {"Attributes": {"BootMode": "Legacy"}})]
+
+    def test_missing_settings_object(self):
+        """Without a readable settings object everything differing is written."""
+        session = self._bmc(CURRENT)
+
+        result = RedfishBiosOperation(CREDENTIALS).set_bios_attributes(
+            {"BootMode": "Legacy"}
+        )
+
+        assert result.success and result.result is True
+        assert session.patches == [(SETTINGS, {"Attributes": {"BootMode": "Legacy"}})]
+
+    def test_manager_reports_reboot_requirement(self):
+        """The BIOS manager returns the diff from the operation."""
+        self._bmc(CURRENT)
+        manager = RedfishBiosManager(CREDENTIALS)
+
+        diff = manager.apply_bios_attributes({"BootMode": "UEFI"})
+
+        assert diff is not None and not diff.reboot_required
+        assert manager.set_bios_attributes({"BootMode": "Legacy"})
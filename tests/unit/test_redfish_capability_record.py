@@ -0,0 +1,145 @@
+"""Tests for Redfish and BIOS code consulting the BMC capability record."""
+
+from unittest.mock import Mock, patch
+
+from hwautomation.hardware.bios.managers.ipmi import IpmiBiosManager
+from hwautomation.hardware.bios.managers.redfish import RedfishBiosManager
+from hwautomation.hardware.ipmi import get_capability_cache
+from hwautomation.hardware.redfish import (
+    RedfishCredentials,
+    RedfishDiscovery,
+    RedfishResponse,
+)
+from hwautomation.hardware.redfish.operations.firmware import RedfishFirmwareOperation
+
+HOST = "10.0.0.7"
+DEVICE_TYPE = "a1.c5.large"
+MAPPINGS = {DEVICE_TYPE: {"redfish_enabled": True, "vendor_tools_available": True}}
+SERVICE_ROOT = {
+    "RedfishVersion": "1.15.0",
+    "ProtocolFeaturesSupported": {"ExpandQuery": {"Levels": True}},
+    "SessionService": {"@odata.id": "/redfish/v1/SessionService"},
+    "Systems": {"@odata.id": "/redfish/v1/Systems"},
+}
+
+
+def _pool(response):
+    session = Mock()
+    session.__enter__ = Mock(return_value=session)
+    session.__exit__ = Mock(return_value=False)
+    session.get.return_value = response
+    pool = Mock()
+    pool.get.return_value = session
+    return pool, session
+
+
+class _IpmiManager(IpmiBiosManager):
+    """IPMI BIOS manager with the XML pipeline stubbed out."""
+
+    pull_current_config = apply_template = validate_config = push_config = Mock()
+
+
+class TestDiscoveryRecord:
+    """Test service root discovery and the capability record."""
+
+    def test_service_root_recorded(self):
+        """Version and features from the service root are recorded."""
+        pool, _ = _pool(RedfishResponse(True, 200, data=SERVICE_ROOT))
+        credentials = RedfishCredentials(host=HOST, username="u", password="p")
+
+        with patch(
+            "hwautomation.hardware.redfish.client.discovery.get_redfish_session_pool",
+            return_value=pool,
+        ):
+            root = RedfishDiscovery(credentials).discover_service_root()
+
+        record = get_capability_cache().lookup(HOST)
+        assert root.redfish_version == "1.15.0"
+        assert record.redfish_version == "1.15.0"
+        assert record.redfish_features == {
+            "expand": True,
+            "sessions": True,
+            "events": False,
+        }
+
+    def test_recorded_unavailable_not_probed(self):
+        """A BMC recorded without Redfish is not contacted."""
+        get_capability_cache().update_redfish(HOST, available=False)
+        pool, _ = _pool(RedfishResponse(True, 200, data=SERVICE_ROOT))
+        credentials = RedfishCredentials(host=HOST, username="u", password="p")
+
+        with patch(
+            "hwautomation.hardware.redfish.client.discovery.get_redfish_session_pool",
+            return_value=pool,
+        ):
+            assert RedfishDiscovery(credentials).discover_service_root() is None
+
+        pool.get.assert_not_called()
+
+
+class TestMethodSelection:
+    """Test BIOS method selection from the capability record."""
+
+    def test_redfish_manager_uses_record(self):
+        """Recorded Redfish support skips the connection test."""
+        get_capability_cache().update_redfish(
+            HOST, version="1.15.0", bios_registry_id="BiosAttributeRegistry.v1"
+        )
+        manager = RedfishBiosManager()
+        manager.device_mappings = MAPPINGS
+        manager.test_redfish_connection = Mock(side_effect=AssertionError)
+
+        result = manager.select_optimal_method(DEVICE_TYPE, HOST)
+
+        assert result.recommended_method.value == "redfish_standard"
+        assert result.redfish_capabilities["tested"] is False
+        assert result.redfish_capabilities["redfish_version"] == "1.15.0"
+
+    def test_connection_test_short_circuits(self):
+        """A BMC recorded without Redfish fails the test without connecting."""
+        get_capability_cache().update_redfish(HOST, available=False)
+
+        with patch("hwautomation.hardware.redfish.RedfishManager") as manager_class:
+            success, message = RedfishBiosManager().test_redfish_connection(
+                HOST, "u", "p"
+            )
+
+        assert not success
+        assert "recorded" in message
+        manager_class.assert_not_called()
+
+    def test_ipmi_manager_uses_record(self):
+        """A BMC identified over IPMI skips the IPMI connection test."""
+        cache = get_capability_cache()
+        record = cache.update_redfish(HOST, available=False)
+        record.guid = "03020100-0504-0706-0809-0a0b0c0d0e0f"
+        manager = _IpmiManager()
+        manager.device_mappings = MAPPINGS
+        manager.test_ipmi_connection = Mock(side_effect=AssertionError)
+
+        result = manager.select_optimal_method(DEVICE_TYPE, HOST)
+
+        assert result.vendor_tools_status["ipmi_tested"] is False
+        assert result.redfish_capabilities == {"available": False}
+
+
+class TestFirmwareRefresh:
+    """Test the record after firmware updates."""
+
+    def test_completed_update_forgets_redfish(self):
+        """A finished firmware update drops the recorded Redfish details."""
+        get_capability_cache().update_redfish(HOST, version="1.11.0")
+        monitor = Mock()
+        monitor.track.return_value.result.return_value = Mock(success=True)
+        credentials = RedfishCredentials(host=HOST, username="u", password="p")
+
+        with patch(
+            "hwautomation.hardware.redfish.operations.firmware.get_task_monitor",
+            return_value=monitor,
+        ):
+            result = RedfishFirmwareOperation(credentials).wait_for_update_completion(
+                "/redfish/v1/TaskService/Tasks/1"
+            )
+
+        assert result.success
+        assert get_capability_cache().lookup(HOST).redfish_version is None
@@ -0,0 +1,79 @@
+"""Tests for the Redfish session resource cache."""
+
+import pytest
+
+from hwautomation.hardware.redfish import RedfishCredentials
+from hwautomation.hardware.redfish.client.session import RedfishSession
+
+from mocks.redfish import SYSTEM, FakeBMC
+
+CREDENTIALS = RedfishCredentials(host="10.0.0.5", username="admin", password="pw")
+
+
+@pytest.fixture
+def bmc():
+    fake = FakeBMC(sessions=False)
+    with fake.install():
+        yield fake
+
+
+class TestResourceCache:
+    """Test conditional GETs and the immutable resource memo."""
+
+    def test_unchanged_resource_revalidated(self, bmc):
+        """A second GET sends If-None-Match and reuses the cached body on 304."""
+        session = RedfishSession(CREDENTIALS)
+
+        first = session.get(SYSTEM)
+        second = session.get(SYSTEM)
+
+        assert bmc.gets(SYSTEM) == [None, 'W/"1"']
+        assert second.success and second.status_code == 200
+        assert second.data == first.data
+        assert session.cache_hits == 1
+
+    def test_cached_copy_is_not_shared(self, bmc):
+        """Callers mutating a response do not corrupt the cache."""
+        session = RedfishSession(CREDENTIALS)
+
+        session.get(SYSTEM).data["PowerState"] = "Off"
+
+        assert session.get(SYSTEM).data["PowerState"] == "On"
+
+    def test_write_invalidates(self, bmc):
+        """A PATCH drops the cached copy and the next GET is unconditional."""
+        session = RedfishSession(CREDENTIALS)
+        session.get(SYSTEM)
+
+        session.patch(SYSTEM, {"AssetTag": "rack-7"})
+        response = session.get(SYSTEM)
+
+        assert bmc.gets(SYSTEM) == [None, None]
+        assert response.data["AssetTag"] == "rack-7"
+
+    def test_service_root_memoized(self, bmc):
+        """The service root is read once per workflow."""
+        session = RedfishSession(CREDENTIALS)
+
+        for _ in range(3):
+            assert session.get("/redfish/v1/").data["RedfishVersion"] == "1.11.0"
+
+        assert len(bmc.gets("/redfish/v1/")) == 1
+
+    def test_expired_memo_revalidates(self, bmc):
+        """After the memo TTL the service root is revalidated with its ETag."""
+        session = RedfishSession(CREDENTIALS, memo_ttl=0)
+
+        session.get("/redfish/v1/")
+        session.get("/redfish/v1/")
+
+        assert bmc.gets("/redfish/v1/") == [None, 'W/"1"']
+
+    def test_cache_disabled(self, bmc):
+        """cache_size=0 sends every GET unconditionally."""
+        session = RedfishSession(CREDENTIALS, cache_size=0)
+
+        session.get(SYSTEM)
+        session.get(SYSTEM)
+
+        assert bmc.gets(SYSTEM) == [None, None]
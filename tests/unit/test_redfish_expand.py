@@ -0,0 +1,120 @@
+"""Tests for Redfish collection expansion."""
+
+import threading
+
+from hwautomation.hardware.redfish import RedfishCredentials, RedfishResponse
+from hwautomation.hardware.redfish.client.expand import expand_query, fetch_collection
+from hwautomation.hardware.redfish.operations.firmware import RedfishFirmwareOperation
+
+from mocks.redfish import FakeSession, FakeSessionPool
+
+INVENTORY = "/redfish/v1/UpdateService/FirmwareInventory"
+
+
+def _component(n):
+    return {
+        "@odata.id": f"{INVENTORY}/{n}",
+        "Id": str(n),
+        "Name": f"BMC {n}",
+        "Version": f"1.{n}",
+    }
+
+
+class InventorySession(FakeSession):
+    """Redfish session serving a firmware inventory of N components."""
+
+    def __init__(self, count=3, expand=None, failing=(), reject_expand=False):
+        super().__init__()
+        self.protocol_features = {"ExpandQuery": expand} if expand else {}
+        self.reject_expand = reject_expand
+        self.count = count
+        self.failing = set(failing)
+        self.threads = set()
+
+    def respond(self, uri):
+        with self._lock:
+            self.threads.add(threading.get_ident())
+        if uri == "/redfish/v1/UpdateService":
+            return self._ok({"FirmwareInventory": {"@odata.id": INVENTORY}})
+        if uri.startswith(INVENTORY + "?$expand="):
+            if self.reject_expand:
+                return RedfishResponse(success=False, status_code=400)
+            members = [_component(n) for n in range(self.count)]
+            return self._ok({"Members": members})
+        if uri == INVENTORY:
+            links = [{"@odata.id": f"{INVENTORY}/{n}"} for n in range(self.count)]
+            return self._ok({"Members": links})
+        n = int(uri.rsplit("/", 1)[1])
+        if n in self.failing:
+            return RedfishResponse(success=False, status_code=500)
+        return self._ok(_component(n))
+
+
+class TestExpandQuery:
+    """Test $expand query selection."""
+
+    def test_query_from_protocol_features(self):
+        """The narrowest supported expansion is used."""
+        assert (
+            expand_query({"ExpandQuery": {"NoLinks": True, "Levels": True}})
+            == "$expand=.($levels=1)"
+        )
+        assert expand_query({"ExpandQuery": {"ExpandAll": True}}) == "$expand=*"
+        assert expand_query({"ExpandQuery": {"Links": True}}) is None
+        assert expand_query({}) is None
+
+
+class TestFetchCollection:
+    """Test expanded and concurrent member fetching."""
+
+    def test_expanded_collection_is_one_request(self):
+        """An advertised $expand returns every member in one round trip."""
+        session = InventorySession(
+            count=30, expand={"NoLinks": True, "Levels": True, "MaxLevels": 6}
+        )
+
+        response, members = fetch_collection(session, INVENTORY)
+
+        assert response.success
+        assert len(members) == 30
+        assert session.requests == [f"{INVENTORY}?$expand=.($levels=1)"]
+
+    def test_members_fetched_concurrently_in_order(self):
+        """Without $expand members are fetched in parallel, keeping order."""
+        session = InventorySession(count=30, failing={4})
+
+        _, members = fetch_collection(session, INVENTORY, max_workers=8)
+
+        assert [m["Id"] for m in members] == [str(n) for n in range(30) if n != 4]
+        assert len(session.requests) == 31
+        assert len(session.threads) > 1
+
+    def test_rejected_expand_falls_back(self):
+        """A service rejecting $expand is read member by member."""
+        session = InventorySession(
+            count=3, expand={"NoLinks": True}, reject_expand=True
+        )
+
+        _, members = fetch_collection(session, INVENTORY, limit=2)
+
+        assert [m["Id"] for m in members] == ["0", "1"]
+
+
+class TestFirmwareInventory:
+    """Test firmware inventory through the collection helper."""
+
+    def test_inventory_uses_expand(self):
+        """The whole inventory takes two requests with $expand."""
+        session = InventorySession(count=12, expand={"NoLinks": True, "Levels": True})
+        operation = RedfishFirmwareOperation(
+            RedfishCredentials(host="10.0.0.5", username="u", password="p")
+        )
+
+        with FakeSessionPool(session).install(
+            "hwautomation.hardware.redfish.operations.firmware"
+        ):
+            result = operation.get_firmware_inventory()
+
+        assert result.success
+        assert [c.version for c in result.result][:2] == ["1.0", "1.1"]
+        assert len(session.requests) == 2
@@ -0,0 +1,221 @@
+"""Tests for streaming Redfish firmware push uploads."""
+
+import asyncio
+import json
+import threading
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from hwautomation.hardware.redfish import (
+    RedfishCredentials,
+    RedfishSession,
+    bulk_push_firmware,
+)
+from hwautomation.hardware.redfish.client import FileUploadBody, MultipartUploadBody
+from hwautomation.hardware.redfish.operations.firmware import RedfishFirmwareOperation
+
+from mocks.redfish import FakeSessionPool
+
+TASK = "/redfish/v1/TaskService/TaskMonitors/1"
+
+
+class FakeUpdateService:
+    """HTTP server standing in for a BMC's UpdateService."""
+
+    def __init__(self, update_service):
+        self.update_service = update_service
+        self.uploads = []
+        self.patches = []
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self._reply(200, service.update_service)
+
+            def do_PATCH(self):
+                service.patches.append(json.loads(self._body()))
+                self._reply(204)
+
+            def do_POST(self):
+                service.uploads.append((dict(self.headers), self._body()))
+                self.send_response(202)
+                self.send_header("Location", TASK)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def _body(self):
+                return self.rfile.read(int(self.headers["Content-Length"]))
+
+            def _reply(self, status, data=None):
+                payload = json.dumps(data).encode() if data is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def credentials(self, host="127.0.0.1"):
+        return RedfishCredentials(
+            host=host,
+            port=self.server.server_port,
+            username="u",
+            password="p",
+            use_ssl=False,
+        )
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / "bmc-fw.bin"
+    path.write_bytes(bytes(range(256)) * 12000)
+    return path
+
+
+class TestFirmwarePush:
+    """Test pushing local images to the UpdateService."""
+
+    def setup_method(self):
+        """Hand out real sessions to the fake UpdateService."""
+        self.pool = FakeSessionPool(factory=RedfishSession).install(
+            "hwautomation.hardware.redfish.operations.firmware",
+            "hwautomation.hardware.redfish.client.async_client",
+        )
+
+    def teardown_method(self):
+        """Stop the fake BMCs and restore the shared session pool."""
+        self.pool.close()
+
+    def _bmc(self, update_service):
+        service = FakeUpdateService(update_service)
+        self.pool.add_cleanup(service.close)
+        return service
+
+    def test_multipart_push(self, image):
+        """The image and parameters are streamed as one multipart body."""
+        service = self._bmc(
+            {"MultipartHttpPushUri": "/redfish/v1/UpdateService/upload"}
+        )
+        progress = []
+
+        result = RedfishFirmwareOperation(service.credentials()).push_firmware(
+            str(image),
+            targets=["/redfish/v1/UpdateService/FirmwareInventory/BMC"],
+            apply_time="OnReset",
+            progress=lambda sent, total: progress.append((sent, total)),
+        )
+
+        assert result.success
+        assert result.result == TASK
+        headers, body = service.uploads[0]
+        assert "Transfer-Encoding" not in headers
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {headers['Content-Type']}\r\n\r\n".encode() + body
+        )
+        parameters, update_file = message.iter_parts()
+        assert json.loads(parameters.get_content()) == {
+            "@Redfish.OperationApplyTime": "OnReset",
+            "Targets": ["/redfish/v1/UpdateService/FirmwareInventory/BMC"],
+        }
+        assert update_file.get_filename() == "bmc-fw.bin"
+        assert update_file.get_content() == image.read_bytes()
+        assert progress[-1] == (len(body), len(body))
+        assert len(progress) > 2
+
+    def test_http_push_fallback(self, image):
+        """Without multipart support the raw image goes to HttpPushUri."""
+        service = self._bmc({"HttpPushUri": "/redfish/v1/UpdateService/push"})
+
+        result = RedfishFirmwareOperation(service.credentials()).push_firmware(
+            str(image), targets=["/redfish/v1/Systems/1"]
+        )
+
+        assert result.success
+        assert service.patches == [
+            {
+                "HttpPushUriTargets": ["/redfish/v1/Systems/1"],
+                "HttpPushUriOptions": {
+                    "HttpPushUriApplyTime": {"ApplyTime": "Immediate"}
+                },
+            }
+        ]
+        headers, body = service.uploads[0]
+        assert headers["Content-Type"] == "application/octet-stream"
+        assert body == image.read_bytes()
+
+    def test_http_push_resets_previous_options(self, image):
+        """Each push overwrites the targets and apply time of the last one."""
+        service = self._bmc({"HttpPushUri": "/redfish/v1/UpdateService/push"})
+        operation = RedfishFirmwareOperation(service.credentials())
+
+        operation.push_firmware(
+            str(image), targets=["/redfish/v1/Systems/1"], apply_time="OnReset"
+        )
+        operation.push_firmware(str(image))
+
+        assert service.patches[-1] == {
+            "HttpPushUriTargets": [],
+            "HttpPushUriOptions": {"HttpPushUriApplyTime": {"ApplyTime": "Immediate"}},
+        }
+
+    def test_push_unsupported(self, image):
+        """Services without a push URI are reported, not uploaded to."""
+        service = self._bmc({"Actions": {}})
+
+        result = RedfishFirmwareOperation(service.credentials()).push_firmware(
+            str(image)
+        )
+
+        assert not result.success
+        assert result.error_message == "HTTP push update not supported"
+        assert service.uploads == []
+
+    def test_bulk_push(self, image):
+        """A fleet upload reports one result per BMC."""
+        service = self._bmc(
+            {"MultipartHttpPushUri": "/redfish/v1/UpdateService/upload"}
+        )
+        hosts = set()
+
+        results = asyncio.run(
+            bulk_push_firmware(
+                [service.credentials("127.0.0.1"), service.credentials("localhost")],
+                str(image),
+                progress=lambda host, sent, total: hosts.add(host),
+            )
+        )
+
+        assert {host: r.result for host, r in results.items()} == {
+            "127.0.0.1": TASK,
+            "localhost": TASK,
+        }
+        assert hosts == {"127.0.0.1", "localhost"}
+        assert len(service.uploads) == 2
+
+
+class TestUploadBodies:
+    """Test streaming upload bodies."""
+
+    def test_bodies_stream_in_chunks(self, image):
+        """Bodies are read in bounded chunks and can be sent again."""
+        raw = FileUploadBody(str(image), chunk_size=4096)
+        multipart = MultipartUploadBody(str(image), {}, chunk_size=4096)
+
+        for body in (raw, multipart):
+            chunks = list(body)
+            assert sum(len(c) for c in chunks) == len(body)
+            assert max(len(c) for c in chunks if c) <= max(4096, len(chunks[0]))
+            assert b"".join(body) == b"".join(chunks)
+        assert len(multipart) > len(raw) == image.stat().st_size
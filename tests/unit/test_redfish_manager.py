@@ -16,6 +16,7 @@ import requests
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from hwautomation.hardware.bios import BiosConfigManager
+from hwautomation.hardware.ipmi.capabilities import get_capability_cache
 from hwautomation.hardware.redfish import (
     RedfishCapabilities,
     RedfishManager,
@@ -413,6 +414,20 @@ class TestBiosConfigManagerRedfish:
         # Should return vendor_tool since device config doesn't specify redfish preference
         assert method in ["redfish", "vendor_tool", "hybrid"]
 
+    def test_bios_config_method_keeps_device_routing(self):
+        """A BMC recorded as serving Redfish does not bypass device configs"""
+        bios_manager = BiosConfigManager()
+        before = bios_manager.determine_bios_config_method(
+            self.target_ip, "no-such-device", self.username, self.password
+        )
+        get_capability_cache().update_redfish(self.target_ip, available=True)
+
+        method = bios_manager.determine_bios_config_method(
+            self.target_ip, "no-such-device", self.username, self.password
+        )
+
+        assert method == before == "hybrid"
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -165,6 +165,32 @@ class TestFirmwareManager:
         assert isinstance(self.firmware_manager, BaseRedfishManager)
         assert self.firmware_manager.credentials == self.mock_credentials
 
+    def test_get_update_status(self):
+        """Test update status is read for the task URI."""
+        task_uri = "/redfish/v1/TaskService/Tasks/1"
+        with patch.object(
+            self.firmware_manager.firmware_ops,
+            "get_update_status",
+            return_value=Mock(success=True, result={"TaskState": "Running"}),
+        ) as get_update_status:
+            status = self.firmware_manager.get_update_status(task_uri)
+
+        get_update_status.assert_called_once_with(task_uri)
+        assert status == {"TaskState": "Running"}
+
+    def test_wait_for_update_completion(self):
+        """Test waiting passes the task URI and timeout."""
+        task_uri = "/redfish/v1/TaskService/Tasks/1"
+        with patch.object(
+            self.firmware_manager.firmware_ops,
+            "wait_for_update_completion",
+            return_value=Mock(success=True),
+        ) as wait:
+            result = self.firmware_manager.wait_for_update_completion(task_uri, 60)
+
+        wait.assert_called_once_with(task_uri, 60)
+        assert result is True
+
 
 class TestRedfishCoordinator:
     """Test suite for RedfishCoordinator integration and orchestration."""
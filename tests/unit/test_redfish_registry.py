@@ -0,0 +1,134 @@
+"""Tests for the Redfish attribute registry cache."""
+
+import gzip
+import threading
+import time
+from unittest.mock import patch
+
+from hwautomation.hardware.redfish import RedfishCredentials
+from hwautomation.hardware.redfish.client import AttributeRegistryCache
+from hwautomation.hardware.redfish.operations.bios import RedfishBiosOperation
+
+from mocks.redfish import FakeSession, FakeSessionPool
+
+REGISTRY_ID = "BiosAttributeRegistryX11.1.0"
+ENTRIES = [
+    {
+        "AttributeName": "BootMode",
+        "HelpText": "Boot mode",
+        "Type": "Enumeration",
+        "Value": [{"ValueName": "UEFI"}, {"ValueName": "Legacy"}],
+    },
+    {"AttributeName": "Hyperthreading", "HelpText": "SMT", "Type": "Boolean"},
+]
+
+
+class RegistrySession(FakeSession):
+    """BMC publishing a registry through a MessageRegistryFile."""
+
+    def __init__(self, delay=0.0):
+        super().__init__(
+            {
+                "/redfish/v1/Systems/1": {
+                    "Bios": {"@odata.id": "/redfish/v1/Systems/1/Bios"}
+                },
+                "/redfish/v1/Systems/1/Bios": {
+                    "AttributeRegistry": REGISTRY_ID,
+                    "Attributes": {"BootMode": "UEFI", "Hyperthreading": True},
+                },
+                f"/redfish/v1/Registries/{REGISTRY_ID}": {
+                    "Location": [
+                        {"Language": "ja", "Uri": "/registries/ja.json"},
+                        {"Language": "en", "Uri": "/registries/en.json"},
+                    ]
+                },
+                "/registries/en.json": {"RegistryEntries": {"Attributes": ENTRIES}},
+            }
+        )
+        self.delay = delay
+
+    def respond(self, uri):
+        if uri == "/registries/en.json":
+            time.sleep(self.delay)
+        return super().respond(uri)
+
+    def downloads(self):
+        return self.requests.count("/registries/en.json")
+
+
+class TestAttributeRegistryCache:
+    """Test registry caching and sharing."""
+
+    def test_download_once_and_index(self, tmp_path):
+        """The registry is fetched once and indexed by attribute name."""
+        cache = AttributeRegistryCache(str(tmp_path))
+        session = RegistrySession()
+
+        first = cache.get_or_fetch(session, REGISTRY_ID)
+        second = cache.get_or_fetch(RegistrySession(), REGISTRY_ID)
+
+        assert first is second
+        assert first["BootMode"]["Type"] == "Enumeration"
+        assert session.downloads() == 1
+        assert "/registries/ja.json" not in session.requests
+
+    def test_disk_cache_shared_between_instances(self, tmp_path):
+        """A new cache (another worker) reads the compressed file."""
+        AttributeRegistryCache(str(tmp_path)).get_or_fetch(
+            RegistrySession(), REGISTRY_ID
+        )
+        (path,) = tmp_path.glob("*.json.gz")
+        with gzip.open(path, "rt") as f:
+            assert "Hyperthreading" in f.read()
+
+        session = RegistrySession()
+        index = AttributeRegistryCache(str(tmp_path)).get_or_fetch(session, REGISTRY_ID)
+
+        assert index["Hyperthreading"]["HelpText"] == "SMT"
+        assert session.requests == []
+
+    def test_concurrent_misses_download_once(self, tmp_path):
+        """Parallel BIOS reads for one registry share a single download."""
+        cache = AttributeRegistryCache(str(tmp_path))
+        session = RegistrySession(delay=0.05)
+        threads = [
+            threading.Thread(target=cache.get_or_fetch, args=(session, REGISTRY_ID))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert session.downloads() == 1
+        assert cache.downloads == 1
+
+    def test_unavailable_registry_is_not_cached(self, tmp_path):
+        """Missing registries return None and leave no cache file."""
+        cache = AttributeRegistryCache(str(tmp_path))
+
+        assert cache.get_or_fetch(RegistrySession(), "Unknown.1.0") is None
+        assert not list(tmp_path.glob("*.json.gz"))
+
+
+class TestBiosEnrichment:
+    """Test BIOS attribute enrichment through the cache."""
+
+    def test_attributes_enriched_from_cache(self, tmp_path):
+        """BIOS reads after the first reuse the cached registry."""
+        cache = AttributeRegistryCache(str(tmp_path))
+        session = RegistrySession()
+        operation = RedfishBiosOperation(
+            RedfishCredentials(host="10.0.0.5", username="u", password="p")
+        )
+
+        module = "hwautomation.hardware.redfish.operations.bios"
+        with FakeSessionPool(session).install(module):
+            with patch(f"{module}.get_registry_cache", return_value=cache):
+                operation.get_bios_attributes()
+                result = operation.get_bios_attributes()
+
+        assert result.success
+        assert result.result["BootMode"].description == "Boot mode"
+        assert result.result["Hyperthreading"].data_type == "Boolean"
+        assert session.downloads() == 1
@@ -0,0 +1,112 @@
+"""Tests for pooled Redfish sessions."""
+
+from unittest.mock import patch
+
+from hwautomation.hardware.redfish import RedfishCredentials, RedfishSessionPool
+from hwautomation.hardware.redfish.managers.power import RedfishPowerManager
+from hwautomation.hardware.redfish.managers.system import RedfishSystemManager
+
+from mocks.redfish import FakeBMC
+
+CREDENTIALS = RedfishCredentials(host="10.0.0.5", username="admin", password="pw")
+
+
+def _pool(bmc, **kwargs):
+    patcher = bmc.install()
+    patcher.start()
+    return RedfishSessionPool(**kwargs), patcher
+
+
+class TestRedfishSessionPool:
+    """Test login reuse, refresh and eviction."""
+
+    def test_managers_share_one_login(self):
+        """Separate managers for one BMC reuse a single session token."""
+        bmc = FakeBMC()
+        pool, patcher = _pool(bmc)
+        try:
+            with patch(
+                "hwautomation.hardware.redfish.managers.base.get_redfish_session_pool",
+                return_value=pool,
+            ):
+                for manager in (
+                    RedfishPowerManager(CREDENTIALS),
+                    RedfishSystemManager(CREDENTIALS),
+                ):
+                    with manager.create_session() as session:
+                        assert session.get("/redfish/v1/Systems/1").success
+        finally:
+            patcher.stop()
+
+        assert bmc.logins == 1
+        assert len(pool) == 1
+        assert bmc.closed == 0
+        assert all(r.token == "token-1" for r in bmc.requests if r.method == "GET")
+
+    def test_expired_token_is_refreshed(self):
+        """A 401 logs in again and retries the request once."""
+        bmc = FakeBMC()
+        pool, patcher = _pool(bmc)
+        try:
+            session = pool.get(CREDENTIALS)
+            session.get("/redfish/v1/Systems/1")
+            bmc.valid_tokens.clear()
+
+            response = session.get("/redfish/v1/Systems/1")
+        finally:
+            patcher.stop()
+
+        assert response.success
+        assert bmc.logins == 2
+        assert session.token == "token-2"
+
+    def test_basic_auth_without_session_service(self):
+        """Services without sessions fall back to basic auth and are not re-probed."""
+        bmc = FakeBMC(sessions=False)
+        pool, patcher = _pool(bmc)
+        try:
+            session = pool.get(CREDENTIALS)
+            for _ in range(3):
+                assert session.get("/redfish/v1/Systems/1").success
+        finally:
+            patcher.stop()
+
+        assert session.token is None
+        assert bmc.count("POST", "/redfish/v1/SessionService/Sessions") == 1
+
+    def test_eviction_logs_out(self):
+        """Idle and discarded sessions delete their BMC session."""
+        bmc = FakeBMC()
+        pool, patcher = _pool(bmc, idle_timeout=0)
+        try:
+            pool.get(CREDENTIALS).get("/redfish/v1/Systems/1")
+            other = RedfishCredentials(host="10.0.0.5", username="ops", password="x")
+            pool.get(other).get("/redfish/v1/Systems/1")
+            evicted_first = bmc.count("DELETE", "/redfish/v1/SessionService/Sessions/1")
+            pool.close_all()
+        finally:
+            patcher.stop()
+
+        assert evicted_first == 1
+        assert bmc.count("DELETE", "/redfish/v1/SessionService/Sessions/2") == 1
+        assert len(pool) == 0
+        assert bmc.valid_tokens == set()
+
+    def test_checked_out_session_is_not_evicted(self):
+        """Sessions held in a ``with`` block survive idle eviction."""
+        bmc = FakeBMC()
+        pool, patcher = _pool(bmc, idle_timeout=0)
+        other = RedfishCredentials(host="10.0.0.5", username="ops", password="x")
+        try:
+            with pool.get(CREDENTIALS) as held:
+                held.get("/redfish/v1/Systems/1")
+                pool.get(other).get("/redfish/v1/Systems/1")
+                assert held.get("/redfish/v1/Systems/1").success
+                assert bmc.count("DELETE", "/redfish/v1/SessionService/Sessions/1") == 0
+            assert held.checkouts == 0
+            pool.get(other)
+        finally:
+            patcher.stop()
+
+        assert bmc.logins == 2
+        assert bmc.count("DELETE", "/redfish/v1/SessionService/Sessions/1") == 1
@@ -0,0 +1,217 @@
+"""Tests for Redfish event subscriptions and the event receiver."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from hwautomation.hardware.redfish import RedfishCredentials, RedfishResponse
+from hwautomation.hardware.redfish.client import RedfishEventReceiver
+from hwautomation.hardware.redfish.client.subscriptions import LEGACY_EVENT_TYPES
+from hwautomation.web.core.websocket_managers import ServerStatusManager
+
+from mocks.redfish import FakeSession, FakeSessionPool
+
+CREDENTIALS = RedfishCredentials(host="127.0.0.1", username="u", password="p")
+SUBSCRIPTIONS = "/redfish/v1/EventService/Subscriptions"
+
+
+class FakeEmitter(FakeSession):
+    """BMC stand-in managing subscriptions and posting events to them."""
+
+    def __init__(self, require_event_types=False):
+        super().__init__()
+        self.require_event_types = require_event_types
+        self.subscriptions = {}
+        self.posts = []
+        self.deleted = []
+
+    def respond(self, uri):
+        if uri == SUBSCRIPTIONS:
+            members = [{"@odata.id": sub_uri} for sub_uri in self.subscriptions]
+            return self._ok({"Members": members})
+        if uri in self.subscriptions:
+            return self._ok({"@odata.id": uri, **self.subscriptions[uri]})
+        return RedfishResponse(success=False, status_code=404)
+
+    def post(self, uri, data=None):
+        self.posts.append(data)
+        if self.require_event_types and "EventTypes" not in data:
+            return RedfishResponse(success=False, status_code=400)
+        sub_uri = f"{SUBSCRIPTIONS}/{len(self.posts)}"
+        self.subscriptions[sub_uri] = dict(data)
+        return RedfishResponse(
+            success=True, status_code=201, headers={"Location": sub_uri}
+        )
+
+    def delete(self, uri):
+        self.deleted.append(uri)
+        self.subscriptions.pop(uri, None)
+        return RedfishResponse(success=True, status_code=204)
+
+    def emit(self, *records, context=None):
+        """POST an event payload to every subscription destination."""
+        for sub in self.subscriptions.values():
+            payload = {
+                "@odata.type": "#Event.v1_7_0.Event",
+                "Context": sub["Context"] if context is None else context,
+                "Events": list(records),
+            }
+            response = requests.post(sub["Destination"], json=payload, timeout=5)
+            assert response.status_code == 204
+
+
+class TestRedfishEventReceiver:
+    """Test subscription management and event delivery."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.pool = FakeSessionPool()
+
+    def teardown_method(self):
+        """Close the receivers started by the test."""
+        self.pool.close()
+
+    def _receiver(self, emitter, **kwargs):
+        self.pool.serve(emitter)
+        receiver = RedfishEventReceiver(
+            listen_host="127.0.0.1", listen_port=0, pool=self.pool, **kwargs
+        )
+        receiver.start()
+        self.pool.add_cleanup(receiver.close)
+        return receiver
+
+    def test_events_delivered_to_listeners(self):
+        """Pushed events reach listeners with their source BMC."""
+        emitter = FakeEmitter()
+        receiver = self._receiver(emitter, route_waits=False)
+        received = []
+        done = threading.Event()
+
+        def listener(source, record):
+            received.append((source.server_id, record["MessageId"]))
+            done.set()
+
+        receiver.add_listener(listener)
+        assert receiver.ensure_subscription(CREDENTIALS, server_id="srv-1")
+        assert receiver.ensure_subscription(CREDENTIALS)
+
+        emitter.emit({"MessageId": "Base.1.0.ResourceChanged"})
+        emitter.emit({"MessageId": "Forged.1.0"}, context="wrong")
+
+        assert done.wait(2)
+        assert received == [("srv-1", "Base.1.0.ResourceChanged")]
+        assert len(emitter.posts) == 1
+        assert emitter.posts[0]["Destination"] == receiver.destination
+
+    def test_stale_subscriptions_replaced(self):
+        """Resubscribing removes the receiver's earlier subscription."""
+        emitter = FakeEmitter()
+        receiver = self._receiver(emitter, route_waits=False)
+        emitter.subscriptions[f"{SUBSCRIPTIONS}/old"] = {
+            "Destination": receiver.destination,
+            "Context": "previous-run",
+        }
+        emitter.subscriptions[f"{SUBSCRIPTIONS}/other"] = {
+            "Destination": "https://collector.example/events",
+            "Context": "x",
+        }
+
+        receiver.subscribe(CREDENTIALS)
+
+        assert emitter.deleted == [f"{SUBSCRIPTIONS}/old"]
+        assert f"{SUBSCRIPTIONS}/other" in emitter.subscriptions
+
+    def test_legacy_event_types_retry(self):
+        """Services requiring EventTypes are subscribed with the legacy list."""
+        emitter = FakeEmitter(require_event_types=True)
+        receiver = self._receiver(emitter, route_waits=False)
+
+        source = receiver.subscribe(CREDENTIALS)
+
+        assert source is not None
+        assert emitter.posts[-1]["EventTypes"] == LEGACY_EVENT_TYPES
+
+    def test_close_removes_subscriptions(self):
+        """Closing the receiver deletes its subscriptions."""
+        emitter = FakeEmitter()
+        receiver = self._receiver(emitter, route_waits=False)
+        source = receiver.subscribe(CREDENTIALS)
+
+        receiver.close()
+
+        assert emitter.deleted == [source.subscription_uri]
+        assert not receiver.is_subscribed(CREDENTIALS)
+        assert not receiver.running
+
+    def test_events_wake_power_and_task_waits(self):
+        """System and task events are routed to the shared waiters."""
+        emitter = FakeEmitter()
+        watcher, monitor = Mock(), Mock()
+        self._receiver(emitter).subscribe(CREDENTIALS)
+        record = {
+            "MessageId": "ResourceEvent.1.0.ResourceChanged",
+            "OriginOfCondition": {"@odata.id": "/redfish/v1/Systems/1/"},
+        }
+
+        with patch(
+            "hwautomation.hardware.power_watch.get_power_watcher", return_value=watcher
+        ):
+            with patch(
+                "hwautomation.hardware.redfish.client.tasks.get_task_monitor",
+                return_value=monitor,
+            ):
+                emitter.emit(record)
+
+        watcher.notify.assert_called_once_with(
+            ("redfish", "127.0.0.1", 443, "/redfish/v1/Systems/1")
+        )
+        monitor.handle_event.assert_called_once_with(CREDENTIALS, record)
+
+    def test_events_without_context_ignored(self):
+        """Events are not matched to a BMC by the sender's address."""
+        emitter = FakeEmitter()
+        receiver = self._receiver(emitter, route_waits=False)
+        receiver.subscribe(CREDENTIALS)
+        received = []
+        receiver.add_listener(lambda source, record: received.append(record))
+
+        delivered = receiver.deliver(
+            {"Events": [{"MessageId": "Base.1.0.ResourceChanged"}]}, "127.0.0.1"
+        )
+
+        assert delivered == 0
+        assert received == []
+
+    def test_plain_http_listens_on_localhost_only(self):
+        """Without a certificate the receiver binds to loopback by default."""
+        assert RedfishEventReceiver().listen_host == "127.0.0.1"
+        assert RedfishEventReceiver(certfile="bmc.pem").listen_host == "0.0.0.0"
+
+        receiver = RedfishEventReceiver(listen_host="0.0.0.0", listen_port=0)
+        with pytest.raises(ValueError):
+            receiver.start()
+        assert not receiver.running
+
+
+class TestServerStatusBroadcast:
+    """Test Redfish events in the server status WebSocket manager."""
+
+    def test_alerts_and_status_updates(self):
+        """Alerts become server_alert, other events status updates."""
+        receiver = Mock()
+        manager = ServerStatusManager(Mock(), event_receiver=receiver)
+        manager.broadcast_to_room = Mock()
+        listener = receiver.add_listener.call_args[0][0]
+        source = Mock(server_id=None, credentials=CREDENTIALS)
+
+        listener(source, {"MessageId": "Fan.1.0.Failed", "MessageSeverity": "Critical"})
+        listener(source, {"MessageId": "Base.1.0.ResourceChanged"})
+
+        calls = manager.broadcast_to_room.call_args_list
+        assert [c[0][:2] for c in calls] == [
+            ("server_127.0.0.1", "server_alert"),
+            ("server_127.0.0.1", "server_status_update"),
+        ]
+        assert calls[0][0][2]["alert"]["message_id"] == "Fan.1.0.Failed"
@@ -0,0 +1,208 @@
+"""Tests for the Redfish task monitor."""
+
+import threading
+import time
+from email.utils import formatdate
+from unittest.mock import patch
+
+from hwautomation.hardware.redfish import RedfishCredentials, RedfishResponse
+from hwautomation.hardware.redfish.client import RedfishTaskMonitor
+from hwautomation.hardware.redfish.client.tasks import retry_after
+from hwautomation.hardware.redfish.operations.firmware import RedfishFirmwareOperation
+
+from mocks.redfish import FakeSession, FakeSessionPool
+
+TASK = "/redfish/v1/TaskService/Tasks/7"
+
+
+def _credentials(n=1):
+    return RedfishCredentials(host=f"10.0.0.{n}", username="u", password="p")
+
+
+def _task(state, percent=0, status_code=200, headers=None):
+    return RedfishResponse(
+        success=True,
+        status_code=status_code,
+        data={"TaskState": state, "PercentComplete": percent},
+        headers=headers or {},
+    )
+
+
+class TaskSession(FakeSession):
+    """BMC whose task advances one scripted step per poll."""
+
+    def __init__(self, steps):
+        super().__init__()
+        self.steps = list(steps)
+        self.polls = []
+
+    def respond(self, uri):
+        with self._lock:
+            self.polls.append(time.monotonic())
+            return self.steps.pop(0) if len(self.steps) > 1 else self.steps[0]
+
+
+class MonitorTestCase:
+    """Runs task monitors against scripted BMCs."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.sessions = {}
+        self.pool = FakeSessionPool(
+            factory=lambda credentials: self.sessions[credentials.host]
+        )
+
+    def teardown_method(self):
+        """Shut down the monitors started by the test."""
+        self.pool.close()
+
+    def _monitor(self, scripts, **kwargs):
+        self.sessions.update(
+            {host: TaskSession(steps) for host, steps in scripts.items()}
+        )
+        kwargs.setdefault("initial_interval", 0.01)
+        kwargs.setdefault("use_events", False)
+        monitor = RedfishTaskMonitor(pool=self.pool, **kwargs)
+        self.pool.add_cleanup(monitor.shutdown)
+        return monitor
+
+
+class TestRedfishTaskMonitor(MonitorTestCase):
+    """Test task tracking, scheduling and completion."""
+
+    def test_many_tasks_share_one_scheduler(self):
+        """Tasks on many BMCs resolve their futures and callbacks."""
+        scripts = {
+            f"10.0.0.{n}": [
+                _task("Running", 10),
+                _task("Running", 60),
+                _task("Completed", 100),
+            ]
+            for n in range(1, 51)
+        }
+        monitor = self._monitor(scripts)
+        finished = []
+
+        handles = [
+            monitor.track(_credentials(n), TASK, timeout=10, callback=finished.append)
+            for n in range(1, 51)
+        ]
+        results = [handle.result(5) for handle in handles]
+
+        assert all(r.success and r.result["task_state"] == "Completed" for r in results)
+        assert len(finished) == 50
+        assert len(monitor) == 0
+        schedulers = [
+            t for t in threading.enumerate() if t.name == "redfish-task-monitor"
+        ]
+        assert len(schedulers) == 1
+
+    def test_duplicate_tracks_share_polls(self):
+        """Two waits on one task poll it once per interval."""
+        monitor = self._monitor({"10.0.0.1": [_task("Running"), _task("Completed")]})
+
+        first = monitor.track(_credentials(), TASK, timeout=5)
+        second = monitor.track(_credentials(), TASK + "/", timeout=5)
+
+        assert first.result(5).success and second.result(5).success
+        assert len(self.sessions["10.0.0.1"].polls) == 2
+
+    def test_retry_after_is_honored(self):
+        """A task monitor's Retry-After delays the next poll."""
+        running = RedfishResponse(
+            success=True, status_code=202, headers={"Retry-After": "0.3"}
+        )
+        done = RedfishResponse(success=True, status_code=204)
+        monitor = self._monitor({"10.0.0.1": [running, done]})
+
+        result = monitor.wait(_credentials(), "/redfish/v1/TaskMonitors/1", timeout=5)
+
+        polls = self.sessions["10.0.0.1"].polls
+        assert result.success
+        assert polls[1] - polls[0] >= 0.25
+
+    def test_failed_and_timed_out_tasks(self):
+        """Failed states and deadlines resolve with an error."""
+        monitor = self._monitor(
+            {"10.0.0.1": [_task("Exception")], "10.0.0.2": [_task("Running")]}
+        )
+
+        failed = monitor.wait(_credentials(1), TASK, timeout=5)
+        timed_out = monitor.wait(_credentials(2), TASK, timeout=0.1)
+
+        assert not failed.success
+        assert failed.result["task_state"] == "Exception"
+        assert not timed_out.success
+        assert "Timed out" in timed_out.error_message
+        assert timed_out.result["task_state"] == "Running"
+
+    def test_task_event_triggers_poll(self):
+        """A task event from the SSE stream polls without waiting."""
+        monitor = self._monitor(
+            {"10.0.0.1": [_task("Running"), _task("Completed")]},
+            initial_interval=30,
+            use_events=True,
+        )
+        streams = []
+
+        class FakeStream:
+            def __init__(self, credentials, uri, callback):
+                self.callback = callback
+                self.stopped = False
+                streams.append(self)
+
+            def start(self):
+                pass
+
+            def stop(self):
+                self.stopped = True
+
+        module = "hwautomation.hardware.redfish.client.tasks"
+        with patch(f"{module}.discover_sse_uri", return_value="/redfish/v1/SSE"):
+            with patch(f"{module}.RedfishEventStream", FakeStream):
+                handle = monitor.track(_credentials(), TASK, timeout=10)
+                deadline = time.monotonic() + 2
+                while (not streams or not self.sessions["10.0.0.1"].polls) and (
+                    time.monotonic() < deadline
+                ):
+                    time.sleep(0.01)
+                streams[0].callback(
+                    {
+                        "MessageId": "TaskEvent.1.0.TaskCompletedOK",
+                        "OriginOfCondition": {"@odata.id": TASK},
+                    }
+                )
+                result = handle.result(2)
+
+        assert result.success
+        assert streams[0].stopped
+
+
+class TestRetryAfter:
+    """Test Retry-After parsing."""
+
+    def test_seconds_and_http_date(self):
+        """Both header forms are converted to seconds."""
+        assert retry_after({"Retry-After": "5"}) == 5.0
+        delay = retry_after({"retry-after": formatdate(time.time() + 60, usegmt=True)})
+        assert 55 <= delay <= 60
+        assert retry_after({"Retry-After": "soon"}) is None
+        assert retry_after(None) is None
+
+
+class TestFirmwareUpdateWait(MonitorTestCase):
+    """Test firmware waits on the shared monitor."""
+
+    def test_wait_for_update_completion(self):
+        """Firmware waits are resolved by the task monitor."""
+        monitor = self._monitor({"10.0.0.1": [_task("Running"), _task("Exception")]})
+        operation = RedfishFirmwareOperation(_credentials())
+
+        with patch(
+            "hwautomation.hardware.redfish.operations.firmware.get_task_monitor",
+            return_value=monitor,
+        ):
+            result = operation.wait_for_update_completion(TASK, timeout=5)
+
+        assert not result.success
+        assert result.error_message == "Update failed with state: Exception"
@@ -0,0 +1,264 @@
+"""Tests for the SFTP transfer engine."""
+
+import os
+import subprocess
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from hwautomation.utils.transfer import (
+    BandwidthLimiter,
+    SFTPFanOut,
+    SFTPTransferEngine,
+    TransferError,
+    TransferSettings,
+    TransferTarget,
+    _contiguous_end,
+    _split_ranges,
+    file_sha256,
+)
+
+
+class _LocalSFTPFile:
+    """File wrapper exposing the paramiko SFTPFile extras used by the engine."""
+
+    def __init__(self, handle):
+        self._handle = handle
+
+    def __getattr__(self, name):
+        return getattr(self._handle, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._handle.close()
+
+    def set_pipelined(self, pipelined=True):
+        pass
+
+    def prefetch(self, file_size=None, max_concurrent_requests=None):
+        pass
+
+    def readv(self, chunks):
+        for offset, length in chunks:
+            self._handle.seek(offset)
+            yield self._handle.read(length)
+
+
+class _LocalSFTP:
+    """SFTP client stand-in backed by the local filesystem."""
+
+    def __init__(self, fail_writes_at=None):
+        self.fail_writes_at = fail_writes_at
+
+    def open(self, path, mode="r"):
+        if self.fail_writes_at is not None and "+" in mode:
+            handle = open(path, mode)
+            original_seek = handle.seek
+
+            def seek(offset, *args):
+                if offset == self.fail_writes_at:
+                    raise IOError("simulated link drop")
+                return original_seek(offset, *args)
+
+            handle.seek = seek
+            return _LocalSFTPFile(handle)
+        return _LocalSFTPFile(open(path, mode))
+
+    def stat(self, path):
+        return os.stat(path)
+
+    def truncate(self, path, size):
+        os.truncate(path, size)
+
+    def remove(self, path):
+        os.remove(path)
+
+    def posix_rename(self, source, target):
+        os.replace(source, target)
+
+    def close(self):
+        pass
+
+
+def _local_exec(command):
+    result = subprocess.run(command, shell=True, capture_output=True, text=True)
+    return result.stdout, result.stderr, result.returncode
+
+
+@pytest.fixture
+def ssh_client():
+    client = Mock()
+    client.host = "10.0.0.5"
+    client.exec_command.side_effect = _local_exec
+    return client
+
+
+@pytest.fixture
+def payload(tmp_path):
+    path = tmp_path / "firmware.bin"
+    path.write_bytes(os.urandom(300 * 1024))
+    return path
+
+
+def _engine(ssh_client, sftp=None, **settings):
+    engine = SFTPTransferEngine(ssh_client, TransferSettings(**settings))
+    engine._open_sftp = lambda: sftp or _LocalSFTP()
+    return engine
+
+
+class TestHelpers:
+    """Test range and checksum helpers."""
+
+    def test_split_ranges(self):
+        assert _split_ranges(10, 35, 10) == [(10, 10), (20, 10), (30, 5)]
+        assert _split_ranges(5, 5, 10) == []
+
+    def test_contiguous_end_stops_at_first_gap(self):
+        ranges = [(0, 10), (10, 10), (20, 10)]
+        assert _contiguous_end(0, ranges, {0, 20}) == 10
+        assert _contiguous_end(0, ranges, {0, 10, 20}) == 30
+        assert _contiguous_end(0, ranges, {10}) == 0
+
+    def test_file_sha256_prefix(self, tmp_path):
+        path = tmp_path / "data"
+        path.write_bytes(b"abcdef")
+        assert file_sha256(str(path), 3) != file_sha256(str(path))
+        other = tmp_path / "prefix"
+        other.write_bytes(b"abc")
+        assert file_sha256(str(path), 3) == file_sha256(str(other))
+
+
+class TestBandwidthLimiter:
+    """Test token bucket limiter."""
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            BandwidthLimiter(0)
+
+    def test_throttles_beyond_burst(self):
+        limiter = BandwidthLimiter(rate=100_000, burst=10_000)
+        start = time.monotonic()
+        limiter.consume(30_000)
+        assert time.monotonic() - start >= 0.15
+
+
+class TestSFTPTransferEngine:
+    """Test uploads and downloads against a local SFTP stand-in."""
+
+    def test_upload_verifies_and_renames(self, ssh_client, payload, tmp_path):
+        remote = tmp_path / "remote.bin"
+        result = _engine(ssh_client).upload(str(payload), str(remote))
+
+        assert result.success and result.verified
+        assert remote.read_bytes() == payload.read_bytes()
+        assert not os.path.exists(str(remote) + ".part")
+        assert result.resumed_from == 0
+
+    def test_upload_resumes_from_verified_prefix(self, ssh_client, payload, tmp_path):
+        remote = tmp_path / "remote.bin"
+        partial = tmp_path / "remote.bin.part"
+        partial.write_bytes(payload.read_bytes()[:100_000])
+
+        result = _engine(ssh_client).upload(str(payload), str(remote))
+
+        assert result.resumed_from == 100_000
+        assert result.bytes_transferred == payload.stat().st_size - 100_000
+        assert remote.read_bytes() == payload.read_bytes()
+
+    def test_upload_restarts_on_corrupt_prefix(self, ssh_client, payload, tmp_path):
+        remote = tmp_path / "remote.bin"
+        (tmp_path / "remote.bin.part").write_bytes(b"\0" * 1000)
+
+        result = _engine(ssh_client).upload(str(payload), str(remote))
+
+        assert result.resumed_from == 0
+        assert remote.read_bytes() == payload.read_bytes()
+
+    def test_parallel_upload(self, ssh_client, payload, tmp_path):
+        remote = tmp_path / "remote.bin"
+        progress = []
+        engine = _engine(
+            ssh_client, parallel_chunks=4, chunk_size=64 * 1024, block_size=8192
+        )
+        result = engine.upload(
+            str(payload), str(remote), lambda done, total: progress.append(done)
+        )
+
+        assert result.verified
+        assert remote.read_bytes() == payload.read_bytes()
+        assert progress[-1] == payload.stat().st_size
+
+    def test_parallel_failure_truncates_to_contiguous_prefix(
+        self, ssh_client, payload, tmp_path
+    ):
+        remote = tmp_path / "remote.bin"
+        engine = _engine(
+            ssh_client,
+            sftp=_LocalSFTP(fail_writes_at=128 * 1024),
+            parallel_chunks=2,
+            chunk_size=64 * 1024,
+        )
+
+        with pytest.raises(TransferError):
+            engine.upload(str(payload), str(remote))
+
+        partial = tmp_path / "remote.bin.part"
+        assert partial.stat().st_size <= 128 * 1024
+        assert not remote.exists()
+
+    def test_download_resume(self, ssh_client, payload, tmp_path):
+        local = tmp_path / "out" / "copy.bin"
+        local.parent.mkdir()
+        (tmp_path / "out" / "copy.bin.part").write_bytes(payload.read_bytes()[:5000])
+
+        result = _engine(ssh_client).download(str(payload), str(local))
+
+        assert result.resumed_from == 5000
+        assert result.verified
+        assert local.read_bytes() == payload.read_bytes()
+
+    def test_parallel_download(self, ssh_client, payload, tmp_path):
+        local = tmp_path / "copy.bin"
+        engine = _engine(ssh_client, parallel_chunks=3, chunk_size=50 * 1024)
+
+        result = engine.download(str(payload), str(local))
+
+        assert result.success
+        assert local.read_bytes() == payload.read_bytes()
+
+    def test_checksum_unavailable_skips_verification(self, payload, tmp_path):
+        client = Mock(host="10.0.0.6")
+        client.exec_command.return_value = ("", "sha256sum: not found", 127)
+        remote = tmp_path / "remote.bin"
+
+        result = _engine(client).upload(str(payload), str(remote))
+
+        assert result.success
+        assert not result.verified
+
+
+class TestSFTPFanOut:
+    """Test multi-host fan-out."""
+
+    def test_isolates_host_failures(self, payload, tmp_path):
+        def connect(target):
+            if target.host == "bad":
+                raise ConnectionError("unreachable")
+            client = Mock(host=target.host)
+            client.exec_command.side_effect = _local_exec
+            return client
+
+        fan_out = SFTPFanOut(connect=connect, total_bandwidth_limit=50 * 1024 * 1024)
+        targets = [
+            TransferTarget(host="good", remote_path=str(tmp_path / "good.bin")),
+            TransferTarget(host="bad"),
+        ]
+        with patch.object(SFTPTransferEngine, "_open_sftp", lambda self: _LocalSFTP()):
+            outcome = fan_out.upload(targets, str(payload), str(tmp_path / "x.bin"))
+
+        assert outcome.succeeded == ["good"]
+        assert outcome.failed == ["bad"]
+        assert "unreachable" in outcome.results["bad"].error
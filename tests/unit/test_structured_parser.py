@@ -0,0 +1,306 @@
+"""Tests for the single-pass structured discovery parser."""
+
+import json
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from hwautomation.hardware.discovery.manager import HardwareDiscoveryManager
+from hwautomation.hardware.discovery.parsers import (
+    DmidecodeParser,
+    NetworkParser,
+    StructuredParser,
+)
+from hwautomation.orchestration.steps.hardware_discovery import DetectServerVendorStep
+from hwautomation.orchestration.utils.vendor_detection import VendorDetector
+from hwautomation.orchestration.workflows.base import StepContext
+
+DMIDECODE_OUTPUT = """# dmidecode 3.3
+Getting SMBIOS data from sysfs.
+SMBIOS 3.2.0 present.
+
+Handle 0x0000, DMI type 0, 26 bytes
+BIOS Information
+\tVendor: American Megatrends Inc.
+\tVersion: 3.4
+\tRelease Date: 04/21/2021
+\tCharacteristics:
+\t\tPCI is supported
+\t\tBIOS is upgradeable
+
+Handle 0x0001, DMI type 1, 27 bytes
+System Information
+\tManufacturer: Supermicro
+\tProduct Name: SYS-6029TP-HTR
+\tVersion: 0123456789
+\tSerial Number: S123456X
+\tUUID: 00000000-0000-0000-0000-AC1F6B123456
+\tWake-up Type: Power Switch
+
+Handle 0x0002, DMI type 2, 15 bytes
+Base Board Information
+\tManufacturer: Supermicro
+\tProduct Name: X11DPT-B
+\tVersion: 1.10
+
+Handle 0x0003, DMI type 3, 22 bytes
+Chassis Information
+\tManufacturer: Supermicro
+\tType: Rack Mount Chassis
+
+Handle 0x0040, DMI type 4, 48 bytes
+Processor Information
+\tSocket Designation: CPU1
+\tVersion: Intel(R) Xeon(R) Gold 6248 CPU @ 2.50GHz
+\tThread Count: 40
+
+Handle 0x0041, DMI type 4, 48 bytes
+Processor Information
+\tSocket Designation: CPU2
+\tVersion: Intel(R) Xeon(R) Gold 6248 CPU @ 2.50GHz
+\tThread Count: 40
+
+Handle 0x00FF, DMI type 127, 4 bytes
+End Of Table
+"""
+
+LSCPU_FLAT = json.dumps(
+    {
+        "lscpu": [
+            {"field": "Architecture:", "data": "x86_64"},
+            {"field": "CPU(s):", "data": "80"},
+            {"field": "Model name:", "data": "Intel(R) Xeon(R) Gold 6248 CPU"},
+            {"field": "Socket(s):", "data": "2"},
+            {"field": "Flags:", "data": "fpu vme avx512f"},
+        ]
+    }
+)
+
+LSCPU_NESTED = json.dumps(
+    {
+        "lscpu": [
+            {"field": "Architecture:", "data": "x86_64"},
+            {"field": "CPU(s):", "data": "64"},
+            {
+                "field": "Vendor ID:",
+                "data": "AuthenticAMD",
+                "children": [
+                    {"field": "Model name:", "data": "AMD EPYC 7543"},
+                    {"field": "Thread(s) per core:", "data": "2"},
+                    {"field": "Core(s) per socket:", "data": "32"},
+                ],
+            },
+        ]
+    }
+)
+
+IP_JSON = json.dumps(
+    [
+        {
+            "ifname": "lo",
+            "flags": ["LOOPBACK", "UP"],
+            "link_type": "loopback",
+            "address": "00:00:00:00:00:00",
+            "addr_info": [{"family": "inet", "local": "127.0.0.1", "prefixlen": 8}],
+        },
+        {
+            "ifname": "eno1",
+            "flags": ["BROADCAST", "MULTICAST", "UP", "LOWER_UP"],
+            "link_type": "ether",
+            "address": "ac:1f:6b:12:34:56",
+            "addr_info": [
+                {"family": "inet6", "local": "fe80::1", "prefixlen": 64},
+                {"family": "inet", "local": "10.0.0.5", "prefixlen": 22},
+            ],
+        },
+        {
+            "ifname": "eno2",
+            "flags": ["BROADCAST", "MULTICAST"],
+            "link_type": "ether",
+            "address": "ac:1f:6b:12:34:57",
+            "addr_info": [],
+        },
+    ]
+)
+
+
+@pytest.fixture
+def parser():
+    return StructuredParser()
+
+
+class TestDmidecode:
+    """Test full dmidecode parsing."""
+
+    def test_indexes_all_types(self, parser):
+        table = parser.parse_dmidecode(DMIDECODE_OUTPUT)
+        assert len(table) == 7
+        assert table.value(1, "Manufacturer") == "Supermicro"
+        assert table.value(2, "Product Name") == "X11DPT-B"
+        assert len(table.by_type(4)) == 2
+        assert table.first(0).name == "BIOS Information"
+
+    def test_collects_list_values(self, parser):
+        bios = parser.parse_dmidecode(DMIDECODE_OUTPUT).first(0)
+        assert bios.lists["Characteristics"] == [
+            "PCI is supported",
+            "BIOS is upgradeable",
+        ]
+        assert "Characteristics" not in bios.properties
+
+    def test_system_info_matches_legacy_parser(self, parser):
+        snapshot = parser.parse_snapshot(dmidecode=DMIDECODE_OUTPUT)
+        structured = snapshot.system_info()
+        legacy = DmidecodeParser().parse_system_info(DMIDECODE_OUTPUT)
+
+        assert structured.manufacturer == legacy.manufacturer
+        assert structured.uuid == legacy.uuid
+        assert structured.bios_version == "3.4"
+        assert structured.bios_date == "04/21/2021"
+        assert structured.chassis_type == "Rack Mount Chassis"
+        # Without lscpu, CPU details come from DMI type 4
+        assert structured.cpu_model.startswith("Intel(R) Xeon(R) Gold 6248")
+        assert structured.cpu_cores == 80
+
+    def test_legacy_single_table_output(self, parser):
+        table = parser.parse_dmidecode(
+            "Handle 0x0001, DMI type 1, 27 bytes\nSystem Information\n"
+            "\tManufacturer: Dell Inc.\n"
+        )
+        assert table.value(1, "Manufacturer") == "Dell Inc."
+
+
+class TestJsonParsers:
+    """Test lscpu and ip JSON parsing."""
+
+    def test_lscpu_flat(self, parser):
+        cpu = parser.parse_lscpu_json(LSCPU_FLAT)
+        assert cpu.cpus == 80
+        assert cpu.sockets == 2
+        assert "avx512f" in cpu.flags
+
+    def test_lscpu_nested(self, parser):
+        cpu = parser.parse_lscpu_json(LSCPU_NESTED)
+        assert cpu.model_name == "AMD EPYC 7543"
+        assert cpu.vendor_id == "AuthenticAMD"
+        assert cpu.cores_per_socket == 32
+
+    def test_ip_json(self, parser):
+        interfaces = {i.name: i for i in parser.parse_ip_json(IP_JSON)}
+        assert interfaces["eno1"].ip_address == "10.0.0.5"
+        assert interfaces["eno1"].netmask == "255.255.252.0"
+        assert interfaces["eno1"].state == "up"
+        assert interfaces["eno2"].state == "down"
+        assert interfaces["lo"].mac_address == ""
+
+    def test_snapshot_skips_bad_json(self, parser):
+        snapshot = parser.parse_snapshot(
+            dmidecode=DMIDECODE_OUTPUT, lscpu_json="lscpu: invalid option -- 'J'"
+        )
+        assert snapshot.cpu is None
+        assert snapshot.system_info().manufacturer == "Supermicro"
+
+
+class TestVendorDetectionSharing:
+    """Test VendorDetector consumes a shared snapshot."""
+
+    def test_detects_from_snapshot(self, parser):
+        snapshot = parser.parse_snapshot(dmidecode=DMIDECODE_OUTPUT)
+        result = VendorDetector().detect_vendor(snapshot=snapshot)
+        assert result["vendor"] == "supermicro"
+        assert result["method"] in ("dmidecode", "bios")
+
+    def test_gather_issues_one_dmidecode_call(self):
+        ssh_client = type("FakeSSH", (), {})()
+        calls = []
+
+        def execute_command(command):
+            calls.append(command)
+            if command.startswith("sudo dmidecode"):
+                return {"success": True, "stdout": DMIDECODE_OUTPUT}
+            return {"success": False}
+
+        ssh_client.execute_command = execute_command
+        result = VendorDetector(ssh_client).detect_vendor()
+
+        assert result["vendor"] == "supermicro"
+        assert sum(1 for c in calls if "dmidecode" in c) == 1
+
+    def test_discovery_result_carries_snapshot(self):
+        """Hardware discovery keeps its snapshot without serializing it."""
+        ssh_client = Mock()
+        ssh_client.__enter__ = Mock(return_value=ssh_client)
+        ssh_client.__exit__ = Mock(return_value=False)
+        ssh_client.exec_command.side_effect = lambda command: (
+            (DMIDECODE_OUTPUT, "", 0) if command == "sudo dmidecode" else ("", "", 1)
+        )
+        ssh_manager = Mock()
+        ssh_manager.connect.return_value = ssh_client
+        with patch("hwautomation.hardware.discovery.manager.ConfigurationManager"):
+            manager = HardwareDiscoveryManager(ssh_manager)
+
+        discovery = manager.discover_hardware("10.0.0.1")
+
+        assert discovery.snapshot.system_info().manufacturer == "Supermicro"
+        assert "snapshot" not in discovery.to_dict()
+
+    def test_vendor_step_uses_discovery_snapshot(self, parser):
+        """Vendor detection reads the snapshot instead of running SSH commands."""
+        context = StepContext(workflow_id="wf-1", server_id="srv-1")
+        context.set_data(
+            "discovery_snapshot", parser.parse_snapshot(dmidecode=DMIDECODE_OUTPUT)
+        )
+
+        with patch(
+            "hwautomation.orchestration.steps.hardware_discovery.SSHClient"
+        ) as ssh_client:
+            result = DetectServerVendorStep().execute(context)
+
+        assert result.data == {"vendor": "Supermicro"}
+        assert context.manufacturer == "Supermicro"
+        ssh_client.assert_not_called()
+
+
+@pytest.mark.performance
+class TestParseThroughput:
+    """Micro-benchmark: structured single pass vs legacy per-field parsers."""
+
+    def test_structured_parse_throughput(self, parser):
+        # A large dmidecode dump: many memory devices like a full 2S server
+        memory_devices = "".join(
+            f"Handle 0x{0x1100 + i:04X}, DMI type 17, 84 bytes\nMemory Device\n"
+            f"\tSize: 32 GB\n\tLocator: DIMM{i}\n\tSpeed: 3200 MT/s\n\n"
+            for i in range(32)
+        )
+        output = DMIDECODE_OUTPUT.replace(
+            "Handle 0x00FF", memory_devices + "Handle 0x00FF"
+        )
+        iterations = 500
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            snapshot = parser.parse_snapshot(
+                dmidecode=output, lscpu_json=LSCPU_FLAT, ip_json=IP_JSON
+            )
+            snapshot.system_info()
+            snapshot.vendor_text()
+        structured_time = time.perf_counter() - start
+
+        legacy_dmi = DmidecodeParser()
+        legacy_net = NetworkParser()
+        ip_text = "2: eno1: <UP>\n    link/ether ac:1f:6b:12:34:56\n" * 3
+        start = time.perf_counter()
+        for _ in range(iterations):
+            legacy_dmi.parse_system_info(output)
+            legacy_dmi.parse_bios_info(output)
+            legacy_net.parse_ip_addr(ip_text)
+            VendorDetector()._detect_from_dmidecode({"dmidecode_system": output})
+        legacy_time = time.perf_counter() - start
+
+        mb = len(output) * iterations / 1024 / 1024
+        print(
+            f"\nstructured: {mb / structured_time:.1f} MiB/s, "
+            f"legacy: {mb / legacy_time:.1f} MiB/s"
+        )
+        assert structured_time < legacy_time